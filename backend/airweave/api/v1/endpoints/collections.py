@@ -32,6 +32,7 @@ from airweave.core.source_connection_service_helpers import source_connection_he
 from airweave.core.sync_service import sync_service
 from airweave.core.temporal_service import temporal_service
 from airweave.models.source_connection import SourceConnection
+from airweave.platform.access_control.cache import invalidate_principals
 from airweave.platform.cleanup import cleanup_service
 from airweave.schemas.errors import (
     NotFoundErrorResponse,
@@ -314,6 +315,13 @@ async def delete(
     # Delete the collection - CASCADE will handle all child objects
     result = await crud.collection.remove(db, id=db_obj.id, ctx=ctx)
 
+    # Memberships of its source connections are gone too (cascade); rebuild the group
+    # closure so nestings through them stop expanding in other collections
+    await crud.access_control_membership.rebuild_group_closure(
+        db, organization_id=ctx.organization.id
+    )
+    await invalidate_principals(ctx.organization.id)
+
     # Publish collection.deleted event
     try:
         await event_bus.publish(
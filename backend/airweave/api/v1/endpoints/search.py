@@ -23,6 +23,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from airweave.api import deps
 from airweave.api.context import ApiContext
 from airweave.api.router import TrailingSlashRouter
+from airweave.core.config import settings
 from airweave.core.guard_rail_service import GuardRailService
 from airweave.core.pubsub import core_pubsub
 from airweave.core.shared_models import ActionType
@@ -34,6 +35,7 @@ from airweave.schemas.errors import (
 )
 from airweave.schemas.search import SearchRequest, SearchResponse
 from airweave.schemas.search_legacy import LegacySearchRequest, LegacySearchResponse, ResponseType
+from airweave.search.channels import local_search_channels
 from airweave.search.legacy_adapter import (
     convert_legacy_request_to_new,
     convert_new_response_to_legacy,
@@ -252,7 +254,9 @@ async def stream_search_collection_advanced(  # noqa: C901 - streaming orchestra
 ) -> StreamingResponse:
     """Server-Sent Events (SSE) streaming endpoint for advanced search.
 
-    Initializes a streaming session and relays events from Redis Pub/Sub.
+    Initializes a streaming session and relays the search's events. The search runs
+    in this process, so events arrive on an in-process channel; Redis Pub/Sub is used
+    when the local channel is disabled.
     Accepts both new SearchRequest and legacy LegacySearchRequest formats.
     """
     request_id = ctx.request_id
@@ -267,7 +271,12 @@ async def stream_search_collection_advanced(  # noqa: C901 - streaming orchestra
         ctx.logger.debug("Processing legacy streaming search request")
         search_request = convert_legacy_request_to_new(search_request)
 
-    pubsub = await core_pubsub.subscribe("search", request_id)
+    local_channel = None
+    pubsub = None
+    if settings.SEARCH_STREAM_LOCAL_CHANNEL_ENABLED:
+        local_channel = local_search_channels.open(request_id)
+    else:
+        pubsub = await core_pubsub.subscribe("search", request_id)
 
     async def _publish_stream_error(
         *, message: str, transient: bool, detail: str | None = None
@@ -279,7 +288,10 @@ async def stream_search_collection_advanced(  # noqa: C901 - streaming orchestra
         }
         if detail:
             payload["detail"] = detail
-        await core_pubsub.publish("search", request_id, payload)
+        if local_channel is not None:
+            await local_channel.publish(payload)
+        else:
+            await core_pubsub.publish("search", request_id, payload)
 
     async def _run_search() -> None:
         try:
@@ -313,6 +325,21 @@ async def stream_search_collection_advanced(  # noqa: C901 - streaming orchestra
             )
 
     search_task = asyncio.create_task(_run_search())
+    heartbeat_interval = 30
+
+    async def _event_messages():
+        """Yield encoded events, or None when nothing arrived for a while."""
+        if local_channel is not None:
+            while True:
+                yield await local_channel.get(timeout=heartbeat_interval)
+
+        async for message in pubsub.listen():
+            if message["type"] == "message":
+                yield message["data"]
+            elif message["type"] == "subscribe":
+                ctx.logger.info(f"[SearchStream] Subscribed to channel search:{request_id}")
+            else:
+                yield None
 
     async def event_stream():  # noqa: C901 - complex loop acceptable
         try:
@@ -326,9 +353,8 @@ async def stream_search_collection_advanced(  # noqa: C901 - streaming orchestra
             yield f"data: {json.dumps(connected_event)}\n\n"
 
             last_heartbeat = asyncio.get_event_loop().time()
-            heartbeat_interval = 30
 
-            async for message in pubsub.listen():
+            async for data in _event_messages():
                 now = asyncio.get_event_loop().time()
                 if now - last_heartbeat > heartbeat_interval:
                     heartbeat_event = {
@@ -338,36 +364,25 @@ async def stream_search_collection_advanced(  # noqa: C901 - streaming orchestra
                     yield f"data: {json.dumps(heartbeat_event)}\n\n"
                     last_heartbeat = now
 
-                if message["type"] == "message":
-                    data = message["data"]
-                    yield f"data: {data}\n\n"
-
-                    try:
-                        parsed = json.loads(data)
-                        if isinstance(parsed, dict) and parsed.get("type") == "done":
-                            ctx.logger.info(
-                                f"[SearchStream] Done event received for search:{request_id}. "
-                                "Closing stream"
-                            )
-                            try:
-                                await guard_rail.increment(ActionType.QUERIES)
-                            except Exception:
-                                pass
-                            break
-                    except Exception:
-                        pass
-
-                elif message["type"] == "subscribe":
-                    ctx.logger.info(f"[SearchStream] Subscribed to channel search:{request_id}")
-                else:
-                    current = asyncio.get_event_loop().time()
-                    if current - last_heartbeat > heartbeat_interval:
-                        heartbeat_event = {
-                            "type": "heartbeat",
-                            "ts": _dt.datetime.now(_dt.timezone.utc).isoformat(),
-                        }
-                        yield f"data: {json.dumps(heartbeat_event)}\n\n"
-                        last_heartbeat = current
+                if data is None:
+                    continue
+
+                yield f"data: {data}\n\n"
+
+                try:
+                    parsed = json.loads(data)
+                    if isinstance(parsed, dict) and parsed.get("type") == "done":
+                        ctx.logger.info(
+                            f"[SearchStream] Done event received for search:{request_id}. "
+                            "Closing stream"
+                        )
+                        try:
+                            await guard_rail.increment(ActionType.QUERIES)
+                        except Exception:
+                            pass
+                        break
+                except Exception:
+                    pass
 
         except asyncio.CancelledError:
             ctx.logger.info(f"[SearchStream] Cancelled stream id={request_id}")
@@ -390,13 +405,16 @@ async def stream_search_collection_advanced(  # noqa: C901 - streaming orchestra
                     await search_task
                 except Exception:
                     pass
-            try:
-                await pubsub.close()
-                ctx.logger.info(
-                    f"[SearchStream] Closed pubsub subscription for search:{request_id}"
-                )
-            except Exception:
-                pass
+            if local_channel is not None:
+                local_search_channels.close(request_id)
+            else:
+                try:
+                    await pubsub.close()
+                    ctx.logger.info(
+                        f"[SearchStream] Closed pubsub subscription for search:{request_id}"
+                    )
+                except Exception:
+                    pass
 
     return StreamingResponse(
         event_stream(),
@@ -43,10 +43,49 @@ class Settings(BaseSettings):
         REDIS_DB (int): The Redis database number.
         QDRANT_HOST (str): The Qdrant host.
         QDRANT_PORT (int): The Qdrant port.
+        QDRANT_GRPC_PORT (int): The Qdrant gRPC port.
+        QDRANT_PREFER_GRPC (bool): Whether Qdrant clients use gRPC instead of HTTP.
         TEXT2VEC_INFERENCE_URL (str): The URL for text2vec-transformers inference service.
         OPENAI_API_KEY (Optional[str]): The OpenAI API key.
         MISTRAL_API_KEY (Optional[str]): The Mistral AI API key.
         EMBEDDING_DIMENSIONS (int): Embedding dimensions for the stack (provider, Vespa, Qdrant).
+        EMBEDDING_CACHE_ENABLED (bool): Whether chunk embeddings are cached by text hash.
+        EMBEDDING_CACHE_BACKEND (str): Embedding cache layers (memory or redis).
+        EMBEDDING_CACHE_MAX_ENTRIES (int): Max embeddings held by the in-process cache.
+        EMBEDDING_CACHE_MAX_BYTES (int): Max serialized bytes held by the in-process cache.
+        EMBEDDING_CACHE_TTL_SECONDS (int): Time-to-live of cached embeddings.
+        EMBEDDING_BATCHER_ENABLED (bool): Whether syncs share pod-wide embedding requests.
+        EMBEDDING_BATCHER_MAX_LINGER_MS (int): Max wait for an embedding request to fill up.
+        FILE_FINGERPRINT_ENABLED (bool): Whether unchanged files are detected before download.
+        PRINCIPAL_CACHE_ENABLED (bool): Whether resolved access principals are cached.
+        PRINCIPAL_CACHE_BACKEND (str): Principal cache layers (memory or redis).
+        PRINCIPAL_CACHE_MAX_ENTRIES (int): Max principal sets held by the in-process cache.
+        PRINCIPAL_CACHE_MEMORY_TTL_SECONDS (float): Time-to-live of in-process principal sets.
+        PRINCIPAL_CACHE_REDIS_TTL_SECONDS (int): Time-to-live of principal sets in Redis.
+        SEARCH_CLIENT_POOL_ENABLED (bool): Whether search reuses process-wide clients.
+        SEARCH_CLIENT_IDLE_SECONDS (float): Idle time after which a pooled client is closed.
+        SEARCH_CLIENT_HEALTH_CHECK_INTERVAL_SECONDS (float): Interval of pooled client checks.
+        SEARCH_CLIENT_MAX_CONNECTIONS (int): Max connections per pooled HTTP client.
+        SEARCH_CLIENT_MAX_KEEPALIVE_CONNECTIONS (int): Max idle connections kept per client.
+        RATE_LIMIT_LOCAL_LEASE_ENABLED (bool): Whether API pods lease rate limit batches.
+        RATE_LIMIT_LEASE_SIZE (int): Max requests leased per organization per Redis call.
+        RATE_LIMIT_LEASE_TTL_SECONDS (float): Lifetime of an unused rate limit lease.
+        PLATFORM_RATE_LIMITER_REDIS_ENABLED (bool): Whether outbound API rate limiters
+            (OpenAI, Mistral, Firecrawl) enforce cluster-wide limits through Redis.
+        VESPA_ASYNC_FEED_ENABLED (bool): Whether Vespa feeds use the asyncio document/v1
+            feeder instead of pyvespa's feed_iterable.
+        SEARCH_PLAN_CACHE_ENABLED (bool): Whether per-collection search plans are cached.
+        SEARCH_PLAN_CACHE_MAX_ENTRIES (int): Max search plans held in memory.
+        SEARCH_PLAN_CACHE_TTL_SECONDS (float): Time-to-live of a cached search plan.
+        SEARCH_QUERY_WRITER_ENABLED (bool): Whether search_query rows are written behind.
+        SEARCH_QUERY_WRITER_MAX_QUEUE_SIZE (int): Max search records waiting to be written.
+        SEARCH_QUERY_WRITER_BATCH_SIZE (int): Rows per multi-row search_query INSERT.
+        SEARCH_QUERY_WRITER_FLUSH_INTERVAL_SECONDS (float): Max wait for a batch to fill.
+        SEARCH_QUERY_WRITER_ENQUEUE_TIMEOUT_SECONDS (float): Wait for queue space before drop.
+        SEARCH_QUERY_WRITER_DRAIN_TIMEOUT_SECONDS (float): Max time to drain on shutdown.
+        SEARCH_STREAM_LOCAL_CHANNEL_ENABLED (bool): Whether SSE search streams skip Redis.
+        SEARCH_STREAM_LOCAL_BUFFER_SIZE (int): Max buffered events per local search stream.
+        SEARCH_STREAM_LOCAL_PUBLISH_TIMEOUT_SECONDS (float): Wait for buffer space before drop.
         FIRECRAWL_API_KEY (Optional[str]): The FireCrawl API key.
         TEMPORAL_HOST (str): The host of the Temporal server.
         TEMPORAL_PORT (int): The Temporal server port.
@@ -55,9 +94,19 @@ class Settings(BaseSettings):
         TEMPORAL_ENABLED (bool): Whether Temporal is enabled.
         SYNC_MAX_WORKERS (int): The maximum number of workers for sync tasks.
         SYNC_THREAD_POOL_SIZE (int): The size of the thread pool for sync tasks.
+        SYNC_PROCESS_POOL_SIZE (int): Workers in the opt-in CPU process pool (0 = CPU count).
+        ENTITY_TRACKER_SPILL_THRESHOLD_BYTES (int): Per-type encountered-ID array size above
+            which it is moved to a memory-mapped temp file (0 = never spill).
+        ENTITY_TRACKER_SPILL_DIR (str): Directory for encountered-ID spill files.
+        ENTITY_UPSERT_ROWS_PER_STATEMENT (int): Rows per entity upsert / hash update statement.
         WEB_FETCHER_MAX_CONCURRENT (int): Max concurrent web scraping requests
         OPENAI_MAX_CONCURRENT (int): Max concurrent OpenAI API requests
         CTTI_MAX_CONCURRENT (int): Max concurrent CTTI (ClinicalTrials.gov) requests
+        SYNC_CHECKPOINT_ENABLED (bool): Whether syncs checkpoint their cursor and resume on retry.
+        SYNC_CHECKPOINT_INTERVAL_SECONDS (float): Minimum time between cursor checkpoints.
+        SYNC_CHECKPOINT_MAX_ATTEMPTS (int): Sync activity attempts when checkpointing is enabled.
+        SYNC_PARTITIONING_ENABLED (bool): Whether partitionable sources fan out across workers.
+        SYNC_PARTITION_MAX_PARALLEL (int): Max partition activities of one sync running at once.
         STRIPE_DEVELOPER_MONTHLY: str = ""
         STRIPE_PRO_MONTHLY: str = ""
         STRIPE_TEAM_MONTHLY: str = ""
@@ -77,6 +126,14 @@ class Settings(BaseSettings):
 
     # Rate limiting
     DISABLE_RATE_LIMIT: bool = False  # For testing purposes - disables rate limiting completely
+    # Optional: each pod leases a small batch of requests per organization from Redis
+    # and admits from memory until the batch is used or the lease expires
+    RATE_LIMIT_LOCAL_LEASE_ENABLED: bool = False
+    RATE_LIMIT_LEASE_SIZE: int = 10
+    RATE_LIMIT_LEASE_TTL_SECONDS: float = 1.0
+    # Optional: outbound API rate limiters share their token buckets through Redis and
+    # enforce the provider's account limit across pods (falls back to per-pod limits)
+    PLATFORM_RATE_LIMITER_REDIS_ENABLED: bool = False
     FIRST_SUPERUSER: str
     FIRST_SUPERUSER_PASSWORD: str
 
@@ -124,6 +181,8 @@ class Settings(BaseSettings):
 
     QDRANT_HOST: Optional[str] = None
     QDRANT_PORT: Optional[int] = None
+    QDRANT_GRPC_PORT: int = 6334
+    QDRANT_PREFER_GRPC: bool = False  # Off by default: some setups don't expose gRPC
     TEXT2VEC_INFERENCE_URL: str = "http://localhost:9878"
 
     # Embedding configuration (source of truth for entire stack)
@@ -131,11 +190,75 @@ class Settings(BaseSettings):
     # Common values: 384 (local), 1024 (Mistral), 1536 (OpenAI small), 3072 (OpenAI large)
     EMBEDDING_DIMENSIONS: int = 1536
 
+    # Content-addressed embedding cache (keyed by model, dimensions and chunk text hash)
+    # Backend: memory (in-process LRU only) | redis (in-process LRU in front of Redis)
+    EMBEDDING_CACHE_ENABLED: bool = False
+    EMBEDDING_CACHE_BACKEND: str = "memory"
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 50_000
+    EMBEDDING_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # 256MB of serialized embeddings
+    EMBEDDING_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+
+    # Pod-wide embedding batcher: dense embedding calls from all syncs in a worker are
+    # packed into shared provider requests (see platform/embedders/batcher.py)
+    EMBEDDING_BATCHER_ENABLED: bool = False
+    EMBEDDING_BATCHER_MAX_LINGER_MS: int = 25
+
+    # Pre-download change detection for files whose source reports a content fingerprint
+    # (Drive md5Checksum, Dropbox content_hash, Box sha1/etag, OneDrive cTag/eTag).
+    # Downloads are deferred until the file resolves to INSERT/UPDATE. Enabling this
+    # changes the hash of those files, so the first sync afterwards updates them once.
+    FILE_FINGERPRINT_ENABLED: bool = False
+
+    # Access principal cache (keyed by organization, collection readable_id and user)
+    # Backend: memory (in-process LRU only) | redis (in-process LRU in front of Redis)
+    # Entries are invalidated per organization when access control memberships sync.
+    # A missed invalidation leaves a user's principals stale for up to the memory TTL
+    # (memory backend) or the Redis TTL (redis backend), so the cache is opt-in.
+    PRINCIPAL_CACHE_ENABLED: bool = False
+    PRINCIPAL_CACHE_BACKEND: str = "redis"
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10_000
+    PRINCIPAL_CACHE_MEMORY_TTL_SECONDS: float = 30.0
+    PRINCIPAL_CACHE_REDIS_TTL_SECONDS: int = 300
+
+    # Process-wide destination and provider clients for the search path
+    # Clients are keyed by type and credentials, health-checked in the background,
+    # closed after SEARCH_CLIENT_IDLE_SECONDS without use and on API shutdown
+    SEARCH_CLIENT_POOL_ENABLED: bool = True
+    SEARCH_CLIENT_IDLE_SECONDS: float = 900.0
+    SEARCH_CLIENT_HEALTH_CHECK_INTERVAL_SECONDS: float = 30.0
+    SEARCH_CLIENT_MAX_CONNECTIONS: int = 100
+    SEARCH_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+
+    # Cached search plans (collection config, source capabilities, destination)
+    # Invalidated by collection.* and source_connection.* domain events
+    SEARCH_PLAN_CACHE_ENABLED: bool = True
+    SEARCH_PLAN_CACHE_MAX_ENTRIES: int = 10_000
+    SEARCH_PLAN_CACHE_TTL_SECONDS: float = 300.0
+
+    # Write-behind persistence of search_query rows and search analytics
+    # Rows are batched into multi-row INSERTs off the request path; records are dropped
+    # (and counted) if the queue stays full for SEARCH_QUERY_WRITER_ENQUEUE_TIMEOUT_SECONDS
+    SEARCH_QUERY_WRITER_ENABLED: bool = True
+    SEARCH_QUERY_WRITER_MAX_QUEUE_SIZE: int = 10_000
+    SEARCH_QUERY_WRITER_BATCH_SIZE: int = 200
+    SEARCH_QUERY_WRITER_FLUSH_INTERVAL_SECONDS: float = 1.0
+    SEARCH_QUERY_WRITER_ENQUEUE_TIMEOUT_SECONDS: float = 0.01
+    SEARCH_QUERY_WRITER_DRAIN_TIMEOUT_SECONDS: float = 10.0
+
+    # In-process channel between a streaming search and its SSE response
+    # Redis pub/sub is only used when the emitter runs in another process
+    SEARCH_STREAM_LOCAL_CHANNEL_ENABLED: bool = True
+    SEARCH_STREAM_LOCAL_BUFFER_SIZE: int = 1000
+    SEARCH_STREAM_LOCAL_PUBLISH_TIMEOUT_SECONDS: float = 1.0
+
     # Vespa configuration
     VESPA_URL: str = "http://localhost"
     VESPA_PORT: int = 8081
     VESPA_TIMEOUT: float = 60.0
     VESPA_CLUSTER: str = "airweave"  # Vespa content cluster name for bulk operations
+    # Feed through the pod-wide asyncio document/v1 feeder instead of pyvespa's threaded
+    # feed_iterable (HTTP/2 connection pool, adaptive in-flight window, per-doc retries)
+    VESPA_ASYNC_FEED_ENABLED: bool = False
 
     # -------------------------------------------------------------------------
     # Storage backend configuration
@@ -187,6 +310,9 @@ class Settings(BaseSettings):
     # Temporal worker graceful shutdown configuration
     TEMPORAL_GRACEFUL_SHUTDOWN_TIMEOUT: int = 7200  # 2 hours in seconds
     WORKER_METRICS_PORT: int = 8888  # Port for /drain and /health endpoints
+    # Internal Prometheus port of the API (None = off). Opt-in: with several API workers
+    # per host only the first one can bind it.
+    API_METRICS_PORT: Optional[int] = None
 
     # Stripe billing settings
     STRIPE_ENABLED: bool = False
@@ -220,10 +346,29 @@ class Settings(BaseSettings):
     # Sync configuration
     SYNC_MAX_WORKERS: int = 20
     SYNC_THREAD_POOL_SIZE: int = 100
+    SYNC_PROCESS_POOL_SIZE: int = 0  # 0 = os.cpu_count(); only used with behavior.cpu_pool=process
+    ENTITY_TRACKER_SPILL_THRESHOLD_BYTES: int = 0  # 0 = keep encountered IDs in memory
+    ENTITY_TRACKER_SPILL_DIR: str = ""  # "" = system temp dir
+
+    ENTITY_UPSERT_ROWS_PER_STATEMENT: int = 1000  # keeps INSERTs under the 32767 bind limit
     WEB_FETCHER_MAX_CONCURRENT: int = 10  # Max concurrent web scraping requests
     OPENAI_MAX_CONCURRENT: int = 20  # Max concurrent OpenAI API requests
     CTTI_MAX_CONCURRENT: int = 3  # Max concurrent CTTI (ClinicalTrials.gov) requests
 
+    # Mid-sync cursor checkpoints (see platform/sync/checkpoint.py). The sync activity is
+    # retried up to SYNC_CHECKPOINT_MAX_ATTEMPTS times after a worker crash and resumes
+    # from the last checkpoint of its sync job instead of the last completed sync.
+    SYNC_CHECKPOINT_ENABLED: bool = False
+    SYNC_CHECKPOINT_INTERVAL_SECONDS: float = 60.0
+    SYNC_CHECKPOINT_MAX_ATTEMPTS: int = 3
+
+    # Partitioned syncs (see platform/sync/partitions.py). Sources that list partitions
+    # run one activity per partition across the worker fleet, then a final activity
+    # does orphan cleanup and the cursor merge. Needs a storage backend shared by all
+    # workers for the partition results.
+    SYNC_PARTITIONING_ENABLED: bool = False
+    SYNC_PARTITION_MAX_PARALLEL: int = 8
+
     API_REQUEST_BODY_SIZE_LIMIT: int = 10 * 1024 * 1024  # 10MB default
     API_REQUEST_TIMEOUT_SECONDS: int = 60
 
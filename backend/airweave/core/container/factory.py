@@ -70,6 +70,8 @@ def _create_event_bus(webhook_publisher):
 
     The event bus fans out domain events to:
     - WebhookEventSubscriber: External webhooks via Svix (all events)
+    - SearchPlanEventSubscriber: Cached search plan invalidation (collection and
+      source connection events)
 
     Future subscribers:
     - PubSubSubscriber: Redis PubSub for real-time UI updates
@@ -77,6 +79,7 @@ def _create_event_bus(webhook_publisher):
     """
     from airweave.adapters.event_bus import InMemoryEventBus
     from airweave.domains.webhooks import WebhookEventSubscriber
+    from airweave.search.plan import SearchPlanEventSubscriber
 
     bus = InMemoryEventBus()
 
@@ -86,4 +89,8 @@ def _create_event_bus(webhook_publisher):
     for pattern in webhook_subscriber.EVENT_PATTERNS:
         bus.subscribe(pattern, webhook_subscriber.handle)
 
+    search_plan_subscriber = SearchPlanEventSubscriber()
+    for pattern in search_plan_subscriber.EVENT_PATTERNS:
+        bus.subscribe(pattern, search_plan_subscriber.handle)
+
     return bus
@@ -0,0 +1,182 @@
+"""In-process LRU cache with TTL and cross-pod invalidation.
+
+Several hot paths keep a pod-local copy of data that is expensive to rebuild (embeddings,
+access principals, search plans). LocalCache is the one implementation they share:
+
+- an LRU bounded by entry count and, optionally, by total value size
+- a TTL per entry, which bounds staleness when an invalidation is missed
+- optionally, an invalidation listener on a core_pubsub namespace: broadcast()
+  publishes an invalidation and every pod's listener hands it to on_invalidation,
+  which drops the affected entries
+
+The listener starts lazily on first use (restarted if it died) and is stopped by
+aclose(). close_local_caches() stops every cache's listener on API shutdown.
+"""
+
+import asyncio
+import json
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from airweave.core.logging import logger as default_logger
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Caches with an invalidation listener, stopped together at shutdown
+_listening_caches: "weakref.WeakSet[LocalCache]" = weakref.WeakSet()
+
+
+class LocalCache(Generic[K, V]):
+    """In-process LRU with a per-entry TTL and optional pubsub invalidation."""
+
+    INVALIDATION_ID = "invalidations"
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        ttl_seconds: Optional[float],
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[V], int] = len,
+        invalidation_namespace: Optional[str] = None,
+        on_invalidation: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            name: Name used in log messages
+            max_entries: Maximum number of entries
+            ttl_seconds: Time-to-live per entry (None disables expiry)
+            max_bytes: Maximum total size of the values, measured with sizeof (None: no
+                bound); a single larger value is not cached
+            sizeof: Size of one value, used with max_bytes
+            invalidation_namespace: core_pubsub namespace to broadcast and listen for
+                invalidations on (None: this pod only)
+            on_invalidation: Drops the entries an invalidation message refers to
+        """
+        self.name = name
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._namespace = invalidation_namespace
+        self._on_invalidation = on_invalidation
+        self._entries: "OrderedDict[K, Tuple[V, Optional[float]]]" = OrderedDict()
+        self._bytes = 0
+        self._listener: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        """Number of entries."""
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the values (0 without max_bytes)."""
+        return self._bytes
+
+    @property
+    def listening(self) -> bool:
+        """Whether invalidations are broadcast and listened for."""
+        return self._namespace is not None
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the value for key, refreshing its recency, or None if missing or expired."""
+        self.ensure_listener()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting least recently used entries past the bounds."""
+        size = self._sizeof(value) if self._max_bytes is not None else 0
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+        self.pop(key)
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._bytes += size
+        while self._entries and (
+            len(self._entries) > self._max_entries
+            or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            self.pop(next(iter(self._entries)))
+
+    def pop(self, key: K) -> None:
+        """Drop one entry, if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None and self._max_bytes is not None:
+            self._bytes -= self._sizeof(entry[0])
+
+    def drop_where(self, predicate: Callable[[K], bool]) -> None:
+        """Drop every entry whose key matches."""
+        for key in [k for k in self._entries if predicate(k)]:
+            self.pop(key)
+
+    async def broadcast(self, data: Dict[str, Any]) -> None:
+        """Publish an invalidation to every pod's listener (failures are only logged)."""
+        if not self.listening:
+            return
+
+        from airweave.core.pubsub import core_pubsub
+
+        try:
+            await core_pubsub.publish(self._namespace, self.INVALIDATION_ID, data)
+        except Exception as e:
+            default_logger.warning(f"[{self.name}] Invalidation broadcast failed: {e}")
+
+    def ensure_listener(self) -> None:
+        """Start the pubsub listener for this pod once (restarted if it died)."""
+        if not self.listening or (self._listener and not self._listener.done()):
+            return
+        self._listener = asyncio.create_task(self._listen())
+        _listening_caches.add(self)
+
+    async def aclose(self) -> None:
+        """Stop the invalidation listener (on shutdown)."""
+        listener, self._listener = self._listener, None
+        if listener is None or listener.done():
+            return
+        listener.cancel()
+        try:
+            await listener
+        except asyncio.CancelledError:
+            pass
+
+    async def _listen(self) -> None:
+        from airweave.core.pubsub import core_pubsub
+
+        pubsub = None
+        try:
+            pubsub = await core_pubsub.subscribe(self._namespace, self.INVALIDATION_ID)
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                self._on_invalidation(json.loads(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Entries stay bounded by their TTL; the next lookup restarts us
+            default_logger.warning(f"[{self.name}] Invalidation listener stopped: {e}")
+        finally:
+            # Release the Redis connection, whether stopped by aclose() or an error
+            if pubsub is not None:
+                try:
+                    await pubsub.unsubscribe()
+                    await pubsub.close()
+                except Exception as e:
+                    default_logger.debug(f"[{self.name}] Error closing pubsub: {e}")
+
+
+async def close_local_caches() -> None:
+    """Stop the invalidation listeners of every LocalCache (API shutdown)."""
+    for cache in list(_listening_caches):
+        await cache.aclose()
@@ -1,8 +1,13 @@
 """Rate limiter service using Redis for distributed rate limiting."""
 
+import asyncio
+import hashlib
 import time
-from typing import Optional
-from uuid import UUID
+from dataclasses import dataclass
+from typing import Dict, NoReturn, Optional, Tuple
+from uuid import UUID, uuid4
+
+from redis.exceptions import NoScriptError
 
 from airweave.api.context import ApiContext
 from airweave.core.config import settings
@@ -12,11 +17,42 @@ from airweave.schemas.organization_billing import BillingPlan
 from airweave.schemas.rate_limit import RateLimitResult
 
 
+@dataclass
+class _Lease:
+    """Requests an API pod may admit for one organization without asking Redis."""
+
+    tokens: int
+    expires_at: float
+    remaining: int  # Window capacity left in Redis when the lease was granted
+    denied_until: float = 0.0
+
+    def take(self, now: float) -> bool:
+        """Consume one leased request if the lease is still valid."""
+        if self.tokens <= 0 or now >= self.expires_at:
+            return False
+        self.tokens -= 1
+        return True
+
+    def expired(self, now: float) -> bool:
+        """Whether the lease neither admits nor denies requests anymore."""
+        return now >= self.expires_at and now >= self.denied_until
+
+
 class RateLimiter:
     """Static rate limiter using Redis for distributed rate limiting.
 
     Implements distributed rate limiting across horizontally scaled instances
     with plan-based limits that automatically adjust based on billing tier.
+
+    Each check is a single atomic Lua call (EVALSHA) that trims the sliding window,
+    counts it and records the request, so concurrent requests on different pods
+    cannot both pass a check-then-add race.
+
+    With RATE_LIMIT_LOCAL_LEASE_ENABLED, a pod reserves a small batch of requests per
+    organization in one call and admits from memory until the batch is used up or
+    RATE_LIMIT_LEASE_TTL_SECONDS passes. Denials are remembered until retry_after.
+    Unused leased requests stay counted in the window, so leasing can only
+    under-admit, never exceed the limit.
     """
 
     # Plan-based rate limits (requests per minute)
@@ -32,6 +68,50 @@ class RateLimiter:
     # Redis key prefix
     KEY_PREFIX = "rate_limit:org"
 
+    # Lua script for atomic check-and-record of up to ARGV[3] requests
+    # Uses the Redis clock so all pods share one notion of "now"
+    # Returns: {granted, count_in_window, retry_after}; granted == 0 means over limit
+    LUA_ACQUIRE = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local window_seconds = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local member_prefix = ARGV[4]
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+-- Remove old entries outside sliding window
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window_seconds)
+
+local count = redis.call('ZCARD', key)
+local granted = math.min(requested, limit - count)
+
+if granted <= 0 then
+    -- Get oldest entry to calculate retry_after
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    local retry_after = window_seconds
+    if oldest and oldest[2] then
+        retry_after = math.max(0.1, tonumber(oldest[2]) + window_seconds - now)
+    end
+    -- Floats are truncated in replies, so return retry_after as a string
+    return {0, count, tostring(retry_after)}
+end
+
+for i = 1, granted do
+    redis.call('ZADD', key, now, member_prefix .. ':' .. i)
+end
+redis.call('EXPIRE', key, window_seconds * 2)
+
+return {granted, count + granted, '0'}
+"""
+    LUA_ACQUIRE_SHA = hashlib.sha1(LUA_ACQUIRE.encode()).hexdigest()
+
+    # Local leases (RATE_LIMIT_LOCAL_LEASE_ENABLED), per organization in this process
+    _leases: Dict[UUID, _Lease] = {}
+    _lease_locks: Dict[UUID, asyncio.Lock] = {}
+    _next_lease_sweep: float = 0.0
+
     @staticmethod
     async def _get_rate_limit(
         ctx: ApiContext,
@@ -94,14 +174,114 @@ class RateLimiter:
         """
         return f"{RateLimiter.KEY_PREFIX}:{organization_id}"
 
+    @staticmethod
+    async def _acquire(
+        organization_id: UUID, rate_limit: int, requested: int
+    ) -> Tuple[int, int, float]:
+        """Atomically admit up to `requested` requests in one Redis call.
+
+        Args:
+            organization_id: The organization ID
+            rate_limit: Requests allowed per window
+            requested: Requests to record (1, or a lease batch)
+
+        Returns:
+            (granted, requests in window after recording, retry_after if none granted)
+        """
+        redis_key = RateLimiter._get_redis_key(organization_id)
+        args = (rate_limit, RateLimiter.WINDOW_SIZE, requested, str(uuid4()))
+        try:
+            result = await redis_client.client.evalsha(
+                RateLimiter.LUA_ACQUIRE_SHA, 1, redis_key, *args
+            )
+        except NoScriptError:
+            # First call after a Redis restart/failover: load the script
+            result = await redis_client.client.eval(RateLimiter.LUA_ACQUIRE, 1, redis_key, *args)
+        return int(result[0]), int(result[1]), float(result[2])
+
+    @staticmethod
+    def _lease_size(rate_limit: int) -> int:
+        """Requests to lease per Redis call; never more than a tenth of the window."""
+        return min(settings.RATE_LIMIT_LEASE_SIZE, rate_limit // 10)
+
+    @staticmethod
+    def _evict_expired_leases(now: float) -> None:
+        """Drop expired leases and idle locks, at most once per lease TTL.
+
+        Without this both dicts would keep one entry per organization ever seen.
+        """
+        if now < RateLimiter._next_lease_sweep:
+            return
+        RateLimiter._next_lease_sweep = now + settings.RATE_LIMIT_LEASE_TTL_SECONDS
+
+        for organization_id, lease in list(RateLimiter._leases.items()):
+            if lease.expired(now):
+                del RateLimiter._leases[organization_id]
+        for organization_id, lock in list(RateLimiter._lease_locks.items()):
+            if organization_id not in RateLimiter._leases and not lock.locked():
+                del RateLimiter._lease_locks[organization_id]
+
+    @staticmethod
+    def _exceeded(ctx: ApiContext, rate_limit: int, retry_after: float) -> NoReturn:
+        """Log and raise the rate limit error."""
+        ctx.logger.warning(
+            f"Rate limit exceeded. {rate_limit}/{rate_limit} requests in window, "
+            f"retry after {retry_after:.2f}s"
+        )
+        raise RateLimitExceededException(
+            retry_after=retry_after,
+            limit=rate_limit,
+            remaining=0,
+        )
+
+    @staticmethod
+    async def _check_with_lease(ctx: ApiContext, rate_limit: int) -> RateLimitResult:
+        """Admit from this pod's lease, refilling it from Redis when it runs out."""
+        organization_id = ctx.organization.id
+        now = time.monotonic()
+
+        lease = RateLimiter._leases.get(organization_id)
+        if lease is not None and lease.denied_until > now:
+            RateLimiter._exceeded(ctx, rate_limit, lease.denied_until - now)
+
+        if lease is None or not lease.take(now):
+            lock = RateLimiter._lease_locks.setdefault(organization_id, asyncio.Lock())
+            async with lock:
+                # Another request may have refilled the lease while we waited
+                now = time.monotonic()
+                RateLimiter._evict_expired_leases(now)
+                lease = RateLimiter._leases.get(organization_id)
+                if lease is None or not lease.take(now):
+                    granted, count, retry_after = await RateLimiter._acquire(
+                        organization_id, rate_limit, RateLimiter._lease_size(rate_limit)
+                    )
+                    if granted == 0:
+                        RateLimiter._leases[organization_id] = _Lease(
+                            tokens=0, expires_at=now, remaining=0, denied_until=now + retry_after
+                        )
+                        RateLimiter._exceeded(ctx, rate_limit, retry_after)
+                    lease = _Lease(
+                        tokens=granted - 1,
+                        expires_at=now + settings.RATE_LIMIT_LEASE_TTL_SECONDS,
+                        remaining=max(0, rate_limit - count),
+                    )
+                    RateLimiter._leases[organization_id] = lease
+
+        return RateLimitResult(
+            allowed=True,
+            retry_after=0.0,
+            limit=rate_limit,
+            remaining=lease.remaining + lease.tokens,
+        )
+
     @staticmethod
     async def check_rate_limit(
         ctx: ApiContext,
     ) -> RateLimitResult:
         """Check if the request should be allowed based on rate limit.
 
-        Uses Redis ZSET with sliding window algorithm for accurate rate limiting
-        across distributed instances.
+        Uses a Redis ZSET sliding window, checked and recorded in one atomic Lua call,
+        for accurate rate limiting across distributed instances.
 
         Args:
             ctx: The API context
@@ -138,62 +318,25 @@ class RateLimiter:
                 remaining=9999,
             )
 
-        current_time = time.time()
-        window_start = current_time - RateLimiter.WINDOW_SIZE
-        redis_key = RateLimiter._get_redis_key(ctx.organization.id)
-
-        # Use Redis pipeline for atomic operations
-        pipe = redis_client.client.pipeline()
+        # Leasing is skipped for small limits, where one pod's batch is a large share
+        if settings.RATE_LIMIT_LOCAL_LEASE_ENABLED and RateLimiter._lease_size(rate_limit) > 1:
+            return await RateLimiter._check_with_lease(ctx, rate_limit)
 
-        # Remove old entries outside the sliding window
-        pipe.zremrangebyscore(redis_key, 0, window_start)
-
-        # Count current requests in window
-        pipe.zcount(redis_key, window_start, current_time)
-
-        # Execute pipeline
-        results = await pipe.execute()
-        current_count = results[1]  # Result from zcount
+        granted, current_count, retry_after = await RateLimiter._acquire(
+            ctx.organization.id, rate_limit, 1
+        )
+        if granted == 0:
+            RateLimiter._exceeded(ctx, rate_limit, retry_after)
 
-        # Calculate remaining requests
         remaining = max(0, rate_limit - current_count)
-
-        # Check if we're over the limit
-        if current_count >= rate_limit:
-            # Calculate when the oldest request will expire
-            oldest_entries = await redis_client.client.zrange(redis_key, 0, 0, withscores=True)
-
-            if oldest_entries:
-                oldest_timestamp = float(oldest_entries[0][1])
-                retry_after = max(0.1, (oldest_timestamp + RateLimiter.WINDOW_SIZE) - current_time)
-            else:
-                retry_after = RateLimiter.WINDOW_SIZE
-
-            ctx.logger.warning(
-                f"Rate limit exceeded. {current_count}/{rate_limit} requests in window, "
-                f"retry after {retry_after:.2f}s"
-            )
-
-            raise RateLimitExceededException(
-                retry_after=retry_after,
-                limit=rate_limit,
-                remaining=0,
-            )
-
-        # Add current request to the sliding window
-        await redis_client.client.zadd(redis_key, {str(current_time): current_time})
-
-        # Set expiration on the key to auto-cleanup
-        await redis_client.client.expire(redis_key, RateLimiter.WINDOW_SIZE * 2)
-
         ctx.logger.debug(
-            f"Rate limit check passed. {current_count + 1}/{rate_limit} requests in window, "
-            f"{remaining - 1} remaining"
+            f"Rate limit check passed. {current_count}/{rate_limit} requests in window, "
+            f"{remaining} remaining"
         )
 
         return RateLimitResult(
             allowed=True,
             retry_after=0.0,
             limit=rate_limit,
-            remaining=remaining - 1,
+            remaining=remaining,
         )
@@ -25,6 +25,7 @@ from airweave.core.temporal_service import temporal_service
 from airweave.crud import connection_init_session
 from airweave.db.unit_of_work import UnitOfWork
 from airweave.models.connection_init_session import ConnectionInitStatus
+from airweave.platform.access_control.cache import invalidate_principals
 from airweave.platform.auth.oauth2_service import oauth2_service
 from airweave.platform.auth.settings import integration_settings
 from airweave.platform.sources._base import BaseSource
@@ -367,6 +368,10 @@ class SourceConnectionService:
                 detail=f"Unsupported authentication method: {auth_method.value}",
             )
 
+        # Collections gaining an access-control source start filtering searches
+        if source.supports_access_control:
+            await invalidate_principals(ctx.organization.id)
+
         # Track analytics
         business_events.track_source_connection_created(
             ctx=ctx,
@@ -525,6 +530,7 @@ class SourceConnectionService:
         # Capture attributes upfront to avoid lazy-loading issues after session changes
         # (cancel_job and other operations may detach the object from the session)
         sync_id = source_conn.sync_id
+        short_name = source_conn.short_name
         collection = await crud.collection.get_by_readable_id(
             db, readable_id=source_conn.readable_collection_id, ctx=ctx
         )
@@ -562,6 +568,14 @@ class SourceConnectionService:
         # Delete the source connection
         await crud.source_connection.remove(db, id=id, ctx=ctx)
 
+        # Its memberships are gone (cascade): nestings through them must stop expanding
+        source = await crud.source.get_by_short_name(db, short_name=short_name)
+        if source and source.supports_access_control:
+            await crud.access_control_membership.rebuild_group_closure(
+                db, organization_id=ctx.organization.id
+            )
+            await invalidate_principals(ctx.organization.id)
+
         return response
 
     # Private creation handlers
@@ -9,6 +9,9 @@ from airweave import crud, schemas
 from airweave.api.context import ApiContext
 from airweave.core.logging import logger
 
+# Key of the mid-sync checkpoint stored next to the last completed sync's cursor data
+CHECKPOINT_KEY = "_checkpoint"
+
 
 class SyncCursorService:
     """Service for managing sync cursor operations."""
@@ -22,12 +25,14 @@ class SyncCursorService:
             ctx: API context
 
         Returns:
-            Cursor data dictionary, empty dict if no cursor exists
+            Cursor data dictionary (without any checkpoint), empty dict if no cursor exists
         """
         try:
             cursor = await crud.sync_cursor.get_by_sync_id(db, sync_id=sync_id, ctx=ctx)
             if cursor:
-                return cursor.cursor_data or {}
+                cursor_data = dict(cursor.cursor_data or {})
+                cursor_data.pop(CHECKPOINT_KEY, None)
+                return cursor_data
             return {}
         except Exception as e:
             logger.warning(f"Failed to load cursor data for sync {sync_id}: {e}")
@@ -94,6 +99,74 @@ class SyncCursorService:
             logger.error(f"Failed to create/update cursor for sync {sync_id}: {e}")
             return None
 
+    async def get_checkpoint(
+        self, db: AsyncSession, sync_id: UUID, sync_job_id: UUID, ctx: ApiContext
+    ) -> Optional[dict]:
+        """Get the mid-sync checkpoint saved by a sync job.
+
+        Args:
+            db: Database session
+            sync_id: The sync ID
+            sync_job_id: The sync job that saved the checkpoint
+            ctx: API context
+
+        Returns:
+            Checkpoint with cursor_data and position, None if the job saved none
+        """
+        try:
+            cursor = await crud.sync_cursor.get_by_sync_id(db, sync_id=sync_id, ctx=ctx)
+            checkpoint = (cursor.cursor_data or {}).get(CHECKPOINT_KEY) if cursor else None
+            if checkpoint and checkpoint.get("sync_job_id") == str(sync_job_id):
+                return checkpoint
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load checkpoint for sync {sync_id}: {e}")
+            return None
+
+    async def save_checkpoint(
+        self,
+        db: AsyncSession,
+        sync_id: UUID,
+        sync_job_id: UUID,
+        cursor_data: dict,
+        position: int,
+        ctx: ApiContext,
+    ) -> Optional[schemas.SyncCursor]:
+        """Save a mid-sync checkpoint, keeping the last completed sync's cursor data.
+
+        The checkpoint is dropped when the sync completes and overwrites the cursor.
+
+        Args:
+            db: Database session
+            sync_id: The sync ID
+            sync_job_id: The running sync job
+            cursor_data: Cursor data that is safe to resume from
+            position: Entities processed before that cursor
+            ctx: API context
+
+        Returns:
+            Updated sync cursor, None if operation failed
+        """
+        try:
+            cursor = await crud.sync_cursor.get_by_sync_id(db, sync_id=sync_id, ctx=ctx)
+            stored_data = dict(cursor.cursor_data or {}) if cursor else {}
+            stored_data[CHECKPOINT_KEY] = {
+                "sync_job_id": str(sync_job_id),
+                "cursor_data": cursor_data,
+                "position": position,
+            }
+            cursor_create = schemas.SyncCursorCreate(
+                sync_id=sync_id,
+                cursor_data=stored_data,
+                cursor_field=cursor.cursor_field if cursor else None,
+            )
+            return await crud.sync_cursor.create_or_update(
+                db=db, obj_in=cursor_create, sync_id=sync_id, ctx=ctx
+            )
+        except Exception as e:
+            logger.error(f"Failed to save checkpoint for sync {sync_id}: {e}")
+            return None
+
     async def update_cursor_data(
         self,
         db: AsyncSession,
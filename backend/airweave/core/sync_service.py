@@ -17,6 +17,7 @@ from airweave.models.sync import Sync
 from airweave.models.sync_job import SyncJob
 from airweave.platform.sync.config import SyncConfig
 from airweave.platform.sync.factory import SyncFactory
+from airweave.platform.sync.orchestrator import SyncOrchestrator
 from airweave.platform.temporal.schedule_service import temporal_schedule_service
 
 
@@ -102,8 +103,9 @@ class SyncService:
         access_token: Optional[str] = None,
         force_full_sync: bool = False,
         execution_config: Optional[SyncConfig] = None,
-    ) -> schemas.Sync:
-        """Run a sync.
+        partition: Optional[str] = None,
+    ) -> Optional[schemas.Sync]:
+        """Run a sync, or one partition of a partitioned sync.
 
         Args:
         ----
@@ -117,15 +119,103 @@ class SyncService:
             force_full_sync (bool): If True, forces a full sync with orphaned entity deletion.
             execution_config (Optional[SyncConfig]): Optional execution config
                 for controlling sync behavior (destination filtering, handler toggles, etc.)
+            partition (Optional[str]): Partition to sync; the sync job is then completed
+                by finalize_partitions() once every partition ran.
 
         Returns:
         -------
-            schemas.Sync: The sync.
+            Optional[schemas.Sync]: The sync (None for a partition).
+        """
+        orchestrator = await self._create_orchestrator(
+            sync,
+            sync_job,
+            collection,
+            source_connection,
+            ctx,
+            access_token,
+            force_full_sync,
+            execution_config,
+            partition=partition,
+        )
+
+        # Run the sync with the dedicated orchestrator instance
+        if partition is not None:
+            await orchestrator.run_partition(partition)
+            return None
+        return await orchestrator.run()
+
+    async def plan_partitions(
+        self,
+        sync: schemas.Sync,
+        sync_job: schemas.SyncJob,
+        collection: schemas.Collection,
+        source_connection: schemas.Connection,
+        ctx: ApiContext,
+        access_token: Optional[str] = None,
+        force_full_sync: bool = False,
+        execution_config: Optional[SyncConfig] = None,
+    ) -> List[str]:
+        """List the partitions of a sync's source (see platform/sync/partitions.py).
+
+        Returns:
+            Partition keys; fewer than two means the sync runs as a single activity
+        """
+        orchestrator = await self._create_orchestrator(
+            sync,
+            sync_job,
+            collection,
+            source_connection,
+            ctx,
+            access_token,
+            force_full_sync,
+            execution_config,
+        )
+        return await orchestrator.sync_context.source_instance.get_partitions()
+
+    async def finalize_partitions(
+        self,
+        sync: schemas.Sync,
+        sync_job: schemas.SyncJob,
+        collection: schemas.Collection,
+        source_connection: schemas.Connection,
+        ctx: ApiContext,
+        partitions: List[str],
+        access_token: Optional[str] = None,
+        force_full_sync: bool = False,
+        execution_config: Optional[SyncConfig] = None,
+    ) -> schemas.Sync:
+        """Complete a partitioned sync once every partition ran.
+
+        Merges the partition results, runs orphan cleanup and saves the merged cursor.
         """
+        orchestrator = await self._create_orchestrator(
+            sync,
+            sync_job,
+            collection,
+            source_connection,
+            ctx,
+            access_token,
+            force_full_sync,
+            execution_config,
+        )
+        return await orchestrator.finalize_partitions(partitions)
+
+    async def _create_orchestrator(
+        self,
+        sync: schemas.Sync,
+        sync_job: schemas.SyncJob,
+        collection: schemas.Collection,
+        source_connection: schemas.Connection,
+        ctx: ApiContext,
+        access_token: Optional[str],
+        force_full_sync: bool,
+        execution_config: Optional[SyncConfig],
+        partition: Optional[str] = None,
+    ) -> SyncOrchestrator:
+        """Create a dedicated orchestrator, failing the sync job if that fails."""
         try:
             async with get_db_context() as db:
-                # Create dedicated orchestrator instance
-                orchestrator = await SyncFactory.create_orchestrator(
+                return await SyncFactory.create_orchestrator(
                     db=db,
                     sync=sync,
                     sync_job=sync_job,
@@ -135,6 +225,7 @@ class SyncService:
                     access_token=access_token,
                     force_full_sync=force_full_sync,
                     execution_config=execution_config,
+                    partition=partition,
                 )
         except Exception as e:
             ctx.logger.error(f"Error during sync orchestrator creation: {e}")
@@ -148,9 +239,6 @@ class SyncService:
             )
             raise e
 
-        # Run the sync with the dedicated orchestrator instance
-        return await orchestrator.run()
-
     async def trigger_sync_run(
         self,
         db: AsyncSession,
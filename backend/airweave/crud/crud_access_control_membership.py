@@ -1,15 +1,48 @@
 """CRUD operations for access control memberships."""
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, text, union
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.crud._base_organization import CRUDBaseOrganization
+from airweave.models.access_control_group_closure import AccessControlGroupClosure
 from airweave.models.access_control_membership import AccessControlMembership
 from airweave.schemas.access_control import AccessControlMembershipCreate
 
+# Serializes closure rebuilds of one organization (held until the transaction ends)
+_LOCK_GROUP_CLOSURE_SQL = text(
+    "SELECT pg_advisory_xact_lock(hashtext('access_control_group_closure:' || :organization_id))"
+)
+
+# Transitive closure of an organization's group-to-group tuples, across all of its
+# source connections: a nesting synced by one source applies to groups of another.
+# UNION (not UNION ALL) deduplicates pairs, so cyclic group graphs terminate.
+_REBUILD_GROUP_CLOSURE_SQL = text(
+    """
+    WITH RECURSIVE edges AS (
+        SELECT DISTINCT member_id AS child, group_id AS parent
+        FROM access_control_membership
+        WHERE organization_id = :organization_id
+          AND member_type = 'group'
+    ),
+    closure (group_id, ancestor_group_id) AS (
+        SELECT child, parent FROM edges
+        UNION
+        SELECT c.group_id, e.parent
+        FROM closure c
+        JOIN edges e ON e.child = c.ancestor_group_id
+    )
+    INSERT INTO access_control_group_closure (
+        id, organization_id, group_id, ancestor_group_id, created_at, modified_at
+    )
+    SELECT gen_random_uuid(), :organization_id, group_id, ancestor_group_id, now(), now()
+    FROM closure
+    WHERE group_id <> ancestor_group_id
+    """
+)
+
 
 class CRUDAccessControlMembership(
     CRUDBaseOrganization[
@@ -82,6 +115,90 @@ class CRUDAccessControlMembership(
         result = await db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_expanded_group_ids(
+        self,
+        db: AsyncSession,
+        member_id: str,
+        member_type: str,
+        organization_id: UUID,
+        readable_collection_id: Optional[str] = None,
+    ) -> List[str]:
+        """Get a member's direct groups plus all their ancestor groups in one query.
+
+        Direct memberships are optionally scoped to a collection's source connections;
+        ancestors come from the materialized group closure (organization-wide).
+
+        Args:
+            db: Database session
+            member_id: Member identifier (email for users, ID for groups)
+            member_type: "user" or "group"
+            organization_id: Organization ID for multi-tenant isolation
+            readable_collection_id: Optional collection readable_id to scope direct
+                memberships to
+
+        Returns:
+            Distinct group IDs (direct + transitive)
+        """
+        direct_stmt = select(AccessControlMembership.group_id).where(
+            AccessControlMembership.organization_id == organization_id,
+            AccessControlMembership.member_id == member_id,
+            AccessControlMembership.member_type == member_type,
+        )
+        if readable_collection_id is not None:
+            from airweave.models.source_connection import SourceConnection
+
+            direct_stmt = direct_stmt.join(
+                SourceConnection,
+                AccessControlMembership.source_connection_id == SourceConnection.id,
+            ).where(SourceConnection.readable_collection_id == readable_collection_id)
+        direct = direct_stmt.cte("direct_groups")
+
+        ancestors = (
+            select(AccessControlGroupClosure.ancestor_group_id)
+            .join(direct, AccessControlGroupClosure.group_id == direct.c.group_id)
+            .where(AccessControlGroupClosure.organization_id == organization_id)
+        )
+        stmt = union(select(direct.c.group_id), ancestors)
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def rebuild_group_closure(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+    ) -> int:
+        """Recompute the group closure rows of an organization.
+
+        Replaces the organization's closure rows with the transitive closure of its
+        current group-to-group memberships (from all source connections), in one
+        transaction.
+
+        Args:
+            db: Database session
+            organization_id: Organization whose memberships changed
+
+        Returns:
+            Number of closure rows written
+        """
+        count = await self._replace_group_closure(db, organization_id)
+        await db.commit()
+
+        return count
+
+    async def _replace_group_closure(self, db: AsyncSession, organization_id: UUID) -> int:
+        """Delete and reinsert the organization's closure rows (without committing)."""
+        from sqlalchemy import delete
+
+        await db.execute(_LOCK_GROUP_CLOSURE_SQL, {"organization_id": str(organization_id)})
+        await db.execute(
+            delete(AccessControlGroupClosure).where(
+                AccessControlGroupClosure.organization_id == organization_id,
+            )
+        )
+        result = await db.execute(_REBUILD_GROUP_CLOSURE_SQL, {"organization_id": organization_id})
+
+        return result.rowcount
+
     async def bulk_create(
         self,
         db: AsyncSession,
@@ -205,9 +322,12 @@ class CRUDAccessControlMembership(
         source_connection_id: UUID,
         organization_id: UUID,
     ) -> int:
-        """Delete all memberships for a source connection.
+        """Delete all memberships for a source connection and rebuild the group closure.
 
-        Used when a source connection is deleted or for full ACL reset.
+        Used when a source connection is deleted or for full ACL reset. The
+        organization's closure is rebuilt in the same transaction, so nestings that
+        ran through the deleted memberships stop expanding. Callers invalidate the
+        organization's cached principals afterwards (invalidate_principals).
 
         Args:
             db: Database session
@@ -224,8 +344,8 @@ class CRUDAccessControlMembership(
             AccessControlMembership.source_connection_id == source_connection_id,
         )
         result = await db.execute(stmt)
+        await self._replace_group_closure(db, organization_id)
         await db.commit()
-
         return result.rowcount
 
 
@@ -1,20 +1,56 @@
 """CRUD operations for entities."""
 
+import json
 from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select, update
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    String,
+    Text,
+    bindparam,
+    func,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.api.context import ApiContext
+from airweave.core.config import settings
 from airweave.core.exceptions import NotFoundException
 from airweave.crud._base_organization import CRUDBaseOrganization
 from airweave.db.unit_of_work import UnitOfWork
 from airweave.models.entity import Entity
 from airweave.schemas.entity import EntityCreate, EntityUpdate
 
+# Set-based hash update: one statement per chunk, rows supplied as parallel arrays.
+# chunk_hashes is only overwritten for rows flagged in set_chunk_hashes.
+_BULK_UPDATE_HASH_STMT = text(
+    """
+    UPDATE entity AS e
+    SET hash = v.hash,
+        chunk_hashes = CASE
+            WHEN v.set_chunk_hashes THEN CAST(v.chunk_hashes AS JSON)
+            ELSE e.chunk_hashes
+        END,
+        modified_at = :modified_at
+    FROM unnest(:ids, :hashes, :chunk_hashes, :set_chunk_hashes)
+        AS v(id, hash, chunk_hashes, set_chunk_hashes)
+    WHERE e.id = v.id
+    """
+).bindparams(
+    bindparam("ids", type_=ARRAY(PG_UUID(as_uuid=True))),
+    bindparam("hashes", type_=ARRAY(String)),
+    bindparam("chunk_hashes", type_=ARRAY(Text)),
+    bindparam("set_chunk_hashes", type_=ARRAY(Boolean)),
+    bindparam("modified_at", type_=DateTime()),
+)
+
 
 class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
     """CRUD operations for entities."""
@@ -206,6 +242,7 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         *,
         objs: list[EntityCreate],
         ctx: ApiContext,
+        rows_per_statement: Optional[int] = None,
     ) -> list[Entity]:
         """Create many Entity rows in a single transaction with conflict resolution.
 
@@ -214,7 +251,69 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
 
         Ensures organization_id is set from the provided context.
         Caller controls commit via the session context.
+
+        Returned rows are hydrated into ORM objects and added to the session; callers that
+        only need the row count should use bulk_upsert instead.
+
+        Args:
+            db: The async database session.
+            objs: Entities to upsert.
+            ctx: API context (provides the organization).
+            rows_per_statement: Rows per INSERT statement
+                (defaults to settings.ENTITY_UPSERT_ROWS_PER_STATEMENT).
         """
+        entities: list[Entity] = []
+        for values_chunk in self._prepare_upsert_values(objs, ctx, rows_per_statement):
+            stmt = self._build_upsert(values_chunk).returning(Entity)
+            result = await db.execute(stmt)
+            entities.extend(result.scalars().all())
+
+        if not entities:
+            return []
+
+        # Ensure the session knows about these entities
+        for entity in entities:
+            db.add(entity)
+
+        await db.flush()
+        return entities
+
+    async def bulk_upsert(
+        self,
+        db: AsyncSession,
+        *,
+        objs: list[EntityCreate],
+        ctx: ApiContext,
+        rows_per_statement: Optional[int] = None,
+    ) -> int:
+        """Upsert many Entity rows without RETURNING or ORM hydration.
+
+        Same conflict resolution as bulk_create, sent as chunked multi-row INSERTs.
+        Caller controls commit via the session context.
+
+        Args:
+            db: The async database session.
+            objs: Entities to upsert.
+            ctx: API context (provides the organization).
+            rows_per_statement: Rows per INSERT statement
+                (defaults to settings.ENTITY_UPSERT_ROWS_PER_STATEMENT).
+
+        Returns:
+            Number of rows inserted or updated.
+        """
+        count = 0
+        for values_chunk in self._prepare_upsert_values(objs, ctx, rows_per_statement):
+            result = await db.execute(self._build_upsert(values_chunk))
+            count += result.rowcount
+        return count
+
+    def _prepare_upsert_values(
+        self,
+        objs: list[EntityCreate],
+        ctx: ApiContext,
+        rows_per_statement: Optional[int],
+    ) -> list[list[dict]]:
+        """Validate objs and split their column values into per-statement chunks."""
         if not objs:
             return []
 
@@ -234,66 +333,82 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
             raise ValueError("ApiContext must contain valid organization information")
 
         # Prepare data for bulk upsert
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
         values_list = []
         for o in objs:
             data = o.model_dump()
             data["organization_id"] = org_id
             # Ensure we have timestamps
-            if "created_at" not in data:
-                data["created_at"] = datetime.now(timezone.utc).replace(tzinfo=None)
-            if "modified_at" not in data:
-                data["modified_at"] = datetime.now(timezone.utc).replace(tzinfo=None)
+            data.setdefault("created_at", now)
+            data.setdefault("modified_at", now)
             values_list.append(data)
 
+        chunk_size = rows_per_statement or settings.ENTITY_UPSERT_ROWS_PER_STATEMENT
+        return [values_list[i : i + chunk_size] for i in range(0, len(values_list), chunk_size)]
+
+    def _build_upsert(self, values_list: list[dict]):
+        """Build INSERT ... ON CONFLICT DO UPDATE for a chunk of rows."""
         # Use PostgreSQL's INSERT ... ON CONFLICT DO UPDATE
         # This handles the unique constraint on (sync_id, entity_id, entity_definition_id)
         stmt = insert(Entity).values(values_list)
 
         # On conflict, update the existing row with the new data
         # This ensures we always have the latest sync_job_id and hash
-        stmt = stmt.on_conflict_do_update(
+        return stmt.on_conflict_do_update(
             index_elements=["sync_id", "entity_id", "entity_definition_id"],
             set_={
                 "sync_job_id": stmt.excluded.sync_job_id,
                 "hash": stmt.excluded.hash,
+                "chunk_hashes": stmt.excluded.chunk_hashes,
                 "modified_at": stmt.excluded.modified_at,
                 # Keep the original organization_id to prevent cross-org updates
                 # organization_id is not updated on conflict
             },
-        ).returning(Entity)
-
-        # Execute the upsert and get all affected rows
-        result = await db.execute(stmt)
-        entities = list(result.scalars().all())
-
-        # Ensure the session knows about these entities
-        for entity in entities:
-            db.add(entity)
-
-        await db.flush()
-        return entities
+        )
 
     async def bulk_update_hash(
         self,
         db: AsyncSession,
         *,
         rows: list[tuple[UUID, str]],
+        chunk_hashes: Optional[dict[UUID, Optional[list[str]]]] = None,
+        rows_per_statement: Optional[int] = None,
     ) -> None:
         """Bulk update the 'hash' field for many entities.
 
+        Sends one set-based UPDATE ... FROM unnest(...) per chunk of rows instead of one
+        UPDATE per row.
+
         Args:
             db: The async database session.
             rows: list of tuples (entity_db_id, new_hash)
+            chunk_hashes: Optional mapping entity_db_id -> new per-chunk hashes.
+                Rows present in the mapping also get their chunk_hashes replaced.
+            rows_per_statement: Rows per UPDATE statement
+                (defaults to settings.ENTITY_UPSERT_ROWS_PER_STATEMENT).
         """
         if not rows:
             return
-        for entity_db_id, new_hash in rows:
-            stmt = (
-                update(Entity)
-                .where(Entity.id == entity_db_id)
-                .values(hash=new_hash, modified_at=datetime.now(timezone.utc).replace(tzinfo=None))
+        chunk_hashes = chunk_hashes or {}
+        modified_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        chunk_size = rows_per_statement or settings.ENTITY_UPSERT_ROWS_PER_STATEMENT
+
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            ids = [entity_db_id for entity_db_id, _ in chunk]
+            await db.execute(
+                _BULK_UPDATE_HASH_STMT,
+                {
+                    "ids": ids,
+                    "hashes": [new_hash for _, new_hash in chunk],
+                    "chunk_hashes": [
+                        json.dumps(chunk_hashes[i]) if chunk_hashes.get(i) is not None else None
+                        for i in ids
+                    ],
+                    "set_chunk_hashes": [i in chunk_hashes for i in ids],
+                    "modified_at": modified_at,
+                },
             )
-            await db.execute(stmt)
 
     async def update_job_id(
         self,
@@ -363,6 +478,41 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         result = await db.execute(stmt)
         return list(result.unique().scalars().all())
 
+    async def get_keys_page_by_sync(
+        self,
+        db: AsyncSession,
+        *,
+        sync_id: UUID,
+        after: Optional[tuple[str, UUID]] = None,
+        limit: int = 10_000,
+    ) -> list[tuple[str, UUID]]:
+        """Get one page of the (entity_id, entity_definition_id) keys stored for a sync.
+
+        Keyset pagination in the order of the (sync_id, entity_id, entity_definition_id)
+        unique index: pass the last key of a page as after to get the next one. Every
+        page is a short, independent query, so callers can do slow work between pages
+        without keeping a transaction or cursor open.
+
+        Args:
+            db: Database session
+            sync_id: The sync whose stored entities are listed
+            after: Last key of the previous page (None for the first page)
+            limit: Maximum keys per page
+
+        Returns:
+            Keys ordered by (entity_id, entity_definition_id)
+        """
+        stmt = select(Entity.entity_id, Entity.entity_definition_id).where(
+            Entity.sync_id == sync_id
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(Entity.entity_id, Entity.entity_definition_id) > tuple_(*after)
+            )
+        stmt = stmt.order_by(Entity.entity_id, Entity.entity_definition_id).limit(limit)
+        result = await db.execute(stmt)
+        return [(row.entity_id, row.entity_definition_id) for row in result]
+
     async def get_latest_entity_time_for_job(
         self,
         db: AsyncSession,
@@ -1,9 +1,9 @@
 """CRUD operations for search query models."""
 
-from typing import List
+from typing import Any, Dict, List
 from uuid import UUID
 
-from sqlalchemy import and_, desc, select
+from sqlalchemy import and_, desc, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.api.context import ApiContext
@@ -55,6 +55,21 @@ class CRUDSearchQuery(CRUDBaseOrganization[SearchQuery, SearchQueryCreate, Searc
         result = await db.execute(query)
         return list(result.unique().scalars().all())
 
+    async def create_many(self, db: AsyncSession, *, rows: List[Dict[str, Any]]) -> None:
+        """Insert pre-built search query rows in a single multi-row INSERT.
+
+        Rows are full column dicts (organization, tracking and timestamps included),
+        already scoped by the caller; see SearchQueryWriter.
+
+        Args:
+            db: Database session
+            rows: Column values, one dict per search query
+        """
+        if not rows:
+            return
+        await db.execute(insert(SearchQuery), rows)
+        await db.commit()
+
 
 # Create singleton instance
 search_query = CRUDSearchQuery(SearchQuery)
@@ -12,6 +12,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import HTMLResponse
+from prometheus_client import start_http_server
 from pydantic import ValidationError
 
 from airweave.api.middleware import (
@@ -45,10 +46,13 @@ from airweave.core.exceptions import (
     RateLimitExceededException,
     UsageLimitExceededException,
 )
+from airweave.core.local_cache import close_local_caches
 from airweave.core.logging import logger
 from airweave.db.init_db import init_db
 from airweave.db.session import AsyncSessionLocal
 from airweave.platform.db_sync import sync_platform_components
+from airweave.search.clients import search_clients
+from airweave.search.write_behind import search_query_writer
 
 
 @asynccontextmanager
@@ -56,6 +60,8 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events.
 
     Initializes the DI container, runs alembic migrations, and syncs platform components.
+    On shutdown, drains the search query writer, closes the pooled search clients and
+    stops the internal metrics server.
     """
     # Initialize the dependency injection container (fail fast if wiring is broken)
     from airweave.core.container import initialize_container
@@ -107,8 +113,34 @@ async def lifespan(app: FastAPI):
                 f"(Temporal may not be available): {e}"
             )
 
+    # Serve Prometheus metrics (e.g. principal cache hit ratio) on an internal port only
+    metrics_server = None
+    if settings.API_METRICS_PORT:
+        try:
+            metrics_server, _ = start_http_server(settings.API_METRICS_PORT)
+        except OSError as e:
+            logger.warning(f"Failed to start metrics server on {settings.API_METRICS_PORT}: {e}")
+
+    # Health-check and evict pooled search clients in the background
+    search_clients.start()
+
+    # Write search_query rows and search analytics behind the request path
+    search_query_writer.start()
+
     yield
 
+    # Flush search_query rows still queued
+    await search_query_writer.aclose()
+
+    # Close pooled search clients (Qdrant/Vespa/LLM connections) on shutdown
+    await search_clients.aclose()
+
+    # Stop listening for cache invalidations (principal and search plan caches)
+    await close_local_caches()
+
+    if metrics_server is not None:
+        metrics_server.shutdown()
+
 
 # Create FastAPI app with our custom router and disable FastAPI's built-in redirects
 app = FastAPI(
@@ -1,5 +1,6 @@
 """Models for the application."""
 
+from .access_control_group_closure import AccessControlGroupClosure
 from .access_control_membership import AccessControlMembership
 from .api_key import APIKey
 from .auth_provider import AuthProvider
@@ -33,6 +34,7 @@ from .user import User
 from .user_organization import UserOrganization
 
 __all__ = [
+    "AccessControlGroupClosure",
     "AccessControlMembership",
     "APIKey",
     "AuthProvider",
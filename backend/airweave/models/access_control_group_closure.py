@@ -0,0 +1,40 @@
+"""Access control group closure model."""
+
+from sqlalchemy import Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from airweave.models._base import OrganizationBase
+
+
+class AccessControlGroupClosure(OrganizationBase):
+    """Transitive closure of group-to-group memberships (derived, not source data).
+
+    One row per (group_id, ancestor_group_id) pair reachable through the
+    group-to-group tuples of an organization, across all its source connections
+    (group expansion is organization-wide), e.g. for
+    ("group-frontend", "group", "group-engineering") and
+    ("group-engineering", "group", "group-all"):
+
+    - ("group-frontend", "group-engineering")
+    - ("group-frontend", "group-all")
+    - ("group-engineering", "group-all")
+
+    Rebuilt from access_control_membership at the end of each membership sync and
+    whenever memberships are deleted with their source connection or collection, so
+    search-time expansion is a single indexed join instead of a query per group.
+    """
+
+    __tablename__ = "access_control_group_closure"
+
+    group_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    ancestor_group_id: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    __table_args__ = (
+        # Expansion lookup: ancestors of a group (index-only scan)
+        Index(
+            "idx_acl_closure_group",
+            "organization_id",
+            "group_id",
+            "ancestor_group_id",
+        ),
+    )
@@ -1,9 +1,9 @@
 """Entity model."""
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy import JSON, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from airweave.models._base import OrganizationBase
@@ -41,6 +41,11 @@ class Entity(OrganizationBase):
         comment="Entity definition this entity belongs to",
     )
     hash: Mapped[str] = mapped_column(String, nullable=False)
+    chunk_hashes: Mapped[Optional[List[str]]] = mapped_column(
+        JSON,
+        nullable=True,
+        comment="Per-chunk text hashes ordered by chunk index (for chunk-diff updates)",
+    )
 
     # Add back references
     sync_job: Mapped["SyncJob"] = relationship(
@@ -1,6 +1,6 @@
 """Access broker for resolving user access context."""
 
-from typing import List, Optional, Set
+from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -27,13 +27,13 @@ class AccessBroker:
         """Resolve user's access context by expanding group memberships.
 
         Steps:
-        1. Query database for user's direct group memberships
-        2. Recursively expand group-to-group relationships (if any)
-        3. Build AccessContext with user + all expanded group principals
+        1. Query database for user's direct group memberships plus their ancestor
+           groups from the materialized group closure (one query)
+        2. Build AccessContext with user + all expanded group principals
 
         Note: SharePoint uses /transitivemembers so group expansion happens
-        server-side. Other sources may store group-group tuples that need
-        recursive expansion here.
+        server-side. Other sources may store group-group tuples; their transitive
+        closure is maintained by AccessControlPipeline after each membership sync.
 
         Args:
             db: Database session
@@ -43,24 +43,13 @@ class AccessBroker:
         Returns:
             AccessContext with fully expanded principals
         """
-        # Query direct user-group memberships (member_type="user")
-        memberships = await crud.access_control_membership.get_by_member(
+        all_groups = await crud.access_control_membership.get_expanded_group_ids(
             db=db, member_id=user_principal, member_type="user", organization_id=organization_id
         )
 
-        # Build principals
-        user_principals = [f"user:{user_principal}"]
-
-        # Recursively expand group-to-group relationships (if any exist)
-        # For SharePoint: no group-group tuples exist (uses /transitivemembers)
-        # For other sources: this handles nested group expansion
-        all_groups = await self._expand_group_memberships(
-            db=db, group_ids=[m.group_id for m in memberships], organization_id=organization_id
-        )
-
         return AccessContext(
             user_principal=user_principal,
-            user_principals=user_principals,
+            user_principals=[f"user:{user_principal}"],
             group_principals=[f"group:{g}" for g in all_groups],
         )
 
@@ -83,9 +72,9 @@ class AccessBroker:
         Steps:
         1. Check if collection has any sources with access control
         2. If no AC sources, return None (no filtering needed)
-        3. Query database for user's group memberships within the collection
-        4. Recursively expand group-to-group relationships (if any)
-        5. Build AccessContext with user + all expanded group principals
+        3. Query database for user's group memberships within the collection plus
+           their ancestor groups from the materialized group closure (one query)
+        4. Build AccessContext with user + all expanded group principals
 
         Args:
             db: Database session
@@ -108,27 +97,19 @@ class AccessBroker:
             # No access control sources in collection → skip filtering
             return None
 
-        # Query user-group memberships scoped to collection (member_type="user")
-        memberships = await crud.access_control_membership.get_by_member_and_collection(
+        # Direct memberships are scoped to the collection; group expansion is
+        # still organization-wide, not collection-scoped
+        all_groups = await crud.access_control_membership.get_expanded_group_ids(
             db=db,
             member_id=user_principal,
             member_type="user",
-            readable_collection_id=readable_collection_id,
             organization_id=organization_id,
-        )
-
-        # Build principals
-        user_principals = [f"user:{user_principal}"]
-
-        # Recursively expand group-to-group relationships (if any exist)
-        # Note: Group expansion is still organization-wide, not collection-scoped
-        all_groups = await self._expand_group_memberships(
-            db=db, group_ids=[m.group_id for m in memberships], organization_id=organization_id
+            readable_collection_id=readable_collection_id,
         )
 
         return AccessContext(
             user_principal=user_principal,
-            user_principals=user_principals,
+            user_principals=[f"user:{user_principal}"],
             group_principals=[f"group:{g}" for g in all_groups],
         )
 
@@ -175,52 +156,6 @@ class AccessBroker:
         result = await db.execute(stmt)
         return result.scalar() or False
 
-    async def _expand_group_memberships(
-        self, db: AsyncSession, group_ids: List[str], organization_id: UUID
-    ) -> Set[str]:
-        """Recursively expand group memberships to handle nested groups.
-
-        For sources that store group-to-group relationships (e.g., Google Drive),
-        this recursively expands nested groups via CRUD layer. For SharePoint,
-        /transitivemembers handles this server-side, so no group-group tuples exist.
-
-        Args:
-            db: Database session
-            group_ids: List of initial group IDs
-            organization_id: Organization ID
-
-        Returns:
-            Set of all group IDs (direct + transitive)
-        """
-        all_groups = set(group_ids)
-        to_process = set(group_ids)
-        visited = set()
-
-        # Recursively expand (max depth: 10 to prevent infinite loops)
-        max_depth = 10
-        depth = 0
-
-        while to_process and depth < max_depth:
-            current_group = to_process.pop()
-            if current_group in visited:
-                continue
-            visited.add(current_group)
-
-            # Query for group-to-group memberships via CRUD layer (member_type="group")
-            nested_memberships = await crud.access_control_membership.get_by_member(
-                db=db, member_id=current_group, member_type="group", organization_id=organization_id
-            )
-
-            # Add parent groups and queue for processing
-            for m in nested_memberships:
-                if m.group_id not in all_groups:
-                    all_groups.add(m.group_id)
-                    to_process.add(m.group_id)
-
-            depth += 1
-
-        return all_groups
-
     def check_entity_access(
         self, entity_access: Optional[AccessControl], access_context: Optional[AccessContext]
     ) -> bool:
@@ -0,0 +1,276 @@
+"""Principal cache for access-controlled search.
+
+Resolving a user's principals for a collection costs several queries (AC-source
+check, direct memberships, group closure) on every search. PrincipalCache keeps the
+result, keyed by (organization, collection readable_id, user principal), in two layers:
+
+- an in-process LRU with a short TTL (a LocalCache, no network round trip)
+- a Redis layer shared across pods with a longer TTL
+
+Invalidation is per organization, because group expansion is organization-wide.
+invalidate_principals runs when AccessControlPipeline finishes writing memberships,
+when memberships of a source connection are deleted, and when an access-control
+source is added to or removed from a collection. It
+- increments the organization's generation in Redis - Redis entries carry the
+  generation they were resolved under and are ignored once it moves on
+- publishes an event on the "access_control" pubsub namespace - every pod listening
+  drops its local LRU entries for the organization
+
+Each pod also keeps a local generation per organization, so a resolution that was
+in flight while an invalidation arrived is not stored in the LRU. If the pubsub
+listener is unavailable, local entries are still bounded by their TTL.
+Cache failures never fail a search - a broken layer is logged and treated as a miss.
+
+Hit ratio and resolution latency are exported as Prometheus metrics:
+- airweave_access_principal_cache_requests_total{result="memory_hit|redis_hit|miss"}
+- airweave_access_principal_resolution_seconds{source="memory|redis|database"}
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave.core.config import settings
+from airweave.core.local_cache import LocalCache
+from airweave.core.logging import logger as default_logger
+from airweave.platform.access_control.broker import access_broker
+from airweave.platform.access_control.schemas import AccessContext
+
+principal_cache_requests = Counter(
+    "airweave_access_principal_cache_requests_total",
+    "Principal cache lookups by outcome",
+    ["result"],
+)
+
+principal_resolution_seconds = Histogram(
+    "airweave_access_principal_resolution_seconds",
+    "Time to resolve a user's access principals, by where they came from",
+    ["source"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+
+@dataclass
+class CachedPrincipals:
+    """Serializable result of one resolution (None context = no AC sources)."""
+
+    has_access_control: bool
+    group_ids: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_context(cls, access_context: Optional[AccessContext]) -> "CachedPrincipals":
+        """Build from AccessBroker's result."""
+        if access_context is None:
+            return cls(has_access_control=False)
+        group_ids = tuple(p.split(":", 1)[1] for p in access_context.group_principals)
+        return cls(has_access_control=True, group_ids=group_ids)
+
+    def to_context(self, user_principal: str) -> Optional[AccessContext]:
+        """Rebuild the AccessContext AccessBroker would have returned."""
+        if not self.has_access_control:
+            return None
+        return AccessContext(
+            user_principal=user_principal,
+            user_principals=[f"user:{user_principal}"],
+            group_principals=[f"group:{g}" for g in self.group_ids],
+        )
+
+    def encode(self, generation: int) -> str:
+        """Serialize for Redis, tagged with the organization generation."""
+        return json.dumps(
+            {"gen": generation, "ac": self.has_access_control, "groups": list(self.group_ids)},
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def decode(cls, payload: str) -> Tuple[int, "CachedPrincipals"]:
+        """Deserialize a Redis payload into (generation, principals)."""
+        data = json.loads(payload)
+        return data["gen"], cls(has_access_control=data["ac"], group_ids=tuple(data["groups"]))
+
+
+class PrincipalCache:
+    """Two-layer cache in front of AccessBroker.resolve_access_context_for_collection."""
+
+    KEY_PREFIX = "access_principals"
+    INVALIDATION_NAMESPACE = "access_control"
+
+    def __init__(
+        self,
+        max_entries: int,
+        memory_ttl_seconds: float,
+        redis_ttl_seconds: int,
+        use_redis: bool = True,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum entries in the in-process LRU
+            memory_ttl_seconds: Time-to-live of in-process entries
+            redis_ttl_seconds: Time-to-live of Redis entries
+            use_redis: Whether to use the shared Redis layer and pubsub invalidation
+        """
+        self._redis_ttl = redis_ttl_seconds
+        self._use_redis = use_redis
+        self._memory: LocalCache[Tuple[str, str, str], CachedPrincipals] = LocalCache(
+            "PrincipalCache",
+            max_entries=max_entries,
+            ttl_seconds=memory_ttl_seconds,
+            invalidation_namespace=self.INVALIDATION_NAMESPACE if use_redis else None,
+            on_invalidation=lambda data: self._drop_local(data["organization_id"]),
+        )
+        self._local_generations: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of in-process entries."""
+        return len(self._memory)
+
+    async def resolve(
+        self,
+        db: AsyncSession,
+        user_principal: str,
+        readable_collection_id: str,
+        organization_id: UUID,
+    ) -> Optional[AccessContext]:
+        """Resolve a user's access context for a collection, using the cache.
+
+        Same contract as AccessBroker.resolve_access_context_for_collection.
+        """
+        start = time.perf_counter()
+        key = (str(organization_id), readable_collection_id, user_principal)
+
+        cached = self._memory.get(key)
+        if cached is not None:
+            self._record("memory_hit", "memory", start)
+            return cached.to_context(user_principal)
+
+        # Results are only stored locally if no invalidation arrived while resolving
+        local_generation = self._local_generations.get(key[0], 0)
+        generation = 0
+        if self._use_redis:
+            generation, cached = await self._redis_get(key)
+            if cached is not None:
+                self._memory_set(key, cached, local_generation)
+                self._record("redis_hit", "redis", start)
+                return cached.to_context(user_principal)
+
+        # The generation was read before resolving, so an invalidation that lands
+        # while we query the database makes this entry stale instead of current.
+        access_context = await access_broker.resolve_access_context_for_collection(
+            db=db,
+            user_principal=user_principal,
+            readable_collection_id=readable_collection_id,
+            organization_id=organization_id,
+        )
+        resolved = CachedPrincipals.from_context(access_context)
+        self._memory_set(key, resolved, local_generation)
+        if self._use_redis:
+            await self._redis_set(key, resolved, generation)
+        self._record("miss", "database", start)
+        return access_context
+
+    async def invalidate_organization(self, organization_id: UUID) -> None:
+        """Invalidate every cached resolution of an organization, on all pods."""
+        self._drop_local(str(organization_id))
+        if not self._use_redis:
+            return
+
+        from airweave.core.redis_client import redis_client
+
+        try:
+            await redis_client.client.incr(self._generation_key(str(organization_id)))
+        except Exception as e:
+            default_logger.warning(f"[PrincipalCache] Invalidation failed: {e}")
+        await self._memory.broadcast({"organization_id": str(organization_id)})
+
+    # -------------------------------------------------------------------------
+    # In-process layer
+    # -------------------------------------------------------------------------
+
+    def _memory_set(
+        self, key: Tuple[str, str, str], cached: CachedPrincipals, local_generation: int
+    ) -> None:
+        if self._local_generations.get(key[0], 0) != local_generation:
+            return
+        self._memory.set(key, cached)
+
+    def _drop_local(self, organization_id: str) -> None:
+        self._local_generations[organization_id] = (
+            self._local_generations.get(organization_id, 0) + 1
+        )
+        self._memory.drop_where(lambda key: key[0] == organization_id)
+
+    # -------------------------------------------------------------------------
+    # Redis layer
+    # -------------------------------------------------------------------------
+
+    def _generation_key(self, organization_id: str) -> str:
+        return f"{self.KEY_PREFIX}:gen:{organization_id}"
+
+    def _entry_key(self, key: Tuple[str, str, str]) -> str:
+        organization_id, readable_collection_id, user_principal = key
+        return f"{self.KEY_PREFIX}:{organization_id}:{readable_collection_id}:{user_principal}"
+
+    async def _redis_get(self, key: Tuple[str, str, str]) -> Tuple[int, Optional[CachedPrincipals]]:
+        """Fetch the organization generation and the entry in one MGET."""
+        from airweave.core.redis_client import redis_client
+
+        try:
+            generation, payload = await redis_client.client.mget(
+                [self._generation_key(key[0]), self._entry_key(key)]
+            )
+            generation = int(generation or 0)
+            if payload is None:
+                return generation, None
+            entry_generation, cached = CachedPrincipals.decode(payload)
+            return generation, cached if entry_generation == generation else None
+        except Exception as e:
+            default_logger.warning(f"[PrincipalCache] redis lookup failed: {e}")
+            return 0, None
+
+    async def _redis_set(
+        self, key: Tuple[str, str, str], cached: CachedPrincipals, generation: int
+    ) -> None:
+        from airweave.core.redis_client import redis_client
+
+        try:
+            await redis_client.client.setex(
+                self._entry_key(key), self._redis_ttl, cached.encode(generation)
+            )
+        except Exception as e:
+            default_logger.warning(f"[PrincipalCache] redis write failed: {e}")
+
+    @staticmethod
+    def _record(result: str, source: str, start: float) -> None:
+        principal_cache_requests.labels(result=result).inc()
+        principal_resolution_seconds.labels(source=source).observe(time.perf_counter() - start)
+
+
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> Optional[PrincipalCache]:
+    """Get the pod-wide principal cache, or None when disabled in settings."""
+    global _principal_cache
+    if not settings.PRINCIPAL_CACHE_ENABLED:
+        return None
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache(
+            max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+            memory_ttl_seconds=settings.PRINCIPAL_CACHE_MEMORY_TTL_SECONDS,
+            redis_ttl_seconds=settings.PRINCIPAL_CACHE_REDIS_TTL_SECONDS,
+            use_redis=settings.PRINCIPAL_CACHE_BACKEND == "redis",
+        )
+    return _principal_cache
+
+
+async def invalidate_principals(organization_id: UUID) -> None:
+    """Invalidate an organization's cached principals, if the cache is enabled."""
+    principal_cache = get_principal_cache()
+    if principal_cache is not None:
+        await principal_cache.invalidate_organization(organization_id)
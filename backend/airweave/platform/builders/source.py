@@ -23,6 +23,7 @@ from airweave.platform.contexts.infra import InfraContext
 from airweave.platform.contexts.source import SourceContext
 from airweave.platform.locator import resource_locator
 from airweave.platform.sources._base import BaseSource
+from airweave.platform.sync.checkpoint import checkpoint_resume_enabled
 from airweave.platform.sync.config import SyncConfig
 from airweave.platform.sync.cursor import SyncCursor
 from airweave.platform.sync.token_manager import TokenManager
@@ -89,6 +90,7 @@ class SourceContextBuilder:
         cursor = await cls._create_cursor(
             db=db,
             sync=sync,
+            sync_job=sync_job,
             source_class=source_connection_data["source_class"],
             ctx=ctx,
             logger=logger,
@@ -479,6 +481,7 @@ class SourceContextBuilder:
         cls,
         db: AsyncSession,
         sync: schemas.Sync,
+        sync_job: schemas.SyncJob,
         source_class: type,
         ctx: ApiContext,
         logger: ContextualLogger,
@@ -492,6 +495,25 @@ class SourceContextBuilder:
             cursor_schema = source_class._cursor_class
             logger.debug(f"Source has typed cursor: {cursor_schema.__name__}")
 
+        # Retried activity: resume from this job's own checkpoint. It was taken with the
+        # same skip_load behavior, so it applies in every mode below (forced full syncs
+        # never resume, see checkpoint_resume_enabled).
+        if checkpoint_resume_enabled(force_full_sync):
+            checkpoint = await sync_cursor_service.get_checkpoint(
+                db=db, sync_id=sync.id, sync_job_id=sync_job.id, ctx=ctx
+            )
+            if checkpoint:
+                logger.info(
+                    f"♻️ RESUMING sync job from checkpoint: {checkpoint['position']} entities "
+                    "were processed before the previous attempt stopped"
+                )
+                return SyncCursor(
+                    sync_id=sync.id,
+                    cursor_schema=cursor_schema,
+                    cursor_data=checkpoint["cursor_data"],
+                    resumed_from_checkpoint=True,
+                )
+
         # Determine whether to load cursor data
         if force_full_sync:
             logger.info(
@@ -54,11 +54,15 @@ class BaseChunker(ABC):
     """
 
     @abstractmethod
-    async def chunk_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+    async def chunk_batch(
+        self, texts: List[str], use_process_pool: bool = False
+    ) -> List[List[Dict[str, Any]]]:
         """Chunk a batch of texts asynchronously.
 
         Args:
             texts: List of textual representations to chunk
+            use_process_pool: Run CPU-bound work in the sync process pool instead of
+                the shared thread pool
 
         Returns:
             List of chunk lists, where each chunk dict contains:
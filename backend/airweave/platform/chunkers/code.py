@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional
 from airweave.core.logging import logger
 from airweave.platform.chunkers._base import BaseChunker
 from airweave.platform.chunkers.tiktoken_compat import SafeEncoding
-from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.sync.async_helpers import run_in_process_pool, run_in_thread_pool
 from airweave.platform.sync.exceptions import SyncFailureError
 from airweave.platform.tokenizers import TikTokenTokenizer, get_tokenizer
 
@@ -106,17 +106,21 @@ class CodeChunker(BaseChunker):
         except Exception as e:
             raise SyncFailureError(f"Failed to initialize CodeChunker: {e}")
 
-    async def chunk_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+    async def chunk_batch(
+        self, texts: List[str], use_process_pool: bool = False
+    ) -> List[List[Dict[str, Any]]]:
         """Chunk a batch of code texts with two-stage approach.
 
         Stage 1: CodeChunker chunks at AST boundaries (functions, classes)
         Stage 1.5: Recount tokens with tiktoken cl100k_base (Chonkie reports incorrect counts)
         Stage 2: TokenChunker force-splits any chunks exceeding MAX_TOKENS_PER_CHUNK (hard limit)
 
-        Uses run_in_thread_pool because Chonkie is synchronous (avoids blocking event loop).
+        Chonkie is synchronous, so the stages run off the event loop: in the shared thread
+        pool by default, or in the pre-warmed process pool when use_process_pool is set.
 
         Args:
             texts: List of code textual representations to chunk
+            use_process_pool: Run the stages in the sync process pool
 
         Returns:
             List of chunk lists (one per input text), where each chunk is a dict
@@ -124,26 +128,13 @@ class CodeChunker(BaseChunker):
         Raises:
             SyncFailureError: If model initialization or batch processing fails
         """
-        self._ensure_chunkers()
+        if use_process_pool:
+            from airweave.platform.sync import cpu_jobs
 
-        # Stage 1: AST-based code chunking
-        try:
-            code_results = await run_in_thread_pool(self._code_chunker.chunk_batch, texts)
-        except Exception as e:
-            # CodeChunker failure = sync failure (not entity-level)
-            raise SyncFailureError(f"CodeChunker batch processing failed: {e}")
-
-        # Stage 1.5: Recount tokens with tiktoken (Chonkie's CodeChunker reports incorrect counts)
-        # Chonkie counts tokens from individual AST nodes, but the final chunk text includes
-        # whitespace/gaps between nodes plus leading/trailing content, causing underestimates.
-        code_results_with_tiktoken = await run_in_thread_pool(
-            self._recount_tokens_with_tiktoken, code_results
-        )
-
-        # Stage 2: Safety net (batched for efficiency, now uses accurate tiktoken counts)
-        final_results = await run_in_thread_pool(
-            self._apply_safety_net_batched, code_results_with_tiktoken
-        )
+            final_results = await run_in_process_pool(cpu_jobs.chunk_code_batch, texts)
+        else:
+            self._ensure_chunkers()
+            final_results = await run_in_thread_pool(self._chunk_batch_sync, texts)
 
         # Validate and filter chunks
         filtered_results = []
@@ -170,6 +161,29 @@ class CodeChunker(BaseChunker):
 
         return filtered_results
 
+    def _chunk_batch_sync(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Run stages 1-2 synchronously (thread or process pool worker).
+
+        Raises:
+            SyncFailureError: If model initialization or batch processing fails
+        """
+        self._ensure_chunkers()
+
+        # Stage 1: AST-based code chunking
+        try:
+            code_results = self._code_chunker.chunk_batch(texts)
+        except Exception as e:
+            # CodeChunker failure = sync failure (not entity-level)
+            raise SyncFailureError(f"CodeChunker batch processing failed: {e}")
+
+        # Stage 1.5: Recount tokens with tiktoken (Chonkie's CodeChunker reports incorrect counts)
+        # Chonkie counts tokens from individual AST nodes, but the final chunk text includes
+        # whitespace/gaps between nodes plus leading/trailing content, causing underestimates.
+        code_results_with_tiktoken = self._recount_tokens_with_tiktoken(code_results)
+
+        # Stage 2: Safety net (batched for efficiency, now uses accurate tiktoken counts)
+        return self._apply_safety_net_batched(code_results_with_tiktoken)
+
     def _apply_safety_net_batched(
         self, code_results: List[List[Any]]
     ) -> List[List[Dict[str, Any]]]:
@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional
 from airweave.core.logging import logger
 from airweave.platform.chunkers._base import BaseChunker
 from airweave.platform.chunkers.tiktoken_compat import SafeEncoding
-from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.sync.async_helpers import run_in_process_pool, run_in_thread_pool
 from airweave.platform.sync.exceptions import SyncFailureError
 from airweave.platform.tokenizers import TikTokenTokenizer, get_tokenizer
 
@@ -149,17 +149,22 @@ class SemanticChunker(BaseChunker):
         except Exception as e:
             raise SyncFailureError(f"Failed to initialize chunkers: {e}")
 
-    async def chunk_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+    async def chunk_batch(
+        self, texts: List[str], use_process_pool: bool = False
+    ) -> List[List[Dict[str, Any]]]:
         """Chunk a batch of texts with semantic chunking + TokenChunker fallback.
 
         Stage 1: SemanticChunker detects semantic boundaries (embedding similarity)
         Stage 1.5: Recount tokens with tiktoken cl100k_base (OpenAI compatibility)
         Stage 2: TokenChunker force-splits any oversized chunks at token boundaries (hard limit)
 
-        Uses run_in_thread_pool because Chonkie is synchronous (avoids blocking event loop).
+        Chonkie is synchronous, so the stages run off the event loop: in the shared thread
+        pool by default, or in the pre-warmed process pool (no GIL contention with the
+        event loop) when use_process_pool is set.
 
         Args:
             texts: List of textual representations to chunk
+            use_process_pool: Run the stages in the sync process pool
 
         Returns:
             List of chunk lists (one per input text), where each chunk is a dict
@@ -167,23 +172,13 @@ class SemanticChunker(BaseChunker):
         Raises:
             SyncFailureError: If model initialization or batch processing fails
         """
-        self._ensure_chunkers()
-
-        # Stage 1: Semantic chunking (finds topic boundaries via embedding similarity)
-        try:
-            semantic_results = await run_in_thread_pool(self._semantic_chunker.chunk_batch, texts)
-        except Exception as e:
-            raise SyncFailureError(f"SemanticChunker batch processing failed: {e}")
+        if use_process_pool:
+            from airweave.platform.sync import cpu_jobs
 
-        # Stage 1.5: Recount tokens with tiktoken (semantic chunker uses its own tokenizer)
-        semantic_results_with_tiktoken = await run_in_thread_pool(
-            self._recount_tokens_with_tiktoken, semantic_results
-        )
-
-        # Stage 2: Safety net (batched for efficiency, uses tiktoken counts)
-        final_results = await run_in_thread_pool(
-            self._apply_safety_net_batched, semantic_results_with_tiktoken
-        )
+            final_results = await run_in_process_pool(cpu_jobs.chunk_semantic_batch, texts)
+        else:
+            self._ensure_chunkers()
+            final_results = await run_in_thread_pool(self._chunk_batch_sync, texts)
 
         # Filter empty chunks and validate token limits
         for doc_chunks in final_results:
@@ -202,6 +197,26 @@ class SemanticChunker(BaseChunker):
 
         return final_results
 
+    def _chunk_batch_sync(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Run stages 1-2 synchronously (thread or process pool worker).
+
+        Raises:
+            SyncFailureError: If model initialization or batch processing fails
+        """
+        self._ensure_chunkers()
+
+        # Stage 1: Semantic chunking (finds topic boundaries via embedding similarity)
+        try:
+            semantic_results = self._semantic_chunker.chunk_batch(texts)
+        except Exception as e:
+            raise SyncFailureError(f"SemanticChunker batch processing failed: {e}")
+
+        # Stage 1.5: Recount tokens with tiktoken (semantic chunker uses its own tokenizer)
+        semantic_results_with_tiktoken = self._recount_tokens_with_tiktoken(semantic_results)
+
+        # Stage 2: Safety net (batched for efficiency, uses tiktoken counts)
+        return self._apply_safety_net_batched(semantic_results_with_tiktoken)
+
     def _recount_tokens_with_tiktoken(self, semantic_results: List[List[Any]]) -> List[List[Any]]:
         """Recount all chunks with tiktoken cl100k_base for OpenAI compatibility.
 
@@ -476,7 +476,40 @@ class CTTIConfig(SourceConfig):
 class PostgreSQLConfig(SourceConfig):
     """Postgres configuration schema."""
 
-    pass
+    max_concurrent_tables: int = Field(
+        default=4,
+        title="Concurrent Tables",
+        description="Number of tables streamed at once, each over its own pooled connection",
+        ge=1,
+        le=32,
+    )
+    modification_columns: list[str] = Field(
+        default=[],
+        title="Modification Columns",
+        description=(
+            "Timestamp column each table sets on every insert and update, as 'table:column' "
+            "(e.g. 'orders:updated_at'). Separate multiple tables with commas. Tables not "
+            "listed use a NOT NULL timestamp column named like 'updated' or 'modified', "
+            "and are fully scanned on every sync without one."
+        ),
+    )
+    incremental_overlap_seconds: int = Field(
+        default=300,
+        title="Incremental Overlap (seconds)",
+        description=(
+            "Incremental syncs re-read rows modified this long before the previous sync's "
+            "watermark, to pick up transactions that committed late"
+        ),
+        ge=0,
+        le=86400,
+    )
+
+    @validator("modification_columns", pre=True)
+    def parse_modification_columns(cls, value):
+        """Convert comma-separated string to list if needed."""
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(",") if item.strip()]
+        return value
 
 
 class SharePointConfig(SourceConfig):
@@ -615,6 +648,16 @@ class StubConfig(SourceConfig):
         ge=0,
         le=10000,
     )
+    partition_count: int = Field(
+        default=1,
+        title="Partition Count",
+        description=(
+            "Number of index ranges the entities are split into for partitioned syncs "
+            "(1 disables partitioning)"
+        ),
+        ge=1,
+        le=64,
+    )
 
     # Distribution weights (will be normalized to sum to 100)
     small_entity_weight: int = Field(
@@ -16,9 +16,16 @@ class PostgreSQLCursor(BaseCursor):
 
     The keys in table_cursors are formatted as "schema.table" (e.g., "public.users").
     The values are ISO 8601 timestamps or sequence numbers depending on the cursor field.
+
+    key_snapshots points each table at the storage path of its primary keys as of
+    the same sync, which the next sync diffs against the table to detect deletes.
     """
 
     table_cursors: Dict[str, str] = Field(
         default_factory=dict,
         description="Per-table cursor values as 'schema.table' -> cursor value mapping",
     )
+    key_snapshots: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Per-table primary-key snapshots as 'schema.table' -> storage path mapping",
+    )
@@ -24,6 +24,10 @@ class BaseDestination(ABC):
         ProcessingRequirement.CHUNKS_AND_EMBEDDINGS
     )
 
+    # Whether chunk-diff updates may delete and update individual chunk documents
+    # (see bulk_delete_by_entity_ids and bulk_update_payloads)
+    supports_chunk_diff: ClassVar[bool] = False
+
     def __init__(self, soft_fail: bool = False):
         """Initialize the base destination.
 
@@ -88,6 +92,31 @@ class BaseDestination(ABC):
         """Bulk delete entities for multiple parent IDs within a given sync."""
         pass
 
+    @abstractmethod
+    async def bulk_delete_by_entity_ids(
+        self,
+        entity_ids: list[str],
+        sync_id: UUID,
+        parent_entities: Optional[list[BaseEntity]] = None,
+    ) -> None:
+        """Delete individual (chunk) documents by entity_id within a given sync.
+
+        parent_entities, when given, are the entities the chunks belong to; destinations
+        whose document IDs are not derived from entity_id alone can use them to delete
+        by document ID.
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_update_payloads(self, entities: list[BaseEntity]) -> None:
+        """Overwrite the stored fields of existing (chunk) documents, keeping dense vectors.
+
+        Used by chunk-diff updates for chunks whose text, and so dense embedding, is
+        unchanged. The entities carry fresh sparse embeddings (BM25 over the whole chunk
+        entity) to store with the fields, but no dense ones.
+        """
+        pass
+
     @abstractmethod
     async def search(
         self,
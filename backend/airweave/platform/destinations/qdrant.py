@@ -5,14 +5,17 @@
 - Accepts either fastembed sparse objects (with `.as_object()`) OR a raw dict shaped like
   {"indices": [...], "values": [...]} for maximum compatibility.
 - Preserves the *improved* per-chunk deterministic UUIDv5 point IDs to avoid overwrites.
+- Writes columnar batches (rest.Batch: ids, vectors and payloads as parallel lists) and
+  pipelines several upserts per bulk insert, bounded by the write concurrency.
 """
 
 from __future__ import annotations
 
 import asyncio
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Literal, Optional
+from typing import Any, ClassVar, List, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -79,6 +82,53 @@ class DecayConfig(BaseModel):
 KEYWORD_VECTOR_NAME = "bm25"
 
 
+@dataclass
+class _PointColumns:
+    """Columnar upsert batch: point IDs, dense vectors, sparse vectors and payloads.
+
+    The dense vectors are the embedders' own lists, sent as they are. Slicing slices
+    every column, so the halving fallback can split it like a list of points.
+    """
+
+    ids: list[str]
+    dense: list[list[float]]
+    sparse: list[Optional[dict]]
+    payloads: list[dict]
+
+    def __len__(self) -> int:
+        """Number of points."""
+        return len(self.ids)
+
+    def __getitem__(self, index: slice) -> "_PointColumns":
+        """Slice every column."""
+        return _PointColumns(
+            self.ids[index], self.dense[index], self.sparse[index], self.payloads[index]
+        )
+
+    def to_batches(self) -> list[rest.Batch]:
+        """Build the upsert request(s).
+
+        Named vectors in a Batch need a value for every point, so points without a
+        sparse vector go in a second Batch (normally all points have one or none do).
+        """
+        batches = []
+        for with_sparse in (True, False):
+            rows = [i for i, sv in enumerate(self.sparse) if (sv is not None) == with_sparse]
+            if not rows:
+                continue
+            vectors: dict = {DEFAULT_VECTOR_NAME: [self.dense[i] for i in rows]}
+            if with_sparse:
+                vectors[KEYWORD_VECTOR_NAME] = [self.sparse[i] for i in rows]
+            batches.append(
+                rest.Batch(
+                    ids=[self.ids[i] for i in rows],
+                    vectors=vectors,
+                    payloads=[self.payloads[i] for i in rows],
+                )
+            )
+        return batches
+
+
 @destination(
     "Qdrant",
     "qdrant",
@@ -90,6 +140,9 @@ KEYWORD_VECTOR_NAME = "bm25"
 class QdrantDestination(VectorDBDestination):
     """Qdrant destination with multi-tenant support and legacy compatibility."""
 
+    # Chunk point IDs are deterministic (see _make_point_uuid)
+    supports_chunk_diff: ClassVar[bool] = True
+
     # Default write concurrency (simple, code-local tuning)
     DEFAULT_WRITE_CONCURRENCY: int = 16
 
@@ -134,6 +187,7 @@ class QdrantDestination(VectorDBDestination):
         config: Optional[dict] = None,
         logger: Optional[ContextualLogger] = None,
         soft_fail: bool = True,
+        client: Optional[AsyncQdrantClient] = None,
     ) -> "QdrantDestination":
         """Create and return a connected destination (matches source pattern).
 
@@ -147,6 +201,8 @@ class QdrantDestination(VectorDBDestination):
             config: Unused (kept for interface consistency with sources)
             logger: Logger instance
             soft_fail: If True, errors won't fail the sync (default True - Qdrant is secondary)
+            client: Optional already-connected client to reuse (e.g. the search path's
+                    pooled client); skips creating and pinging a new one
 
         Returns:
             Configured QdrantDestination instance with multi-tenant shared collection
@@ -186,7 +242,10 @@ class QdrantDestination(VectorDBDestination):
             instance.vector_size,
         )
 
-        await instance.connect_to_qdrant()
+        if client is not None:
+            instance.client = client
+        else:
+            await instance.connect_to_qdrant()
         return instance
 
     async def ensure_collection_ready(self) -> None:
@@ -214,20 +273,25 @@ class QdrantDestination(VectorDBDestination):
                 await self.setup_collection(self.vector_size)
             self._collection_ready = True
 
+    @staticmethod
+    def build_client(url: Optional[str] = None, api_key: Optional[str] = None) -> AsyncQdrantClient:
+        """Build an (unconnected) AsyncQdrantClient for the given or native endpoint."""
+        # HTTP by default (broadest compatibility); gRPC with QDRANT_PREFER_GRPC.
+        return AsyncQdrantClient(
+            url=url or settings.qdrant_url,
+            api_key=api_key,
+            timeout=120.0,  # float timeout (seconds) for connect/read/write
+            prefer_grpc=settings.QDRANT_PREFER_GRPC,  # opt-in: some setups don't expose gRPC
+            grpc_port=settings.QDRANT_GRPC_PORT,
+        )
+
     async def connect_to_qdrant(self) -> None:
         """Initialize the AsyncQdrantClient and verify connectivity."""
         if self.client is not None:
             return
         try:
             location = self.url or settings.qdrant_url
-
-            # Reverted to HTTP-only; broadest compatibility with qdrant-client versions.
-            self.client = AsyncQdrantClient(
-                url=location,
-                api_key=self.api_key,
-                timeout=120.0,  # float timeout (seconds) for connect/read/write
-                prefer_grpc=False,  # revert: some setups don't expose gRPC
-            )
+            self.client = self.build_client(location, self.api_key)
 
             # Ping
             await self.client.get_collections()
@@ -434,12 +498,41 @@ class QdrantDestination(VectorDBDestination):
     # ----------------------------------------------------------------------------------
     # Insert / Upsert
     # ----------------------------------------------------------------------------------
-    def _build_point_struct(self, entity: BaseEntity) -> rest.PointStruct:
-        """Convert a BaseEntity to a Qdrant PointStruct with tenant metadata."""
+    def _build_point_columns(self, entities: list[BaseEntity]) -> _PointColumns:
+        """Convert BaseEntities to a columnar batch, validating the dense dimensions."""
+        payloads = [self._build_payload(e) for e in entities]
+        dense = [e.airweave_system_metadata.dense_embedding for e in entities]
+        for entity, vector in zip(entities, dense, strict=True):
+            if len(vector) != self.vector_size:
+                raise ValueError(
+                    f"Dense embeddings must all have {self.vector_size} dimensions "
+                    f"(entity {entity.entity_id} has {len(vector)})"
+                )
+        return _PointColumns(
+            ids=[
+                self._make_point_uuid(e.airweave_system_metadata.sync_id, e.entity_id)
+                for e in entities
+            ],
+            dense=dense,
+            sparse=[self._sparse_vector(e) for e in entities],
+            payloads=payloads,
+        )
+
+    @staticmethod
+    def _sparse_vector(entity: BaseEntity) -> Optional[dict]:
+        """Return the entity's sparse vector as an {"indices", "values"} dict, if any."""
+        sv = entity.airweave_system_metadata.sparse_embedding
+        if sv is None:
+            return None
+        obj = sv.as_object() if hasattr(sv, "as_object") else sv
+        return obj if isinstance(obj, dict) else None
+
+    def _build_payload(self, entity: BaseEntity, require_embedding: bool = True) -> dict:
+        """Validate an entity and build its point payload with tenant metadata."""
         # Validate required fields first
         if not entity.airweave_system_metadata:
             raise ValueError(f"Entity {entity.entity_id} has no system metadata")
-        if entity.airweave_system_metadata.dense_embedding is None:
+        if require_embedding and entity.airweave_system_metadata.dense_embedding is None:
             raise ValueError(f"Entity {entity.entity_id} has no dense_embedding in system metadata")
         if not entity.airweave_system_metadata.sync_id:
             raise ValueError(f"Entity {entity.entity_id} has no sync_id in system metadata")
@@ -472,23 +565,7 @@ class QdrantDestination(VectorDBDestination):
 
         # Add tenant metadata for filtering
         entity_data["airweave_collection_id"] = str(self.collection_id)
-
-        point_id = self._make_point_uuid(entity.airweave_system_metadata.sync_id, entity.entity_id)
-
-        # Build sparse vector part if present
-        sparse_part: dict = {}
-        sv = entity.airweave_system_metadata.sparse_embedding
-        if sv is not None:
-            obj = sv.as_object() if hasattr(sv, "as_object") else sv
-            if isinstance(obj, dict):
-                sparse_part = {KEYWORD_VECTOR_NAME: obj}
-
-        return rest.PointStruct(
-            id=point_id,
-            vector={DEFAULT_VECTOR_NAME: entity.airweave_system_metadata.dense_embedding}
-            | sparse_part,
-            payload=entity_data,
-        )
+        return entity_data
 
     def _max_points_per_batch(self) -> int:
         """Determine the maximum points to send in a single upsert request."""
@@ -498,8 +575,15 @@ class QdrantDestination(VectorDBDestination):
             return 60
         return 100
 
+    def _max_in_flight_per_insert(self) -> int:
+        """Upserts one bulk_insert may have in flight: half the write slots (rounded up).
+
+        Leaves slots for the destination's other writers (concurrent inserts, deletes).
+        """
+        return max(1, (self._write_limit + 1) // 2)
+
     async def _upsert_points_with_fallback(  # noqa: C901
-        self, points: list[rest.PointStruct], *, min_batch: int = 50
+        self, points: _PointColumns, *, min_batch: int = 50
     ) -> None:
         """Upsert points in batches to prevent timeouts and allow heartbeats.
 
@@ -541,16 +625,16 @@ class QdrantDestination(VectorDBDestination):
                 f"[Qdrant] Upserting {len(points)} points to collection={self.collection_name}, "
                 f"collection_id={self.collection_id}, vector_size={self.vector_size}"
             )
-            op = await self.client.upsert(
-                collection_name=self.collection_name,
-                points=points,
-                wait=True,
-            )
+            for request in points.to_batches():
+                op = await self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=request,
+                    wait=True,
+                )
+                if hasattr(op, "errors") and op.errors:
+                    raise Exception(f"Errors during bulk insert: {op.errors}")
             duration = asyncio.get_event_loop().time() - start_time
 
-            if hasattr(op, "errors") and op.errors:
-                raise Exception(f"Errors during bulk insert: {op.errors}")
-
             # SUCCESS LOGGING - Critical for diagnosing performance
             if duration > 10.0:
                 self.logger.warning(
@@ -602,7 +686,7 @@ class QdrantDestination(VectorDBDestination):
             # Add request sample (first point payload keys)
             if points:
                 try:
-                    sample_payload_keys = list(points[0].payload.keys())[:10]
+                    sample_payload_keys = list(points.payloads[0].keys())[:10]
                     error_context["sample_payload_keys"] = sample_payload_keys
                 except Exception:
                     pass
@@ -727,14 +811,10 @@ class QdrantDestination(VectorDBDestination):
                 except Exception:
                     pass
 
-            # Estimate payload size
-            try:
-                import sys
-
-                total_size_mb = sys.getsizeof(points) / (1024 * 1024)
-                error_context["estimated_payload_size_mb"] = round(total_size_mb, 2)
-            except Exception:
-                pass
+            # Estimate payload size (dense vectors dominate, as float32)
+            error_context["estimated_payload_size_mb"] = round(
+                len(points) * self.vector_size * 4 / (1024 * 1024), 2
+            )
 
             error_summary = f"{type(e).__name__}: {e}"
 
@@ -778,27 +858,83 @@ class QdrantDestination(VectorDBDestination):
             f"collection_id={self.collection_id}, vector_size={self.vector_size}"
         )
 
-        point_structs = [self._build_point_struct(e) for e in entities]
+        points = self._build_point_columns(entities)
 
-        if not point_structs:
-            self.logger.warning("No valid entities to insert")
-            return
+        # Split into request-sized batches and pipeline them: each batch takes its own
+        # write slot, with at most _max_in_flight_per_insert() in flight for this call.
+        # Each batch still falls back to halving on failure.
+        max_batch = self._max_points_per_batch()
+        adaptive_min_batch = max(2, min(8, max_batch // 8 if max_batch >= 8 else max_batch))
+        batches = [points[i : i + max_batch] for i in range(0, len(points), max_batch)]
 
-        # Try once with the whole payload; fall back to halving on failure
         # Track semaphore contention to understand queueing behavior
         available_slots = self._write_sem._value
         total_slots = self._write_limit
         active_writes = max(0, total_slots - available_slots)
         self.logger.info(
             f"[Qdrant] 🔒 Semaphore state: {active_writes}/{total_slots} "
-            f"active writes before acquiring lock for {len(point_structs)} points"
+            f"active writes before pipelining {len(points)} points in {len(batches)} requests"
+        )
+
+        call_slots = asyncio.Semaphore(self._max_in_flight_per_insert())
+        results = await asyncio.gather(
+            *(
+                self._upsert_with_write_slot(batch, adaptive_min_batch, call_slots)
+                for batch in batches
+            ),
+            return_exceptions=True,
         )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            raise errors[0]
 
+    async def bulk_update_payloads(self, entities: list[BaseEntity]) -> None:
+        """Overwrite the payloads and sparse vectors of existing chunk points.
+
+        Dense vectors are kept; the sparse (BM25) vector covers the whole chunk entity
+        and is rewritten with the payload.
+        """
+        if not entities:
+            return
+
+        await self.ensure_client_readiness()
+        operations: list[rest.UpdateOperation] = []
+        for e in entities:
+            point_id = self._make_point_uuid(e.airweave_system_metadata.sync_id, e.entity_id)
+            operations.append(
+                rest.OverwritePayloadOperation(
+                    overwrite_payload=rest.SetPayload(
+                        payload=self._build_payload(e, require_embedding=False),
+                        points=[point_id],
+                    )
+                )
+            )
+            sparse = self._sparse_vector(e)
+            if sparse is not None:
+                operations.append(
+                    rest.UpdateVectorsOperation(
+                        update_vectors=rest.UpdateVectors(
+                            points=[
+                                rest.PointVectors(id=point_id, vector={KEYWORD_VECTOR_NAME: sparse})
+                            ]
+                        )
+                    )
+                )
         max_batch = self._max_points_per_batch()
-        adaptive_min_batch = max(2, min(8, max_batch // 8 if max_batch >= 8 else max_batch))
+        for i in range(0, len(operations), max_batch):
+            async with self._write_sem:
+                await self.client.batch_update_points(
+                    collection_name=self.collection_name,
+                    update_operations=operations[i : i + max_batch],
+                    wait=True,
+                )
 
-        async with self._write_sem:
-            await self._upsert_points_with_fallback(point_structs, min_batch=adaptive_min_batch)
+    async def _upsert_with_write_slot(
+        self, points: _PointColumns, min_batch: int, call_slots: asyncio.Semaphore
+    ) -> None:
+        """Upsert one batch while holding one of its call's slots and a write slot."""
+        async with call_slots, self._write_sem:
+            await self._upsert_points_with_fallback(points, min_batch=min_batch)
 
     # ----------------------------------------------------------------------------------
     # Deletes (by parent/sync/etc.)
@@ -857,6 +993,25 @@ class QdrantDestination(VectorDBDestination):
                 wait=True,
             )
 
+    async def bulk_delete_by_entity_ids(
+        self,
+        entity_ids: list[str],
+        sync_id: UUID,
+        parent_entities: Optional[list[BaseEntity]] = None,
+    ) -> None:
+        """Delete individual chunk points by their (deterministic) point IDs."""
+        if not entity_ids:
+            return
+        await self.ensure_client_readiness()
+        async with self._write_sem:
+            await self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=rest.PointIdsList(
+                    points=[self._make_point_uuid(sync_id, eid) for eid in entity_ids]
+                ),
+                wait=True,
+            )
+
     # ----------------------------------------------------------------------------------
     # Query building (legacy-compatible sparse semantics)
     # ----------------------------------------------------------------------------------
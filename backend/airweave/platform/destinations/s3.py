@@ -532,6 +532,44 @@ class S3Destination(BaseDestination):
             )
             raise
 
+    async def bulk_delete_by_entity_ids(
+        self,
+        entity_ids: list[str],
+        sync_id: UUID,
+        parent_entities: Optional[list["BaseEntity"]] = None,
+    ) -> None:
+        """Delete individual entity JSON files by entity_id.
+
+        Args:
+            entity_ids: List of entity IDs to delete
+            sync_id: Sync ID (for path construction)
+            parent_entities: Unused, entity paths only depend on entity_id
+        """
+        if not entity_ids:
+            return
+
+        try:
+            async with await self._get_s3_client() as s3:
+                # delete_objects accepts at most 1000 keys per request
+                for i in range(0, len(entity_ids), 1000):
+                    objects_to_delete = [
+                        {"Key": self._entity_path(entity_id)}
+                        for entity_id in entity_ids[i : i + 1000]
+                    ]
+                    await s3.delete_objects(
+                        Bucket=self.bucket_name, Delete={"Objects": objects_to_delete}
+                    )
+            self.logger.info(f"Deleted {len(entity_ids)} entities by entity_id from S3")
+        except Exception as e:
+            self.logger.error(
+                f"Failed to delete entities by entity_ids from S3: {e}", exc_info=True
+            )
+            raise
+
+    async def bulk_update_payloads(self, entities: list) -> None:
+        """Rewrite entity JSON files (S3 stores no embeddings, so this is an insert)."""
+        await self.bulk_insert(entities)
+
     async def delete_by_sync_id(self, sync_id: UUID) -> None:
         """Delete all entities for a given sync."""
         self.logger.warning(
@@ -10,10 +10,11 @@ This module encapsulates all direct communication with Vespa, including:
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import json
 import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import quote
 from uuid import UUID
 
@@ -25,10 +26,13 @@ from airweave.core.logging import logger as default_logger
 from airweave.platform.destinations.vespa.config import (
     ALL_VESPA_SCHEMAS,
     DELETE_BATCH_SIZE,
+    DELETE_MAX_CONCURRENCY,
+    DOCUMENT_DELETE_MAX_CONCURRENCY,
     FEED_MAX_CONNECTIONS,
     FEED_MAX_QUEUE_SIZE,
     FEED_MAX_WORKERS,
 )
+from airweave.platform.destinations.vespa.feeder import feed_deadline, vespa_feeder
 from airweave.platform.destinations.vespa.types import (
     DeleteResult,
     FeedResult,
@@ -45,6 +49,8 @@ from airweave.schemas.search_result import (
 if TYPE_CHECKING:
     from vespa.application import Vespa
 
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class VespaClient:
     """Low-level Vespa client wrapper.
@@ -52,7 +58,7 @@ class VespaClient:
     Handles all I/O operations with Vespa, including:
     - Connection management
     - Document feeding via feed_iterable
-    - Document deletion via selection-based API
+    - Document deletion via selection-based API (concurrent) or by document ID
     - Query execution
     """
 
@@ -60,15 +66,20 @@ class VespaClient:
         self,
         app: "Vespa",
         logger: Optional[ContextualLogger] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize the Vespa client.
 
         Args:
             app: Connected pyvespa Vespa application instance
             logger: Optional logger for debug/warning messages
+            http_client: Optional long-lived HTTP client for queries. pyvespa opens a
+                new session per query; a shared client reuses pooled connections.
+                Owned by the caller - close() does not close it.
         """
         self.app = app
         self._logger = logger or default_logger
+        self._http_client = http_client
 
     @classmethod
     async def connect(
@@ -76,6 +87,7 @@ class VespaClient:
         url: Optional[str] = None,
         port: Optional[int] = None,
         logger: Optional[ContextualLogger] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> "VespaClient":
         """Create and connect a Vespa client.
 
@@ -83,6 +95,7 @@ class VespaClient:
             url: Vespa URL (defaults to settings.VESPA_URL)
             port: Vespa port (defaults to settings.VESPA_PORT)
             logger: Optional logger
+            http_client: Optional shared HTTP client used for queries
 
         Returns:
             Connected VespaClient instance
@@ -97,7 +110,7 @@ class VespaClient:
         log = logger or default_logger
         log.info(f"Connected to Vespa at {vespa_url}:{vespa_port}")
 
-        return cls(app=app, logger=logger)
+        return cls(app=app, logger=logger, http_client=http_client)
 
     async def close(self) -> None:
         """Close the Vespa connection."""
@@ -112,6 +125,7 @@ class VespaClient:
         self,
         docs_by_schema: Dict[str, List[VespaDocument]],
         callback: Optional[Callable] = None,
+        operation_type: str = "feed",
     ) -> FeedResult:
         """Feed documents to Vespa using feed_iterable.
 
@@ -120,13 +134,23 @@ class VespaClient:
 
         IMPORTANT: feed_iterable is synchronous, so we run it in a thread pool.
 
+        With VESPA_ASYNC_FEED_ENABLED (and no custom callback) documents are fed by
+        the pod's asyncio feeder instead, see feeder.py.
+
         Args:
             docs_by_schema: Dict mapping schema name to list of VespaDocuments
             callback: Optional callback for tracking progress
+            operation_type: "feed" to put whole documents, "update" to assign the
+                given fields of existing documents
 
         Returns:
             FeedResult with success count and failed documents
         """
+        if settings.VESPA_ASYNC_FEED_ENABLED and callback is None:
+            return await self._feed_documents_async(
+                docs_by_schema, update=operation_type == "update"
+            )
+
         result = FeedResult()
 
         def track_callback(response, doc_id: str):
@@ -150,6 +174,7 @@ class VespaClient:
                     iter=docs_iter,
                     schema=schema_name,
                     namespace="airweave",
+                    operation_type=operation_type,
                     callback=actual_callback,
                     max_queue_size=FEED_MAX_QUEUE_SIZE,
                     max_workers=FEED_MAX_WORKERS,
@@ -178,11 +203,60 @@ class VespaClient:
 
         return result
 
+    async def _feed_documents_async(
+        self, docs_by_schema: Dict[str, List[VespaDocument]], update: bool = False
+    ) -> FeedResult:
+        """Feed documents with the pod's shared asyncio feeder (VESPA_ASYNC_FEED_ENABLED)."""
+        total_docs = sum(len(docs) for docs in docs_by_schema.values())
+        if total_docs == 0:
+            return FeedResult()
+
+        feed_start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                vespa_feeder.feed(docs_by_schema, update=update),
+                timeout=feed_deadline(total_docs),
+            )
+        except asyncio.TimeoutError:
+            feed_ms = (time.perf_counter() - feed_start) * 1000
+            self._logger.error(
+                f"[VespaClient] Async feed TIMED OUT after {feed_ms:.0f}ms ({total_docs} docs)"
+            )
+            raise
+        feed_ms = (time.perf_counter() - feed_start) * 1000
+
+        retried = sum(1 for doc in result.documents if doc.attempts > 1)
+        self._logger.info(
+            f"[VespaClient] Fed {total_docs} docs in {feed_ms:.1f}ms "
+            f"({feed_ms / total_docs:.1f}ms/doc, {retried} retried, "
+            f"{len(result.failed_docs)} failed)"
+        )
+        return result
+
     # -------------------------------------------------------------------------
     # Delete Operations
     # -------------------------------------------------------------------------
 
-    async def delete_by_selection(self, schema: str, selection: str) -> DeleteResult:
+    def _delete_session(self, max_connections: int) -> httpx.AsyncClient:
+        """Build the HTTP client shared by the concurrent requests of one delete call.
+
+        Negotiates HTTP/2 (so requests multiplex over few connections) when the h2
+        package is installed and Vespa is served over https.
+        """
+        return httpx.AsyncClient(
+            timeout=settings.VESPA_TIMEOUT,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+        )
+
+    async def delete_by_selection(
+        self,
+        schema: str,
+        selection: str,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> DeleteResult:
         """Delete documents using Vespa's selection-based bulk delete API.
 
         This is faster than query-then-delete because it performs server-side
@@ -193,21 +267,26 @@ class VespaClient:
         Args:
             schema: The Vespa schema/document type to delete from
             selection: Document selection expression (e.g., "field=='value'")
+            http_client: Optional client to send the request on (a one-off client is
+                opened otherwise)
 
         Returns:
             DeleteResult with count of deleted documents
         """
+        if http_client is None:
+            async with self._delete_session(max_connections=1) as session:
+                return await self.delete_by_selection(schema, selection, session)
+
         url = self._build_bulk_delete_url(schema, selection)
         self._logger.debug(f"[VespaClient] Bulk delete from {schema} with selection: {selection}")
 
         deleted_count = 0
         try:
-            async with httpx.AsyncClient(timeout=settings.VESPA_TIMEOUT) as client:
-                async with client.stream("DELETE", url) as response:
-                    if response.status_code == 200:
-                        deleted_count = await self._parse_bulk_delete_response(response)
-                    else:
-                        await self._log_delete_error(response)
+            async with http_client.stream("DELETE", url) as response:
+                if response.status_code == 200:
+                    deleted_count = await self._parse_bulk_delete_response(response)
+                else:
+                    await self._log_delete_error(response)
         except httpx.TimeoutException:
             self._logger.error(
                 f"[VespaClient] Bulk delete timed out after {settings.VESPA_TIMEOUT}s"
@@ -222,6 +301,25 @@ class VespaClient:
 
         return DeleteResult(deleted_count=deleted_count, schema=schema)
 
+    async def _delete_by_selections(self, selections: List[Tuple[str, str]]) -> List[DeleteResult]:
+        """Run (schema, selection) deletes concurrently over one shared HTTP client.
+
+        At most DELETE_MAX_CONCURRENCY visitor scans run at a time. Results are
+        returned in the order of `selections`.
+        """
+        semaphore = asyncio.Semaphore(DELETE_MAX_CONCURRENCY)
+
+        async def _delete(schema: str, selection: str, session: httpx.AsyncClient):
+            async with semaphore:
+                return await self.delete_by_selection(schema, selection, http_client=session)
+
+        async with self._delete_session(DELETE_MAX_CONCURRENCY) as session:
+            return list(
+                await asyncio.gather(
+                    *(_delete(schema, selection, session) for schema, selection in selections)
+                )
+            )
+
     async def delete_by_sync_id(self, sync_id: UUID, collection_id: UUID) -> List[DeleteResult]:
         """Delete all documents for a sync ID across all schemas.
 
@@ -232,15 +330,16 @@ class VespaClient:
         Returns:
             List of DeleteResult for each schema
         """
-        results = []
-        for schema in ALL_VESPA_SCHEMAS:
-            selection = (
-                f"{schema}.airweave_system_metadata_sync_id=='{sync_id}' and "
-                f"{schema}.airweave_system_metadata_collection_id=='{collection_id}'"
-            )
-            result = await self.delete_by_selection(schema, selection)
-            results.append(result)
-        return results
+        return await self._delete_by_selections(
+            [
+                (
+                    schema,
+                    f"{schema}.airweave_system_metadata_sync_id=='{sync_id}' and "
+                    f"{schema}.airweave_system_metadata_collection_id=='{collection_id}'",
+                )
+                for schema in ALL_VESPA_SCHEMAS
+            ]
+        )
 
     async def delete_by_collection_id(self, collection_id: UUID) -> List[DeleteResult]:
         """Delete all documents for a collection across all schemas.
@@ -251,12 +350,12 @@ class VespaClient:
         Returns:
             List of DeleteResult for each schema
         """
-        results = []
-        for schema in ALL_VESPA_SCHEMAS:
-            selection = f"{schema}.airweave_system_metadata_collection_id=='{collection_id}'"
-            result = await self.delete_by_selection(schema, selection)
-            results.append(result)
-        return results
+        return await self._delete_by_selections(
+            [
+                (schema, f"{schema}.airweave_system_metadata_collection_id=='{collection_id}'")
+                for schema in ALL_VESPA_SCHEMAS
+            ]
+        )
 
     async def delete_by_parent_ids(
         self,
@@ -266,7 +365,8 @@ class VespaClient:
     ) -> List[DeleteResult]:
         """Delete all documents for parent IDs across all schemas.
 
-        Batches parent IDs to avoid overly long selection expressions.
+        Batches parent IDs to avoid overly long selection expressions; batches and
+        schemas are deleted concurrently.
 
         Args:
             parent_ids: List of parent entity IDs
@@ -279,7 +379,7 @@ class VespaClient:
         if not parent_ids:
             return []
 
-        results = []
+        selections = []
         for i in range(0, len(parent_ids), batch_size):
             batch = parent_ids[i : i + batch_size]
 
@@ -292,10 +392,107 @@ class VespaClient:
                     f"({parent_conditions}) and "
                     f"{schema}.airweave_system_metadata_collection_id=='{collection_id}'"
                 )
-                result = await self.delete_by_selection(schema, selection)
-                results.append(result)
+                selections.append((schema, selection))
 
-        return results
+        return await self._delete_by_selections(selections)
+
+    async def delete_by_entity_ids(
+        self,
+        entity_ids: List[str],
+        collection_id: UUID,
+        batch_size: int = DELETE_BATCH_SIZE,
+    ) -> List[DeleteResult]:
+        """Delete individual (chunk) documents by entity_id across all schemas.
+
+        Args:
+            entity_ids: List of chunk entity IDs
+            collection_id: Collection ID to scope deletion
+            batch_size: Max entity IDs per batch
+
+        Returns:
+            List of DeleteResult for all operations
+        """
+        if not entity_ids:
+            return []
+
+        selections = []
+        for i in range(0, len(entity_ids), batch_size):
+            batch = entity_ids[i : i + batch_size]
+
+            for schema in ALL_VESPA_SCHEMAS:
+                id_conditions = " or ".join(f"{schema}.entity_id=='{eid}'" for eid in batch)
+                selection = (
+                    f"({id_conditions}) and "
+                    f"{schema}.airweave_system_metadata_collection_id=='{collection_id}'"
+                )
+                selections.append((schema, selection))
+
+        return await self._delete_by_selections(selections)
+
+    async def delete_by_document_ids(
+        self,
+        doc_ids_by_schema: Dict[str, List[str]],
+        collection_id: UUID,
+    ) -> List[DeleteResult]:
+        """Delete documents whose IDs are known, without a visitor scan.
+
+        Sends one document/v1 remove per document (the feed API), concurrently over a
+        shared HTTP client. Each remove is conditioned on the collection ID, so a
+        document that belongs to another collection is left alone.
+
+        Uses: DELETE /document/v1/{namespace}/{doctype}/docid/{id}?condition={expr}
+
+        Args:
+            doc_ids_by_schema: Dict mapping schema name to Vespa document IDs
+            collection_id: Collection ID to scope deletion
+
+        Returns:
+            List of DeleteResult, one per schema
+        """
+        semaphore = asyncio.Semaphore(DOCUMENT_DELETE_MAX_CONCURRENCY)
+        base_url = f"{settings.VESPA_URL}:{settings.VESPA_PORT}"
+
+        async def _remove(schema: str, doc_id: str, session: httpx.AsyncClient) -> bool:
+            condition = quote(
+                f"{schema}.airweave_system_metadata_collection_id=='{collection_id}'", safe=""
+            )
+            url = (
+                f"{base_url}/document/v1/airweave/{schema}/docid/{quote(doc_id, safe='')}"
+                f"?condition={condition}&cluster={settings.VESPA_CLUSTER}"
+            )
+            async with semaphore:
+                response = await session.delete(url)
+            # 412: condition not met (document absent or from another collection)
+            if response.status_code not in (200, 404, 412):
+                self._logger.error(
+                    f"[VespaClient] Remove of {doc_id} failed "
+                    f"({response.status_code}): {response.text}"
+                )
+            return response.status_code == 200
+
+        removes = [
+            (schema, doc_id) for schema, doc_ids in doc_ids_by_schema.items() for doc_id in doc_ids
+        ]
+        async with self._delete_session(DOCUMENT_DELETE_MAX_CONCURRENCY) as session:
+            # Let every remove finish before surfacing an error, so a retry by the
+            # caller does not race removes still in flight on a closed client
+            outcomes = await asyncio.gather(
+                *(_remove(schema, doc_id, session) for schema, doc_id in removes),
+                return_exceptions=True,
+            )
+        errors = [o for o in outcomes if isinstance(o, BaseException)]
+        if errors:
+            raise errors[0]
+
+        deleted: Dict[str, int] = dict.fromkeys(doc_ids_by_schema, 0)
+        for (schema, _), removed in zip(removes, outcomes, strict=True):
+            deleted[schema] += removed
+        self._logger.debug(
+            f"[VespaClient] Removed {sum(deleted.values())}/{len(removes)} documents by ID"
+        )
+        return [
+            DeleteResult(deleted_count=count, schema=schema) for schema, count in deleted.items()
+        ]
 
     def _build_bulk_delete_url(self, schema: str, selection: str) -> str:
         """Build the URL for Vespa bulk delete operation."""
@@ -351,6 +548,9 @@ class VespaClient:
         Returns:
             VespaQueryResponse with hits and metrics
         """
+        if self._http_client is not None:
+            return await self._execute_query_http(query_params)
+
         start_time = time.monotonic()
         try:
             response = await asyncio.to_thread(self.app.query, body=query_params)
@@ -383,6 +583,39 @@ class VespaClient:
             query_time_ms=query_time_ms,
         )
 
+    async def _execute_query_http(self, query_params: Dict[str, Any]) -> VespaQueryResponse:
+        """Execute a query over the shared HTTP client (same semantics as app.query)."""
+        start_time = time.monotonic()
+        try:
+            response = await self._http_client.post(
+                f"{self.app.end_point}/search/", json=query_params
+            )
+            raw_json = response.json()
+        except Exception as e:
+            self._logger.error(f"[VespaClient] Vespa query failed: {e}")
+            raise RuntimeError(f"Vespa search failed: {e}") from e
+        query_time_ms = (time.monotonic() - start_time) * 1000
+
+        root = raw_json.get("root", {})
+        if response.status_code != 200:
+            error_msg = raw_json.get("error") or root.get("errors") or response.text
+            self._logger.error(f"[VespaClient] Vespa returned error: {error_msg}")
+            raise RuntimeError(f"Vespa search error: {error_msg}")
+
+        hits = root.get("children", [])
+        total_count = root.get("fields", {}).get("totalCount", 0)
+        self._logger.info(
+            f"[VespaClient] Query completed in {query_time_ms:.1f}ms, "
+            f"total={total_count}, hits={len(hits)}"
+        )
+
+        return VespaQueryResponse(
+            hits=hits,
+            total_count=total_count,
+            coverage_percent=root.get("coverage", {}).get("coverage", 100.0),
+            query_time_ms=query_time_ms,
+        )
+
     def convert_hits_to_results(self, hits: List[Dict[str, Any]]) -> List[AirweaveSearchResult]:
         """Convert Vespa hits to AirweaveSearchResult objects.
 
@@ -23,6 +23,11 @@ GLOBAL_PHASE_RERANK_COUNT = 100
 # Expected embedding dimensions (text-embedding-3-large)
 VESPA_EMBEDDING_DIM = 3072
 
+# Cell type of the dense_embedding tensor field in the deployed schemas. The feed
+# sends dense embeddings as hex already quantized to this type ("float", "bfloat16"
+# or "int8"), so it must match the schema.
+DENSE_EMBEDDING_CELL_TYPE = "bfloat16"
+
 # =============================================================================
 # Feed Settings (bulk_insert)
 # =============================================================================
@@ -31,6 +36,21 @@ FEED_MAX_QUEUE_SIZE = 500
 FEED_MAX_WORKERS = 16
 FEED_MAX_CONNECTIONS = 16
 
+# Asyncio feeder (VESPA_ASYNC_FEED_ENABLED): adaptive in-flight window per pod
+FEED_INITIAL_IN_FLIGHT = 32
+FEED_MIN_IN_FLIGHT = 4
+FEED_MAX_IN_FLIGHT = 256
+
+# Attempts per document; retries back off exponentially from this base (with jitter)
+FEED_MAX_ATTEMPTS = 5
+FEED_RETRY_BACKOFF_SECONDS = 0.1
+
+# Deadline of one feed call: one document's full retry budget plus this much per document
+FEED_DEADLINE_SECONDS_PER_DOC = 0.5
+
+# Use HTTP/2 with prior knowledge (h2c) when Vespa is served over plain http
+FEED_HTTP2_CLEARTEXT = True
+
 # =============================================================================
 # Delete Settings
 # =============================================================================
@@ -38,6 +58,12 @@ FEED_MAX_CONNECTIONS = 16
 # Batch size for bulk_delete_by_parent_ids
 DELETE_BATCH_SIZE = 50
 
+# Max concurrent selection deletes (each one is a visitor scan on the content nodes)
+DELETE_MAX_CONCURRENCY = 8
+
+# Max concurrent single-document removes by ID (cheap, like feed operations)
+DOCUMENT_DELETE_MAX_CONCURRENCY = 64
+
 # =============================================================================
 # Vespa Schema Names
 # =============================================================================
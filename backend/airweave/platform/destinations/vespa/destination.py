@@ -43,10 +43,12 @@ class VespaDestination(VectorDBDestination):
 
     This is the public API for Vespa operations. It provides:
     - bulk_insert: Feed entities to Vespa
+    - bulk_update_payloads: Update the fields of unchanged chunk documents
     - search: Execute hybrid search queries
     - delete_by_sync_id: Delete documents for a sync run
     - delete_by_collection_id: Delete all documents for a collection
     - bulk_delete_by_parent_ids: Delete documents by parent entity IDs
+    - bulk_delete_by_entity_ids: Delete individual chunk documents
 
     Internally, it delegates to:
     - VespaClient for I/O operations
@@ -57,6 +59,7 @@ class VespaDestination(VectorDBDestination):
     from airweave.platform.sync.pipeline import ProcessingRequirement
 
     processing_requirement = ProcessingRequirement.CHUNKS_AND_EMBEDDINGS
+    supports_chunk_diff = True
 
     def __init__(self, soft_fail: bool = False):
         """Initialize the Vespa destination.
@@ -95,7 +98,8 @@ class VespaDestination(VectorDBDestination):
             vector_size: Vector dimensions (unused - Vespa handles embeddings)
             logger: Logger instance
             soft_fail: If True, errors won't fail the sync (default False - Vespa is primary)
-            **kwargs: Additional keyword arguments (unused)
+            **kwargs: Additional keyword arguments. http_client (httpx.AsyncClient) is
+                passed to VespaClient for queries (e.g. the search path's pooled client)
 
         Returns:
             Configured VespaDestination instance
@@ -106,7 +110,9 @@ class VespaDestination(VectorDBDestination):
         instance.organization_id = organization_id
 
         # Initialize components
-        instance._client = await VespaClient.connect(logger=instance.logger)
+        instance._client = await VespaClient.connect(
+            logger=instance.logger, http_client=kwargs.get("http_client")
+        )
         instance._transformer = EntityTransformer(
             collection_id=collection_id,
             logger=instance.logger,
@@ -180,6 +186,30 @@ class VespaDestination(VectorDBDestination):
         if result.failed_docs:
             self._handle_feed_failures(result.failed_docs, total_docs)
 
+    async def bulk_update_payloads(self, entities: List[BaseEntity]) -> None:
+        """Assign all fields but the dense embedding of existing chunk documents.
+
+        The sparse (BM25) embedding covers the whole chunk entity and is assigned too.
+
+        Args:
+            entities: Chunk entities (without dense embeddings) whose documents to update
+        """
+        if not entities:
+            return
+        if not self._client or not self._transformer:
+            raise RuntimeError("Vespa client not initialized. Call create() first.")
+
+        docs_by_schema = self._transformer.transform_batch(entities, include_dense_embedding=False)
+        total_docs = sum(len(docs) for docs in docs_by_schema.values())
+        result = await self._client.feed_documents(docs_by_schema, operation_type="update")
+        self.logger.info(
+            f"[VespaDestination] Updated fields of {result.success_count}/{total_docs} "
+            f"unchanged chunk documents"
+        )
+
+        if result.failed_docs:
+            self._handle_feed_failures(result.failed_docs, total_docs)
+
     def _handle_feed_failures(self, failed_docs: List[tuple], total_docs: int) -> None:
         """Log and raise error for feed failures."""
         self.logger.error(f"{len(failed_docs)}/{total_docs} documents failed to feed")
@@ -231,6 +261,33 @@ class VespaDestination(VectorDBDestination):
 
         await self._client.delete_by_parent_ids(parent_ids, self.collection_id)
 
+    async def bulk_delete_by_entity_ids(
+        self,
+        entity_ids: List[str],
+        sync_id: UUID,
+        parent_entities: Optional[List[BaseEntity]] = None,
+    ) -> None:
+        """Delete individual chunk documents by entity_id.
+
+        With the chunks' parent entities the document IDs are known, so the chunks
+        are removed by ID instead of by a selection (visitor) scan.
+
+        Args:
+            entity_ids: List of chunk entity IDs
+            sync_id: The sync ID for scoping (unused, kept for interface)
+            parent_entities: Optional parent entities of the chunks
+        """
+        if not entity_ids or not self._client:
+            return
+
+        if parent_entities:
+            doc_ids = self._transformer.chunk_document_ids(entity_ids, parent_entities)
+            if doc_ids is not None:
+                await self._client.delete_by_document_ids(doc_ids, self.collection_id)
+                return
+
+        await self._client.delete_by_entity_ids(entity_ids, self.collection_id)
+
     async def search(
         self,
         queries: List[str],
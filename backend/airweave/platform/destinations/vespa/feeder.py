@@ -0,0 +1,259 @@
+"""Native asyncio Vespa feeder over the document/v1 API.
+
+pyvespa's feed_iterable is synchronous, so every feed_documents call used to run it
+in its own thread with its own connection pool. VespaFeeder instead sends one
+document/v1 put (POST) per document from the event loop:
+
+- one HTTP client per pod (vespa_feeder), shared by all concurrent batches; HTTP/2
+  multiplexes the requests over FEED_MAX_CONNECTIONS connections when h2 is installed
+- an adaptive in-flight window (AIMD): it grows by one per window of successful
+  responses and halves when Vespa pushes back with 429/503
+- each document is retried on its own (throttling, 502/504 and transport errors)
+  with exponential backoff, and gets its own DocumentFeedResult
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import random
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+import httpx
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.platform.destinations.vespa.config import (
+    FEED_DEADLINE_SECONDS_PER_DOC,
+    FEED_HTTP2_CLEARTEXT,
+    FEED_INITIAL_IN_FLIGHT,
+    FEED_MAX_ATTEMPTS,
+    FEED_MAX_CONNECTIONS,
+    FEED_MAX_IN_FLIGHT,
+    FEED_MIN_IN_FLIGHT,
+    FEED_RETRY_BACKOFF_SECONDS,
+)
+from airweave.platform.destinations.vespa.types import (
+    DocumentFeedResult,
+    FeedResult,
+    VespaDocument,
+)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+THROTTLED_STATUS_CODES = frozenset({429, 503})
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+MAX_RETRY_BACKOFF_SECONDS = 5.0
+
+
+def feed_deadline(total_docs: int) -> float:
+    """Seconds one feed call of `total_docs` documents may take before it is abandoned.
+
+    VESPA_TIMEOUT bounds each request, so the deadline leaves room for one document
+    to use all its attempts and backoffs, and grows with the batch so throttled
+    batches (small window, many retries) are not cut off mid-retry.
+    """
+    backoffs = sum(
+        min(MAX_RETRY_BACKOFF_SECONDS, FEED_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)) * 1.5
+        for attempt in range(1, FEED_MAX_ATTEMPTS)
+    )
+    retry_budget = FEED_MAX_ATTEMPTS * settings.VESPA_TIMEOUT + backoffs
+    return retry_budget + total_docs * FEED_DEADLINE_SECONDS_PER_DOC
+
+
+class InFlightWindow:
+    """Adaptive limit on concurrent requests (additive increase, multiplicative decrease).
+
+    Every success adds 1/limit, so the limit grows by one per window of successes.
+    Throttling halves it, at most once per window of responses so a burst of 429s
+    from requests that were already in flight counts as one signal.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int) -> None:
+        """Initialize the window.
+
+        Args:
+            initial: Starting in-flight limit
+            minimum: Lowest limit throttling can push it to
+            maximum: Highest limit successes can raise it to
+        """
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self._responses_since_decrease = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot in the window."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, throttled: bool) -> None:
+        """Free a slot and adapt the limit to the response."""
+        async with self._condition:
+            self.in_flight -= 1
+            self._responses_since_decrease += 1
+            if throttled:
+                if self._responses_since_decrease >= int(self.limit):
+                    self.limit = max(float(self.minimum), self.limit / 2)
+                    self._responses_since_decrease = 0
+            else:
+                self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+            free = int(self.limit) - self.in_flight
+            if free > 0:
+                self._condition.notify(free)
+
+
+class VespaFeeder:
+    """Per-pod asyncio feeder for Vespa documents.
+
+    The HTTP client and window are created on first use and re-created if the event
+    loop changes (they cannot be shared across loops).
+    """
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        """Initialize the feeder (the client is created lazily).
+
+        Args:
+            transport: Optional httpx transport (tests and benchmarks)
+        """
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._window: Optional[InFlightWindow] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _session(self) -> tuple[httpx.AsyncClient, InFlightWindow]:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            cleartext = settings.VESPA_URL.startswith("http://")
+            self._client = httpx.AsyncClient(
+                # The window bounds queueing, so waiting for a pooled connection is fine
+                timeout=httpx.Timeout(settings.VESPA_TIMEOUT, pool=None),
+                http2=HTTP2_AVAILABLE,
+                # Vespa speaks HTTP/2 over cleartext with prior knowledge (h2c)
+                http1=not (HTTP2_AVAILABLE and cleartext and FEED_HTTP2_CLEARTEXT),
+                limits=httpx.Limits(
+                    max_connections=FEED_MAX_CONNECTIONS,
+                    max_keepalive_connections=FEED_MAX_CONNECTIONS,
+                ),
+                transport=self._transport,
+            )
+            self._window = InFlightWindow(
+                FEED_INITIAL_IN_FLIGHT, FEED_MIN_IN_FLIGHT, FEED_MAX_IN_FLIGHT
+            )
+            self._loop = loop
+        return self._client, self._window
+
+    async def feed(
+        self, docs_by_schema: Dict[str, List[VespaDocument]], update: bool = False
+    ) -> FeedResult:
+        """Feed documents and return a result for every document.
+
+        Args:
+            docs_by_schema: Dict mapping schema name to list of VespaDocuments
+            update: Assign the documents' fields to existing documents (PUT) instead
+                of putting whole documents (POST)
+
+        Returns:
+            FeedResult with the success count, failed documents and per-document results
+        """
+        client, window = self._session()
+        documents = await asyncio.gather(
+            *(
+                self._feed_one(client, window, doc, update)
+                for docs in docs_by_schema.values()
+                for doc in docs
+            )
+        )
+
+        result = FeedResult(documents=list(documents))
+        for doc in documents:
+            if doc.success:
+                result.success_count += 1
+            else:
+                result.failed_docs.append((doc.doc_id, doc.status_code, doc.body))
+        return result
+
+    async def _feed_one(
+        self,
+        client: httpx.AsyncClient,
+        window: InFlightWindow,
+        doc: VespaDocument,
+        update: bool = False,
+    ) -> DocumentFeedResult:
+        """Put (or update) one document, retrying it on throttling and transient failures."""
+        url = (
+            f"{settings.VESPA_URL}:{settings.VESPA_PORT}/document/v1/airweave/{doc.schema}"
+            f"/docid/{quote(doc.id, safe='')}"
+        )
+        if update:
+            method = "PUT"
+            payload = {"fields": {name: {"assign": value} for name, value in doc.fields.items()}}
+        else:
+            method = "POST"
+            payload = {"fields": doc.fields}
+        status_code: Optional[int] = None
+        body: Dict = {}
+        for attempt in range(1, FEED_MAX_ATTEMPTS + 1):
+            await window.acquire()
+            throttled = False
+            try:
+                response = await client.request(method, url, json=payload)
+                status_code = response.status_code
+                throttled = status_code in THROTTLED_STATUS_CODES
+                if status_code != 200:
+                    body = _response_body(response)
+            except httpx.TransportError as e:
+                status_code = None
+                body = {"message": f"{type(e).__name__}: {e}"}
+            finally:
+                await window.release(throttled)
+
+            if status_code == 200:
+                return DocumentFeedResult(
+                    doc_id=doc.id,
+                    schema=doc.schema,
+                    success=True,
+                    status_code=200,
+                    attempts=attempt,
+                )
+            if status_code is not None and status_code not in RETRYABLE_STATUS_CODES:
+                break
+            if attempt < FEED_MAX_ATTEMPTS:
+                backoff = min(
+                    MAX_RETRY_BACKOFF_SECONDS, FEED_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+                )
+                await asyncio.sleep(backoff * (0.5 + random.random()))
+
+        logger.debug(f"[VespaFeeder] Feeding {doc.id} failed after {attempt} attempts: {body}")
+        return DocumentFeedResult(
+            doc_id=doc.id,
+            schema=doc.schema,
+            success=False,
+            status_code=status_code,
+            attempts=attempt,
+            body=body,
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (worker shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._window = None
+        self._loop = None
+
+
+def _response_body(response: httpx.Response) -> Dict:
+    """Parse a document/v1 response body, keeping non-JSON bodies as a message."""
+    try:
+        body = response.json()
+    except ValueError:
+        return {"message": response.text}
+    return body if isinstance(body, dict) else {"message": str(body)}
+
+
+vespa_feeder = VespaFeeder()
@@ -11,8 +11,11 @@ from collections import defaultdict
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+import numpy as np
+
 from airweave.core.logging import ContextualLogger
 from airweave.core.logging import logger as default_logger
+from airweave.platform.destinations.vespa.config import DENSE_EMBEDDING_CELL_TYPE
 from airweave.platform.destinations.vespa.types import VespaDocument
 from airweave.platform.entities._base import (
     AirweaveSystemMetadata,
@@ -24,6 +27,36 @@ from airweave.platform.entities._base import (
 )
 
 
+def encode_dense_tensor(values: Any, cell_type: str = DENSE_EMBEDDING_CELL_TYPE) -> str:
+    """Encode a dense vector in the hex string form of a Vespa indexed tensor.
+
+    Vespa reads a hex "values" string as the cells in the field's cell type, so the
+    vector is quantized here: 8 hex digits per float cell, 4 per bfloat16 cell
+    (round to nearest even) and 2 per int8 cell (scaled so the largest magnitude
+    maps to 127, which angular distance is invariant to).
+
+    Args:
+        values: Vector as a numpy array or list of floats
+        cell_type: Cell type of the target tensor field ("float", "bfloat16", "int8")
+
+    Returns:
+        Uppercase hex string
+    """
+    vector = np.ascontiguousarray(values, dtype=np.float32)
+    if cell_type == "float":
+        cells = vector.astype(">f4")
+    elif cell_type == "bfloat16":
+        bits = vector.view(np.uint32).astype(np.uint64)
+        cells = ((bits + 0x7FFF + ((bits >> 16) & 1)) >> 16).astype(">u2")
+    elif cell_type == "int8":
+        peak = float(np.abs(vector).max()) if vector.size else 0.0
+        scaled = vector * (127.0 / peak) if peak > 0 else vector
+        cells = np.rint(scaled).astype(np.int8)
+    else:
+        raise ValueError(f"Unsupported dense tensor cell type: {cell_type}")
+    return cells.tobytes().hex().upper()
+
+
 def _sanitize_for_vespa(text: str) -> str:
     """Sanitize text for Vespa by removing illegal characters.
 
@@ -162,25 +195,27 @@ class EntityTransformer:
         self.collection_id = collection_id
         self._logger = logger or default_logger
 
-    def transform(self, entity: BaseEntity) -> VespaDocument:
+    def transform(self, entity: BaseEntity, include_dense_embedding: bool = True) -> VespaDocument:
         """Transform a single entity to Vespa document format.
 
         Args:
             entity: The entity to transform
+            include_dense_embedding: Whether to add the dense embedding field (False
+                for partial updates that keep the stored one)
 
         Returns:
             VespaDocument with schema, id, and fields
         """
         entity_type = self._get_entity_type(entity)
         schema = self._get_vespa_schema(entity)
-        doc_id = f"{entity_type}_{entity.entity_id}"
+        doc_id = self._build_document_id(entity_type, entity.entity_id)
 
         # Build fields from various sources
         fields = self._build_base_fields(entity)
         self._add_system_metadata_fields(fields, entity, entity_type)
         self._add_type_specific_fields(fields, entity)
         self._add_access_control_fields(fields, entity)
-        self._add_embedding_fields(fields, entity)
+        self._add_embedding_fields(fields, entity, include_dense=include_dense_embedding)
         self._add_payload_field(fields, entity)
 
         # Remove None values from top-level fields
@@ -188,11 +223,14 @@ class EntityTransformer:
 
         return VespaDocument(schema=schema, id=doc_id, fields=fields)
 
-    def transform_batch(self, entities: List[BaseEntity]) -> Dict[str, List[VespaDocument]]:
+    def transform_batch(
+        self, entities: List[BaseEntity], include_dense_embedding: bool = True
+    ) -> Dict[str, List[VespaDocument]]:
         """Transform entities and group by Vespa schema.
 
         Args:
             entities: List of entities to transform
+            include_dense_embedding: Whether to add the dense embedding field
 
         Returns:
             Dict mapping schema name to list of VespaDocuments
@@ -201,7 +239,7 @@ class EntityTransformer:
 
         for entity in entities:
             try:
-                doc = self.transform(entity)
+                doc = self.transform(entity, include_dense_embedding=include_dense_embedding)
                 docs_by_schema[doc.schema].append(doc)
 
                 # Debug logging
@@ -215,6 +253,39 @@ class EntityTransformer:
 
         return dict(docs_by_schema)
 
+    def chunk_document_ids(
+        self, chunk_entity_ids: List[str], parents: List[BaseEntity]
+    ) -> Optional[Dict[str, List[str]]]:
+        """Derive Vespa document IDs of chunks from their parent entities.
+
+        Chunks share their parent's entity type and schema, and their entity_id is
+        "{original_entity_id}__chunk_{chunk_index}".
+
+        Args:
+            chunk_entity_ids: Chunk entity IDs
+            parents: Parent entities the chunks were produced from
+
+        Returns:
+            Dict mapping schema name to document IDs, or None if a chunk's parent is
+            not among `parents`
+        """
+        parents_by_id = {parent.entity_id: parent for parent in parents}
+        doc_ids: Dict[str, List[str]] = defaultdict(list)
+        for chunk_entity_id in chunk_entity_ids:
+            parent_id, separator, _ = chunk_entity_id.rpartition("__chunk_")
+            parent = parents_by_id.get(parent_id) if separator else None
+            if parent is None:
+                return None
+            doc_ids[self._get_vespa_schema(parent)].append(
+                self._build_document_id(self._get_entity_type(parent), chunk_entity_id)
+            )
+        return dict(doc_ids)
+
+    @staticmethod
+    def _build_document_id(entity_type: str, entity_id: str) -> str:
+        """Build the Vespa document ID of an entity (or chunk)."""
+        return f"{entity_type}_{entity_id}"
+
     def _get_entity_type(self, entity: BaseEntity) -> str:
         """Get entity type from metadata or class name."""
         if entity.airweave_system_metadata and entity.airweave_system_metadata.entity_type:
@@ -347,14 +418,19 @@ class EntityTransformer:
             fields["access_is_public"] = True
             fields["access_viewers"] = []
 
-    def _add_embedding_fields(self, fields: Dict[str, Any], entity: BaseEntity) -> None:
+    def _add_embedding_fields(
+        self, fields: Dict[str, Any], entity: BaseEntity, include_dense: bool = True
+    ) -> None:
         """Add pre-computed embeddings from airweave_system_metadata.
 
         ChunkEmbedProcessor populates each chunk entity with:
         - airweave_system_metadata.dense_embedding: 3072-dim float32 embedding
         - airweave_system_metadata.sparse_embedding: FastEmbed BM25 sparse vector
 
-        Vespa auto-converts float32 to bfloat16 for dense embedding storage.
+        The dense embedding is sent as a hex string already in the field's cell type
+        (DENSE_EMBEDDING_CELL_TYPE), a fraction of the size of a JSON float list and
+        without per-float encoding on either side. Partial updates of unchanged chunks
+        pass include_dense=False to keep the stored dense embedding.
         """
         meta = entity.airweave_system_metadata
         if meta is None:
@@ -364,16 +440,8 @@ class EntityTransformer:
             return
 
         # Dense embedding (3072-dim for neural search)
-        dense_emb = meta.dense_embedding
-        if dense_emb is not None and isinstance(dense_emb, list) and len(dense_emb) > 0:
-            fields["dense_embedding"] = {"values": dense_emb}
-            self._logger.debug(
-                f"[EntityTransformer] Added dense_embedding with {len(dense_emb)} dims"
-            )
-        else:
-            self._logger.warning(
-                f"[EntityTransformer] Entity {entity.entity_id}: No valid dense_embedding"
-            )
+        if include_dense:
+            self._add_dense_embedding_field(fields, entity)
 
         # Sparse embedding (FastEmbed BM25 for keyword scoring)
         sparse_emb = meta.sparse_embedding
@@ -383,24 +451,37 @@ class EntityTransformer:
                 fields["sparse_embedding"] = sparse_tensor
                 self._logger.debug(
                     f"[EntityTransformer] Added sparse_embedding with "
-                    f"{len(sparse_tensor.get('cells', []))} tokens"
+                    f"{len(sparse_tensor['cells'])} tokens"
                 )
         else:
             self._logger.warning(
                 f"[EntityTransformer] Entity {entity.entity_id}: No sparse_embedding"
             )
 
+    def _add_dense_embedding_field(self, fields: Dict[str, Any], entity: BaseEntity) -> None:
+        """Add the dense embedding as a hex-encoded tensor, if the entity has a valid one."""
+        dense_emb = entity.airweave_system_metadata.dense_embedding
+        if dense_emb is not None and isinstance(dense_emb, (list, np.ndarray)) and len(dense_emb):
+            fields["dense_embedding"] = {"values": encode_dense_tensor(dense_emb)}
+            self._logger.debug(
+                f"[EntityTransformer] Added dense_embedding with {len(dense_emb)} dims"
+            )
+        else:
+            self._logger.warning(
+                f"[EntityTransformer] Entity {entity.entity_id}: No valid dense_embedding"
+            )
+
     def _convert_sparse_to_vespa_tensor(
         self, sparse_emb: Any, entity_id: str
     ) -> Optional[Dict[str, Any]]:
-        """Convert FastEmbed SparseEmbedding to Vespa mapped tensor format.
+        """Convert FastEmbed SparseEmbedding to Vespa mapped tensor short form.
 
         FastEmbed SparseEmbedding has:
         - indices: numpy.ndarray[int] - token IDs
         - values: numpy.ndarray[float] - token weights
 
-        Vespa mapped tensor format:
-        - {"cells": [{"address": {"token": "123"}, "value": 0.5}, ...]}
+        Vespa mapped tensor short form (single mapped dimension):
+        - {"cells": {"123": 0.5, ...}}
 
         We use token IDs as strings since we don't need actual token text.
         This works because Vespa just needs consistent keys for matching.
@@ -429,12 +510,8 @@ class EntityTransformer:
             if not indices or not values:
                 return None
 
-            # Convert to Vespa cells format
-            cells = []
-            for idx, val in zip(indices, values, strict=False):
-                cells.append({"address": {"token": str(idx)}, "value": float(val)})
-
-            return {"cells": cells}
+            # Label -> value short form instead of one address object per cell
+            return {"cells": dict(zip(map(str, indices), map(float, values), strict=False))}
 
         except Exception as e:
             self._logger.warning(
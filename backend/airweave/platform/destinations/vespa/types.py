@@ -3,7 +3,7 @@
 Simple Pydantic models for type safety and clear interfaces between components.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -19,6 +19,19 @@ class VespaDocument(BaseModel):
     fields: Dict[str, Any] = Field(..., description="Document fields for Vespa")
 
 
+class DocumentFeedResult(BaseModel):
+    """Result of feeding a single document."""
+
+    doc_id: str = Field(..., description="Document ID")
+    schema: str = Field(..., description="Vespa schema the document was fed to")
+    success: bool = Field(..., description="Whether the document was stored")
+    status_code: Optional[int] = Field(
+        default=None, description="Last HTTP status (None after a transport error)"
+    )
+    attempts: int = Field(default=1, description="Number of requests sent")
+    body: Dict[str, Any] = Field(default_factory=dict, description="Error body, if failed")
+
+
 class FeedResult(BaseModel):
     """Result of a Vespa feed operation."""
 
@@ -27,6 +40,10 @@ class FeedResult(BaseModel):
         default_factory=list,
         description="List of (doc_id, status_code, body) for failed documents",
     )
+    documents: List[DocumentFeedResult] = Field(
+        default_factory=list,
+        description="Per-document results (asyncio feeder only)",
+    )
 
 
 class DeleteResult(BaseModel):
@@ -9,6 +9,7 @@ Use get_dense_embedder() to get the appropriate embedder based on provider/model
 from airweave.core.config import settings
 
 from ._base import BaseEmbedder
+from .cache import EmbeddingCache, get_embedding_cache
 from .config import (
     get_default_provider,
     get_embedding_model,
@@ -85,6 +86,9 @@ __all__ = [
     "SparseEmbedder",
     # Factory
     "get_dense_embedder",
+    # Embedding cache
+    "EmbeddingCache",
+    "get_embedding_cache",
     # Config re-exports
     "get_default_provider",
     "get_provider_for_model",
@@ -0,0 +1,301 @@
+"""Pod-wide embedding request batcher.
+
+Every sync's pipeline embeds its own micro-batch, so without coalescing each call pays
+a full request round trip and rarely fills the provider's per-request limits. With
+EMBEDDING_BATCHER_ENABLED, dense embedders submit sync texts here instead:
+
+- one EmbeddingBatcher per (model, dimensions), shared by every sync in the pod
+- texts wait in per-sync FIFO queues until a request is full (input count or token
+  budget) or the oldest text has waited EMBEDDING_BATCHER_MAX_LINGER_MS
+- requests are packed round-robin across syncs, so a large sync cannot starve a
+  small one, and the next request starts with the next sync
+- at most max_concurrent requests are in flight; while they are, texts keep
+  accumulating, so requests fill up under load
+- each submit() passes its embedder's call and logger; a packed request is sent with
+  the caller of its first text, i.e. the sync the round-robin started with (every
+  caller of a batcher uses the same model and dimensions), so its rate limiter
+  still applies
+- embedders keep their own error policy (OpenAI returns zero vectors for a failed
+  API call, as without the batcher); a request whose embedder call raises and packs
+  several callers' texts is retried per caller, so the error only fails the callers
+  it belongs to
+
+Fill ratio, queueing delay and throughput are exported on the worker's /metrics.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Set
+
+from airweave.core.config import settings
+from airweave.core.logging import ContextualLogger
+from airweave.platform.sync.exceptions import SyncFailureError
+from airweave.platform.temporal.prometheus_metrics import (
+    embedding_batcher_fill_ratio,
+    embedding_batcher_queue_delay_seconds,
+    embedding_batcher_queued_texts,
+    embedding_batcher_requests_total,
+    embedding_batcher_texts_total,
+    embedding_batcher_tokens_total,
+)
+
+# Provider call for one packed request: (texts, token counts, logger) -> embeddings.
+# Errors it raises are passed to the callers whose texts were in the request.
+EmbedFn = Callable[[List[str], List[int], ContextualLogger], Awaitable[List[Any]]]
+
+
+@dataclass(eq=False)
+class _Request:
+    """One submit() call: the embedder call and logger its texts are embedded with."""
+
+    embed_fn: EmbedFn
+    logger: ContextualLogger
+
+
+@dataclass
+class _PendingText:
+    """One submitted text waiting for its embedding."""
+
+    text: str
+    tokens: int
+    future: asyncio.Future
+    enqueued_at: float
+    request: _Request
+
+
+class EmbeddingBatcher:
+    """Coalesces embedding requests from all syncs in the pod into full requests."""
+
+    def __init__(
+        self,
+        name: str,
+        max_inputs: int,
+        max_tokens: int,
+        max_concurrent: int,
+        max_linger_seconds: float,
+    ) -> None:
+        """Initialize the batcher (the dispatcher starts on first submit).
+
+        Args:
+            name: Metrics label (model and dimensions)
+            max_inputs: Max texts per request
+            max_tokens: Max tokens per request (a single larger text is sent alone)
+            max_concurrent: Max requests in flight
+            max_linger_seconds: Max time the oldest text waits for a request to fill
+        """
+        self.name = name
+        self._max_inputs = max_inputs
+        self._max_tokens = max_tokens
+        self._max_concurrent = max_concurrent
+        self._max_linger = max_linger_seconds
+
+        self._queues: "OrderedDict[Hashable, Deque[_PendingText]]" = OrderedDict()
+        self._queued_texts = 0
+        self._queued_tokens = 0
+        self._in_flight: Set[asyncio.Task] = set()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(
+        self,
+        texts: List[str],
+        token_counts: List[int],
+        key: Hashable,
+        embed_fn: EmbedFn,
+        logger: ContextualLogger,
+    ) -> List:
+        """Queue texts and wait for their embeddings.
+
+        Args:
+            texts: Texts to embed
+            token_counts: Token count of each text
+            key: Fair-share key (the sync ID)
+            embed_fn: The caller's provider call, used for requests that start with its texts
+            logger: The caller's logger
+
+        Returns:
+            Embeddings in input order
+
+        Raises:
+            Exception: The provider error of a request with one of these texts
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Events and semaphores are bound to the loop they are used on
+            self._wakeup = asyncio.Event()
+            self._slots = asyncio.Semaphore(self._max_concurrent)
+            self._dispatcher = None
+            self._loop = loop
+
+        now = time.monotonic()
+        request = _Request(embed_fn, logger)
+        items = [
+            _PendingText(text, tokens, loop.create_future(), now, request)
+            for text, tokens in zip(texts, token_counts, strict=True)
+        ]
+        self._queues.setdefault(key, deque()).extend(items)
+        self._queued_texts += len(items)
+        self._queued_tokens += sum(token_counts)
+        embedding_batcher_queued_texts.labels(model=self.name).set(self._queued_texts)
+
+        self._wakeup.set()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        futures = [item.future for item in items]
+        try:
+            return list(await asyncio.gather(*futures))
+        except BaseException:
+            # Texts still queued are dropped from later requests
+            for future in futures:
+                future.cancel()
+            raise
+
+    async def _dispatch(self) -> None:
+        """Send requests while texts are queued (exits when the queues drain)."""
+        while self._queued_texts:
+            await self._slots.acquire()
+            try:
+                await self._wait_until_ready()
+                batch = self._pack()
+            except BaseException:
+                self._slots.release()
+                raise
+            if not batch:
+                self._slots.release()
+                continue
+            task = asyncio.create_task(self._send(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _wait_until_ready(self) -> None:
+        """Wait until a request is full or the oldest text's linger deadline passes."""
+        while self._queued_texts and not self._full():
+            oldest = min(queue[0].enqueued_at for queue in self._queues.values())
+            remaining = oldest + self._max_linger - time.monotonic()
+            if remaining <= 0:
+                return
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return
+
+    def _full(self) -> bool:
+        return self._queued_texts >= self._max_inputs or self._queued_tokens >= self._max_tokens
+
+    def _pack(self) -> List[_PendingText]:
+        """Take texts round-robin across syncs up to the input and token limits."""
+        batch: List[_PendingText] = []
+        tokens = 0
+        progressed = True
+        while progressed and self._queues and len(batch) < self._max_inputs:
+            progressed = False
+            for key in list(self._queues):
+                queue = self._queues[key]
+                item = queue[0]
+                if batch and tokens + item.tokens > self._max_tokens:
+                    continue
+                queue.popleft()
+                if not queue:
+                    del self._queues[key]
+                self._queued_texts -= 1
+                self._queued_tokens -= item.tokens
+                progressed = True
+                if item.future.done():  # Caller was cancelled
+                    continue
+                batch.append(item)
+                tokens += item.tokens
+                if len(batch) >= self._max_inputs:
+                    break
+
+        # Start the next request with the next sync
+        if self._queues:
+            self._queues.move_to_end(next(iter(self._queues)))
+        embedding_batcher_queued_texts.labels(model=self.name).set(self._queued_texts)
+        return batch
+
+    async def _send(self, batch: List[_PendingText]) -> None:
+        """Embed one packed request and resolve its futures."""
+        try:
+            tokens = [item.tokens for item in batch]
+            now = time.monotonic()
+            embedding_batcher_requests_total.labels(model=self.name).inc()
+            embedding_batcher_texts_total.labels(model=self.name).inc(len(batch))
+            embedding_batcher_tokens_total.labels(model=self.name).inc(sum(tokens))
+            embedding_batcher_fill_ratio.labels(model=self.name).observe(
+                min(1.0, max(len(batch) / self._max_inputs, sum(tokens) / self._max_tokens))
+            )
+            delay = embedding_batcher_queue_delay_seconds.labels(model=self.name)
+            for item in batch:
+                delay.observe(now - item.enqueued_at)
+
+            try:
+                await self._embed(batch)
+            except Exception as e:
+                requests: Dict[_Request, List[_PendingText]] = {}
+                for item in batch:
+                    requests.setdefault(item.request, []).append(item)
+                if len(requests) == 1:
+                    batch[0].request.logger.error(f"[EmbeddingBatcher] {self.name} failed: {e}")
+                    self._fail(batch, e)
+                    return
+                # Don't fail every caller for one caller's texts: retry each on its own
+                for request, items in requests.items():
+                    try:
+                        await self._embed(items)
+                    except Exception as e:
+                        request.logger.error(f"[EmbeddingBatcher] {self.name} failed: {e}")
+                        self._fail(items, e)
+        finally:
+            for item in batch:
+                if not item.future.done():
+                    item.future.cancel()
+            self._slots.release()
+
+    @staticmethod
+    async def _embed(batch: List[_PendingText]) -> None:
+        """Send texts with their first text's caller's embedder and resolve their futures."""
+        request = batch[0].request
+        embeddings = await request.embed_fn(
+            [item.text for item in batch], [item.tokens for item in batch], request.logger
+        )
+        if len(embeddings) != len(batch):
+            raise SyncFailureError(
+                f"PROGRAMMING ERROR: Got {len(embeddings)} embeddings for {len(batch)} texts"
+            )
+        for item, embedding in zip(batch, embeddings, strict=True):
+            if not item.future.done():
+                item.future.set_result(embedding)
+
+    @staticmethod
+    def _fail(batch: List[_PendingText], error: Exception) -> None:
+        for item in batch:
+            if not item.future.done():
+                item.future.set_exception(error)
+
+
+_batchers: Dict[str, EmbeddingBatcher] = {}
+
+
+def get_embedding_batcher(
+    name: str,
+    max_inputs: int,
+    max_tokens: int,
+    max_concurrent: int,
+) -> EmbeddingBatcher:
+    """Get the pod-wide batcher for `name` (model and dimensions), creating it once."""
+    batcher = _batchers.get(name)
+    if batcher is None:
+        batcher = EmbeddingBatcher(
+            name,
+            max_inputs=max_inputs,
+            max_tokens=max_tokens,
+            max_concurrent=max_concurrent,
+            max_linger_seconds=settings.EMBEDDING_BATCHER_MAX_LINGER_MS / 1000,
+        )
+        _batchers[name] = batcher
+    return batcher
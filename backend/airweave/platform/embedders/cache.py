@@ -0,0 +1,323 @@
+"""Content-addressed embedding cache.
+
+Embeddings are keyed by (model name, dimensions, sha256 of the text), so a chunk whose
+text has not changed since the last sync is never sent to the provider again - e.g. an
+edited 200-page document where only one paragraph changed.
+
+Two layers are available:
+- LRUEmbeddingCache: in-process, bounded by entry count, payload bytes and TTL
+- RedisEmbeddingCache: shared across pods, bounded by TTL (and Redis maxmemory policy)
+
+EmbeddingCache chains the layers: lookups go front to back and promote hits into the
+faster layers, writes go to every layer. Cache failures never fail a sync - a broken
+layer is logged and treated as a miss.
+
+Only valid embeddings are cached: providers return all-zero vectors for failed or
+oversized inputs, and caching those would serve them for the whole TTL.
+"""
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Protocol, Sequence, TypeVar
+
+import numpy as np
+from fastembed import SparseEmbedding
+
+from airweave.core.config import settings
+from airweave.core.local_cache import LocalCache
+from airweave.core.logging import logger as default_logger
+
+T = TypeVar("T")
+
+
+# -----------------------------------------------------------------------------
+# Keys and codecs
+# -----------------------------------------------------------------------------
+
+
+def embedding_cache_key(model_name: str, dimensions: int, text: str) -> str:
+    """Build the content-addressed cache key for one text."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{model_name}:{dimensions}:{digest}"
+
+
+def encode_dense(vector: List[float]) -> str:
+    """Encode a dense vector as base64 float32 (4 bytes per dimension)."""
+    return base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode("ascii")
+
+
+def decode_dense(payload: str) -> List[float]:
+    """Decode a dense vector produced by encode_dense."""
+    return np.frombuffer(base64.b64decode(payload), dtype=np.float32).tolist()
+
+
+def encode_sparse(embedding: SparseEmbedding) -> str:
+    """Encode a sparse embedding as compact JSON."""
+    return json.dumps(
+        {
+            "i": np.asarray(embedding.indices).tolist(),
+            "v": np.asarray(embedding.values).tolist(),
+        },
+        separators=(",", ":"),
+    )
+
+
+def decode_sparse(payload: str) -> SparseEmbedding:
+    """Decode a sparse embedding produced by encode_sparse."""
+    data = json.loads(payload)
+    return SparseEmbedding(
+        indices=np.asarray(data["i"], dtype=np.int64),
+        values=np.asarray(data["v"], dtype=np.float32),
+    )
+
+
+def is_cacheable_dense(vector: List[float]) -> bool:
+    """Whether a dense vector is worth caching (non-empty, finite, not all zeros)."""
+    array = np.asarray(vector, dtype=np.float32)
+    return array.size > 0 and bool(np.isfinite(array).all()) and bool(array.any())
+
+
+def is_cacheable_sparse(embedding: SparseEmbedding) -> bool:
+    """Whether a sparse embedding is worth caching (finite, with a non-zero value)."""
+    values = np.asarray(embedding.values, dtype=np.float32)
+    return values.size > 0 and bool(np.isfinite(values).all()) and bool(values.any())
+
+
+# -----------------------------------------------------------------------------
+# Layers
+# -----------------------------------------------------------------------------
+
+
+class EmbeddingCacheLayer(Protocol):
+    """Storage layer for serialized embeddings."""
+
+    name: str
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """Return the payload for each key, or None on miss."""
+        ...
+
+    async def set_many(self, items: Dict[str, str]) -> None:
+        """Store payloads by key."""
+        ...
+
+
+class LRUEmbeddingCache:
+    """In-process LRU layer, evicting by entry count, payload bytes and TTL."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: int):
+        """Initialize the LRU layer.
+
+        Args:
+            max_entries: Maximum number of cached embeddings
+            max_bytes: Maximum total payload size in bytes
+            ttl_seconds: Time-to-live per entry (0 disables expiry)
+        """
+        self._entries: LocalCache[str, str] = LocalCache(
+            "EmbeddingCache",
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds or None,
+            max_bytes=max_bytes,
+        )
+
+    @property
+    def size_bytes(self) -> int:
+        """Total payload bytes currently held."""
+        return self._entries.size_bytes
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """Return cached payloads, refreshing recency and dropping expired entries."""
+        return [self._entries.get(key) for key in keys]
+
+    async def set_many(self, items: Dict[str, str]) -> None:
+        """Store payloads, evicting least recently used entries past the bounds."""
+        for key, payload in items.items():
+            self._entries.set(key, payload)
+
+
+class RedisEmbeddingCache:
+    """Shared Redis layer with per-key TTL."""
+
+    name = "redis"
+    KEY_PREFIX = "embedding_cache"
+
+    def __init__(self, ttl_seconds: int):
+        """Initialize the Redis layer.
+
+        Args:
+            ttl_seconds: Time-to-live per entry
+        """
+        self._ttl = ttl_seconds
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}:{key}"
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """Fetch payloads with a single MGET."""
+        from airweave.core.redis_client import redis_client
+
+        if not keys:
+            return []
+        return await redis_client.client.mget([self._redis_key(k) for k in keys])
+
+    async def set_many(self, items: Dict[str, str]) -> None:
+        """Store payloads with SETEX in one pipeline."""
+        from airweave.core.redis_client import redis_client
+
+        if not items:
+            return
+        pipe = redis_client.client.pipeline(transaction=False)
+        for key, payload in items.items():
+            pipe.setex(self._redis_key(key), self._ttl, payload)
+        await pipe.execute()
+
+
+# -----------------------------------------------------------------------------
+# Tiered cache
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class EmbeddingCacheResult:
+    """Outcome of a cached embedding call."""
+
+    embeddings: List
+    hits: int
+    misses: int
+
+
+class EmbeddingCache:
+    """Tiered embedding cache in front of an embedding provider."""
+
+    def __init__(self, layers: List[EmbeddingCacheLayer]):
+        """Initialize with layers ordered fastest first."""
+        self._layers = layers
+
+    async def embed(
+        self,
+        texts: List[str],
+        model_name: str,
+        dimensions: int,
+        embed_fn: Callable[[List[str]], Awaitable[List[T]]],
+        encode: Callable[[T], str],
+        decode: Callable[[str], T],
+        is_cacheable: Optional[Callable[[T], bool]] = None,
+    ) -> EmbeddingCacheResult:
+        """Embed texts, only sending cache misses to embed_fn.
+
+        Identical texts within the batch are embedded once. Embeddings rejected by
+        is_cacheable are neither stored nor served from the cache.
+
+        Args:
+            texts: Texts to embed
+            model_name: Embedding model (part of the cache key)
+            dimensions: Output dimensions (part of the cache key)
+            embed_fn: Provider call for the texts that missed
+            encode: Serializes one embedding for storage
+            decode: Deserializes one stored embedding
+            is_cacheable: Validates one embedding (e.g. is_cacheable_dense); None caches all
+
+        Returns:
+            EmbeddingCacheResult with embeddings in input order and hit/miss counts
+        """
+        keys = [embedding_cache_key(model_name, dimensions, text) for text in texts]
+        found = await self._lookup(list(dict.fromkeys(keys)))
+
+        resolved: Dict[str, T] = {}
+        for key, payload in found.items():
+            try:
+                embedding = decode(payload)
+            except Exception as e:
+                default_logger.warning(f"[EmbeddingCache] Dropping undecodable entry: {e}")
+                continue
+            if is_cacheable is None or is_cacheable(embedding):
+                resolved[key] = embedding
+
+        miss_texts: Dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in resolved:
+                miss_texts.setdefault(key, text)
+
+        if miss_texts:
+            fresh = await embed_fn(list(miss_texts.values()))
+            fresh_by_key = dict(zip(miss_texts.keys(), fresh, strict=True))
+            resolved.update(fresh_by_key)
+            cacheable = {
+                k: encode(v)
+                for k, v in fresh_by_key.items()
+                if is_cacheable is None or is_cacheable(v)
+            }
+            if len(cacheable) < len(fresh_by_key):
+                default_logger.warning(
+                    f"[EmbeddingCache] Not caching {len(fresh_by_key) - len(cacheable)} "
+                    "zero or invalid embedding(s)"
+                )
+            await self._store(cacheable)
+
+        hits = sum(1 for key in keys if key not in miss_texts)
+        return EmbeddingCacheResult(
+            embeddings=[resolved[key] for key in keys],
+            hits=hits,
+            misses=len(keys) - hits,
+        )
+
+    async def _lookup(self, keys: List[str]) -> Dict[str, str]:
+        """Look keys up layer by layer, promoting hits into faster layers."""
+        found: Dict[str, str] = {}
+        remaining = keys
+        for depth, layer in enumerate(self._layers):
+            if not remaining:
+                break
+            try:
+                payloads = await layer.get_many(remaining)
+            except Exception as e:
+                default_logger.warning(f"[EmbeddingCache] {layer.name} lookup failed: {e}")
+                continue
+
+            layer_hits = {k: p for k, p in zip(remaining, payloads, strict=True) if p is not None}
+            if layer_hits:
+                found.update(layer_hits)
+                for faster in self._layers[:depth]:
+                    await self._safe_set(faster, layer_hits)
+            remaining = [k for k in remaining if k not in layer_hits]
+        return found
+
+    async def _store(self, items: Dict[str, str]) -> None:
+        for layer in self._layers:
+            await self._safe_set(layer, items)
+
+    async def _safe_set(self, layer: EmbeddingCacheLayer, items: Dict[str, str]) -> None:
+        try:
+            await layer.set_many(items)
+        except Exception as e:
+            default_logger.warning(f"[EmbeddingCache] {layer.name} write failed: {e}")
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Get the pod-wide embedding cache, or None when disabled in settings."""
+    global _embedding_cache
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+    if _embedding_cache is None:
+        layers: List[EmbeddingCacheLayer] = [
+            LRUEmbeddingCache(
+                max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+                max_bytes=settings.EMBEDDING_CACHE_MAX_BYTES,
+                ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS,
+            )
+        ]
+        if settings.EMBEDDING_CACHE_BACKEND == "redis":
+            layers.append(RedisEmbeddingCache(ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS))
+        _embedding_cache = EmbeddingCache(layers)
+    return _embedding_cache
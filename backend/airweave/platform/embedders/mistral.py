@@ -14,6 +14,7 @@ except ImportError:
 from airweave.core.config import settings
 from airweave.core.logging import ContextualLogger
 from airweave.core.logging import logger as default_logger
+from airweave.platform.embedders.batcher import EmbeddingBatcher, get_embedding_batcher
 from airweave.platform.embedders.config import is_mock_model
 from airweave.platform.rate_limiters.mistral import MistralRateLimiter
 from airweave.platform.sync.async_helpers import run_in_thread_pool
@@ -138,13 +139,19 @@ class MistralDenseEmbedder(BaseEmbedder):
         return [emb for batch in results for emb in batch]
 
     async def _embed_with_token_limits(
-        self, texts: List[str], dimensions: int, logger: ContextualLogger
+        self,
+        texts: List[str],
+        dimensions: int,
+        logger: ContextualLogger,
+        token_counts: Optional[List[int]] = None,
     ) -> List[List[float]]:
         """Embed texts, splitting if token limits exceeded."""
         if not texts:
             return []
 
-        total_tokens = sum(self._tokenizer.count_tokens(text) for text in texts)
+        if token_counts is None:
+            token_counts = [self._tokenizer.count_tokens(text) for text in texts]
+        total_tokens = sum(token_counts)
 
         if len(texts) == 1 and total_tokens > self.MAX_TOKENS_PER_REQUEST:
             logger.warning(
@@ -156,12 +163,25 @@ class MistralDenseEmbedder(BaseEmbedder):
         if total_tokens > self.MAX_TOKENS_PER_REQUEST:
             logger.debug(f"[EMBED] Batch exceeds {self.MAX_TOKENS_PER_REQUEST} tokens, splitting")
             mid = len(texts) // 2
-            first_half = await self._embed_with_token_limits(texts[:mid], dimensions, logger)
-            second_half = await self._embed_with_token_limits(texts[mid:], dimensions, logger)
+            first_half = await self._embed_with_token_limits(
+                texts[:mid], dimensions, logger, token_counts[:mid]
+            )
+            second_half = await self._embed_with_token_limits(
+                texts[mid:], dimensions, logger, token_counts[mid:]
+            )
             return first_half + second_half
 
         return await self._embed_batches(texts)
 
+    def _batcher(self, dimensions: int) -> EmbeddingBatcher:
+        """Get the pod-wide batcher for this model."""
+        return get_embedding_batcher(
+            f"{self.MODEL_NAME}:{dimensions}",
+            max_inputs=self.MAX_BATCH_SIZE,
+            max_tokens=self.MAX_TOKENS_PER_REQUEST,
+            max_concurrent=self.MAX_CONCURRENT_REQUESTS,
+        )
+
     async def embed_many(
         self,
         texts: List[str],
@@ -189,6 +209,20 @@ class MistralDenseEmbedder(BaseEmbedder):
                 f"Requested {requested_dimensions}. Use OpenAI for custom dimensions."
             )
 
+        # Sync calls share pod-wide requests with other syncs when batching is enabled
+        sync_id = getattr(context, "sync_id", None)
+        if settings.EMBEDDING_BATCHER_ENABLED and sync_id is not None:
+            token_counts = [self._tokenizer.count_tokens(text) for text in texts]
+            return await self._batcher(requested_dimensions).submit(
+                texts,
+                token_counts,
+                key=sync_id,
+                embed_fn=lambda batch, tokens, batch_logger: self._embed_with_token_limits(
+                    batch, requested_dimensions, batch_logger, token_counts=tokens
+                ),
+                logger=logger,
+            )
+
         return await self._embed_with_token_limits(texts, requested_dimensions, logger)
 
     @staticmethod
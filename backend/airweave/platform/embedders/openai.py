@@ -14,6 +14,7 @@ from openai import AsyncOpenAI
 from airweave.core.config import settings
 from airweave.core.logging import ContextualLogger
 from airweave.core.logging import logger as default_logger
+from airweave.platform.embedders.batcher import EmbeddingBatcher, get_embedding_batcher
 from airweave.platform.rate_limiters.openai import OpenAIRateLimiter
 from airweave.platform.sync.exceptions import SyncFailureError
 
@@ -31,6 +32,7 @@ class OpenAIDenseEmbedder(BaseEmbedder):
     - Batch processing with OpenAI limits (2048 texts/request, 300K tokens/request)
     - 10 concurrent requests max (safe with 6 pods at Tier 4: 10,000 RPM)
     - Rate limiting with OpenAIRateLimiter singleton (shared across instances)
+    - Optional pod-wide request batching across syncs (EMBEDDING_BATCHER_ENABLED)
     - Automatic retry on transient errors (via AsyncOpenAI client)
     - Fail-fast on any API errors (no silent failures)
     """
@@ -124,14 +126,26 @@ class OpenAIDenseEmbedder(BaseEmbedder):
         # Count tokens for the entire batch
         # Use allowed_special="all" to handle special tokens like <|endoftext|>
         # that may appear in user content
-        total_tokens = sum(
-            len(self._tokenizer.encode(text, allowed_special="all")) for text in texts
-        )
+        token_counts = [len(self._tokenizer.encode(text, allowed_special="all")) for text in texts]
+        total_tokens = sum(token_counts)
 
         logger.debug(
             f"Embedding {len(texts)} texts with {total_tokens} tokens -> {output_dims}-dim vectors"
         )
 
+        # Sync calls share pod-wide requests with other syncs when batching is enabled
+        sync_id = getattr(context, "sync_id", None)
+        if settings.EMBEDDING_BATCHER_ENABLED and sync_id is not None:
+            return await self._batcher(output_dims).submit(
+                texts,
+                token_counts,
+                key=sync_id,
+                embed_fn=lambda batch, tokens, batch_logger: self._embed_sub_batch(
+                    batch, batch_logger, output_dims, token_counts=tokens
+                ),
+                logger=logger,
+            )
+
         # Split into smaller batches and process concurrently
         # Max 100 texts per sub-batch to stay under 300K token limit
         # (100 texts × 2000 avg tokens = 200K tokens, safely under 300K)
@@ -143,61 +157,7 @@ class OpenAIDenseEmbedder(BaseEmbedder):
                 texts[i : i + MAX_TEXTS_PER_SUBBATCH]
                 for i in range(0, len(texts), MAX_TEXTS_PER_SUBBATCH)
             ]
-
-            logger.debug(
-                f"[EMBED] Starting {len(sub_batches)} sub-batches "
-                f"(max {self.MAX_CONCURRENT_REQUESTS} concurrent)"
-            )
-
-            # Process sub-batches concurrently with semaphore limit
-            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
-            active_count = 0
-            active_lock = asyncio.Lock()
-            batch_start_time = time.monotonic()
-
-            async def embed_with_semaphore(
-                batch_idx: int, sub_batch: List[str]
-            ) -> List[List[float]]:
-                nonlocal active_count
-                wait_start = time.monotonic()
-
-                async with semaphore:
-                    async with active_lock:
-                        active_count += 1
-                        current_active = active_count
-
-                    wait_time = time.monotonic() - wait_start
-                    start_time = time.monotonic()
-                    logger.debug(
-                        f"[EMBED] Batch {batch_idx + 1}/{len(sub_batches)} STARTED "
-                        f"(texts={len(sub_batch)}, active={current_active}, wait={wait_time:.2f}s)"
-                    )
-
-                    try:
-                        result = await self._embed_sub_batch(sub_batch, logger, output_dims)
-                        elapsed = time.monotonic() - start_time
-                        logger.debug(
-                            f"[EMBED] Batch {batch_idx + 1}/{len(sub_batches)} DONE "
-                            f"in {elapsed:.2f}s (texts={len(sub_batch)})"
-                        )
-                        return result
-                    finally:
-                        async with active_lock:
-                            active_count -= 1
-
-            # Execute all sub-batches concurrently (limited by semaphore)
-            results = await asyncio.gather(
-                *[embed_with_semaphore(i, sb) for i, sb in enumerate(sub_batches)]
-            )
-
-            total_time = time.monotonic() - batch_start_time
-            logger.debug(
-                f"[EMBED] All {len(sub_batches)} sub-batches completed in {total_time:.2f}s "
-                f"(avg {total_time / len(sub_batches):.2f}s/batch)"
-            )
-
-            # Flatten results while preserving order
-            return [emb for batch_result in results for emb in batch_result]
+            return await self._embed_sub_batches(sub_batches, logger, output_dims)
 
         # Check if we need to split due to token limit
         if total_tokens > self.MAX_TOKENS_PER_REQUEST:
@@ -208,7 +168,7 @@ class OpenAIDenseEmbedder(BaseEmbedder):
             return first_half + second_half
 
         # Process single request with rate limiting
-        embeddings = await self._embed_batch(texts, logger, output_dims)
+        embeddings = await self._embed_batch(texts, logger, output_dims, tokens=total_tokens)
 
         # Validate result count matches input count
         if len(embeddings) != len(texts):
@@ -218,8 +178,81 @@ class OpenAIDenseEmbedder(BaseEmbedder):
 
         return embeddings
 
+    async def _embed_sub_batches(
+        self,
+        sub_batches: List[List[str]],
+        logger: ContextualLogger,
+        output_dims: int,
+    ) -> List[List[float]]:
+        """Embed sub-batches concurrently (up to MAX_CONCURRENT_REQUESTS), keeping order."""
+        logger.debug(
+            f"[EMBED] Starting {len(sub_batches)} sub-batches "
+            f"(max {self.MAX_CONCURRENT_REQUESTS} concurrent)"
+        )
+
+        # Process sub-batches concurrently with semaphore limit
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        active_count = 0
+        active_lock = asyncio.Lock()
+        batch_start_time = time.monotonic()
+
+        async def embed_with_semaphore(batch_idx: int, sub_batch: List[str]) -> List[List[float]]:
+            nonlocal active_count
+            wait_start = time.monotonic()
+
+            async with semaphore:
+                async with active_lock:
+                    active_count += 1
+                    current_active = active_count
+
+                wait_time = time.monotonic() - wait_start
+                start_time = time.monotonic()
+                logger.debug(
+                    f"[EMBED] Batch {batch_idx + 1}/{len(sub_batches)} STARTED "
+                    f"(texts={len(sub_batch)}, active={current_active}, wait={wait_time:.2f}s)"
+                )
+
+                try:
+                    result = await self._embed_sub_batch(sub_batch, logger, output_dims)
+                    elapsed = time.monotonic() - start_time
+                    logger.debug(
+                        f"[EMBED] Batch {batch_idx + 1}/{len(sub_batches)} DONE "
+                        f"in {elapsed:.2f}s (texts={len(sub_batch)})"
+                    )
+                    return result
+                finally:
+                    async with active_lock:
+                        active_count -= 1
+
+        # Execute all sub-batches concurrently (limited by semaphore)
+        results = await asyncio.gather(
+            *[embed_with_semaphore(i, sb) for i, sb in enumerate(sub_batches)]
+        )
+
+        total_time = time.monotonic() - batch_start_time
+        logger.debug(
+            f"[EMBED] All {len(sub_batches)} sub-batches completed in {total_time:.2f}s "
+            f"(avg {total_time / len(sub_batches):.2f}s/batch)"
+        )
+
+        # Flatten results while preserving order
+        return [emb for batch_result in results for emb in batch_result]
+
+    def _batcher(self, output_dims: int) -> EmbeddingBatcher:
+        """Get the pod-wide batcher for this model and output dimensions."""
+        return get_embedding_batcher(
+            f"{self.MODEL_NAME}:{output_dims}",
+            max_inputs=self.MAX_BATCH_SIZE,
+            max_tokens=self.MAX_TOKENS_PER_REQUEST,
+            max_concurrent=self.MAX_CONCURRENT_REQUESTS,
+        )
+
     async def _embed_sub_batch(
-        self, texts: List[str], logger: ContextualLogger, output_dims: int
+        self,
+        texts: List[str],
+        logger: ContextualLogger,
+        output_dims: int,
+        token_counts: Optional[List[int]] = None,
     ) -> List[List[float]]:
         """Embed a sub-batch, handling token limit splitting if needed.
 
@@ -233,6 +266,7 @@ class OpenAIDenseEmbedder(BaseEmbedder):
             texts: List of texts to embed (already within count limit)
             logger: Logger for debug output
             output_dims: Output dimension for embeddings
+            token_counts: Token count of each text, if already known
 
         Returns:
             List of embedding vectors (zero vectors for skipped texts)
@@ -242,7 +276,10 @@ class OpenAIDenseEmbedder(BaseEmbedder):
 
         # Count tokens for each text individually
         # Use allowed_special="all" to handle special tokens like <|endoftext|>
-        token_counts = [len(self._tokenizer.encode(text, allowed_special="all")) for text in texts]
+        if token_counts is None:
+            token_counts = [
+                len(self._tokenizer.encode(text, allowed_special="all")) for text in texts
+            ]
         total_tokens = sum(token_counts)
 
         # Handle single text that exceeds the limit - skip it gracefully
@@ -261,15 +298,23 @@ class OpenAIDenseEmbedder(BaseEmbedder):
                 f"Sub-batch exceeds {self.MAX_TOKENS_PER_REQUEST} tokens, splitting in half"
             )
             mid = len(texts) // 2
-            first_half = await self._embed_sub_batch(texts[:mid], logger, output_dims)
-            second_half = await self._embed_sub_batch(texts[mid:], logger, output_dims)
+            first_half = await self._embed_sub_batch(
+                texts[:mid], logger, output_dims, token_counts[:mid]
+            )
+            second_half = await self._embed_sub_batch(
+                texts[mid:], logger, output_dims, token_counts[mid:]
+            )
             return first_half + second_half
 
         # Process single request
-        return await self._embed_batch(texts, logger, output_dims)
+        return await self._embed_batch(texts, logger, output_dims, tokens=total_tokens)
 
     async def _embed_batch(
-        self, batch: List[str], logger: ContextualLogger, output_dims: int
+        self,
+        batch: List[str],
+        logger: ContextualLogger,
+        output_dims: int,
+        tokens: Optional[int] = None,
     ) -> List[List[float]]:
         """Embed single batch with rate limiting and error handling.
 
@@ -277,19 +322,24 @@ class OpenAIDenseEmbedder(BaseEmbedder):
             batch: List of texts to embed (must fit in one OpenAI request)
             logger: Logger for debug output
             output_dims: Output dimension for embeddings (Matryoshka support)
+            tokens: Token count of the batch, charged against the TPM limit
 
         Returns:
             List of embedding vectors
 
         Raises:
-            SyncFailureError: On any API error
+            SyncFailureError: On invalid responses, or if no rate limit slot is available
         """
+        # Rate limit (singleton shared across pod). The limiter only paces requests, so a
+        # timeout here means the pod is stuck - fail instead of storing zero vectors.
+        rate_limit_start = time.monotonic()
         try:
-            # Rate limit (singleton shared across pod)
-            rate_limit_start = time.monotonic()
-            await self._rate_limiter.acquire()
-            rate_limit_wait = time.monotonic() - rate_limit_start
+            await self._rate_limiter.acquire(tokens=tokens)
+        except TimeoutError as e:
+            raise SyncFailureError(f"OpenAI rate limit slot unavailable: {e}") from e
+        rate_limit_wait = time.monotonic() - rate_limit_start
 
+        try:
             # Call OpenAI API with explicit dimensions (Matryoshka support)
             api_start = time.monotonic()
             response = await self._client.embeddings.create(
@@ -1,9 +1,9 @@
 from datetime import datetime
-from typing import Any, ClassVar, Dict, List, Optional, Type
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Type
 from uuid import UUID
 
 from fastembed import SparseEmbedding
-from pydantic import BaseModel, ConfigDict, Field, create_model, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, create_model, model_validator
 
 
 class Breadcrumb(BaseModel):
@@ -66,6 +66,10 @@ class AirweaveSystemMetadata(BaseModel):
 
     # Set during chunking
     chunk_index: Optional[int] = Field(None, description="Index of the chunk in the file.")
+    chunk_hashes: Optional[List[str]] = Field(
+        None,
+        description="Per-chunk text hashes ordered by chunk index (set on parent entities).",
+    )
     original_entity_id: Optional[str] = Field(
         None, description="Original entity_id before chunking (for bulk deletes)"
     )
@@ -235,6 +239,21 @@ class FileEntity(BaseEntity):
 
     local_path: Optional[str] = Field(None, description="Local path of the file.")
 
+    # Download deferred by FileService until the entity is known to be new or changed
+    _pending_download: Optional[Callable[[], Awaitable[None]]] = PrivateAttr(default=None)
+
+    def content_fingerprint(self) -> Optional[str]:
+        """Return a version signal for the file content that is known before download.
+
+        Sources whose APIs report a content hash or version tag override this. With
+        FILE_FINGERPRINT_ENABLED, the entity hash uses the fingerprint instead of the
+        downloaded bytes, so unchanged files resolve to KEEP without being downloaded.
+
+        Returns:
+            Fingerprint string, or None to hash the downloaded content
+        """
+        return None
+
 
 class PolymorphicEntity(BaseEntity):
     """Base class for entities that are generated dynamically from table schemas."""
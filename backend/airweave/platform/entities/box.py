@@ -244,6 +244,10 @@ class BoxFileEntity(FileEntity):
             return self.permalink_url
         return f"https://app.box.com/file/{self.file_id}"
 
+    def content_fingerprint(self) -> Optional[str]:
+        """SHA1 of the content, falling back to the version etag."""
+        return self.sha1 or self.etag
+
 
 class BoxCommentEntity(BaseEntity):
     """Schema for Box comment entities."""
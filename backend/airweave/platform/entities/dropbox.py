@@ -204,3 +204,7 @@ class DropboxFileEntity(FileEntity):
         """Web URL that opens the file in Dropbox."""
         path = self.path_display or ""
         return f"https://www.dropbox.com/home{path}"
+
+    def content_fingerprint(self) -> Optional[str]:
+        """Dropbox content hash of the file."""
+        return self.content_hash
@@ -159,6 +159,10 @@ class GoogleDriveFileEntity(FileEntity):
             return self.web_view_link
         return f"https://drive.google.com/file/d/{self.file_id}/view"
 
+    def content_fingerprint(self) -> Optional[str]:
+        """MD5 of the content (not set for Google Workspace files, which are exported)."""
+        return self.md5_checksum
+
 
 class GoogleDriveFileDeletionEntity(DeletionEntity):
     """Deletion signal for a Google Drive file."""
@@ -127,3 +127,7 @@ class OneDriveDriveItemEntity(FileEntity):
         if self.web_url_override:
             return self.web_url_override
         return f"https://onedrive.live.com/?id={self.id}"
+
+    def content_fingerprint(self) -> Optional[str]:
+        """Content tag (changes with content only), falling back to the eTag."""
+        return self.ctag or self.etag
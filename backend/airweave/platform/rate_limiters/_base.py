@@ -1,24 +1,100 @@
 """Base rate limiter for API clients."""
 
 import asyncio
+import hashlib
 import time
-from typing import Optional
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 
+from airweave.core.config import settings
 from airweave.core.logging import logger
 
 
+@dataclass
+class _Bucket:
+    """Token bucket kept as a theoretical arrival time (GCRA).
+
+    The bucket is full when tat <= now. Each acquisition pushes tat forward by
+    cost / rate; a caller may proceed once tat - capacity / rate has passed.
+    """
+
+    rate: float  # Units refilled per second
+    capacity: float  # Burst size in units
+    tat: float = 0.0
+
+    def wait_for(self, cost: float, now: float) -> float:
+        """Seconds until `cost` units are available (<= 0 means now)."""
+        return max(self.tat, now) + (cost - self.capacity) / self.rate - now
+
+    def commit(self, cost: float, now: float) -> None:
+        """Reserve `cost` units."""
+        self.tat = max(self.tat, now) + cost / self.rate
+
+    def refund(self, cost: float) -> None:
+        """Give back units reserved by a caller that never used them."""
+        self.tat -= cost / self.rate
+
+
 class BaseRateLimiter:
     """Base class for per-pod singleton rate limiters.
 
-    Implements sliding window rate limiting with async-safe locks.
+    Implements token bucket rate limiting: acquire() reserves capacity immediately
+    and sleeps for exactly the computed wait, so there is no polling, and callers
+    are released in FIFO order (each reservation lands after the previous one).
+
+    Limits:
+    - requests: RATE_LIMIT_PER_POD_RPS, bursting up to a RATE_LIMIT_WINDOW_SECONDS worth
+    - tokens (optional): RATE_LIMIT_PER_POD_TPM, for weighted acquire(tokens=...) calls
+
+    With PLATFORM_RATE_LIMITER_REDIS_ENABLED and RATE_LIMIT_CLUSTER_RPS set, the buckets
+    live in Redis and the cluster-wide limits apply to all pods together; if Redis is
+    unavailable the per-pod buckets are used.
+
     Shared across all converter instances in the pod.
     """
 
     # Subclasses must define these class attributes
     RATE_LIMIT_PER_POD_RPS: float = NotImplemented  # Requests per second per pod
-    RATE_LIMIT_WINDOW_SECONDS: float = 1.0  # Sliding window size
+    RATE_LIMIT_WINDOW_SECONDS: float = 1.0  # Burst window
+    RATE_LIMIT_PER_POD_TPM: Optional[float] = None  # Tokens per minute per pod
     MAX_WAIT_FOR_SLOT_SECONDS: float = 30.0  # Max wait time
-    POLL_INTERVAL_SECONDS: float = 0.1  # Poll interval
+
+    # Cluster-wide limits, used when coordinating through Redis
+    RATE_LIMIT_CLUSTER_RPS: Optional[float] = None
+    RATE_LIMIT_CLUSTER_TPM: Optional[float] = None
+
+    REDIS_KEY_PREFIX = "platform_rate_limit"
+
+    # Lua script reserving cost in every bucket (KEYS) atomically, or none of them
+    # ARGV[1] = max wait; per bucket i: ARGV[3i-1] rate, ARGV[3i] capacity, ARGV[3i+1] cost
+    # Returns: {reserved (0/1), wait seconds as string}
+    LUA_RESERVE = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local max_wait = tonumber(ARGV[1])
+local wait = 0
+local tats = {}
+
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 3 - 1])
+    local capacity = tonumber(ARGV[i * 3])
+    local cost = tonumber(ARGV[i * 3 + 1])
+    local tat = math.max(tonumber(redis.call('GET', key) or 0), now)
+    tats[i] = tat + cost / rate
+    wait = math.max(wait, tat + (cost - capacity) / rate - now)
+end
+
+if wait > max_wait then
+    return {0, tostring(wait)}
+end
+
+for i, key in ipairs(KEYS) do
+    local ttl_ms = math.ceil((tats[i] - now) * 1000) + 1000
+    redis.call('SET', key, string.format('%.6f', tats[i]), 'PX', ttl_ms)
+end
+return {1, tostring(wait)}
+"""
+    LUA_RESERVE_SHA = hashlib.sha1(LUA_RESERVE.encode()).hexdigest()
 
     _instance: Optional["BaseRateLimiter"] = None
 
@@ -34,9 +110,16 @@ class BaseRateLimiter:
         if self._initialized:
             return
 
-        # Sliding window tracking
-        self._request_times: list[float] = []
-        self._lock = asyncio.Lock()
+        self._requests = _Bucket(
+            rate=self.RATE_LIMIT_PER_POD_RPS,
+            capacity=max(1.0, self.RATE_LIMIT_PER_POD_RPS * self.RATE_LIMIT_WINDOW_SECONDS),
+        )
+        self._tokens: Optional[_Bucket] = None
+        if self.RATE_LIMIT_PER_POD_TPM:
+            # Allow one minute's worth of tokens in a burst, like a TPM quota
+            self._tokens = _Bucket(
+                rate=self.RATE_LIMIT_PER_POD_TPM / 60, capacity=self.RATE_LIMIT_PER_POD_TPM
+            )
         self._initialized = True
 
         # Log initialization (subclass should provide details)
@@ -48,37 +131,88 @@ class BaseRateLimiter:
             f"{self.__class__.__name__} initialized: {self.RATE_LIMIT_PER_POD_RPS:.1f} RPS per pod"
         )
 
-    async def acquire(self):
+    async def acquire(self, tokens: Optional[float] = None):
         """Acquire a rate limit slot (blocks until available).
 
-        Uses sliding window algorithm to enforce rate limit.
         All instances in this pod share this limiter.
 
+        Args:
+            tokens: Weight of the request against the token limit (e.g. tokens in an
+                embedding request); ignored if the limiter has no token limit
+
         Raises:
-            TimeoutError: If can't acquire slot within MAX_WAIT_FOR_SLOT_SECONDS
+            TimeoutError: If the slot would not be available within MAX_WAIT_FOR_SLOT_SECONDS
         """
-        start_time = time.time()
-
-        while True:
-            now = time.time()
-
-            # Timeout check
-            if now - start_time > self.MAX_WAIT_FOR_SLOT_SECONDS:
-                raise TimeoutError(
-                    f"Failed to acquire {self.__class__.__name__} rate limit slot within "
-                    f"{self.MAX_WAIT_FOR_SLOT_SECONDS}s"
+        wait = None
+        if settings.PLATFORM_RATE_LIMITER_REDIS_ENABLED and self.RATE_LIMIT_CLUSTER_RPS:
+            wait = await self._reserve_cluster(tokens)
+        reserved_locally = wait is None
+        if reserved_locally:
+            wait = self._reserve_local(tokens)
+
+        if wait <= 0:
+            return
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            if reserved_locally:
+                for bucket, cost in self._costs(tokens):
+                    bucket.refund(cost)
+            raise
+
+    def _costs(self, tokens: Optional[float]) -> List[Tuple[_Bucket, float]]:
+        costs = [(self._requests, 1.0)]
+        if self._tokens is not None and tokens:
+            costs.append((self._tokens, float(tokens)))
+        return costs
+
+    def _reserve_local(self, tokens: Optional[float]) -> float:
+        """Reserve in the per-pod buckets and return the wait in seconds."""
+        now = time.monotonic()
+        costs = self._costs(tokens)
+        wait = max(bucket.wait_for(cost, now) for bucket, cost in costs)
+        self._raise_if_too_long(wait)
+        for bucket, cost in costs:
+            bucket.commit(cost, now)
+        return wait
+
+    async def _reserve_cluster(self, tokens: Optional[float]) -> Optional[float]:
+        """Reserve in the cluster-wide Redis buckets; None if Redis is unavailable."""
+        from redis.exceptions import NoScriptError
+
+        from airweave.core.redis_client import redis_client
+
+        name = self.__class__.__name__
+        keys = [f"{self.REDIS_KEY_PREFIX}:{name}:requests"]
+        args: List[float] = [
+            self.MAX_WAIT_FOR_SLOT_SECONDS,
+            self.RATE_LIMIT_CLUSTER_RPS,
+            max(1.0, self.RATE_LIMIT_CLUSTER_RPS * self.RATE_LIMIT_WINDOW_SECONDS),
+            1.0,
+        ]
+        if self.RATE_LIMIT_CLUSTER_TPM and tokens:
+            keys.append(f"{self.REDIS_KEY_PREFIX}:{name}:tokens")
+            args += [self.RATE_LIMIT_CLUSTER_TPM / 60, self.RATE_LIMIT_CLUSTER_TPM, float(tokens)]
+
+        try:
+            try:
+                result = await redis_client.client.evalsha(
+                    self.LUA_RESERVE_SHA, len(keys), *keys, *args
                 )
-
-            async with self._lock:
-                # Remove requests outside sliding window
-                cutoff = now - self.RATE_LIMIT_WINDOW_SECONDS
-                self._request_times = [t for t in self._request_times if t > cutoff]
-
-                # Check if slot available
-                if len(self._request_times) < self.RATE_LIMIT_PER_POD_RPS:
-                    # Slot available - claim it
-                    self._request_times.append(now)
-                    return
-
-            # At limit - wait and retry
-            await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
+            except NoScriptError:
+                result = await redis_client.client.eval(self.LUA_RESERVE, len(keys), *keys, *args)
+        except Exception as e:
+            logger.warning(f"{name} Redis coordination failed, using per-pod limit: {e}")
+            return None
+
+        wait = float(result[1])
+        if not int(result[0]):
+            self._raise_if_too_long(wait)
+        return wait
+
+    def _raise_if_too_long(self, wait: float) -> None:
+        if wait > self.MAX_WAIT_FOR_SLOT_SECONDS:
+            raise TimeoutError(
+                f"Failed to acquire {self.__class__.__name__} rate limit slot within "
+                f"{self.MAX_WAIT_FOR_SLOT_SECONDS}s (next slot in {wait:.1f}s)"
+            )
@@ -31,12 +31,14 @@ class FirecrawlRateLimiter(BaseRateLimiter):
     # Per-pod rate limit (conservative)
     RATE_LIMIT_PER_POD_RPS = 7.0  # RPS per pod (42/6 ≈ 7)
 
-    # Sliding window configuration
-    RATE_LIMIT_WINDOW_SECONDS = 1.0  # 1 second sliding window
+    # Cluster-wide limit (PLATFORM_RATE_LIMITER_REDIS_ENABLED)
+    RATE_LIMIT_CLUSTER_RPS = FIRECRAWL_WORKSPACE_RPS * 0.9
+
+    # Token bucket configuration
+    RATE_LIMIT_WINDOW_SECONDS = 1.0  # Burst of up to 1 second of requests
 
     # Acquisition timeout (very long - rate limiter paces but never fails sync)
     MAX_WAIT_FOR_SLOT_SECONDS = 3600.0  # 1 hour - only paces, never stops sync
-    POLL_INTERVAL_SECONDS = 0.1  # Check availability every 100ms
 
     # ==========================================================================
 
@@ -14,8 +14,7 @@ class MistralRateLimiter(BaseRateLimiter):
     Assumes 6 sync worker pods, each gets ~3 RPS (24 / 6 = 4, conservative: 3).
 
     Features:
-    - Sliding window rate limiting
-    - Async-safe with locks
+    - Token bucket rate limiting with exact, FIFO waits
     - Shared across all syncs in the pod
     """
 
@@ -30,12 +29,14 @@ class MistralRateLimiter(BaseRateLimiter):
     # Per-pod rate limit (use full capacity)
     RATE_LIMIT_PER_POD_RPS = 10.0  # RPS per pod (36 / 6 = 6)
 
-    # Sliding window configuration
-    RATE_LIMIT_WINDOW_SECONDS = 1.0  # 1 second sliding window
+    # Cluster-wide limit (PLATFORM_RATE_LIMITER_REDIS_ENABLED)
+    RATE_LIMIT_CLUSTER_RPS = MISTRAL_WORKSPACE_RPS * 0.9
+
+    # Token bucket configuration
+    RATE_LIMIT_WINDOW_SECONDS = 1.0  # Burst of up to 1 second of requests
 
     # Acquisition timeout (very long - rate limiter paces but never fails sync)
     MAX_WAIT_FOR_SLOT_SECONDS = 3600.0  # 1 hour - only paces, never stops sync
-    POLL_INTERVAL_SECONDS = 0.1  # Check availability every 100ms
 
     # ==========================================================================
 
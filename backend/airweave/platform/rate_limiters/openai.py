@@ -10,14 +10,16 @@ from ._base import BaseRateLimiter
 class OpenAIRateLimiter(BaseRateLimiter):
     """Per-pod rate limiter for OpenAI API.
 
-    Singleton shared across all CodeConverter instances in pod.
-    Based on gpt-5-nano limits: 10,000 RPM.
+    Singleton shared across all CodeConverter instances and OpenAI embedders in pod.
+    Based on gpt-5-nano limits: 10,000 RPM. Embedding calls also pass their token
+    count, enforcing a tokens-per-minute budget.
     """
 
     # ==================== CONFIGURATION (Class Attributes) ====================
 
     # OpenAI rate limits (gpt-5-nano)
     OPENAI_RPM_LIMIT = 10_000  # Requests per minute
+    OPENAI_TPM_LIMIT = 5_000_000  # Tokens per minute (text-embedding-3)
 
     # Deployment configuration
     NUM_SYNC_WORKER_PODS = 6  # Number of K8s sync worker pods
@@ -25,11 +27,17 @@ class OpenAIRateLimiter(BaseRateLimiter):
     # Per-pod rate limit (conservative)
     RATE_LIMIT_PER_POD_RPM = 1500  # RPM per pod (10k / 6 ≈ 1666, use 1500)
     RATE_LIMIT_PER_POD_RPS = RATE_LIMIT_PER_POD_RPM / 60  # = 25 RPS
+    RATE_LIMIT_PER_POD_TPM = 750_000  # TPM per pod (5M / 6 ≈ 833k, use 750k)
 
-    # Sliding window configuration
-    RATE_LIMIT_WINDOW_SECONDS = 1.0  # 1 second window
-    MAX_WAIT_FOR_SLOT_SECONDS = 30.0  # Max wait time
-    POLL_INTERVAL_SECONDS = 0.1  # Poll every 100ms
+    # Cluster-wide limits (PLATFORM_RATE_LIMITER_REDIS_ENABLED), 90% of the account limits
+    RATE_LIMIT_CLUSTER_RPS = OPENAI_RPM_LIMIT * 0.9 / 60  # = 150 RPS
+    RATE_LIMIT_CLUSTER_TPM = OPENAI_TPM_LIMIT * 0.9
+
+    # Token bucket configuration
+    RATE_LIMIT_WINDOW_SECONDS = 1.0  # Burst of up to 1 second of requests
+
+    # Acquisition timeout (very long - large requests wait for TPM, pacing the sync)
+    MAX_WAIT_FOR_SLOT_SECONDS = 3600.0  # 1 hour - only paces, never stops sync
 
     # ==========================================================================
 
@@ -40,5 +48,7 @@ class OpenAIRateLimiter(BaseRateLimiter):
         logger.debug(
             f"OpenAI rate limiter initialized: {self.RATE_LIMIT_PER_POD_RPS:.1f} RPS per pod "
             f"({self.NUM_SYNC_WORKER_PODS} pods × {self.RATE_LIMIT_PER_POD_RPS:.1f} = "
-            f"{self.NUM_SYNC_WORKER_PODS * self.RATE_LIMIT_PER_POD_RPS:.1f} RPS total)"
+            f"{self.NUM_SYNC_WORKER_PODS * self.RATE_LIMIT_PER_POD_RPS:.1f} RPS total, "
+            f"{self.RATE_LIMIT_PER_POD_TPM:,.0f} TPM per pod, "
+            f"timeout: {self.MAX_WAIT_FOR_SLOT_SECONDS / 60:.0f} min)"
         )
@@ -15,6 +15,7 @@ from typing import (
     ClassVar,
     Dict,
     Iterable,
+    List,
     Optional,
     Union,
 )
@@ -153,6 +154,55 @@ class BaseSource:
         """Get the cursor for this source."""
         return getattr(self, "_cursor", None)
 
+    def set_partition(self, partition: Optional[str]) -> None:
+        """Restrict generate_entities() to one partition from get_partitions().
+
+        Args:
+            partition: Partition key, or None to sync the whole source
+        """
+        self._partition = partition
+
+    @property
+    def partition(self) -> Optional[str]:
+        """Get the partition this instance syncs (None for the whole source)."""
+        return getattr(self, "_partition", None)
+
+    async def get_partitions(self) -> List[str]:
+        """List independent partitions of the source for a partitioned sync.
+
+        Override in sources whose data splits naturally (tables, shared drives,
+        projects, channels). With SYNC_PARTITIONING_ENABLED, each partition is synced
+        by its own activity, possibly on another worker, with `partition` set and the
+        cursor of the last completed sync. Partitions must not share entities.
+
+        Returns:
+            Partition keys; fewer than two (the default) keeps a single-activity sync
+        """
+        return []
+
+    def merge_partition_cursors(self, partition_cursors: Dict[str, dict]) -> dict:
+        """Merge the cursors partitions ended with into the cursor of the whole sync.
+
+        The default merge unions dict-valued fields one level deep; for other fields
+        the last partition wins. Each partition starts from the same cursor, so this is
+        only right if a partition's dicts hold just the entries it set. Override it when
+        partitions save the whole previous cursor back (e.g. per-table cursors).
+
+        Args:
+            partition_cursors: Cursor data by partition key, in get_partitions() order
+
+        Returns:
+            Cursor data for the whole source
+        """
+        merged: Dict[str, Any] = {}
+        for cursor_data in partition_cursors.values():
+            for key, value in cursor_data.items():
+                if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                    merged[key] = {**merged[key], **value}
+                else:
+                    merged[key] = value
+        return merged
+
     @classmethod
     def is_internal(cls) -> bool:
         """Check if this is an internal/test source.
@@ -1,6 +1,6 @@
 """Dropbox source implementation."""
 
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 import httpx
 from tenacity import retry, stop_after_attempt
@@ -384,6 +384,39 @@ class DropboxSource(BaseSource):
             has_explicit_shared_members=entry.get("has_explicit_shared_members"),
         )
 
+    def _make_file_download(self, file_entity: DropboxFileEntity) -> Callable[[], Awaitable[None]]:
+        """Build the download of a file into the temp directory (sets local_path)."""
+
+        async def download() -> None:
+            # Dropbox requires POST with special header containing the file path
+            import json
+
+            dropbox_api_arg = json.dumps({"path": file_entity.path_lower})
+
+            async with self.http_client() as download_client:
+                access_token = await self.get_access_token()
+                headers = {
+                    "Authorization": f"Bearer {access_token}",
+                    "Dropbox-API-Arg": dropbox_api_arg,
+                }
+
+                # Dropbox uses POST for downloads
+                response = await download_client.post(
+                    "https://content.dropboxapi.com/2/files/download",
+                    headers=headers,
+                )
+                response.raise_for_status()
+
+                # Save the file content
+                await self.file_downloader.save_bytes(
+                    entity=file_entity,
+                    content=response.content,
+                    filename_with_extension=file_entity.name,
+                    logger=self.logger,
+                )
+
+        return download
+
     async def _generate_file_entities(
         self, client: httpx.AsyncClient, folder_breadcrumbs: List[Breadcrumb], folder_path: str = ""
     ) -> AsyncGenerator[BaseEntity, None]:
@@ -418,43 +451,21 @@ class DropboxSource(BaseSource):
                     file_entity = self._create_file_entity(entry, folder_breadcrumbs)
 
                     try:
-                        # Download file using custom Dropbox download logic
-                        # Dropbox requires POST with special header containing the file path
-                        import json
-
-                        dropbox_api_arg = json.dumps({"path": file_entity.path_lower})
-
-                        async with self.http_client() as download_client:
-                            access_token = await self.get_access_token()
-                            headers = {
-                                "Authorization": f"Bearer {access_token}",
-                                "Dropbox-API-Arg": dropbox_api_arg,
-                            }
-
-                            # Dropbox uses POST for downloads
-                            response = await download_client.post(
-                                "https://content.dropboxapi.com/2/files/download",
-                                headers=headers,
+                        # Download deferred until change detection if the file is unchanged
+                        download = self._make_file_download(file_entity)
+                        if not self.file_downloader.defer_download(
+                            file_entity, download, self.logger
+                        ):
+                            await download()
+
+                        # Verify save succeeded
+                        if not file_entity.local_path:
+                            raise ValueError(
+                                f"Save failed - no local path set for {file_entity.name}"
                             )
-                            response.raise_for_status()
-
-                            # Save the file content
-                            content = response.content
-                            await self.file_downloader.save_bytes(
-                                entity=file_entity,
-                                content=content,
-                                filename_with_extension=file_entity.name,
-                                logger=self.logger,
-                            )
-
-                            # Verify save succeeded
-                            if not file_entity.local_path:
-                                raise ValueError(
-                                    f"Save failed - no local path set for {file_entity.name}"
-                                )
 
-                            self.logger.debug(f"Successfully downloaded file: {file_entity.name}")
-                            yield file_entity
+                        self.logger.debug(f"Successfully downloaded file: {file_entity.name}")
+                        yield file_entity
 
                     except FileSkippedException as e:
                         self.logger.debug(f"Skipping file: {e.reason}")
@@ -3,21 +3,39 @@
 This source connects to a PostgreSQL database and generates entities for each table
 based on its schema structure. It dynamically creates entity classes at runtime
 using the PolymorphicEntity system.
+
+Tables are streamed concurrently over a connection pool. Tables with a primary key
+and a modification column sync incrementally: each sync re-reads the rows modified
+since shortly before the table's watermark and detects deleted rows by diffing the
+primary keys saved by the previous sync against the table in SQL (or in Python where
+the diff's temp table can't be created, e.g. on a read replica).
+
+If any synced table (e.g. a view) has no diffable primary key, or the key snapshot
+its cursor references is missing, every table syncs in full and no cursor state is
+kept, so the sync's orphan cleanup detects deletes.
 """
 
+import asyncio
+import gzip
 import hashlib
+import io
 import json
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, AsyncGenerator, Dict, List, Optional, Type, Union
+from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional, Tuple, Type, Union
+from uuid import uuid4
 
 import asyncpg
 
 from airweave.core.pg_field_catalog_service import overwrite_catalog
 from airweave.core.shared_models import RateLimitLevel
 from airweave.db.session import get_db_context
+from airweave.platform.cursors import PostgreSQLCursor
 from airweave.platform.decorators import source
-from airweave.platform.entities._base import BaseEntity, PolymorphicEntity
+from airweave.platform.entities._base import BaseEntity, DeletionEntity, PolymorphicEntity
 from airweave.platform.sources._base import BaseSource
+from airweave.platform.storage.paths import paths
+from airweave.platform.sync.pipeline.encountered_ids import EncounteredIdStore, entity_id_hash
 from airweave.schemas.source_connection import AuthenticationMethod
 
 # Mapping of PostgreSQL types to Python types
@@ -42,6 +60,30 @@ PG_TYPE_MAP = {
 }
 
 
+def _storage():
+    """Get the storage backend (lazy to avoid circular import at module load)."""
+    from airweave.platform.storage import storage_backend
+
+    return storage_backend
+
+
+@dataclass
+class _TableSynced:
+    """Marker ending a key-tracked table's stream: the cursor values to save for it.
+
+    They are saved only once the table's entities were all yielded, so cursor
+    checkpoints never cover rows still waiting in the stream queue.
+    """
+
+    table_key: str
+    key_snapshot: str
+    watermark: Optional[str]
+
+
+# Put on the stream queue by a table worker that has no pending tables left
+_WORKER_DONE = object()
+
+
 @source(
     name="PostgreSQL",
     short_name="postgresql",
@@ -51,6 +93,8 @@ PG_TYPE_MAP = {
     config_class="PostgreSQLConfig",
     labels=["Database"],
     rate_limit_level=RateLimitLevel.ORG,
+    supports_continuous=True,
+    cursor_class=PostgreSQLCursor,
 )
 class PostgreSQLSource(BaseSource):
     """PostgreSQL source connector integrates with PostgreSQL databases to extract structured data.
@@ -74,12 +118,35 @@ class PostgreSQLSource(BaseSource):
         "primary_key_columns",
     }
 
+    # Entities buffered between the table streams and the sync
+    TABLE_STREAM_QUEUE_SIZE = 1000
+
+    # Column types and names a modification column is detected by (dates are too coarse)
+    MODIFICATION_COLUMN_TYPES = {
+        "timestamp",
+        "timestamp without time zone",
+        "timestamp with time zone",
+        "timestamptz",
+    }
+    MODIFICATION_COLUMN_NAMES = ("updated", "modified", "last_edited")
+
     def __init__(self):
         """Initialize the PostgreSQL source."""
         super().__init__()  # Initialize BaseSource to get cursor support
         self.conn: Optional[asyncpg.Connection] = None
+        self.max_concurrent_tables = 4
+        # table -> configured modification column
+        self.modification_columns: Dict[str, str] = {}
+        self.incremental_overlap_seconds = 300
         self.entity_classes: Dict[str, Type[PolymorphicEntity]] = {}
+        self.deletion_entity_classes: Dict[str, Type[DeletionEntity]] = {}
         self.column_field_mappings: Dict[str, Dict[str, str]] = {}
+        # table key -> (modification column, its SQL type); None for full scans
+        self.recency_columns: Dict[str, Optional[Tuple[str, str]]] = {}
+        # table key -> primary key column -> SQL type (empty if keys can't be diffed)
+        self.key_column_types: Dict[str, Dict[str, str]] = {}
+        # Off when a synced table can't diff keys (see _disable_key_diffs)
+        self.key_diffs_enabled = True
 
     @classmethod
     async def create(
@@ -96,12 +163,27 @@ class PostgreSQLSource(BaseSource):
                 - password: Password
                 - schema: Schema to sync (defaults to 'public')
                 - tables: Table to sync (defaults to '*')
-            config: Optional configuration parameters for the PostgreSQL source.
+            config: Optional configuration parameters for the PostgreSQL source:
+                - max_concurrent_tables: Tables streamed at once (defaults to 4)
+                - modification_columns: 'table:column' entries naming the column each
+                  table sets on every insert and update
+                - incremental_overlap_seconds: How far before the watermark incremental
+                  syncs re-read rows (defaults to 300)
         """
+        config = config or {}
         instance = cls()
         instance.config = (
             credentials.model_dump() if hasattr(credentials, "model_dump") else dict(credentials)
         )
+        instance.max_concurrent_tables = config.get("max_concurrent_tables", 4)
+        instance.incremental_overlap_seconds = config.get("incremental_overlap_seconds", 300)
+        modification_columns = config.get("modification_columns") or []
+        if isinstance(modification_columns, str):
+            modification_columns = modification_columns.split(",")
+        for entry in modification_columns:
+            table, _, column = entry.strip().rpartition(":")
+            if table and column:
+                instance.modification_columns[table.strip()] = column.strip()
         return instance
 
     def _get_table_key(self, schema: str, table: str) -> str:
@@ -116,38 +198,42 @@ class PostgreSQLSource(BaseSource):
             return f"{column_name}_field"
         return column_name
 
+    def _connection_kwargs(self) -> Dict[str, Any]:
+        """Connection arguments shared by the metadata connection and the table pool."""
+        # Convert localhost to 127.0.0.1 to avoid DNS resolution issues
+        host = (
+            "127.0.0.1"
+            if self.config["host"].lower() in ("localhost", "127.0.0.1")
+            else self.config["host"]
+        )
+        return {
+            "host": host,
+            "port": self.config["port"],
+            "user": self.config["user"],
+            "password": self.config["password"],
+            "database": self.config["database"],
+            "timeout": 90.0,  # Connection timeout (1.5 minutes)
+            "command_timeout": 900.0,  # Command timeout (15 minutes for slow queries)
+            # Add server settings to prevent idle timeouts
+            "server_settings": {
+                "jit": "off",  # Disable JIT for predictable performance
+                "statement_timeout": "0",  # No statement timeout (handled client-side)
+                "idle_in_transaction_session_timeout": "0",  # Disable idle timeout
+                "tcp_keepalives_idle": "30",  # Send keepalive after 30s of idle
+                "tcp_keepalives_interval": "10",  # Keepalive interval 10s
+                "tcp_keepalives_count": "6",  # Number of keepalives before considering dead
+            },
+        }
+
     async def _connect(self) -> None:
         """Establish database connection with timeout and error handling."""
         if not self.conn:
             try:
-                # Convert localhost to 127.0.0.1 to avoid DNS resolution issues
-                host = (
-                    "127.0.0.1"
-                    if self.config["host"].lower() in ("localhost", "127.0.0.1")
-                    else self.config["host"]
-                )
-
-                self.conn = await asyncpg.connect(
-                    host=host,
-                    port=self.config["port"],
-                    user=self.config["user"],
-                    password=self.config["password"],
-                    database=self.config["database"],
-                    timeout=90.0,  # Connection timeout (1.5 minutes)
-                    command_timeout=900.0,  # Command timeout (15 minutes for slow queries)
-                    # Add server settings to prevent idle timeouts
-                    server_settings={
-                        "jit": "off",  # Disable JIT for predictable performance
-                        "statement_timeout": "0",  # No statement timeout (handled client-side)
-                        "idle_in_transaction_session_timeout": "0",  # Disable idle timeout
-                        "tcp_keepalives_idle": "30",  # Send keepalive after 30s of idle
-                        "tcp_keepalives_interval": "10",  # Keepalive interval 10s
-                        "tcp_keepalives_count": "6",  # Number of keepalives before considering dead
-                    },
-                )
+                connection_kwargs = self._connection_kwargs()
+                self.conn = await asyncpg.connect(**connection_kwargs)
                 self.logger.info(
-                    f"Connected to PostgreSQL at {host}:{self.config['port']}, "
-                    f"database: {self.config['database']}"
+                    f"Connected to PostgreSQL at {connection_kwargs['host']}:"
+                    f"{self.config['port']}, database: {self.config['database']}"
                 )
             except asyncpg.InvalidPasswordError as e:
                 raise ValueError("Invalid database credentials") from e
@@ -166,6 +252,15 @@ class PostgreSQLSource(BaseSource):
             except Exception as e:
                 raise ValueError(f"Database connection failed: {str(e)}") from e
 
+    async def _create_pool(self, size: int) -> asyncpg.Pool:
+        """Create the pool tables are streamed over, one connection per concurrent table.
+
+        Metadata queries stay on the connection from _connect().
+        """
+        pool = await asyncpg.create_pool(min_size=size, max_size=size, **self._connection_kwargs())
+        self.logger.info(f"Opened pool of {size} PostgreSQL connection(s) for table streaming")
+        return pool
+
     async def _ensure_connection(self) -> None:
         """Ensure connection is alive and reconnect if needed."""
         if self.conn:
@@ -311,6 +406,13 @@ class PostgreSQLSource(BaseSource):
 
         self.column_field_mappings[table_key] = column_mapping
 
+        self.recency_columns[table_key] = self._select_modification_column(
+            schema, table, table_info["columns"]
+        )
+        self.key_column_types[table_key] = await self._get_key_column_types(
+            schema, table, table_info["primary_keys"]
+        )
+
         return PolymorphicEntity.create_table_entity_class(
             table_name=table,
             schema_name=schema,
@@ -318,6 +420,88 @@ class PostgreSQLSource(BaseSource):
             primary_keys=table_info["primary_keys"],
         )
 
+    def _select_modification_column(
+        self, schema: str, table: str, columns: Dict[str, Dict[str, Any]]
+    ) -> Optional[Tuple[str, str]]:
+        """Select the column incremental syncs of a table filter on.
+
+        Uses the column configured for the table, otherwise a timestamp column named
+        like 'updated' or 'modified'. Creation times and dates don't capture every
+        change, and NULLs would never be past a watermark, so tables without a NOT NULL
+        modification timestamp are fully scanned on every sync.
+
+        Returns:
+            (column, SQL type), or None to always scan the table in full
+        """
+        table_key = self._get_table_key(schema, table)
+        configured = self.modification_columns.get(table_key) or self.modification_columns.get(
+            table
+        )
+        if configured:
+            candidates = [configured]
+        else:
+            candidates = [
+                name
+                for name in columns
+                if any(k in name.lower() for k in self.MODIFICATION_COLUMN_NAMES)
+            ]
+
+        for name in candidates:
+            meta = columns.get(name)
+            if not meta or meta["pg_type"] not in self.MODIFICATION_COLUMN_TYPES:
+                continue
+            if meta["nullable"]:
+                continue
+            return name, meta["pg_type"]
+
+        if configured:
+            self.logger.warning(
+                f"Table {table_key}: Modification column '{configured}' is not a NOT NULL "
+                f"timestamp column, syncing the table in full"
+            )
+        return None
+
+    async def _get_key_column_types(
+        self, schema: str, table: str, primary_keys: List[str]
+    ) -> Dict[str, str]:
+        """Get the SQL types of the key columns, to cast snapshot values back for diffs.
+
+        Returns:
+            Key column -> SQL type, or an empty dict if the keys can't be diffed
+        """
+        if not primary_keys:
+            return {}
+        query = """
+            SELECT a.attname, format_type(a.atttypid, a.atttypmod) AS column_type
+            FROM pg_attribute a
+            WHERE a.attrelid = format('%I.%I', $1::text, $2::text)::regclass
+              AND a.attname = ANY($3::text[])
+        """
+        try:
+            rows = await self.conn.fetch(query, schema, table, primary_keys)
+        except asyncpg.PostgresError as e:
+            self.logger.warning(f"Could not resolve key column types of {schema}.{table}: {e}")
+            return {}
+        column_types = {row["attname"]: row["column_type"] for row in rows}
+        if set(column_types) != set(primary_keys):
+            return {}
+        return {pk: column_types[pk] for pk in primary_keys}
+
+    def _get_deletion_entity_class(self, table_key: str) -> Type[DeletionEntity]:
+        """Get the deletion entity class for a table, creating it on first use.
+
+        It also subclasses the table's entity class, so it is populated and resolved
+        like the table's polymorphic entities.
+        """
+        if table_key not in self.deletion_entity_classes:
+            entity_class = self.entity_classes[table_key]
+            self.deletion_entity_classes[table_key] = type(
+                f"{entity_class.__name__}Deletion",
+                (DeletionEntity, entity_class),
+                {"__module__": __name__, "deletes_entity_class": entity_class},
+            )
+        return self.deletion_entity_classes[table_key]
+
     async def _get_tables(self, schema: str) -> List[str]:
         """Get list of tables in a schema.
 
@@ -547,21 +731,29 @@ class PostgreSQLSource(BaseSource):
             **processed_data,
         )
 
-    async def _process_table_with_streaming(  # noqa: C901
+    async def _process_table_with_streaming(
         self,
+        conn: asyncpg.Connection,
         schema: str,
         table: str,
         entity_class: Type[PolymorphicEntity],
+        watermark: Optional[str] = None,
+        key_snapshot: Optional[io.BufferedIOBase] = None,
     ) -> AsyncGenerator[BaseEntity, None]:
         """Process table using server-side cursor for efficient streaming.
 
         Uses PostgreSQL's server-side cursor for optimal performance on large tables.
-        This avoids the OFFSET penalty and streams data efficiently.
+        This avoids the OFFSET penalty and streams data efficiently. Must run inside
+        a transaction on conn.
 
         Args:
+            conn: Connection the table is streamed over
             schema: Schema name
             table: Table name
             entity_class: Entity class for the table
+            watermark: Only stream rows modified since incremental_overlap_seconds
+                before this value
+            key_snapshot: Write the key of every streamed row here
 
         Yields:
             Entities from the table
@@ -583,30 +775,42 @@ class PostgreSQLSource(BaseSource):
                 SELECT * FROM "{schema}"."{table}"
             """
             query_args: list[Any] = []
+            if watermark is not None:
+                recency_column, recency_type = self.recency_columns[table_key]
+                query += (
+                    f'WHERE "{recency_column}" >= '
+                    f"$1::text::{recency_type} - make_interval(secs => $2)"
+                )
+                query_args.extend([watermark, float(self.incremental_overlap_seconds)])
+                self.logger.info(
+                    f"Table {table_key}: Streaming rows modified since "
+                    f"{self.incremental_overlap_seconds}s before {watermark}"
+                )
 
             # Use server-side cursor with prefetch for efficient streaming
             # This streams data from PostgreSQL without loading all into memory
-            async with self.conn.transaction():
-                cursor = self.conn.cursor(query, *query_args, prefetch=BUFFER_SIZE)
+            cursor = conn.cursor(query, *query_args, prefetch=BUFFER_SIZE)
 
-                async for record in cursor:
-                    # Process record to entity using consolidated logic
-                    entity = await self._process_record_to_entity(
-                        record, schema, table, entity_class, primary_keys
-                    )
+            async for record in cursor:
+                # Process record to entity using consolidated logic
+                entity = await self._process_record_to_entity(
+                    record, schema, table, entity_class, primary_keys
+                )
+                if key_snapshot is not None:
+                    self._write_snapshot_key(key_snapshot, entity.entity_id, record, primary_keys)
 
-                    # Buffer entity
-                    buffer.append(entity)
+                # Buffer entity
+                buffer.append(entity)
 
-                    # Yield buffered entities periodically
-                    if len(buffer) >= BUFFER_SIZE:
-                        for e in buffer:
-                            yield e
-                            total_records += 1
+                # Yield buffered entities periodically
+                if len(buffer) >= BUFFER_SIZE:
+                    for e in buffer:
+                        yield e
+                        total_records += 1
 
-                        if total_records % 1000 == 0:
-                            self.logger.info(f"Table {table_key}: Streamed {total_records} records")
-                        buffer = []
+                    if total_records % 1000 == 0:
+                        self.logger.info(f"Table {table_key}: Streamed {total_records} records")
+                    buffer = []
 
             # Yield remaining buffered entities
             for e in buffer:
@@ -625,79 +829,514 @@ class PostgreSQLSource(BaseSource):
 
     async def _process_table(
         self,
+        conn: asyncpg.Connection,
         schema: str,
         table: str,
-    ) -> AsyncGenerator[BaseEntity, None]:
-        """Process a single table using server-side cursor streaming.
+    ) -> AsyncGenerator[Union[BaseEntity, _TableSynced], None]:
+        """Process a single table: deleted rows first, then new and changed rows.
 
-        Uses PostgreSQL's server-side cursor for efficient streaming of data,
-        maintaining transaction consistency and avoiding OFFSET penalties.
+        Tables with a diffable primary key and a modification column sync incrementally
+        once the cursor holds their watermark and key snapshot. Everything is read in
+        one repeatable-read transaction, so the watermark and key snapshot saved for the
+        next sync match the rows yielded here.
+
+        Incremental scans re-read rows from incremental_overlap_seconds before the
+        watermark, so rows stamped before the watermark but committed after it are not
+        missed. The overlap's rows that didn't change again are yielded unchanged and
+        deduplicated by the sync's content hashes.
 
         Args:
+            conn: Connection the table is streamed over
             schema: Schema name
             table: Table name
 
         Yields:
-            Entities from the table
+            Deletion entities for removed rows, then entities from the table, then
+            (for key-tracked tables) the _TableSynced marker with the cursor values
         """
         table_key = self._get_table_key(schema, table)
+        entity_class = self.entity_classes[table_key]
+        key_column_types = self.key_column_types.get(table_key) or {}
+        recency = self.recency_columns.get(table_key)
+
+        track_keys, previous_snapshot = await self._load_key_tracking(table_key)
+        watermark = None
+        if recency and previous_snapshot is not None:
+            watermark = self._get_table_cursor_value("table_cursors", table_key)
+
+        key_snapshot_buffer = io.BytesIO()
+        key_snapshot = None
+        if track_keys:
+            key_snapshot = gzip.GzipFile(fileobj=key_snapshot_buffer, mode="wb")
+        new_watermark = None
+
+        async with conn.transaction(isolation="repeatable_read"):
+            if recency and track_keys:
+                new_watermark = await conn.fetchval(
+                    f'SELECT max("{recency[0]}")::text FROM "{schema}"."{table}"'
+                )
+
+            if previous_snapshot is not None:
+                async for entity in self._generate_deletions(
+                    conn, schema, table, key_column_types, previous_snapshot
+                ):
+                    yield entity
+
+            # A full scan sees every key; an incremental one reads them separately
+            async for entity in self._process_table_with_streaming(
+                conn,
+                schema,
+                table,
+                entity_class,
+                watermark=watermark,
+                key_snapshot=key_snapshot if watermark is None else None,
+            ):
+                yield entity
+            if key_snapshot and watermark is not None:
+                await self._write_current_keys(
+                    conn, schema, table, list(key_column_types), key_snapshot
+                )
+
+        if key_snapshot:
+            key_snapshot.close()
+            snapshot_path = await self._save_key_snapshot(table_key, key_snapshot_buffer.getvalue())
+            yield _TableSynced(table_key, snapshot_path, new_watermark)
 
-        # Create entity class if not already created
+    async def _load_key_tracking(self, table_key: str) -> Tuple[bool, Optional[bytes]]:
+        """Whether to save a key snapshot of the table, and the previous one to diff.
+
+        A table whose referenced snapshot is missing keeps its cursor values, since a
+        new snapshot would hide the rows deleted since the missing one.
+        """
+        if not self.key_column_types.get(table_key) or not self._key_snapshots_enabled():
+            return False, None
+        previous_snapshot = await self._load_key_snapshot(table_key)
+        if previous_snapshot is None and self._get_table_cursor_value("key_snapshots", table_key):
+            return False, None
+        return True, previous_snapshot
+
+    def _save_table_cursor(self, synced: _TableSynced) -> None:
+        """Save a synced table's key snapshot and watermark in the cursor."""
+        self._set_table_cursor_value("key_snapshots", synced.table_key, synced.key_snapshot)
+        if synced.watermark is not None:
+            self._set_table_cursor_value("table_cursors", synced.table_key, synced.watermark)
+
+    async def _generate_deletions(
+        self,
+        conn: asyncpg.Connection,
+        schema: str,
+        table: str,
+        key_column_types: Dict[str, str],
+        previous_snapshot: bytes,
+    ) -> AsyncGenerator[BaseEntity, None]:
+        """Yield deletions for the rows of the previous key snapshot that are gone.
+
+        The set diff runs in Postgres; if it can't (e.g. on a read-only replica), it
+        runs in Python instead.
+        """
+        table_key = self._get_table_key(schema, table)
+        try:
+            deleted = await self._diff_keys_in_sql(
+                conn, schema, table, key_column_types, previous_snapshot
+            )
+        except asyncpg.PostgresError as e:
+            self.logger.warning(
+                f"Table {table_key}: Could not diff keys in SQL, diffing them in Python: {e}"
+            )
+            deleted = await self._diff_keys_in_python(
+                conn, schema, table, list(key_column_types), previous_snapshot
+            )
+
+        if deleted:
+            self.logger.info(f"Table {table_key}: {len(deleted)} row(s) deleted since last sync")
+        deletion_class = self._get_deletion_entity_class(table_key)
+        for entity_id in deleted:
+            yield deletion_class(
+                entity_id=entity_id,
+                breadcrumbs=[],
+                name=table,
+                deletion_status="removed",
+            )
+
+    async def _diff_keys_in_sql(
+        self,
+        conn: asyncpg.Connection,
+        schema: str,
+        table: str,
+        key_column_types: Dict[str, str],
+        previous_snapshot: bytes,
+    ) -> List[str]:
+        """Get the entity IDs of the previous key snapshot's rows that are gone, in SQL.
+
+        The snapshot is copied into a temp table and anti-joined with the table on its
+        primary key. Runs in a savepoint, so a failed diff doesn't abort the table's
+        transaction.
+        """
+        key_matches = " AND ".join(
+            f't."{column}" = p.key_values[{i}]::{column_type}'
+            for i, (column, column_type) in enumerate(key_column_types.items(), 1)
+        )
+        diff_query = f"""
+            SELECT p.entity_id FROM "_airweave_previous_keys" p
+            WHERE NOT EXISTS (SELECT 1 FROM "{schema}"."{table}" t WHERE {key_matches})
+        """
+
+        async with conn.transaction():
+            await conn.execute(
+                'CREATE TEMP TABLE "_airweave_previous_keys" '
+                "(entity_id text, key_values text[]) ON COMMIT DROP"
+            )
+            await conn.copy_records_to_table(
+                "_airweave_previous_keys", records=self._read_snapshot_keys(previous_snapshot)
+            )
+            deleted = await conn.fetch(diff_query)
+            await conn.execute('DROP TABLE "_airweave_previous_keys"')
+        return [record["entity_id"] for record in deleted]
+
+    async def _diff_keys_in_python(
+        self,
+        conn: asyncpg.Connection,
+        schema: str,
+        table: str,
+        primary_keys: List[str],
+        previous_snapshot: bytes,
+    ) -> List[str]:
+        """Get the entity IDs of the previous key snapshot's rows that are gone, in Python.
+
+        The table's current entity IDs are streamed into a hash set of ~16 bytes per row,
+        then the snapshot is checked against it.
+        """
+        current_ids = EncounteredIdStore()
+        async for entity_id, _ in self._stream_current_keys(conn, schema, table, primary_keys):
+            current_ids.add(entity_id_hash(entity_id))
+        return [
+            entity_id
+            for entity_id, _ in self._read_snapshot_keys(previous_snapshot)
+            if not current_ids.contains(entity_id_hash(entity_id))
+        ]
+
+    async def _stream_current_keys(
+        self,
+        conn: asyncpg.Connection,
+        schema: str,
+        table: str,
+        primary_keys: List[str],
+    ) -> AsyncGenerator[Tuple[str, Any], None]:
+        """Stream the entity ID and key record of every row of the table."""
+        columns = ", ".join(f'"{pk}"' for pk in primary_keys)
+        query = f'SELECT {columns} FROM "{schema}"."{table}"'
+        async for record in conn.cursor(query, prefetch=10000):
+            # Same entity ID as _process_record_to_entity builds from the full row
+            data = dict(record)
+            self._parse_json_fields(data)
+            entity_id = self._generate_entity_id(schema, table, data, primary_keys)
+            yield self._ensure_entity_id_length(entity_id, schema, table), record
+
+    async def _write_current_keys(
+        self,
+        conn: asyncpg.Connection,
+        schema: str,
+        table: str,
+        primary_keys: List[str],
+        key_snapshot: io.BufferedIOBase,
+    ) -> None:
+        """Write the keys of all rows to the snapshot (for incremental scans)."""
+        async for entity_id, record in self._stream_current_keys(conn, schema, table, primary_keys):
+            self._write_snapshot_key(key_snapshot, entity_id, record, primary_keys)
+
+    @staticmethod
+    def _write_snapshot_key(
+        key_snapshot: io.BufferedIOBase, entity_id: str, record: Any, primary_keys: List[str]
+    ) -> None:
+        """Write a row's entity ID and key values (as text, for the SQL diff)."""
+        key_values = [record[pk] for pk in primary_keys]
+        if any(value is None for value in key_values):
+            return
+        line = json.dumps([entity_id, [str(value) for value in key_values]])
+        key_snapshot.write(line.encode() + b"\n")
+
+    @staticmethod
+    def _read_snapshot_keys(snapshot: bytes) -> Iterator[Tuple[str, List[str]]]:
+        """Read the (entity ID, key values) records of a key snapshot."""
+        with gzip.GzipFile(fileobj=io.BytesIO(snapshot), mode="rb") as lines:
+            for line in lines:
+                entity_id, key_values = json.loads(line)
+                yield entity_id, key_values
+
+    def _key_snapshots_enabled(self) -> bool:
+        """Key snapshots need a cursor to reference them and a connection to scope them."""
+        return (
+            self.key_diffs_enabled and self.cursor is not None and bool(self._source_connection_id)
+        )
+
+    def _get_undiffable_tables(self, schema: str, tables: List[str]) -> List[str]:
+        """Get the prepared tables whose deletes a key diff can't detect (views, no PK)."""
+        return [t for t in tables if not self.key_column_types.get(self._get_table_key(schema, t))]
+
+    async def _get_tables_missing_key_snapshots(self, schema: str, tables: List[str]) -> List[str]:
+        """Get the tables whose cursor references a key snapshot that no longer exists."""
+        missing = []
+        for table in tables:
+            snapshot_path = self._get_table_cursor_value(
+                "key_snapshots", self._get_table_key(schema, table)
+            )
+            if snapshot_path and not await _storage().exists(snapshot_path):
+                missing.append(table)
+        return missing
+
+    async def _get_tables_needing_orphan_cleanup(self, schema: str, tables: List[str]) -> str:
+        """Describe the prepared tables whose deletes only orphan cleanup can detect.
+
+        Returns:
+            Why key diffs can't detect every delete of this sync, or "" if they can
+        """
+        undiffable = self._get_undiffable_tables(schema, tables)
+        if undiffable:
+            return f"Tables without a diffable primary key: {', '.join(undiffable)}"
+        missing = await self._get_tables_missing_key_snapshots(schema, tables)
+        if missing:
+            return f"Tables with a missing key snapshot: {', '.join(missing)}"
+        return ""
+
+    async def _disable_key_diffs(self, reason: str) -> None:
+        """Sync every table in full and leave delete detection to orphan cleanup.
+
+        Orphan cleanup only runs when the source keeps no cursor state, and it would
+        delete the unchanged rows an incremental scan skips. So the watermarks and key
+        snapshots of all tables are dropped.
+        """
+        self.logger.info(f"{reason}. Syncing all tables in full so orphan cleanup detects deletes")
+        self.key_diffs_enabled = False
+        storage = _storage()
+        for snapshot_path in (self.cursor.data.get("key_snapshots") or {}).values():
+            await storage.delete(snapshot_path)
+        self.cursor.update(table_cursors={}, key_snapshots={})
+
+    def _get_table_cursor_value(self, field: str, table_key: str) -> Optional[str]:
+        """Get a table's value from a per-table cursor field."""
+        return (self.cursor.data.get(field) or {}).get(table_key)
+
+    def _set_table_cursor_value(self, field: str, table_key: str, value: str) -> None:
+        """Set a table's value in a per-table cursor field."""
+        values = dict(self.cursor.data.get(field) or {})
+        values[table_key] = value
+        self.cursor.update(**{field: values})
+
+    async def _load_key_snapshot(self, table_key: str) -> Optional[bytes]:
+        """Load the table's key snapshot referenced by the cursor.
+
+        Snapshots the cursor doesn't reference (from failed or superseded syncs) are
+        deleted.
+        """
+        storage = _storage()
+        snapshot_path = self._get_table_cursor_value("key_snapshots", table_key)
+        snapshots_dir = paths.pg_key_snapshots_dir(self._source_connection_id, table_key)
+        for path in await storage.list_files(snapshots_dir):
+            if path != snapshot_path:
+                await storage.delete(path)
+
+        if snapshot_path and await storage.exists(snapshot_path):
+            return await storage.read_file(snapshot_path)
+        if snapshot_path:
+            self.logger.warning(
+                f"Key snapshot of {table_key} is missing, syncing it in full and "
+                f"keeping its cursor values"
+            )
+        return None
+
+    async def _save_key_snapshot(self, table_key: str, content: bytes) -> str:
+        """Save a new key snapshot of the table and return its storage path."""
+        snapshot_path = paths.pg_key_snapshot_path(
+            self._source_connection_id, table_key, uuid4().hex
+        )
+        await _storage().write_file(snapshot_path, content)
+        return snapshot_path
+
+    async def _prepare_table(self, schema: str, table: str) -> None:
+        """Create the table's entity class on the metadata connection.
+
+        Runs for every table before streaming starts, since an asyncpg connection
+        can't run queries for several concurrent tables.
+        """
+        table_key = self._get_table_key(schema, table)
         if table_key not in self.entity_classes:
+            await self._ensure_connection()
             self.entity_classes[table_key] = await self._create_entity_class(schema, table)
 
-        entity_class = self.entity_classes[table_key]
-        # Always use server-side cursor for efficient streaming
-        # This provides consistent snapshot isolation and better performance
-        self.logger.info(f"Using server-side cursor for streaming {table_key}")
-        async for entity in self._process_table_with_streaming(schema, table, entity_class):
-            yield entity
+    async def _stream_tables(
+        self, pool: asyncpg.Pool, schema: str, tables: List[str], concurrency: int
+    ) -> AsyncGenerator[BaseEntity, None]:
+        """Stream the tables concurrently into one entity stream.
 
-    async def generate_entities(self) -> AsyncGenerator[BaseEntity, None]:
-        """Generate entities for all tables in specified schemas with incremental support."""
+        Each of `concurrency` tasks holds a pool connection and syncs the next pending
+        table. Entities pass through a bounded queue, so a slow sync pauses the
+        server-side cursors instead of buffering whole tables. A table's cursor values
+        are saved when its _TableSynced marker comes off the queue, after its last
+        entity was yielded.
+        """
+        pending: asyncio.Queue = asyncio.Queue()
+        for table in tables:
+            pending.put_nowait(table)
+        items: asyncio.Queue = asyncio.Queue(maxsize=self.TABLE_STREAM_QUEUE_SIZE)
+
+        workers = [
+            asyncio.create_task(self._stream_pending_tables(pool, schema, tables, pending, items))
+            for _ in range(concurrency)
+        ]
+        try:
+            running = len(workers)
+            while running:
+                item = await items.get()
+                if item is _WORKER_DONE:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                elif isinstance(item, _TableSynced):
+                    self._save_table_cursor(item)
+                else:
+                    yield item
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _stream_pending_tables(
+        self,
+        pool: asyncpg.Pool,
+        schema: str,
+        tables: List[str],
+        pending: asyncio.Queue,
+        items: asyncio.Queue,
+    ) -> None:
+        """Sync pending tables over one pool connection onto the stream queue.
+
+        Ends with _WORKER_DONE, or with the exception that stopped it.
+        """
+        try:
+            async with pool.acquire() as conn:
+                while not pending.empty():
+                    table = pending.get_nowait()
+                    table_key = self._get_table_key(schema, table)
+                    self.logger.info(
+                        f"Processing table {len(tables) - pending.qsize()}/{len(tables)}: "
+                        f"{table_key}"
+                    )
+                    async for item in self._process_table(conn, schema, table):
+                        await items.put(item)
+        except Exception as e:
+            await items.put(e)
+        else:
+            await items.put(_WORKER_DONE)
+
+    async def _persist_field_catalog(self, schema: str, tables: List[str]) -> None:
+        """Persist the field catalog snapshot of the synced tables (best effort)."""
+        try:
+            snapshot = await self._build_field_catalog_snapshot(schema, tables)
+            # Best-effort persistence (no failure of sync if catalog fails)
+            if getattr(self, "_organization_id", None) and getattr(
+                self, "_source_connection_id", None
+            ):
+                async with get_db_context() as db:
+                    await overwrite_catalog(
+                        db=db,
+                        organization_id=self._organization_id,  # type: ignore[arg-type]
+                        source_connection_id=self._source_connection_id,  # type: ignore[arg-type]
+                        snapshot=snapshot,
+                        logger=self.logger,
+                    )
+                    await db.commit()
+        except Exception as e:
+            self.logger.warning(f"Failed to update Postgres field catalog: {e}")
+
+    async def get_partitions(self) -> List[str]:
+        """One partition per table (or view) to sync, keyed by table name.
+
+        The field catalog covers all tables, so it is persisted here rather than by
+        each partition. Incremental syncs with a table whose deletes only orphan cleanup
+        can detect are not partitioned: a partition can't make the other tables sync
+        in full.
+        """
         try:
             await self._connect()
             schema = self.config.get("schema", "public") or "public"
             tables = await self._get_table_list(schema)
+            await self._persist_field_catalog(schema, tables)
+            if self._key_snapshots_enabled():
+                for table in tables:
+                    await self._prepare_table(schema, table)
+                reason = await self._get_tables_needing_orphan_cleanup(schema, tables)
+                if reason:
+                    self.logger.info(f"Not partitioning. {reason}")
+                    return []
+            return tables
+        finally:
+            if self.conn:
+                await self.conn.close()
+                self.conn = None
+
+    def merge_partition_cursors(self, partition_cursors: Dict[str, dict]) -> dict:
+        """Merge the partition cursors, taking each table's values from its own partition.
+
+        Every partition starts from the whole previous cursor and saves it back with only
+        its table's watermark and key snapshot replaced, so the default merge would
+        restore the previous values of all but the last partition's table.
+        """
+        merged = super().merge_partition_cursors(partition_cursors)
+        schema = self.config.get("schema", "public") or "public"
+        for field in ("table_cursors", "key_snapshots"):
+            values = {}
+            for table, cursor_data in partition_cursors.items():
+                table_key = self._get_table_key(schema, table)
+                value = (cursor_data.get(field) or {}).get(table_key)
+                if value is not None:
+                    values[table_key] = value
+            merged[field] = values
+        return merged
+
+    async def generate_entities(self) -> AsyncGenerator[BaseEntity, None]:
+        """Generate entities for all tables in specified schemas with incremental support.
+
+        Up to max_concurrent_tables tables are streamed at once, each over its own
+        pooled connection; see _process_table() for incremental syncs.
+        """
+        pool: Optional[asyncpg.Pool] = None
+        try:
+            await self._connect()
+            schema = self.config.get("schema", "public") or "public"
+            if self.partition:
+                tables = [self.partition]
+            else:
+                tables = await self._get_table_list(schema)
 
             self.logger.info(
                 f"Found {len(tables)} table(s) to sync in schema '{schema}': {', '.join(tables)}"
             )
 
             # Persist field catalog snapshot for this connection before streaming
-            try:
-                snapshot = await self._build_field_catalog_snapshot(schema, tables)
-                # Best-effort persistence (no failure of sync if catalog fails)
-                if getattr(self, "_organization_id", None) and getattr(
-                    self, "_source_connection_id", None
-                ):
-                    async with get_db_context() as db:
-                        await overwrite_catalog(
-                            db=db,
-                            organization_id=self._organization_id,  # type: ignore[arg-type]
-                            source_connection_id=self._source_connection_id,  # type: ignore[arg-type]
-                            snapshot=snapshot,
-                            logger=self.logger,
-                        )
-                        await db.commit()
-            except Exception as e:
-                self.logger.warning(f"Failed to update Postgres field catalog: {e}")
+            if not self.partition:
+                await self._persist_field_catalog(schema, tables)
 
-            # Process tables WITHOUT a long-running transaction
-            # This prevents transaction timeout issues and allows better connection management
-            for i, table in enumerate(tables, 1):
-                table_key = self._get_table_key(schema, table)
-                self.logger.info(f"Processing table {i}/{len(tables)}: {table_key}")
+            for table in tables:
+                await self._prepare_table(schema, table)
 
-                # Check connection health before processing each table
-                await self._ensure_connection()
+            # get_partitions() only partitions sources whose tables can all diff keys
+            if not self.partition and self._key_snapshots_enabled():
+                reason = await self._get_tables_needing_orphan_cleanup(schema, tables)
+                if reason:
+                    await self._disable_key_diffs(reason)
 
-                async for entity in self._process_table(schema, table):
-                    yield entity
+            # Each table runs in its own short transaction on a pooled connection,
+            # which prevents transaction timeouts of one long-running transaction
+            concurrency = max(1, min(self.max_concurrent_tables, len(tables)))
+            pool = await self._create_pool(concurrency)
+            async for entity in self._stream_tables(pool, schema, tables, concurrency):
+                yield entity
 
             self.logger.info(f"Successfully completed sync for all {len(tables)} table(s)")
 
         finally:
+            if pool:
+                await pool.close()
             if self.conn:
                 self.logger.info("Closing PostgreSQL connection")
                 await self.conn.close()
@@ -830,7 +1469,13 @@ class PostgreSQLSource(BaseSource):
 
         def is_ts(col: Dict[str, Any]) -> bool:
             dt = (col.get("data_type") or "").lower()
-            return dt in {"timestamp", "timestamp with time zone", "timestamptz", "date"}
+            return dt in {
+                "timestamp",
+                "timestamp without time zone",
+                "timestamp with time zone",
+                "timestamptz",
+                "date",
+            }
 
         candidates = [c for c in columns if is_ts(c)]
         if not candidates:
@@ -503,6 +503,7 @@ class StubSource(BaseSource):
         self.seed: int = 42
         self.entity_count: int = 10
         self.generation_delay_ms: int = 0
+        self.partition_count: int = 1
         self.weights: Dict[str, int] = {}
         self.generator: Optional[ContentGenerator] = None
         self._temp_dir: Optional[str] = None
@@ -528,6 +529,7 @@ class StubSource(BaseSource):
         instance.seed = config.get("seed", 42)
         instance.entity_count = config.get("entity_count", 10)
         instance.generation_delay_ms = config.get("generation_delay_ms", 0)
+        instance.partition_count = config.get("partition_count", 1)
 
         # Parse distribution weights
         instance.weights = {
@@ -839,12 +841,56 @@ class StubSource(BaseSource):
             commit_id=f"stub-commit-{self.seed}-{index}",
         )
 
+    async def get_partitions(self) -> List[str]:
+        """Split the entity indices into partition_count contiguous ranges.
+
+        Returns:
+            Partition keys of the form "<start>-<end>" (end exclusive).
+        """
+        if self.partition_count <= 1:
+            return []
+        count = min(self.partition_count, self.entity_count)
+        bounds = [self.entity_count * k // count for k in range(count + 1)]
+        return [f"{start}-{end}" for start, end in zip(bounds, bounds[1:], strict=False)]
+
+    def _index_range(self) -> Tuple[int, int]:
+        """Entity indices to generate: the set partition's range, or resume at the cursor."""
+        if self.partition:
+            start_index, end_index = (int(bound) for bound in self.partition.split("-"))
+            return start_index, end_index
+
+        start_index = 0
+        if self.cursor:
+            # Resume after the last entity covered by a mid-sync checkpoint
+            start_index = self.cursor.data.get("next_index", 0)
+            if start_index:
+                self.logger.info(f"Resuming stub entity generation at index {start_index}")
+        return start_index, self.entity_count
+
+    async def _generate_entity(
+        self, entity_type: str, index: int, breadcrumbs: List[Breadcrumb]
+    ) -> BaseEntity:
+        """Generate the entity at an index for its selected type."""
+        generators = {
+            "small": self._generate_small_entity,
+            "medium": self._generate_medium_entity,
+            "large": self._generate_large_entity,
+            "small_file": self._generate_small_file_entity,
+            "large_file": self._generate_large_file_entity,
+            "code_file": self._generate_code_file_entity,
+        }
+        # Fallback to small entity
+        generate = generators.get(entity_type, self._generate_small_entity)
+        return await generate(index, breadcrumbs)
+
     async def generate_entities(self) -> AsyncGenerator[BaseEntity, None]:
-        """Generate all stub entities.
+        """Generate all stub entities (or the index range of the set partition).
 
         Yields:
             BaseEntity instances according to configured distribution.
         """
+        start_index, end_index = self._index_range()
+
         self.logger.info(
             f"Starting stub entity generation: count={self.entity_count}, "
             f"seed={self.seed}, delay={self.generation_delay_ms}ms"
@@ -862,8 +908,10 @@ class StubSource(BaseSource):
             entity_count=self.entity_count,
             breadcrumbs=[],
         )
-        yield container
-        self.logger.info(f"Yielded container entity: {container_id}")
+        # Partitions must not share entities: the first one owns the container
+        if not self.partition or start_index == 0:
+            yield container
+            self.logger.info(f"Yielded container entity: {container_id}")
 
         # Create breadcrumb for child entities
         container_breadcrumb = Breadcrumb(
@@ -884,28 +932,15 @@ class StubSource(BaseSource):
         }
 
         # Generate entities according to distribution
-        for i in range(self.entity_count):
+        for i in range(start_index, end_index):
             entity_type = self._select_entity_type(i)
             type_counts[entity_type] += 1
 
-            # Generate entity based on type
-            if entity_type == "small":
-                entity = await self._generate_small_entity(i, breadcrumbs)
-            elif entity_type == "medium":
-                entity = await self._generate_medium_entity(i, breadcrumbs)
-            elif entity_type == "large":
-                entity = await self._generate_large_entity(i, breadcrumbs)
-            elif entity_type == "small_file":
-                entity = await self._generate_small_file_entity(i, breadcrumbs)
-            elif entity_type == "large_file":
-                entity = await self._generate_large_file_entity(i, breadcrumbs)
-            elif entity_type == "code_file":
-                entity = await self._generate_code_file_entity(i, breadcrumbs)
-            else:
-                # Fallback to small entity
-                entity = await self._generate_small_entity(i, breadcrumbs)
+            yield await self._generate_entity(entity_type, i, breadcrumbs)
 
-            yield entity
+            # Updated after the yield, so the cursor only covers yielded entities
+            if self.cursor and not self.partition:
+                self.cursor.update(next_index=i + 1)
 
             # Apply generation delay if configured
             if self.generation_delay_ms > 0:
@@ -917,6 +952,10 @@ class StubSource(BaseSource):
 
         self.logger.info(f"Completed stub entity generation. Distribution: {type_counts}")
 
+        # Every completed sync is a full sync again
+        if self.cursor and not self.partition:
+            self.cursor.update(next_index=0)
+
     async def validate(self) -> bool:
         """Validate the stub source configuration.
 
@@ -4,17 +4,19 @@ Handles:
 - Downloading files from URLs to temp directory
 - Restoring files from ARF storage to temp directory
 - File validation (extension, size)
+- Deferring downloads until change detection (files with content fingerprints)
 - Temp directory cleanup
 """
 
 import os
 import shutil
-from typing import TYPE_CHECKING, Callable, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, Tuple
 from uuid import UUID, uuid4
 
 import httpx
 from tenacity import retry, stop_after_attempt
 
+from airweave.core.config import settings
 from airweave.core.logging import ContextualLogger
 from airweave.platform.entities._base import FileEntity
 from airweave.platform.sources.retry_helpers import (
@@ -36,6 +38,7 @@ class FileService:
     - Download files from URLs to temp (for live sources)
     - Restore files from ARF storage to temp (for replay)
     - Validate files before download (extension, size)
+    - Defer downloads of fingerprinted files until they are known to be new or changed
     - Save in-memory bytes to temp
     - Cleanup temp directory after sync
     """
@@ -209,10 +212,21 @@ class FileService:
         Returns:
             FileEntity with local_path set
 
+        Note:
+            Files with a content fingerprint are not downloaded here when
+            FILE_FINGERPRINT_ENABLED is set (see defer_download).
+
         Raises:
             FileSkippedException: If file should be skipped
             ValueError: If url is missing
         """
+
+        async def download() -> None:
+            await self._download_to_temp(entity, http_client_factory, access_token_provider, logger)
+
+        if self.defer_download(entity, download, logger):
+            return entity
+
         should_download, skip_reason = await self._validate_file_before_download(
             entity, http_client_factory, access_token_provider, logger
         )
@@ -221,6 +235,20 @@ class FileService:
             logger.debug(f"Skipping download of {entity.name}: {skip_reason}")
             raise FileSkippedException(reason=skip_reason, filename=entity.name)
 
+        await download()
+        return entity
+
+    async def _download_to_temp(
+        self,
+        entity: FileEntity,
+        http_client_factory: Callable,
+        access_token_provider: Callable,
+        logger: ContextualLogger,
+    ) -> None:
+        """GET the file into the temp directory and set entity.local_path."""
+        if not entity.url:
+            raise ValueError(f"No download URL for file {entity.name}")
+
         file_uuid = str(uuid4())
         safe_filename = self._safe_filename(entity.name)
         temp_path = f"{self.base_temp_dir}/{file_uuid}-{safe_filename}"
@@ -245,7 +273,6 @@ class FileService:
 
             logger.debug(f"Downloaded file to: {temp_path}")
             entity.local_path = temp_path
-            return entity
 
         except Exception:
             if os.path.exists(temp_path):
@@ -255,6 +282,60 @@ class FileService:
                     pass
             raise
 
+    # =========================================================================
+    # Deferred download (pre-download change detection)
+    # =========================================================================
+
+    def defer_download(
+        self,
+        entity: FileEntity,
+        download: Callable[[], Awaitable[Any]],
+        logger: ContextualLogger,
+    ) -> bool:
+        """Defer a file's download until the entity resolves to INSERT or UPDATE.
+
+        With FILE_FINGERPRINT_ENABLED, files whose source reports a content fingerprint
+        are hashed on the fingerprint instead of their bytes, so EntityActionResolver
+        can tell unchanged files apart before anything is downloaded. The resolver
+        runs the pending download for new and changed files only.
+
+        local_path is set to a placeholder so the sources' download checks pass;
+        `download` must set the real local_path.
+
+        Args:
+            entity: FileEntity to download
+            download: Async callable that downloads the file and sets local_path
+            logger: Logger for diagnostics
+
+        Returns:
+            Whether the download was deferred (if not, the caller downloads now)
+
+        Raises:
+            FileSkippedException: If the extension or reported size is not supported
+        """
+        if not settings.FILE_FINGERPRINT_ENABLED or not entity.content_fingerprint():
+            return False
+
+        # The HEAD request is skipped as well: the source already reported the size
+        _, ext = os.path.splitext(entity.name)
+        ext = ext.lower()
+        if ext not in SUPPORTED_FILE_EXTENSIONS:
+            skip_reason = f"Unsupported file extension: {ext}"
+        elif entity.size and entity.size > self.MAX_FILE_SIZE_BYTES:
+            skip_reason = f"File too large: {entity.size / (1024 * 1024):.1f}MB (max 1GB)"
+        else:
+            skip_reason = None
+        if skip_reason:
+            logger.debug(f"Skipping download of {entity.name}: {skip_reason}")
+            raise FileSkippedException(reason=skip_reason, filename=entity.name)
+
+        file_uuid = str(uuid4())
+        safe_filename = self._safe_filename(entity.name)
+        entity.local_path = f"{self.base_temp_dir}/{file_uuid}-{safe_filename}"
+        entity._pending_download = download
+        logger.debug(f"Deferred download of {entity.name} until change detection")
+        return True
+
     # =========================================================================
     # ARF Restoration (for replay sources)
     # =========================================================================
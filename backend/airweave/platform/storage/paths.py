@@ -25,6 +25,12 @@ class StoragePaths:
     # ARF (Airweave Raw Format) storage prefix
     ARF_PREFIX = "raw"
 
+    # Results of partitioned sync activities (kept until the final activity merges them)
+    PARTITIONS_PREFIX = "sync_partitions"
+
+    # Primary-key snapshots of synced Postgres tables (for delete detection)
+    PG_KEY_SNAPSHOTS_PREFIX = "pg_key_snapshots"
+
     # Legacy directories
     CTTI_GLOBAL_DIR = "aactmarkdowns"
 
@@ -69,6 +75,45 @@ class StoragePaths:
         """Files directory: raw/{sync_id}/files/."""
         return f"{cls.arf_sync_path(sync_id)}/files"
 
+    # =========================================================================
+    # Partitioned sync path builders
+    # =========================================================================
+
+    @classmethod
+    def partition_results_dir(cls, sync_job_id: UUID) -> str:
+        """Partition results of a sync job: sync_partitions/{sync_job_id}/."""
+        return f"{cls.PARTITIONS_PREFIX}/{sync_job_id}"
+
+    @classmethod
+    def partition_result_path(cls, sync_job_id: UUID, partition: str) -> str:
+        """Partition cursor and stats: sync_partitions/{sync_job_id}/{partition}.json."""
+        safe_partition = cls._safe_filename(partition)
+        return f"{cls.partition_results_dir(sync_job_id)}/{safe_partition}.json"
+
+    @classmethod
+    def partition_encountered_path(cls, sync_job_id: UUID, partition: str) -> str:
+        """Partition encountered-ID hashes: sync_partitions/{sync_job_id}/{partition}.npz."""
+        safe_partition = cls._safe_filename(partition)
+        return f"{cls.partition_results_dir(sync_job_id)}/{safe_partition}.npz"
+
+    # =========================================================================
+    # Postgres key snapshot path builders
+    # =========================================================================
+
+    @classmethod
+    def pg_key_snapshots_dir(cls, source_connection_id: UUID, table_key: str) -> str:
+        """Key snapshots of a table: pg_key_snapshots/{source_connection_id}/{table_key}/."""
+        safe_table = cls._safe_filename(table_key)
+        return f"{cls.PG_KEY_SNAPSHOTS_PREFIX}/{source_connection_id}/{safe_table}"
+
+    @classmethod
+    def pg_key_snapshot_path(
+        cls, source_connection_id: UUID, table_key: str, snapshot_id: str
+    ) -> str:
+        """Key snapshot: pg_key_snapshots/{source_connection_id}/{table_key}/{id}.jsonl.gz."""
+        snapshots_dir = cls.pg_key_snapshots_dir(source_connection_id, table_key)
+        return f"{snapshots_dir}/{snapshot_id}.jsonl.gz"
+
     # =========================================================================
     # Temp path builders
     # =========================================================================
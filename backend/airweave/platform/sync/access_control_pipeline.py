@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, List, Set, Tuple
 
 from airweave import crud
 from airweave.db.session import get_db_context
+from airweave.platform.access_control.cache import get_principal_cache
 from airweave.platform.access_control.schemas import MembershipTuple
 from airweave.platform.sync.actions.access_control import ACActionDispatcher, ACActionResolver
 from airweave.platform.sync.pipeline.acl_membership_tracker import ACLMembershipTracker
@@ -28,6 +29,8 @@ class AccessControlPipeline:
     2. Dispatch: Route actions to handlers
     3. Handle: Persist to destinations (currently just Postgres)
     4. Cleanup: Delete orphan memberships (revoked permissions)
+    5. Closure: Rebuild the transitive group closure from the final memberships
+    6. Invalidate: Drop cached search principals of the organization
 
     This architecture supports:
     - Deduplication within a sync
@@ -104,6 +107,12 @@ class AccessControlPipeline:
                 f"🗑️ Deleted {deleted_count} orphan ACL memberships (revoked permissions)"
             )
 
+        # Step 4: Rebuild the transitive group closure used for search-time expansion
+        await self._rebuild_group_closure(sync_context)
+
+        # Step 5: Invalidate cached principals so searches see the new memberships
+        await self._invalidate_principal_cache(sync_context)
+
         # Log final summary
         self._tracker.log_summary()
 
@@ -170,3 +179,37 @@ class AccessControlPipeline:
             )
 
         return deleted_count
+
+    async def _rebuild_group_closure(self, sync_context: "SyncContext") -> None:
+        """Recompute the organization's group closure from its memberships.
+
+        Runs after upserts and orphan deletes so AccessBroker resolves nested groups
+        (and revoked nestings) with a single indexed query. Organization-wide, because
+        this source's group tuples can nest groups synced by other sources.
+
+        Args:
+            sync_context: Sync context with organization_id
+        """
+        async with get_db_context() as db:
+            closure_rows = await crud.access_control_membership.rebuild_group_closure(
+                db=db,
+                organization_id=sync_context.organization_id,
+            )
+
+        sync_context.logger.info(f"🔐 Rebuilt group closure ({closure_rows} nested group pairs)")
+
+    async def _invalidate_principal_cache(self, sync_context: "SyncContext") -> None:
+        """Invalidate the organization's cached search principals on all API pods.
+
+        Organization-wide because group closure expansion is not scoped to one source
+        connection. With the memory backend only this process is invalidated; other
+        processes catch up when their entries expire.
+
+        Args:
+            sync_context: Sync context with organization_id
+        """
+        principal_cache = get_principal_cache()
+        if principal_cache is None:
+            return
+        await principal_cache.invalidate_organization(sync_context.organization_id)
+        sync_context.logger.debug("🔐 Invalidated cached access principals for organization")
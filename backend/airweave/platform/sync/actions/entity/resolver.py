@@ -2,8 +2,10 @@
 
 Resolves entities to their appropriate action (INSERT/UPDATE/DELETE/KEEP)
 by comparing content hashes against stored values in the database.
+File downloads deferred until change detection are run here for INSERT/UPDATE only.
 """
 
+import asyncio
 import time
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from uuid import UUID
@@ -11,7 +13,12 @@ from uuid import UUID
 from airweave import crud, models
 from airweave.core.constants.reserved_ids import RESERVED_TABLE_ENTITY_ID
 from airweave.db.session import get_db_context
-from airweave.platform.entities._base import BaseEntity, DeletionEntity, PolymorphicEntity
+from airweave.platform.entities._base import (
+    BaseEntity,
+    DeletionEntity,
+    FileEntity,
+    PolymorphicEntity,
+)
 from airweave.platform.sync.actions.entity.types import (
     EntityActionBatch,
     EntityDeleteAction,
@@ -24,6 +31,9 @@ from airweave.platform.sync.exceptions import SyncFailureError
 if TYPE_CHECKING:
     from airweave.platform.contexts import SyncContext
 
+# Max deferred file downloads in flight per batch
+DEFERRED_DOWNLOAD_CONCURRENCY = 10
+
 
 class EntityActionResolver:
     """Resolves entities to action objects (INSERT/UPDATE/DELETE/KEEP).
@@ -70,7 +80,9 @@ class EntityActionResolver:
             sync_context.logger.info(
                 "skip_hash_comparison enabled: Forcing all entities as INSERT actions"
             )
-            return self._force_all_inserts(entities, sync_context)
+            batch = self._force_all_inserts(entities, sync_context)
+            await self._run_deferred_downloads(batch, sync_context)
+            return batch
 
         # Step 1: Separate deletions from non-deletions
         delete_entities, non_delete_entities = self._separate_deletions(entities)
@@ -90,6 +102,9 @@ class EntityActionResolver:
             sync_context,
         )
 
+        # Step 5: Download new and changed files (unchanged ones are never downloaded)
+        await self._run_deferred_downloads(batch, sync_context)
+
         # Log summary
         sync_context.logger.debug(f"Action resolution: {batch.summary()}")
 
@@ -366,6 +381,63 @@ class EntityActionResolver:
             db_id=db_row.id if db_row else None,
         )
 
+    async def _run_deferred_downloads(
+        self,
+        batch: EntityActionBatch,
+        sync_context: "SyncContext",
+    ) -> None:
+        """Run file downloads deferred by FileService.defer_download.
+
+        KEEP files are not downloaded; their sizes are recorded as bytes saved.
+        INSERT/UPDATE files whose download fails are dropped from the batch and
+        counted as skipped (the stored entity is left as is until the next sync).
+
+        Args:
+            batch: Resolved actions (modified in-place)
+            sync_context: Sync context with logger and entity tracker
+        """
+        skipped_count = 0
+        bytes_saved = 0
+        for action in batch.keeps:
+            entity = action.entity
+            if isinstance(entity, FileEntity) and entity._pending_download:
+                entity._pending_download = None
+                skipped_count += 1
+                bytes_saved += entity.size or 0
+        if skipped_count:
+            await sync_context.entity_tracker.record_skipped_downloads(skipped_count, bytes_saved)
+
+        pending = [
+            action
+            for action in [*batch.inserts, *batch.updates]
+            if isinstance(action.entity, FileEntity) and action.entity._pending_download
+        ]
+        if not pending:
+            return
+
+        semaphore = asyncio.Semaphore(DEFERRED_DOWNLOAD_CONCURRENCY)
+
+        async def download(action: EntityInsertAction | EntityUpdateAction) -> bool:
+            entity = action.entity
+            run_download, entity._pending_download = entity._pending_download, None
+            async with semaphore:
+                try:
+                    await run_download()
+                    return True
+                except Exception as e:
+                    sync_context.logger.warning(
+                        f"Deferred download failed for {entity.__class__.__name__}"
+                        f"[{entity.entity_id}]: {e}"
+                    )
+                    return False
+
+        results = await asyncio.gather(*[download(action) for action in pending])
+        failed = {id(action) for action, ok in zip(pending, results, strict=True) if not ok}
+        if failed:
+            batch.inserts = [a for a in batch.inserts if id(a) not in failed]
+            batch.updates = [a for a in batch.updates if id(a) not in failed]
+            await sync_context.entity_tracker.record_skipped(len(failed))
+
     def _force_all_inserts(
         self,
         entities: List[BaseEntity],
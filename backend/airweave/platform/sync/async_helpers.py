@@ -1,17 +1,25 @@
 """Async helper utilities for improved performance."""
 
 import asyncio
+import multiprocessing
 import os
 import threading
-from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, TypeVar
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, TypeVar
 
 from airweave.core.config import settings
 
+if TYPE_CHECKING:
+    from airweave.platform.contexts import SyncContext
+
 # Shared thread pool for CPU-bound operations
 _cpu_executor = None
 _cpu_executor_lock = asyncio.Lock()
 
+# Opt-in process pool for GIL-bound work (chunking, hashing)
+_process_executor = None
+_process_executor_lock = asyncio.Lock()
+
 # Thread tracking for metrics
 _active_thread_count = 0
 _thread_count_lock = threading.Lock()
@@ -65,6 +73,66 @@ async def run_in_thread_pool(func: Callable[..., T], *args, **kwargs) -> T:
             _active_thread_count -= 1
 
 
+async def get_process_executor() -> ProcessPoolExecutor:
+    """Get or create the shared, pre-warmed process pool.
+
+    Workers use the spawn start method (forking a process that runs an event loop and
+    thread pools is unsafe) and load the chunking models and tiktoken encodings once
+    in their initializer. All workers are started and warmed before the pool is
+    returned, so the first sync batch does not pay the model load.
+    """
+    global _process_executor
+
+    async with _process_executor_lock:
+        if _process_executor is None:
+            from airweave.platform.sync import cpu_jobs
+
+            max_workers = settings.SYNC_PROCESS_POOL_SIZE or os.cpu_count() or 1
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=cpu_jobs.warm_worker,
+            )
+
+            # Workers spawn on demand - submit one ping per worker to start them all
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *[loop.run_in_executor(executor, cpu_jobs.ping) for _ in range(max_workers)]
+            )
+            _process_executor = executor
+
+    return _process_executor
+
+
+def use_process_pool(sync_context: "SyncContext") -> bool:
+    """Whether the sync config selects the process pool for CPU-bound work."""
+    return bool(
+        sync_context.execution_config
+        and sync_context.execution_config.behavior
+        and sync_context.execution_config.behavior.cpu_pool == "process"
+    )
+
+
+async def run_in_process_pool(func: Callable[..., T], *args) -> T:
+    """Run a picklable module-level function in the shared process pool.
+
+    Arguments and return values cross a process boundary, so they must be
+    picklable - see airweave.platform.sync.cpu_jobs for the available jobs.
+    """
+    loop = asyncio.get_running_loop()
+    executor = await get_process_executor()
+    return await loop.run_in_executor(executor, func, *args)
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the process pool (no-op if it was never started)."""
+    global _process_executor
+
+    if _process_executor is not None:
+        _process_executor.shutdown(wait=False, cancel_futures=True)
+        _process_executor = None
+
+
 def get_active_thread_count() -> int:
     """Get current number of active threads in the shared thread pool.
 
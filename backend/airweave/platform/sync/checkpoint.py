@@ -0,0 +1,132 @@
+"""Periodic cursor checkpoints for resumable syncs.
+
+The cursor is otherwise persisted only when a sync completes, so a worker crash late in
+a long sync throws all progress away. With SYNC_CHECKPOINT_ENABLED the orchestrator
+periodically persists a "safe" cursor instead, and a retried sync activity resumes from
+it (see SourceContextBuilder._create_cursor).
+
+Entities are numbered in the order the source yields them, which is also the order the
+orchestrator pulls them into batches:
+
+- before each entity is queued, the stream snapshots the cursor if the source updated
+  it since the last snapshot (throttled, since some cursors are large)
+- each submitted batch covers a contiguous position range; the watermark is the start
+  of the oldest batch still in flight, or the next undispatched position
+- the safe cursor is the newest snapshot at or before the watermark: every entity the
+  source yielded before that snapshot has been processed
+- a checkpoint is due one interval after the snapshot of the previous one was taken,
+  so a crash re-processes at most about one interval of work
+
+This relies on sources updating their cursor only for entities they already yielded
+(update after the yield, as CTTI and the stub source do).
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Optional, Set, Tuple
+
+from airweave.core.config import settings
+from airweave.platform.sync.cursor import SyncCursor
+
+# Fraction of the checkpoint interval between two cursor snapshots
+SNAPSHOT_INTERVAL_FRACTION = 0.1
+
+
+def checkpoint_resume_enabled(force_full_sync: bool) -> bool:
+    """Whether a sync checkpoints its cursor and a retried attempt resumes from it.
+
+    Forced full syncs always start over: their orphan cleanup needs every entity to be
+    re-encountered, which a resumed attempt cannot do.
+    """
+    return settings.SYNC_CHECKPOINT_ENABLED and not force_full_sync
+
+
+@dataclass
+class SyncCheckpoint:
+    """A cursor that is safe to resume from."""
+
+    cursor_data: dict
+    position: int  # Entities (in source order) processed before this cursor
+
+
+class SyncCheckpointer:
+    """Tracks the safe cursor watermark of a running sync."""
+
+    def __init__(
+        self,
+        cursor: SyncCursor,
+        interval_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the checkpointer with the cursor the sync started from.
+
+        Args:
+            cursor: The sync cursor the source updates
+            interval_seconds: Time between the cursor snapshots of two checkpoints
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._cursor = cursor
+        self._interval = interval_seconds
+        self._clock = clock
+
+        self._produced = 0
+        self._dispatched = 0
+        self._in_flight: Set[int] = set()
+
+        # (position, taken at, cursor data), oldest first
+        now = clock()
+        self._snapshots: Deque[Tuple[int, float, dict]] = deque([(0, now, cursor.data)])
+        self._snapshot_version = cursor.version
+        self._saved_position = 0
+        self._saved_snapshot_at = now
+
+    def record_produced(self) -> None:
+        """Record that the source yielded the next entity (called before it is queued)."""
+        if self._cursor.version != self._snapshot_version:
+            now = self._clock()
+            if now - self._snapshots[-1][1] >= self._interval * SNAPSHOT_INTERVAL_FRACTION:
+                self._snapshots.append((self._produced, now, self._cursor.data))
+                self._snapshot_version = self._cursor.version
+        self._produced += 1
+
+    def dispatch(self, count: int) -> int:
+        """Record that the next `count` entities were submitted as one batch.
+
+        Returns:
+            The batch's start position, to pass to complete()
+        """
+        start = self._dispatched
+        self._in_flight.add(start)
+        self._dispatched += count
+        return start
+
+    def complete(self, start: int) -> None:
+        """Record that the batch starting at `start` was processed."""
+        self._in_flight.discard(start)
+
+    @property
+    def watermark(self) -> int:
+        """Position before which every entity has been processed."""
+        return min(self._in_flight) if self._in_flight else self._dispatched
+
+    def next_checkpoint(self) -> Optional[SyncCheckpoint]:
+        """Get a checkpoint to persist, if one is due and the safe cursor advanced.
+
+        The returned checkpoint is assumed to be persisted.
+        """
+        if self._clock() - self._saved_snapshot_at < self._interval:
+            return None
+
+        # Drop snapshots superseded by a newer one that is already safe
+        watermark = self.watermark
+        while len(self._snapshots) > 1 and self._snapshots[1][0] <= watermark:
+            self._snapshots.popleft()
+
+        position, taken_at, cursor_data = self._snapshots[0]
+        if position <= self._saved_position:
+            return None
+
+        self._saved_position = position
+        self._saved_snapshot_at = taken_at
+        return SyncCheckpoint(cursor_data=cursor_data, position=position)
@@ -5,7 +5,7 @@ Uses Pydantic Settings for automatic env var loading.
 """
 
 import warnings
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, model_validator
@@ -48,6 +48,14 @@ class BehaviorConfig(BaseModel):
         False, description="Replay from ARF storage instead of calling source"
     )
     skip_guardrails: bool = Field(False, description="Skip usage guardrails (entity count checks)")
+    chunk_diff_updates: bool = Field(
+        False,
+        description="On UPDATE, only re-embed and rewrite chunks whose text hash changed",
+    )
+    cpu_pool: Literal["thread", "process"] = Field(
+        "thread",
+        description="Executor for chunking and hashing: shared thread pool or process pool",
+    )
 
 
 class SyncConfig(BaseSettings):
@@ -0,0 +1,52 @@
+"""Picklable CPU jobs for the opt-in sync process pool.
+
+Every job is a module-level function taking and returning plain picklable data
+(lists of strings, dicts), so it can be shipped to a worker process by
+run_in_process_pool. Jobs work on whole batches to amortize the IPC cost.
+
+Workers are pre-warmed by warm_worker(), which loads the potion-base-8M model,
+Magika and the tiktoken encodings once per process instead of once per batch.
+"""
+
+from typing import Any, Dict, List
+
+from airweave.core.logging import logger
+
+
+def warm_worker() -> None:
+    """Process pool initializer: load chunking models and tokenizers once."""
+    from airweave.platform.chunkers.code import CodeChunker
+    from airweave.platform.chunkers.semantic import SemanticChunker
+
+    try:
+        SemanticChunker()._ensure_chunkers()
+        CodeChunker()._ensure_chunkers()
+    except Exception as e:
+        # Jobs will retry the lazy init and surface the error with context
+        logger.warning(f"[cpu_jobs] Worker warm-up failed: {e}")
+
+
+def ping() -> bool:
+    """No-op job used to force worker start-up."""
+    return True
+
+
+def chunk_semantic_batch(texts: List[str]) -> List[List[Dict[str, Any]]]:
+    """Run all SemanticChunker stages for a batch of texts."""
+    from airweave.platform.chunkers.semantic import SemanticChunker
+
+    return SemanticChunker()._chunk_batch_sync(texts)
+
+
+def chunk_code_batch(texts: List[str]) -> List[List[Dict[str, Any]]]:
+    """Run all CodeChunker stages for a batch of code texts."""
+    from airweave.platform.chunkers.code import CodeChunker
+
+    return CodeChunker()._chunk_batch_sync(texts)
+
+
+def compute_dict_hashes(content_dicts: List[Dict[str, Any]]) -> List[str]:
+    """Stable-serialize and SHA256-hash a batch of entity content dicts."""
+    from airweave.platform.sync.pipeline.hash_computer import hash_computer
+
+    return [hash_computer._compute_dict_hash(content_dict) for content_dict in content_dicts]
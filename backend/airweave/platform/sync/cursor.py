@@ -21,6 +21,7 @@ class SyncCursor:
         sync_id: UUID,
         cursor_schema: Optional[Type[BaseModel]] = None,
         cursor_data: dict | None = None,
+        resumed_from_checkpoint: bool = False,
     ):
         """Initialize cursor with optional typed schema.
 
@@ -28,9 +29,14 @@ class SyncCursor:
             sync_id: Associated sync ID
             cursor_schema: Pydantic model class for validation (e.g., GmailCursor)
             cursor_data: Existing cursor data from database
+            resumed_from_checkpoint: Whether cursor_data is a mid-sync checkpoint of the
+                same sync job (the activity was retried after a crash)
         """
         self.sync_id = sync_id
         self.cursor_schema = cursor_schema
+        self.resumed_from_checkpoint = resumed_from_checkpoint
+        # Incremented on every update, so checkpointing only snapshots changed cursors
+        self.version = 0
 
         # Instantiate typed cursor if schema provided
         if cursor_schema:
@@ -62,6 +68,7 @@ class SyncCursor:
         else:
             # Fallback to raw dict
             self._raw_data.update(fields)
+        self.version += 1
 
     def get(self) -> dict:
         """Get cursor data as dict.
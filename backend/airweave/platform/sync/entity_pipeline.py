@@ -11,7 +11,7 @@ Lifecycle:
 """
 
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Tuple
 from uuid import UUID
 
 from airweave.core.shared_models import AirweaveFieldFlag
@@ -27,6 +27,11 @@ from airweave.platform.sync.pipeline.cleanup_service import cleanup_service
 from airweave.platform.sync.pipeline.entity_tracker import EntityTracker
 from airweave.platform.sync.pipeline.hash_computer import hash_computer
 
+# Max orphan IDs dispatched to handlers per cleanup call
+ORPHAN_CLEANUP_BATCH_SIZE = 1000
+# Stored entity keys read per orphan-detection query
+ORPHAN_SCAN_PAGE_SIZE = 10_000
+
 
 class EntityPipeline:
     """Pipeline for processing entities with stateful tracking across sync lifecycle.
@@ -107,22 +112,15 @@ class EntityPipeline:
         Args:
             sync_context: Sync context
         """
-        # Get orphan entity IDs grouped by definition
-        orphans_by_definition = await self._identify_orphans(sync_context)
-        if not orphans_by_definition:
-            return
-
-        # Flatten for dispatcher (it just needs all IDs)
-        all_orphan_ids = [
-            entity_id for entity_ids in orphans_by_definition.values() for entity_id in entity_ids
-        ]
-
-        # Dispatch cleanup to ALL handlers (destinations + postgres)
-        await self._dispatcher.dispatch_orphan_cleanup(all_orphan_ids, sync_context)
-
-        # Update tracker with orphan deletion counts per definition
-        for definition_id, entity_ids in orphans_by_definition.items():
+        total_orphans = 0
+        async for definition_id, entity_ids in self._stream_orphans(sync_context):
+            # Dispatch cleanup to ALL handlers (destinations + postgres) page by page
+            await self._dispatcher.dispatch_orphan_cleanup(entity_ids, sync_context)
             await sync_context.entity_tracker.record_deletes(definition_id, len(entity_ids))
+            total_orphans += len(entity_ids)
+
+        if total_orphans:
+            sync_context.logger.info(f"🧹 Cleaned up {total_orphans} orphaned entities")
 
     async def cleanup_temp_files(self, sync_context: SyncContext) -> None:
         """Remove entire sync_job_id directory (final cleanup safety net).
@@ -164,11 +162,10 @@ class EntityPipeline:
         unique = []
         skipped_count = 0
 
-        for entity in entities:
-            is_new = await self._tracker.track_entity(
-                entity.__class__.__name__,
-                entity.entity_id,
-            )
+        flags = await self._tracker.track_entities_batch(
+            [(entity.__class__.__name__, entity.entity_id) for entity in entities]
+        )
+        for entity, is_new in zip(entities, flags, strict=True):
             if is_new:
                 unique.append(entity)
             else:
@@ -292,40 +289,65 @@ class EntityPipeline:
     # Orphan Identification
     # -------------------------------------------------------------------------
 
-    async def _identify_orphans(self, sync_context: SyncContext) -> Dict[UUID, List[str]]:
-        """Identify orphaned entity IDs (in DB but not encountered), grouped by definition.
+    async def _stream_orphans(
+        self, sync_context: SyncContext
+    ) -> AsyncIterator[Tuple[UUID, List[str]]]:
+        """Stream orphaned entity IDs (in DB but not encountered) in pages per definition.
+
+        The sync's stored keys are read in keyset-paginated pages, each in its own short
+        session, and checked against the encountered IDs in memory. No transaction or
+        cursor stays open while the caller deletes the orphans found so far.
 
         Args:
             sync_context: Sync context
 
-        Returns:
-            Dict mapping entity_definition_id to list of orphaned entity IDs
+        Yields:
+            (entity_definition_id, orphaned entity IDs) pages of at most
+            ORPHAN_CLEANUP_BATCH_SIZE IDs
         """
         from airweave import crud
         from airweave.db.session import get_db_context
 
-        # Get all encountered IDs
         encountered_ids = self._tracker.get_all_encountered_ids_flat()
-
-        # Get all stored entity IDs for this sync
-        async with get_db_context() as db:
-            stored_entities = await crud.entity.get_by_sync_id(db=db, sync_id=sync_context.sync.id)
-
-        # Find orphans grouped by definition
         orphans_by_definition: Dict[UUID, List[str]] = defaultdict(list)
-        for entity in stored_entities:
-            if entity.entity_id not in encountered_ids:
-                orphans_by_definition[entity.entity_definition_id].append(entity.entity_id)
-
-        total_orphans = sum(len(ids) for ids in orphans_by_definition.values())
-        if total_orphans:
-            sync_context.logger.info(
-                f"🔍 Identified {total_orphans} orphaned entities "
-                f"across {len(orphans_by_definition)} definitions "
-                f"out of {len(stored_entities)} stored"
-            )
+        after = None
 
-        return dict(orphans_by_definition)
+        while True:
+            async with get_db_context() as db:
+                keys = await crud.entity.get_keys_page_by_sync(
+                    db, sync_id=sync_context.sync.id, after=after, limit=ORPHAN_SCAN_PAGE_SIZE
+                )
+            if not keys:
+                break
+            after = keys[-1]
+
+            seen = encountered_ids.contains_many(entity_id for entity_id, _ in keys)
+            for (entity_id, definition_id), is_seen in zip(keys, seen.tolist(), strict=True):
+                if is_seen:
+                    continue
+                page = orphans_by_definition[definition_id]
+                page.append(entity_id)
+                if len(page) >= ORPHAN_CLEANUP_BATCH_SIZE:
+                    yield self._orphan_page(definition_id, orphans_by_definition, sync_context)
+
+            if len(keys) < ORPHAN_SCAN_PAGE_SIZE:
+                break
+
+        for definition_id in list(orphans_by_definition):
+            yield self._orphan_page(definition_id, orphans_by_definition, sync_context)
+
+    @staticmethod
+    def _orphan_page(
+        definition_id: UUID,
+        orphans_by_definition: Dict[UUID, List[str]],
+        sync_context: SyncContext,
+    ) -> Tuple[UUID, List[str]]:
+        """Take the orphans collected for one definition as a page."""
+        entity_ids = orphans_by_definition.pop(definition_id)
+        sync_context.logger.debug(
+            f"🔍 Identified {len(entity_ids)} orphaned entities for definition {definition_id}"
+        )
+        return definition_id, entity_ids
 
     # -------------------------------------------------------------------------
     # Temp File Cleanup
@@ -23,6 +23,7 @@ from airweave.platform.sync.actions import (
     EntityActionResolver,
     EntityDispatcherBuilder,
 )
+from airweave.platform.sync.checkpoint import SyncCheckpointer, checkpoint_resume_enabled
 from airweave.platform.sync.config import SyncExecutionConfig
 from airweave.platform.sync.entity_pipeline import EntityPipeline
 from airweave.platform.sync.handlers import ACPostgresHandler
@@ -52,6 +53,7 @@ class SyncFactory:
         max_workers: int = None,
         force_full_sync: bool = False,
         execution_config: Optional[SyncConfig] = None,
+        partition: Optional[str] = None,
     ) -> SyncOrchestrator:
         """Create a dedicated orchestrator instance for a sync run.
 
@@ -70,6 +72,7 @@ class SyncFactory:
             force_full_sync: If True, forces a full sync with orphaned entity deletion
             execution_config: Optional execution config for controlling sync behavior
                 (overrides job-level config if provided)
+            partition: Partition of a partitioned sync to restrict the source to
 
         Returns:
             A dedicated SyncOrchestrator instance
@@ -145,11 +148,31 @@ class SyncFactory:
         # Step 4: Create worker pool
         worker_pool = AsyncWorkerPool(max_workers=max_workers, logger=sync_context.logger)
 
-        # Step 5: Create stream
+        # Step 5: Create stream (and checkpointer, so retries resume mid-sync)
+        if partition is not None:
+            sync_context.source_instance.set_partition(partition)
+
+        checkpointer = None
+        skip_cursor_updates = bool(
+            sync_context.execution_config and sync_context.execution_config.cursor.skip_updates
+        )
+        # Checkpoints are per sync job, so partitions of one job cannot use them
+        if (
+            checkpoint_resume_enabled(sync_context.force_full_sync)
+            and sync_context.cursor
+            and not skip_cursor_updates
+            and partition is None
+        ):
+            checkpointer = SyncCheckpointer(
+                sync_context.cursor,
+                interval_seconds=settings.SYNC_CHECKPOINT_INTERVAL_SECONDS,
+            )
+
         stream = AsyncSourceStream(
             source_generator=sync_context.source_instance.generate_entities(),
             queue_size=10000,  # TODO: make this configurable
             logger=sync_context.logger,
+            checkpointer=checkpointer,
         )
 
         # Step 6: Create orchestrator
@@ -159,6 +182,7 @@ class SyncFactory:
             stream=stream,
             sync_context=sync_context,
             access_control_pipeline=access_control_pipeline,
+            checkpointer=checkpointer,
         )
 
         logger.info(f"Total orchestrator initialization took {time.time() - init_start:.2f}s")
@@ -1,11 +1,12 @@
 """Unified destination handler using processor strategy pattern.
 
 Destinations declare what they need via processing_requirement class var.
-Handler owns processor lifecycle (singletons).
+Handler owns processor lifecycle (singletons) and runs each processor once per
+batch for all destinations sharing a requirement.
 """
 
 import asyncio
-from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional
 
 import httpcore
 import httpx
@@ -26,6 +27,7 @@ from airweave.platform.sync.processors import (
     RawProcessor,
     TextOnlyProcessor,
 )
+from airweave.platform.sync.processors.chunk_embed import split_unchanged_chunks
 
 if TYPE_CHECKING:
     from airweave.platform.contexts import SyncContext
@@ -88,18 +90,20 @@ class DestinationHandler(EntityActionHandler):
             sync_context.logger.debug(f"[{self.name}] No mutations, skipping")
             return
 
-        # Updates: delete old data first, then insert new
-        if batch.updates:
-            await self._do_delete_by_ids(
-                [a.entity_id for a in batch.updates],
-                "update_delete",
-                sync_context,
-            )
+        # Updates with stored chunk hashes only rewrite the chunks that changed
+        previous_chunk_hashes = self._get_previous_chunk_hashes(batch, sync_context)
+
+        # Other updates: delete old data first, then insert new
+        full_updates = [
+            a.entity_id for a in batch.updates if a.entity_id not in previous_chunk_hashes
+        ]
+        if full_updates:
+            await self._do_delete_by_ids(full_updates, "update_delete", sync_context)
 
         # Process and insert (inserts + updates)
         entities = batch.get_entities_to_process()
         if entities:
-            await self._do_process_and_insert(entities, sync_context)
+            await self._do_process_and_insert(entities, sync_context, previous_chunk_hashes)
 
         # Deletes
         if batch.deletes:
@@ -164,25 +168,55 @@ class DestinationHandler(EntityActionHandler):
         self,
         entities: List["BaseEntity"],
         sync_context: "SyncContext",
+        previous_chunk_hashes: Optional[Dict[str, List[str]]] = None,
     ) -> None:
-        """Process entities and insert into each destination.
+        """Process entities once per requirement and insert into each destination.
 
-        Each destination gets entities processed by its required processor.
-        Deep-copies entities to avoid cross-contamination between processors.
+        Destinations sharing a ProcessingRequirement share a single processor run,
+        so text building, chunking and embedding happen once per batch regardless of
+        how many vector DBs the collection writes to. Each requirement group gets its
+        own deep copy of the entities to avoid cross-contamination between processors.
+        Destinations treat processed entities as read-only in bulk_insert().
+
+        Args:
+            entities: Entities to process and insert
+            sync_context: Sync context
+            previous_chunk_hashes: Stored chunk hashes by entity_id for updates that
+                were not deleted up front (chunk-diff updates). Groups that can diff
+                only write changed chunks, refresh the payloads of unchanged ones and
+                delete stale ones; other groups delete these parents before inserting.
         """
-        for dest in self._destinations:
-            processor = self._get_processor(dest)
-
-            # Deep-copy to avoid cross-contamination
-            dest_entities = [e.model_copy(deep=True) for e in entities]
-
-            proc_start = asyncio.get_running_loop().time()
-            processed = await processor.process(dest_entities, sync_context)
-            proc_elapsed = asyncio.get_running_loop().time() - proc_start
-            if proc_elapsed > 10:
-                sync_context.logger.warning(
-                    f"[{self.name}] {processor.__class__.__name__} slow: "
-                    f"{proc_elapsed:.1f}s for {len(dest_entities)} entities"
+        previous_chunk_hashes = previous_chunk_hashes or {}
+
+        for requirement, destinations in self._group_by_requirement().items():
+            processor = self._get_processor(destinations[0])
+            diff_group = bool(previous_chunk_hashes) and self._can_chunk_diff(
+                requirement, destinations
+            )
+
+            if previous_chunk_hashes and not diff_group:
+                await self._do_delete_by_ids(
+                    list(previous_chunk_hashes),
+                    "update_delete",
+                    sync_context,
+                    destinations=destinations,
+                )
+
+            # Deep-copy to avoid cross-contamination between processors
+            group_entities = [e.model_copy(deep=True) for e in entities]
+            processed = await self._run_processor(
+                processor,
+                group_entities,
+                sync_context,
+                previous_chunk_hashes if diff_group else None,
+            )
+
+            if requirement == ProcessingRequirement.CHUNKS_AND_EMBEDDINGS:
+                self._copy_chunk_hashes(group_entities, entities)
+
+            if diff_group:
+                processed = await self._apply_chunk_diff(
+                    processed, group_entities, previous_chunk_hashes, destinations, sync_context
                 )
 
             if not processed:
@@ -191,21 +225,73 @@ class DestinationHandler(EntityActionHandler):
                 )
                 continue
 
-            await self._execute_with_retry(
-                operation=lambda d=dest, p=processed: d.bulk_insert(p),
-                operation_name=f"insert_{dest.__class__.__name__}",
-                destination=dest,
-                sync_context=sync_context,
+            await self._record_shared_processing(
+                requirement, len(destinations), len(processed), sync_context
+            )
+
+            for dest in destinations:
+                await self._execute_with_retry(
+                    operation=lambda d=dest, p=processed: d.bulk_insert(p),
+                    operation_name=f"insert_{dest.__class__.__name__}",
+                    destination=dest,
+                    sync_context=sync_context,
+                )
+
+    async def _run_processor(
+        self,
+        processor: ContentProcessor,
+        entities: List["BaseEntity"],
+        sync_context: "SyncContext",
+        previous_chunk_hashes: Optional[Dict[str, List[str]]],
+    ) -> List["BaseEntity"]:
+        """Run a processor on a group's entities, warning when it is slow."""
+        proc_start = asyncio.get_running_loop().time()
+        if previous_chunk_hashes:
+            processed = await processor.process(
+                entities, sync_context, previous_chunk_hashes=previous_chunk_hashes
+            )
+        else:
+            processed = await processor.process(entities, sync_context)
+        proc_elapsed = asyncio.get_running_loop().time() - proc_start
+        if proc_elapsed > 10:
+            sync_context.logger.warning(
+                f"[{self.name}] {processor.__class__.__name__} slow: "
+                f"{proc_elapsed:.1f}s for {len(entities)} entities"
             )
+        return processed
+
+    async def _apply_chunk_diff(
+        self,
+        processed: List["BaseEntity"],
+        parent_entities: List["BaseEntity"],
+        previous_chunk_hashes: Dict[str, List[str]],
+        destinations: List[BaseDestination],
+        sync_context: "SyncContext",
+    ) -> List["BaseEntity"]:
+        """Delete stale chunks and refresh unchanged ones (chunk-diff updates).
+
+        Returns:
+            The new and changed chunks, still to be inserted
+        """
+        stale_ids = self._get_stale_chunk_ids(parent_entities, previous_chunk_hashes)
+        if stale_ids:
+            await self._do_delete_chunks(
+                stale_ids, destinations, sync_context, parent_entities=parent_entities
+            )
+        changed, unchanged = split_unchanged_chunks(processed)
+        if unchanged:
+            await self._do_update_payloads(unchanged, destinations, sync_context)
+        return changed
 
     async def _do_delete_by_ids(
         self,
         entity_ids: List[str],
         operation: str,
         sync_context: "SyncContext",
+        destinations: Optional[List[BaseDestination]] = None,
     ) -> None:
-        """Delete entities by parent IDs from all destinations."""
-        for dest in self._destinations:
+        """Delete entities by parent IDs from all (or the given) destinations."""
+        for dest in destinations if destinations is not None else self._destinations:
             await self._execute_with_retry(
                 operation=lambda d=dest, ids=entity_ids: d.bulk_delete_by_parent_ids(
                     ids, sync_context.sync.id
@@ -215,10 +301,154 @@ class DestinationHandler(EntityActionHandler):
                 sync_context=sync_context,
             )
 
+    async def _do_delete_chunks(
+        self,
+        chunk_ids: List[str],
+        destinations: List[BaseDestination],
+        sync_context: "SyncContext",
+        parent_entities: Optional[List["BaseEntity"]] = None,
+    ) -> None:
+        """Delete individual chunk documents (chunk-diff updates).
+
+        parent_entities lets destinations derive document IDs and skip selection scans.
+        """
+        for dest in destinations:
+            await self._execute_with_retry(
+                operation=lambda d=dest, ids=chunk_ids: d.bulk_delete_by_entity_ids(
+                    ids, sync_context.sync.id, parent_entities=parent_entities
+                ),
+                operation_name=f"stale_chunk_delete_{dest.__class__.__name__}",
+                destination=dest,
+                sync_context=sync_context,
+            )
+
+    async def _do_update_payloads(
+        self,
+        chunk_entities: List["BaseEntity"],
+        destinations: List[BaseDestination],
+        sync_context: "SyncContext",
+    ) -> None:
+        """Refresh the payloads of unchanged chunk documents (chunk-diff updates)."""
+        for dest in destinations:
+            await self._execute_with_retry(
+                operation=lambda d=dest, chunks=chunk_entities: d.bulk_update_payloads(chunks),
+                operation_name=f"payload_update_{dest.__class__.__name__}",
+                destination=dest,
+                sync_context=sync_context,
+            )
+
     # -------------------------------------------------------------------------
     # Private: Helpers
     # -------------------------------------------------------------------------
 
+    def _group_by_requirement(self) -> Dict[ProcessingRequirement, List[BaseDestination]]:
+        """Group destinations by processing_requirement, preserving destination order."""
+        groups: Dict[ProcessingRequirement, List[BaseDestination]] = {}
+        for dest in self._destinations:
+            groups.setdefault(dest.processing_requirement, []).append(dest)
+        return groups
+
+    async def _record_shared_processing(
+        self,
+        requirement: ProcessingRequirement,
+        destination_count: int,
+        processed_count: int,
+        sync_context: "SyncContext",
+    ) -> None:
+        """Record the processor runs and chunk embeddings saved by sharing a group.
+
+        Without sharing, every extra destination in the group would have re-run the
+        processor - and for CHUNKS_AND_EMBEDDINGS re-embedded every chunk.
+        """
+        runs_saved = destination_count - 1
+        if runs_saved <= 0:
+            return
+
+        embeddings_saved = 0
+        if requirement == ProcessingRequirement.CHUNKS_AND_EMBEDDINGS:
+            embeddings_saved = processed_count * runs_saved
+
+        await sync_context.entity_tracker.record_shared_processing(
+            runs_saved=runs_saved,
+            embeddings_saved=embeddings_saved,
+        )
+        sync_context.logger.debug(
+            f"[{self.name}] Shared {requirement.value} processing across "
+            f"{destination_count} destinations: saved {runs_saved} processor run(s), "
+            f"{embeddings_saved} chunk embeddings"
+        )
+
+    def _get_previous_chunk_hashes(
+        self,
+        batch: EntityActionBatch,
+        sync_context: "SyncContext",
+    ) -> Dict[str, List[str]]:
+        """Get stored chunk hashes for updates that can be chunk-diffed.
+
+        Only used when enabled in the sync config and at least one destination can
+        delete individual chunks. Updates without stored hashes (synced before hashes
+        were recorded) fall back to delete + re-insert.
+        """
+        if not (
+            batch.updates
+            and sync_context.execution_config
+            and sync_context.execution_config.behavior
+            and sync_context.execution_config.behavior.chunk_diff_updates
+        ):
+            return {}
+        if not any(d.supports_chunk_diff for d in self._destinations):
+            return {}
+
+        previous: Dict[str, List[str]] = {}
+        for action in batch.updates:
+            db_entity = batch.existing_map.get((action.entity_id, action.entity_definition_id))
+            chunk_hashes = getattr(db_entity, "chunk_hashes", None)
+            if chunk_hashes is not None:
+                previous[action.entity_id] = list(chunk_hashes)
+        return previous
+
+    @staticmethod
+    def _can_chunk_diff(
+        requirement: ProcessingRequirement,
+        destinations: List[BaseDestination],
+    ) -> bool:
+        """Whether a requirement group can apply chunk-diff updates."""
+        return requirement == ProcessingRequirement.CHUNKS_AND_EMBEDDINGS and all(
+            d.supports_chunk_diff for d in destinations
+        )
+
+    @staticmethod
+    def _copy_chunk_hashes(
+        processed_entities: List["BaseEntity"],
+        entities: List["BaseEntity"],
+    ) -> None:
+        """Copy chunk hashes from a group's copies back onto the batch entities.
+
+        EntityPostgresHandler persists them for the next sync's chunk diff.
+        """
+        hashes_by_id = {
+            e.entity_id: e.airweave_system_metadata.chunk_hashes for e in processed_entities
+        }
+        for entity in entities:
+            entity.airweave_system_metadata.chunk_hashes = hashes_by_id.get(entity.entity_id)
+
+    @staticmethod
+    def _get_stale_chunk_ids(
+        processed_entities: List["BaseEntity"],
+        previous_chunk_hashes: Dict[str, List[str]],
+    ) -> List[str]:
+        """Get chunk IDs that existed before an update but no longer exist after it."""
+        current = {
+            e.entity_id: e.airweave_system_metadata.chunk_hashes or [] for e in processed_entities
+        }
+        stale_ids: List[str] = []
+        for entity_id, previous in previous_chunk_hashes.items():
+            new = current.get(entity_id, [])
+            for idx, old_hash in enumerate(previous):
+                if old_hash and (idx >= len(new) or not new[idx]):
+                    stale_ids.append(f"{entity_id}__chunk_{idx}")
+        return stale_ids
+
     def _get_processor(self, dest: BaseDestination) -> ContentProcessor:
         """Get processor for a destination based on its processing_requirement."""
         requirement = dest.processing_requirement
@@ -33,6 +33,7 @@ class EntityPostgresHandler(EntityActionHandler):
     - entity_id: Unique identifier from source
     - entity_definition_id: Type classification
     - hash: Content hash for change detection
+    - chunk_hashes: Per-chunk text hashes for chunk-diff updates
     - sync_id, sync_job_id: Sync tracking
 
     Runs AFTER destination handlers succeed (dispatcher handles ordering).
@@ -190,6 +191,7 @@ class EntityPostgresHandler(EntityActionHandler):
                     entity_id=action.entity_id,
                     entity_definition_id=action.entity_definition_id,
                     hash=action.entity.airweave_system_metadata.hash,
+                    chunk_hashes=action.entity.airweave_system_metadata.chunk_hashes,
                 )
             )
 
@@ -200,7 +202,7 @@ class EntityPostgresHandler(EntityActionHandler):
         sync_context.logger.debug(
             f"[EntityPostgres] Upserting {len(create_objs)} (sample: {sample_ids})"
         )
-        await crud.entity.bulk_create(db, objs=create_objs, ctx=sync_context.ctx)
+        await crud.entity.bulk_upsert(db, objs=create_objs, ctx=sync_context.ctx)
 
     async def _do_updates(
         self,
@@ -209,8 +211,9 @@ class EntityPostgresHandler(EntityActionHandler):
         sync_context: "SyncContext",
         db: AsyncSession,
     ) -> None:
-        """Execute UPDATE operations (hash updates)."""
+        """Execute UPDATE operations (hash and chunk hash updates)."""
         update_pairs = []
+        chunk_hashes: Dict[UUID, Any] = {}
         for action in actions:
             if not action.entity.airweave_system_metadata.hash:
                 raise SyncFailureError(f"Entity {action.entity_id} missing hash")
@@ -219,14 +222,17 @@ class EntityPostgresHandler(EntityActionHandler):
             if key not in existing_map:
                 raise SyncFailureError(f"UPDATE entity {action.entity_id} not in existing_map")
 
-            update_pairs.append((existing_map[key].id, action.entity.airweave_system_metadata.hash))
+            db_id = existing_map[key].id
+            update_pairs.append((db_id, action.entity.airweave_system_metadata.hash))
+            # Always overwrite: stale hashes must not survive a full re-chunk
+            chunk_hashes[db_id] = action.entity.airweave_system_metadata.chunk_hashes
 
         if not update_pairs:
             return
 
         update_pairs.sort(key=lambda p: p[0])
         sync_context.logger.debug(f"[EntityPostgres] Updating {len(update_pairs)} hashes")
-        await crud.entity.bulk_update_hash(db, rows=update_pairs)
+        await crud.entity.bulk_update_hash(db, rows=update_pairs, chunk_hashes=chunk_hashes)
 
     async def _do_deletes(
         self,
@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+from functools import partial
 from typing import List, Optional
 
 from airweave import schemas
@@ -16,8 +17,14 @@ from airweave.db.session import get_db_context
 from airweave.platform.access_control.schemas import MembershipTuple
 from airweave.platform.contexts import SyncContext
 from airweave.platform.sync.access_control_pipeline import AccessControlPipeline
+from airweave.platform.sync.checkpoint import SyncCheckpoint, SyncCheckpointer
 from airweave.platform.sync.entity_pipeline import EntityPipeline
 from airweave.platform.sync.exceptions import EntityProcessingError, SyncFailureError
+from airweave.platform.sync.partitions import (
+    delete_partition_results,
+    merge_partition_results,
+    save_partition_result,
+)
 from airweave.platform.sync.stream import AsyncSourceStream
 from airweave.platform.sync.worker_pool import AsyncWorkerPool
 from airweave.platform.utils.error_utils import get_error_message
@@ -41,6 +48,7 @@ class SyncOrchestrator:
         stream: AsyncSourceStream,
         sync_context: SyncContext,
         access_control_pipeline: AccessControlPipeline,
+        checkpointer: Optional[SyncCheckpointer] = None,
     ):
         """Initialize the sync orchestrator with ALL required components."""
         self.entity_pipeline = entity_pipeline
@@ -48,6 +56,7 @@ class SyncOrchestrator:
         self.stream = stream  # Stream is now passed in, not created here!
         self.sync_context = sync_context
         self.access_control_pipeline = access_control_pipeline
+        self.checkpointer = checkpointer  # Same instance the stream records entities on
 
         # Batch config from context
         self.should_batch = sync_context.should_batch
@@ -172,6 +181,77 @@ class SyncOrchestrator:
                     exc_info=True,
                 )
 
+    async def run_partition(self, partition: str) -> None:
+        """Sync one partition of a partitioned sync (see platform/sync/partitions.py).
+
+        Processes the partition's entities and saves its result. The planning activity
+        marks the job RUNNING, and ACL sync, orphan cleanup, the cursor and job
+        completion are left to finalize_partitions().
+        """
+        try:
+            self.sync_context.logger.info(f"🚀 Processing entities of partition '{partition}'...")
+            await self.stream.start()
+            await self._process_entities()
+            await save_partition_result(self.sync_context, partition)
+            stats = self.sync_context.entity_tracker.get_stats()
+            self.sync_context.logger.info(f"✅ Partition '{partition}' complete. Stats: {stats}")
+        except asyncio.CancelledError:
+            # The workflow owns the job status: it cancels partitions when a sibling
+            # fails, or marks the job CANCELLED when the whole workflow is cancelled
+            await self.worker_pool.cancel_all()
+            await self.stream.cancel()
+            raise
+        except Exception as e:
+            await self._handle_sync_failure(e)
+            raise
+        finally:
+            try:
+                await self.sync_context.guard_rail.flush_all()
+            except Exception as flush_error:
+                self.sync_context.logger.error(
+                    f"Failed to flush guard rail usage: {flush_error}", exc_info=True
+                )
+            try:
+                await self.entity_pipeline.cleanup_temp_files(self.sync_context)
+            except Exception as cleanup_error:
+                self.sync_context.logger.error(
+                    f"Temp file cleanup failed (non-fatal in finally block): {cleanup_error}",
+                    exc_info=True,
+                )
+
+    async def finalize_partitions(self, partitions: List[str]) -> schemas.Sync:
+        """Finish a partitioned sync once every partition saved its result.
+
+        Runs the phases a single-activity sync runs after processing entities, over
+        the merged encountered IDs, stats and cursor of all partitions.
+        """
+        final_status = SyncJobStatus.FAILED
+        error_message: Optional[str] = None
+        try:
+            await merge_partition_results(self.sync_context, partitions)
+
+            if self._source_supports_access_control():
+                await self._process_access_control_memberships()
+            await self._cleanup_orphaned_entities_if_needed()
+            await self._complete_sync()
+            final_status = SyncJobStatus.COMPLETED
+
+            try:
+                await delete_partition_results(self.sync_context.sync_job.id, partitions)
+            except Exception as e:
+                self.sync_context.logger.warning(f"Failed to delete partition results: {e}")
+            return self.sync_context.sync
+        except asyncio.CancelledError:
+            await self._handle_cancellation()
+            final_status = SyncJobStatus.CANCELLED
+            raise
+        except Exception as e:
+            error_message = get_error_message(e)
+            await self._handle_sync_failure(e)
+            raise
+        finally:
+            await self._finalize_progress_and_trackers(final_status, error_message)
+
     async def _start_sync(self) -> None:
         """Initialize sync job and start all components."""
         self.sync_context.logger.info("Starting sync job")
@@ -287,6 +367,13 @@ class SyncOrchestrator:
         )
         pending_tasks.add(task)
 
+        if self.checkpointer:
+            start = self.checkpointer.dispatch(len(batch))
+            task.add_done_callback(partial(self._record_batch_done, start))
+            checkpoint = self.checkpointer.next_checkpoint()
+            if checkpoint:
+                await self._save_checkpoint(checkpoint)
+
         # Check for completed tasks and fail fast on sync errors
         pending_tasks = await self._check_completed_tasks_fail_fast(pending_tasks)
 
@@ -296,6 +383,36 @@ class SyncOrchestrator:
 
         return pending_tasks
 
+    def _record_batch_done(self, start: int, task: asyncio.Task) -> None:
+        """Advance the checkpoint watermark past a batch that finished processing.
+
+        Batches that were cancelled or failed the sync never count as processed.
+        """
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is None or isinstance(exc, EntityProcessingError):
+            self.checkpointer.complete(start)
+
+    async def _save_checkpoint(self, checkpoint: SyncCheckpoint) -> None:
+        """Persist a safe cursor so a retried sync job can resume from it."""
+        try:
+            async with get_db_context() as db:
+                await sync_cursor_service.save_checkpoint(
+                    db=db,
+                    sync_id=self.sync_context.sync.id,
+                    sync_job_id=self.sync_context.sync_job.id,
+                    cursor_data=checkpoint.cursor_data,
+                    position=checkpoint.position,
+                    ctx=self.sync_context.ctx,
+                )
+            self.sync_context.logger.debug(
+                f"💾 Checkpointed cursor after {checkpoint.position} entities"
+            )
+        except Exception as e:
+            # A missed checkpoint only means more work on retry
+            self.sync_context.logger.warning(f"Failed to save checkpoint: {get_error_message(e)}")
+
     async def _check_completed_tasks_fail_fast(
         self, pending_tasks: set[asyncio.Task]
     ) -> set[asyncio.Task]:
@@ -422,10 +539,19 @@ class SyncOrchestrator:
 
     async def _cleanup_orphaned_entities_if_needed(self) -> None:
         """Cleanup orphaned entities based on sync type."""
+        if self.sync_context.cursor and self.sync_context.cursor.resumed_from_checkpoint:
+            # Entities processed before the checkpoint were not encountered in this attempt
+            self.sync_context.logger.info(
+                "⏩ Skipping orphaned entity cleanup for RESUMED sync "
+                "(entities synced before the checkpoint were not re-encountered)"
+            )
+            return
+
+        # Typed cursors always dump their fields, so only non-empty values count
         has_cursor_data = bool(
             hasattr(self.sync_context, "cursor")
             and self.sync_context.cursor
-            and self.sync_context.cursor.cursor_data
+            and any(self.sync_context.cursor.cursor_data.values())
         )
 
         # Check if source supports continuous/incremental sync (class attribute)
@@ -440,7 +566,7 @@ class SyncOrchestrator:
 
         # Cleanup should run if:
         # 1. Forced full sync (daily cleanup schedule), OR
-        # 2. First sync (no cursor data), OR
+        # 2. First sync, or the source left no incremental state (no cursor data), OR
         # 3. Source doesn't support incremental sync (every sync is a full sync)
         should_cleanup = (
             self.sync_context.force_full_sync
@@ -461,7 +587,7 @@ class SyncOrchestrator:
                 )
             else:
                 self.sync_context.logger.info(
-                    "🧹 Starting orphaned entity cleanup phase (first sync - no cursor data)"
+                    "🧹 Starting orphaned entity cleanup phase (no cursor data - full sync)"
                 )
             # Dispatcher handles ALL handlers: Destination, ARF, and Postgres
             await self.entity_pipeline.cleanup_orphaned_entities(self.sync_context)
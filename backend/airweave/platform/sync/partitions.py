@@ -0,0 +1,109 @@
+"""Partitioned syncs: one sync fanned out across the worker fleet.
+
+A sync activity is bounded by SYNC_MAX_WORKERS on the pod that runs it. With
+SYNC_PARTITIONING_ENABLED, RunSourceConnectionWorkflow syncs sources that implement
+BaseSource.get_partitions() (Postgres tables, stub index ranges) in three steps:
+
+- plan: list the partitions and mark the job RUNNING
+- one activity per partition, at most SYNC_PARTITION_MAX_PARALLEL at once and on any
+  worker, each with its own source instance, stream, worker pool and entity pipeline;
+  instead of completing the job, a partition saves its result here
+- finalize: merge every partition's encountered IDs and stats into one tracker, run
+  orphan cleanup over the merged IDs, merge the partition cursors via the source and
+  complete the job
+
+Results (encountered-ID hashes as .npz, cursor and stats as JSON) go through the
+storage backend, which therefore has to be shared by all workers. Progress published
+while partitions run covers each partition separately; the final stats are merged.
+"""
+
+import io
+from dataclasses import asdict
+from typing import Dict, List
+from uuid import UUID
+
+import numpy as np
+
+from airweave.platform.contexts import SyncContext
+from airweave.platform.storage.paths import paths
+from airweave.platform.sync.exceptions import SyncFailureError
+from airweave.platform.sync.pipeline.entity_tracker import SyncStats
+
+
+def _storage():
+    """Get the storage backend (lazy to avoid circular import at module load)."""
+    from airweave.platform.storage import storage_backend
+
+    return storage_backend
+
+
+async def save_partition_result(sync_context: SyncContext, partition: str) -> None:
+    """Save what the final activity needs from a synced partition.
+
+    Args:
+        sync_context: Context of the partition's run
+        partition: The partition key
+    """
+    storage = _storage()
+    sync_job_id = sync_context.sync_job.id
+    tracker = sync_context.entity_tracker
+
+    buffer = io.BytesIO()
+    np.savez(buffer, **tracker.export_encountered())
+    await storage.write_file(
+        paths.partition_encountered_path(sync_job_id, partition), buffer.getvalue()
+    )
+    await storage.write_json(
+        paths.partition_result_path(sync_job_id, partition),
+        {
+            "partition": partition,
+            "cursor_data": sync_context.cursor.data if sync_context.cursor else {},
+            "stats": asdict(tracker.get_stats()),
+        },
+    )
+
+
+async def merge_partition_results(sync_context: SyncContext, partitions: List[str]) -> None:
+    """Merge the saved partition results into the final activity's tracker and cursor.
+
+    Args:
+        sync_context: Context of the final activity
+        partitions: All partition keys of the sync job, in get_partitions() order
+
+    Raises:
+        SyncFailureError: If a partition has no saved result
+    """
+    storage = _storage()
+    sync_job_id = sync_context.sync_job.id
+    partition_cursors: Dict[str, dict] = {}
+
+    for partition in partitions:
+        result_path = paths.partition_result_path(sync_job_id, partition)
+        if not await storage.exists(result_path):
+            raise SyncFailureError(f"No result saved for partition '{partition}'")
+        result = await storage.read_json(result_path)
+        encountered_bytes = await storage.read_file(
+            paths.partition_encountered_path(sync_job_id, partition)
+        )
+        with np.load(io.BytesIO(encountered_bytes)) as arrays:
+            encountered = {entity_type: arrays[entity_type] for entity_type in arrays.files}
+
+        await sync_context.entity_tracker.merge_partition(encountered, SyncStats(**result["stats"]))
+        partition_cursors[partition] = result["cursor_data"]
+
+    sync_context.logger.info(
+        f"Merged results of {len(partitions)} partitions: "
+        f"{len(sync_context.entity_tracker.get_all_encountered_ids_flat())} entities encountered"
+    )
+
+    if sync_context.cursor and any(partition_cursors.values()):
+        merged = sync_context.source_instance.merge_partition_cursors(partition_cursors)
+        sync_context.cursor.update(**merged)
+
+
+async def delete_partition_results(sync_job_id: UUID, partitions: List[str]) -> None:
+    """Delete the saved partition results of a finished sync job."""
+    storage = _storage()
+    for partition in partitions:
+        await storage.delete(paths.partition_result_path(sync_job_id, partition))
+        await storage.delete(paths.partition_encountered_path(sync_job_id, partition))
@@ -0,0 +1,215 @@
+"""Compact storage for entity IDs encountered during a sync.
+
+EntityTracker has to remember every (entity_type, entity_id) it has seen for the whole
+sync, for deduplication and orphan detection. Holding the ID strings in Python sets
+costs ~100+ bytes per entity. Here each ID is reduced to its full 128-bit MD5 digest,
+kept per entity type in a sorted numpy array (16-byte void keys, compared bytewise)
+plus a small insert buffer - ~16 bytes per entity.
+
+Orphan detection pages through the stored entity IDs of a sync, hashes them and
+checks each page against the stores in one vectorized pass (contains_many).
+
+Collisions: two distinct IDs of the same type sharing a digest would make the second
+one look like a duplicate. With 128-bit digests the probability is ~n²/2^129, i.e.
+below 1e-25 for 5M entities of one type.
+
+Optionally, once a store's sorted array grows past a byte threshold, it is moved to
+an unlinked memory-mapped temp file so the OS can page it out under memory pressure.
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
+
+# One MD5 digest per entity ID
+HASH_DTYPE = np.dtype("V16")
+
+
+def entity_id_hash(entity_id: str) -> bytes:
+    """Hash one entity ID to its 16-byte MD5 digest."""
+    return hashlib.md5(entity_id.encode("utf-8"), usedforsecurity=False).digest()
+
+
+def entity_id_hashes(entity_ids: Iterable[str]) -> np.ndarray:
+    """Hash many entity IDs to an array of 16-byte digests."""
+    packed = b"".join(entity_id_hash(entity_id) for entity_id in entity_ids)
+    return np.frombuffer(packed, dtype=HASH_DTYPE)
+
+
+def _to_array(keys: Iterable[bytes], count: int) -> np.ndarray:
+    """Pack digests (bytes) into a HASH_DTYPE array."""
+    return np.frombuffer(b"".join(keys), dtype=HASH_DTYPE, count=count)
+
+
+class EncounteredIdStore:
+    """Set of 128-bit ID hashes: sorted array of digests plus a small insert buffer."""
+
+    # The buffer is merged once it reaches 1/BUFFER_FRACTION of the sorted array (at
+    # least BUFFER_MIN), so buffered bytes objects stay a small share of the footprint
+    # while total merge work stays linear in the number of keys.
+    BUFFER_MIN = 4_096
+    BUFFER_FRACTION = 64
+
+    def __init__(self, spill_threshold_bytes: int = 0, spill_dir: Optional[str] = None):
+        """Initialize the store.
+
+        Args:
+            spill_threshold_bytes: Move the sorted array to a memory-mapped temp file
+                once it exceeds this size (0 disables spilling)
+            spill_dir: Directory for spill files (defaults to the system temp dir)
+        """
+        self._spill_threshold = spill_threshold_bytes
+        self._spill_dir = spill_dir
+        self._sorted: np.ndarray = np.empty(0, dtype=HASH_DTYPE)
+        self._buffer: set = set()
+        self._spilled = False
+
+    def __len__(self) -> int:
+        """Number of stored hashes."""
+        return len(self._sorted) + len(self._buffer)
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the sorted array lives in a memory-mapped file."""
+        return self._spilled
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate resident bytes (sorted array unless spilled, plus insert buffer)."""
+        sorted_bytes = 0 if self._spilled else self._sorted.nbytes
+        # Set overhead plus one 16-byte bytes object per buffered hash
+        buffer_bytes = sys.getsizeof(self._buffer) + 49 * len(self._buffer)
+        return sorted_bytes + buffer_bytes
+
+    def add(self, key: bytes) -> bool:
+        """Add one hash. Returns True if it was not present."""
+        if key in self._buffer or self._contains_sorted(_to_array([key], 1))[0]:
+            return False
+        self._buffer.add(key)
+        if len(self._buffer) >= max(self.BUFFER_MIN, len(self._sorted) // self.BUFFER_FRACTION):
+            self._merge()
+        return True
+
+    def add_many(self, keys: np.ndarray) -> np.ndarray:
+        """Add hashes in one vectorized pass.
+
+        Args:
+            keys: HASH_DTYPE hashes (may contain repeats)
+
+        Returns:
+            Boolean mask aligned with keys: True for the first occurrence of each
+            hash that was not already stored
+        """
+        keys = np.asarray(keys, dtype=HASH_DTYPE)
+        mask = np.zeros(len(keys), dtype=bool)
+        if not len(keys):
+            return mask
+
+        unique, first_index = np.unique(keys, return_index=True)
+        is_new = ~self._contains_sorted(unique)
+        if self._buffer:
+            buffer = self._buffer
+            is_new &= np.fromiter(
+                (key not in buffer for key in unique.tolist()), dtype=bool, count=len(unique)
+            )
+
+        mask[first_index[is_new]] = True
+        self._buffer.update(unique[is_new].tolist())
+        if len(self._buffer) >= max(self.BUFFER_MIN, len(self._sorted) // self.BUFFER_FRACTION):
+            self._merge()
+        return mask
+
+    def contains(self, key: bytes) -> bool:
+        """Whether a hash is stored."""
+        return key in self._buffer or bool(self._contains_sorted(_to_array([key], 1))[0])
+
+    def contains_many(self, keys: np.ndarray) -> np.ndarray:
+        """Boolean mask of which hashes are stored."""
+        found = self._contains_sorted(keys)
+        if self._buffer:
+            buffer = self._buffer
+            found |= np.fromiter(
+                (key in buffer for key in keys.tolist()), dtype=bool, count=len(keys)
+            )
+        return found
+
+    def iter_chunks(self, chunk_size: int = 10_000) -> Iterator[np.ndarray]:
+        """Iterate over all stored hashes in chunks."""
+        for start in range(0, len(self._sorted), chunk_size):
+            yield np.asarray(self._sorted[start : start + chunk_size])
+        if self._buffer:
+            buffered = _to_array(self._buffer, len(self._buffer))
+            for start in range(0, len(buffered), chunk_size):
+                yield buffered[start : start + chunk_size]
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _contains_sorted(self, keys: np.ndarray) -> np.ndarray:
+        if not len(self._sorted):
+            return np.zeros(len(keys), dtype=bool)
+        positions = np.searchsorted(self._sorted, keys)
+        positions[positions == len(self._sorted)] = 0
+        return self._sorted[positions] == keys
+
+    def _merge(self) -> None:
+        """Merge the insert buffer into the sorted array.
+
+        Both inputs are sorted, so the stable sort (timsort) is a linear merge.
+        """
+        buffered = np.sort(_to_array(self._buffer, len(self._buffer)))
+        merged = np.sort(np.concatenate([self._sorted, buffered]), kind="stable")
+        self._buffer = set()
+
+        if self._spill_threshold and merged.nbytes > self._spill_threshold:
+            merged = self._spill(merged)
+        self._sorted = merged
+
+    def _spill(self, array: np.ndarray) -> np.ndarray:
+        """Copy the array into a memory-mapped temp file.
+
+        The file is unlinked right after mapping, so it is reclaimed as soon as the
+        mapping is dropped (including on crash) and never needs explicit cleanup.
+        """
+        fd, path = tempfile.mkstemp(prefix="airweave-encountered-", dir=self._spill_dir)
+        os.close(fd)
+        try:
+            mapped = np.memmap(path, dtype=HASH_DTYPE, mode="w+", shape=array.shape)
+            mapped[:] = array
+            mapped.flush()
+        finally:
+            os.unlink(path)
+        self._spilled = True
+        return mapped
+
+
+class EncounteredIds:
+    """Read-only view over all types' stores: membership by entity ID."""
+
+    def __init__(self, stores: List[EncounteredIdStore]):
+        """Initialize with the per-type stores."""
+        self._stores = stores
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Whether an entity ID was encountered under any type."""
+        if not isinstance(entity_id, str):
+            return False
+        key = entity_id_hash(entity_id)
+        return any(store.contains(key) for store in self._stores)
+
+    def __len__(self) -> int:
+        """Number of encountered (entity_type, entity_id) pairs."""
+        return sum(len(store) for store in self._stores)
+
+    def contains_many(self, entity_ids: Iterable[str]) -> np.ndarray:
+        """Boolean mask of which entity IDs were encountered under any type."""
+        keys = entity_id_hashes(entity_ids)
+        found = np.zeros(len(keys), dtype=bool)
+        for store in self._stores:
+            found |= store.contains_many(keys)
+        return found
@@ -10,11 +10,20 @@ Publishing is handled by SyncStatePublisher (state_publisher.py).
 """
 
 import asyncio
-from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
+import numpy as np
+
+from airweave.core.config import settings
+from airweave.platform.sync.pipeline.encountered_ids import (
+    HASH_DTYPE,
+    EncounteredIds,
+    EncounteredIdStore,
+    entity_id_hash,
+    entity_id_hashes,
+)
 from airweave.schemas.entity_count import EntityCountWithDefinition
 
 if TYPE_CHECKING:
@@ -32,6 +41,28 @@ class SyncStats:
     skipped: int = 0
     entities_encountered: Dict[str, int] = field(default_factory=dict)
     total_operations: int = 0
+    # Work avoided by sharing one processor run across destinations
+    processing_runs_saved: int = 0
+    embeddings_saved: int = 0
+    # Content-addressed embedding cache lookups (dense + sparse)
+    embedding_cache_hits: int = 0
+    embedding_cache_misses: int = 0
+    # Chunks left in place by chunk-diff updates (not re-embedded or rewritten)
+    chunks_unchanged: int = 0
+    # Unchanged files detected by content fingerprint (never downloaded)
+    file_downloads_skipped: int = 0
+    file_download_bytes_saved: int = 0
+    # Resident memory of the encountered-ID stores
+    encountered_ids_bytes: int = 0
+    encountered_bytes_per_entity: float = 0.0
+
+
+# Recomputed rather than summed when merging partition stats
+_NON_ADDITIVE_STATS = {
+    "entities_encountered",
+    "encountered_ids_bytes",
+    "encountered_bytes_per_entity",
+}
 
 
 class EntityTracker:
@@ -73,8 +104,8 @@ class EntityTracker:
         self.stats = SyncStats()
 
         # Entity encounter tracking (for dedup + orphan detection)
-        # The set tracks IDs, stats.entities_encountered tracks counts
-        self._encountered_by_type: Dict[str, Set[str]] = defaultdict(set)
+        # The stores track 128-bit ID hashes, stats.entities_encountered tracks counts
+        self._encountered_by_type: Dict[str, EncounteredIdStore] = {}
 
         # Entity count tracking
         self._counts_by_definition: Dict[UUID, int] = {}
@@ -114,53 +145,110 @@ class EntityTracker:
             True if this is a new entity (first time encountered)
             False if this is a duplicate (already encountered in this sync)
         """
+        key = entity_id_hash(entity_id)
         async with self._lock:
-            if entity_id in self._encountered_by_type[entity_type]:
+            if not self._get_store(entity_type).add(key):
                 return False  # Duplicate
-            self._encountered_by_type[entity_type].add(entity_id)
             # Update stats directly
             self.stats.entities_encountered[entity_type] = (
                 self.stats.entities_encountered.get(entity_type, 0) + 1
             )
+            self._update_memory_stats()
             return True  # New
 
-    async def track_entities_batch(self, entities: List[tuple]) -> List[tuple]:
-        """Track multiple entities and return only the new ones.
+    async def track_entities_batch(self, entities: Sequence[Tuple[str, str]]) -> List[bool]:
+        """Track a batch of entities under a single lock acquisition.
 
-        More efficient than calling track_entity in a loop when batch is large.
+        IDs are hashed outside the lock and checked per entity type in one vectorized
+        pass. Within the batch, the first occurrence of a (type, id) pair wins.
 
         Args:
-            entities: List of (entity_type, entity_id) tuples
+            entities: (entity_type, entity_id) tuples
 
         Returns:
-            List of (entity_type, entity_id) tuples that are NEW (not duplicates)
+            One flag per input tuple: True if new, False if duplicate
         """
-        new_entities = []
+        keys = entity_id_hashes(entity_id for _, entity_id in entities)
+        positions_by_type: Dict[str, List[int]] = {}
+        for position, (entity_type, _) in enumerate(entities):
+            positions_by_type.setdefault(entity_type, []).append(position)
+
+        is_new = np.zeros(len(entities), dtype=bool)
         async with self._lock:
-            for entity_type, entity_id in entities:
-                if entity_id not in self._encountered_by_type[entity_type]:
-                    self._encountered_by_type[entity_type].add(entity_id)
-                    # Update stats directly
+            for entity_type, positions in positions_by_type.items():
+                index = np.asarray(positions)
+                new_mask = self._get_store(entity_type).add_many(keys[index])
+                is_new[index] = new_mask
+                new_count = int(new_mask.sum())
+                if new_count:
                     self.stats.entities_encountered[entity_type] = (
-                        self.stats.entities_encountered.get(entity_type, 0) + 1
+                        self.stats.entities_encountered.get(entity_type, 0) + new_count
                     )
-                    new_entities.append((entity_type, entity_id))
-        return new_entities
-
-    def get_encountered_ids(self) -> Dict[str, Set[str]]:
-        """Get all encountered entity IDs by type (for orphan detection at sync end)."""
-        return dict(self._encountered_by_type)
+            self._update_memory_stats()
+        return is_new.tolist()
 
     def get_encountered_count(self) -> Dict[str, int]:
         """Get count of encountered entities by type."""
         return dict(self.stats.entities_encountered)
 
-    def get_all_encountered_ids_flat(self) -> Set[str]:
-        """Get all encountered entity IDs as a flat set."""
-        all_ids: Set[str] = set()
-        for ids in self._encountered_by_type.values():
-            all_ids.update(ids)
-        return all_ids
+    def get_all_encountered_ids_flat(self) -> EncounteredIds:
+        """Get all encountered entity IDs as a flat, set-like view.
+
+        Supports ``entity_id in view``, ``len(view)`` and ``view.contains_many(ids)``
+        for checking a page of stored IDs at once.
+        """
+        return EncounteredIds(list(self._encountered_by_type.values()))
+
+    def export_encountered(self) -> Dict[str, np.ndarray]:
+        """Get the encountered-ID hashes by entity type (saved by sync partitions)."""
+        return {
+            entity_type: np.concatenate([np.empty(0, dtype=HASH_DTYPE), *store.iter_chunks()])
+            for entity_type, store in self._encountered_by_type.items()
+        }
+
+    async def merge_partition(self, encountered: Dict[str, np.ndarray], stats: SyncStats) -> None:
+        """Merge the encountered IDs and operation stats of a synced partition.
+
+        Counts by definition are not merged: the final activity of a partitioned sync
+        loads them from the database after all partitions wrote their entities.
+
+        Args:
+            encountered: Hashes by entity type, as returned by export_encountered()
+            stats: The partition's stats
+        """
+        async with self._lock:
+            for entity_type, keys in encountered.items():
+                new_count = int(self._get_store(entity_type).add_many(keys).sum())
+                if new_count:
+                    self.stats.entities_encountered[entity_type] = (
+                        self.stats.entities_encountered.get(entity_type, 0) + new_count
+                    )
+            for stats_field in fields(SyncStats):
+                if stats_field.name not in _NON_ADDITIVE_STATS:
+                    name = stats_field.name
+                    setattr(self.stats, name, getattr(self.stats, name) + getattr(stats, name))
+            self._update_memory_stats()
+
+    def _get_store(self, entity_type: str) -> EncounteredIdStore:
+        """Get (or create) the encountered-ID store for an entity type."""
+        store = self._encountered_by_type.get(entity_type)
+        if store is None:
+            store = EncounteredIdStore(
+                spill_threshold_bytes=settings.ENTITY_TRACKER_SPILL_THRESHOLD_BYTES,
+                spill_dir=settings.ENTITY_TRACKER_SPILL_DIR or None,
+            )
+            self._encountered_by_type[entity_type] = store
+        return store
+
+    def _update_memory_stats(self) -> None:
+        """Refresh encountered-ID memory stats (caller holds the lock)."""
+        total_bytes = 0
+        total_ids = 0
+        for store in self._encountered_by_type.values():
+            total_bytes += store.memory_bytes
+            total_ids += len(store)
+        self.stats.encountered_ids_bytes = total_bytes
+        self.stats.encountered_bytes_per_entity = total_bytes / total_ids if total_ids else 0.0
 
     # -------------------------------------------------------------------------
     # Entity Count Tracking & Global Stats
@@ -216,6 +304,33 @@ class EntityTracker:
             self.stats.skipped += count
             self.stats.total_operations += count
 
+    async def record_shared_processing(
+        self,
+        runs_saved: int,
+        embeddings_saved: int = 0,
+    ) -> None:
+        """Record processor runs and chunk embeddings avoided by shared processing."""
+        async with self._lock:
+            self.stats.processing_runs_saved += runs_saved
+            self.stats.embeddings_saved += embeddings_saved
+
+    async def record_embedding_cache(self, hits: int, misses: int) -> None:
+        """Record embedding cache hits and misses."""
+        async with self._lock:
+            self.stats.embedding_cache_hits += hits
+            self.stats.embedding_cache_misses += misses
+
+    async def record_unchanged_chunks(self, count: int) -> None:
+        """Record chunks skipped by chunk-diff updates."""
+        async with self._lock:
+            self.stats.chunks_unchanged += count
+
+    async def record_skipped_downloads(self, count: int, bytes_saved: int) -> None:
+        """Record file downloads avoided by content fingerprint change detection."""
+        async with self._lock:
+            self.stats.file_downloads_skipped += count
+            self.stats.file_download_bytes_saved += bytes_saved
+
     async def record_batch_results(
         self,
         inserts_by_def: Dict[UUID, int],
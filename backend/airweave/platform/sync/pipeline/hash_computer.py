@@ -7,8 +7,10 @@ from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 import aiofiles
 
+from airweave.core.config import settings
 from airweave.core.shared_models import AirweaveFieldFlag
 from airweave.platform.entities._base import BaseEntity, CodeFileEntity, FileEntity
+from airweave.platform.sync.async_helpers import run_in_process_pool, use_process_pool
 from airweave.platform.sync.exceptions import EntityProcessingError, SyncFailureError
 
 if TYPE_CHECKING:
@@ -21,6 +23,7 @@ class HashComputer:
     Handles:
     - Stable serialization of entity data
     - File content hashing for FileEntity/CodeFileEntity
+    - Content fingerprints instead of file bytes (FILE_FINGERPRINT_ENABLED)
     - Batch hash computation with semaphore-controlled concurrency
     """
 
@@ -50,7 +53,10 @@ class HashComputer:
             return
 
         # Compute all hashes concurrently with semaphore control
-        results = await self._compute_hashes_concurrently(entities, sync_context)
+        if use_process_pool(sync_context):
+            results = await self._compute_hashes_in_process_pool(entities, sync_context)
+        else:
+            results = await self._compute_hashes_concurrently(entities, sync_context)
 
         # Process results and handle failures
         await self._process_hash_results(entities, results, sync_context)
@@ -71,16 +77,8 @@ class HashComputer:
             EntityProcessingError: If file entity is missing local_path or file read fails
         """
         try:
-            # Step 1: Get entity dict
-            entity_dict = entity.model_dump(mode="python", exclude_none=True)
-
-            # Step 2: For file entities, compute and add content hash
-            if isinstance(entity, (FileEntity, CodeFileEntity)):
-                content_hash = await self._compute_file_content_hash(entity)
-                entity_dict["_content_hash"] = content_hash
-
-            # Step 3: Exclude volatile fields
-            content_dict = self._exclude_volatile_fields(entity, entity_dict)
+            # Steps 1-3: Entity dict with file content hash, without volatile fields
+            content_dict = await self._build_content_dict(entity)
 
             # Step 4: Stable serialize and hash
             return self._compute_dict_hash(content_dict)
@@ -90,33 +88,88 @@ class HashComputer:
         except Exception:
             raise
 
+    async def _build_content_dict(self, entity: BaseEntity) -> dict:
+        """Build the hashable content dict for an entity.
+
+        Raises:
+            EntityProcessingError: If file entity is missing local_path or file read fails
+        """
+        # Step 1: Get entity dict
+        entity_dict = entity.model_dump(mode="python", exclude_none=True)
+
+        # Step 2: For file entities, compute and add content hash
+        if isinstance(entity, (FileEntity, CodeFileEntity)):
+            content_hash = await self._compute_file_content_hash(entity)
+            entity_dict["_content_hash"] = content_hash
+
+        # Step 3: Exclude volatile fields
+        return self._exclude_volatile_fields(entity, entity_dict)
+
     # ------------------------------------------------------------------------------------
     # Batch Processing
     # ------------------------------------------------------------------------------------
 
-    async def _compute_hashes_concurrently(
+    async def _compute_hashes_in_process_pool(
         self,
         entities: List[BaseEntity],
         sync_context: "SyncContext",
     ) -> List[Tuple[Tuple[str, str], Optional[str]]]:
+        """Compute hashes with serialization and hashing offloaded to the process pool.
+
+        File reads stay async in this process; the content dicts of the whole batch
+        are then stable-serialized and hashed in a single process pool job.
+
+        Args:
+            entities: Entities to hash
+            sync_context: Sync context with logger
+
+        Returns:
+            List of ((entity_type, entity_id), hash_value) tuples
+        """
+        from airweave.platform.sync import cpu_jobs
+
+        content_results = await self._compute_hashes_concurrently(
+            entities, sync_context, build_only=True
+        )
+        content_dicts = [content for _, content in content_results if content is not None]
+        hashes = iter(
+            await run_in_process_pool(cpu_jobs.compute_dict_hashes, content_dicts)
+            if content_dicts
+            else []
+        )
+        return [
+            (entity_key, next(hashes) if content is not None else None)
+            for entity_key, content in content_results
+        ]
+
+    async def _compute_hashes_concurrently(
+        self,
+        entities: List[BaseEntity],
+        sync_context: "SyncContext",
+        build_only: bool = False,
+    ) -> List[Tuple[Tuple[str, str], Optional[Any]]]:
         """Compute hashes for all entities concurrently with semaphore control.
 
         Args:
             entities: Entities to hash
             sync_context: Sync context with logger
+            build_only: Return the content dicts instead of hashing them
 
         Returns:
             List of ((entity_type, entity_id), hash_value) tuples
+            (content dicts instead of hash values when build_only is set)
         """
         # Limit concurrent file reads
         semaphore = asyncio.Semaphore(10)
 
         async def compute_with_semaphore(
             entity: BaseEntity,
-        ) -> Tuple[Tuple[str, str], Optional[str]]:
+        ) -> Tuple[Tuple[str, str], Optional[Any]]:
             async with semaphore:
                 entity_key = (entity.__class__.__name__, entity.entity_id)
                 try:
+                    if build_only:
+                        return entity_key, await self._build_content_dict(entity)
                     hash_value = await self.compute_for_entity(entity)
                     return entity_key, hash_value
                 except EntityProcessingError as e:
@@ -202,15 +255,23 @@ class HashComputer:
     async def _compute_file_content_hash(self, entity: BaseEntity) -> str:
         """Compute SHA256 hash of file content.
 
+        With FILE_FINGERPRINT_ENABLED, the source-reported content fingerprint is used
+        instead, so the file does not need to be downloaded yet.
+
         Args:
             entity: FileEntity or CodeFileEntity with local_path
 
         Returns:
-            Hex digest of file content hash
+            Hex digest of file content hash, or the prefixed content fingerprint
 
         Raises:
             EntityProcessingError: If local_path missing or file read fails
         """
+        if settings.FILE_FINGERPRINT_ENABLED:
+            fingerprint = entity.content_fingerprint()
+            if fingerprint:
+                return f"fingerprint:{fingerprint}"
+
         local_path = getattr(entity, "local_path", None)
         if not local_path:
             raise EntityProcessingError(
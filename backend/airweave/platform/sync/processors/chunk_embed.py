@@ -11,10 +11,14 @@ This ensures consistent keyword search behavior across both vector databases,
 with benefits of pre-trained vocabulary/IDF, stopword removal, and learned term weights.
 """
 
+import hashlib
+import itertools
 import json
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from collections import defaultdict, deque
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 
 from airweave.platform.entities._base import BaseEntity, CodeFileEntity
+from airweave.platform.sync.async_helpers import use_process_pool
 from airweave.platform.sync.exceptions import SyncFailureError
 from airweave.platform.sync.pipeline.text_builder import text_builder
 from airweave.platform.sync.processors.protocol import ContentProcessor
@@ -22,6 +26,69 @@ from airweave.platform.sync.processors.utils import filter_empty_representations
 
 if TYPE_CHECKING:
     from airweave.platform.contexts import SyncContext
+    from airweave.platform.embedders.cache import EmbeddingCache
+
+
+def compute_chunk_hash(text: str) -> str:
+    """Hash chunk text for chunk-diff updates."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def match_chunk_slots(
+    hashes: List[str], previous: List[str]
+) -> Tuple[List[int], List[bool], List[str]]:
+    """Assign a parent's chunks to slots, keeping the previous slot of unchanged text.
+
+    A slot is the chunk's "__chunk_{slot}" entity_id suffix. Chunks whose text hash
+    was stored take that slot wherever they moved; the other chunks take the freed
+    slots first (overwriting stale chunks), then new ones.
+
+    Args:
+        hashes: Text hashes of the parent's chunks, in order
+        previous: Stored chunk hashes by slot ("" for unused slots)
+
+    Returns:
+        Slot of each chunk, whether each chunk is unchanged, and the new hashes by slot
+    """
+    stored_slots: Dict[str, Deque[int]] = defaultdict(deque)
+    for slot, chunk_hash in enumerate(previous):
+        if chunk_hash:
+            stored_slots[chunk_hash].append(slot)
+
+    slots: List[Optional[int]] = [None] * len(hashes)
+    for i, chunk_hash in enumerate(hashes):
+        if stored_slots.get(chunk_hash):
+            slots[i] = stored_slots[chunk_hash].popleft()
+    unchanged = [slot is not None for slot in slots]
+
+    taken = {slot for slot in slots if slot is not None}
+    free_slots = (slot for slot in itertools.count() if slot not in taken)
+    for i, slot in enumerate(slots):
+        if slot is None:
+            slots[i] = next(free_slots)
+
+    slot_hashes = [""] * (max(slots) + 1 if slots else 0)
+    for slot, chunk_hash in zip(slots, hashes, strict=True):
+        slot_hashes[slot] = chunk_hash
+    return slots, unchanged, slot_hashes
+
+
+def split_unchanged_chunks(
+    chunk_entities: List[BaseEntity],
+) -> Tuple[List[BaseEntity], List[BaseEntity]]:
+    """Split chunk-diff processor output into chunks to write and unchanged chunks.
+
+    Unchanged chunks are returned without dense embeddings; only their payloads and
+    sparse vectors need refreshing in the destinations.
+    """
+    changed: List[BaseEntity] = []
+    unchanged: List[BaseEntity] = []
+    for chunk in chunk_entities:
+        if chunk.airweave_system_metadata.dense_embedding is None:
+            unchanged.append(chunk)
+        else:
+            changed.append(chunk)
+    return changed, unchanged
 
 
 class ChunkEmbedProcessor(ContentProcessor):
@@ -36,7 +103,7 @@ class ChunkEmbedProcessor(ContentProcessor):
 
     Output:
         Chunk entities with:
-        - entity_id: "{original_id}__chunk_{idx}"
+        - entity_id: "{original_id}__chunk_{idx}" (chunk-diff updates keep stored suffixes)
         - textual_representation: chunk text
         - airweave_system_metadata.dense_embedding: 3072-dim vector
         - airweave_system_metadata.sparse_embedding: FastEmbed BM25 sparse vector
@@ -48,8 +115,21 @@ class ChunkEmbedProcessor(ContentProcessor):
         self,
         entities: List[BaseEntity],
         sync_context: "SyncContext",
+        previous_chunk_hashes: Optional[Dict[str, List[str]]] = None,
     ) -> List[BaseEntity]:
-        """Process entities through full chunk+embed pipeline."""
+        """Process entities through full chunk+embed pipeline.
+
+        Args:
+            entities: Entities to chunk and embed
+            sync_context: Sync context
+            previous_chunk_hashes: Optional stored chunk hashes by parent entity_id
+                (chunk-diff updates). Chunks are matched to the stored chunks by text
+                hash, see _match_previous_chunks().
+
+        Returns:
+            Chunk entities. With previous_chunk_hashes, chunks that are already stored
+            are returned without dense embeddings, see split_unchanged_chunks().
+        """
         if not entities:
             return []
 
@@ -69,14 +149,24 @@ class ChunkEmbedProcessor(ContentProcessor):
         for entity in processed:
             entity.textual_representation = None
 
-        # Step 5: Embed chunks
+        # Step 5: Match chunks to the stored chunks by text (chunk-diff updates)
+        unchanged: List[BaseEntity] = []
+        if previous_chunk_hashes:
+            chunk_entities, unchanged = await self._match_previous_chunks(
+                processed, chunk_entities, previous_chunk_hashes, sync_context
+            )
+
+        # Step 6: Embed new and changed chunks. Unchanged chunks only get new sparse
+        # embeddings: BM25 covers the whole chunk entity, not just the hashed text.
         await self._embed_entities(chunk_entities, sync_context)
+        await self._embed_sparse(unchanged, sync_context)
 
         sync_context.logger.debug(
-            f"[ChunkEmbedProcessor] {len(entities)} entities -> {len(chunk_entities)} chunks"
+            f"[ChunkEmbedProcessor] {len(entities)} entities -> "
+            f"{len(chunk_entities) + len(unchanged)} chunks"
         )
 
-        return chunk_entities
+        return chunk_entities + unchanged
 
     # -------------------------------------------------------------------------
     # Chunking
@@ -123,7 +213,9 @@ class ChunkEmbedProcessor(ContentProcessor):
         texts = [e.textual_representation for e in supported]
 
         try:
-            chunk_lists = await chunker.chunk_batch(texts)
+            chunk_lists = await chunker.chunk_batch(
+                texts, use_process_pool=use_process_pool(sync_context)
+            )
         except Exception as e:
             raise SyncFailureError(f"[ChunkEmbedProcessor] CodeChunker failed: {e}")
 
@@ -141,7 +233,9 @@ class ChunkEmbedProcessor(ContentProcessor):
         texts = [e.textual_representation for e in entities]
 
         try:
-            chunk_lists = await chunker.chunk_batch(texts)
+            chunk_lists = await chunker.chunk_batch(
+                texts, use_process_pool=use_process_pool(sync_context)
+            )
         except Exception as e:
             raise SyncFailureError(f"[ChunkEmbedProcessor] SemanticChunker failed: {e}")
 
@@ -180,18 +274,21 @@ class ChunkEmbedProcessor(ContentProcessor):
         chunk_lists: List[List[Dict[str, Any]]],
         sync_context: "SyncContext",
     ) -> List[BaseEntity]:
-        """Create chunk entities from chunker output."""
+        """Create chunk entities from chunker output.
+
+        Also records the per-chunk text hashes on each parent entity
+        (airweave_system_metadata.chunk_hashes, "" for skipped empty chunks).
+        """
         chunk_entities: List[BaseEntity] = []
 
         for entity, chunks in zip(entities, chunk_lists, strict=True):
-            if not chunks:
-                continue
-
             original_id = entity.entity_id
+            chunk_hashes: List[str] = []
 
             for idx, chunk in enumerate(chunks):
                 chunk_text = chunk.get("text", "")
                 if not chunk_text or not chunk_text.strip():
+                    chunk_hashes.append("")
                     continue
 
                 chunk_entity = entity.model_copy(deep=True)
@@ -201,9 +298,61 @@ class ChunkEmbedProcessor(ContentProcessor):
                 chunk_entity.airweave_system_metadata.original_entity_id = original_id
 
                 chunk_entities.append(chunk_entity)
+                chunk_hashes.append(compute_chunk_hash(chunk_text))
+
+            # Set after copying so chunk documents don't carry the parent's hash list
+            entity.airweave_system_metadata.chunk_hashes = chunk_hashes
 
         return chunk_entities
 
+    async def _match_previous_chunks(
+        self,
+        parents: List[BaseEntity],
+        chunk_entities: List[BaseEntity],
+        previous_chunk_hashes: Dict[str, List[str]],
+        sync_context: "SyncContext",
+    ) -> Tuple[List[BaseEntity], List[BaseEntity]]:
+        """Match chunks to their parent's stored chunks by text hash.
+
+        Unchanged chunks keep their stored slot (entity_id) even if text before them
+        was inserted or removed, so they need no dense embedding. The parents' chunk_hashes
+        are rebuilt by slot; slots no chunk uses anymore are left empty ("").
+
+        Returns:
+            (chunks to embed and write, unchanged chunks)
+        """
+        chunks_by_parent: Dict[str, List[BaseEntity]] = defaultdict(list)
+        for chunk in chunk_entities:
+            chunks_by_parent[chunk.airweave_system_metadata.original_entity_id].append(chunk)
+
+        changed: List[BaseEntity] = []
+        unchanged: List[BaseEntity] = []
+        for parent in parents:
+            chunks = chunks_by_parent.pop(parent.entity_id, [])
+            previous = previous_chunk_hashes.get(parent.entity_id)
+            if previous is None or parent.airweave_system_metadata.chunk_hashes is None:
+                changed.extend(chunks)
+                continue
+
+            hashes = [compute_chunk_hash(chunk.textual_representation) for chunk in chunks]
+            slots, is_unchanged, slot_hashes = match_chunk_slots(hashes, previous)
+            for chunk, slot, same in zip(chunks, slots, is_unchanged, strict=True):
+                chunk.entity_id = f"{parent.entity_id}__chunk_{slot}"
+                chunk.airweave_system_metadata.chunk_index = slot
+                (unchanged if same else changed).append(chunk)
+            parent.airweave_system_metadata.chunk_hashes = slot_hashes
+
+        for chunks in chunks_by_parent.values():
+            changed.extend(chunks)
+
+        if unchanged:
+            await sync_context.entity_tracker.record_unchanged_chunks(len(unchanged))
+            sync_context.logger.debug(
+                f"[ChunkEmbedProcessor] Chunk diff: {len(unchanged)}/{len(chunk_entities)} "
+                f"chunks unchanged, skipping embedding"
+            )
+        return changed, unchanged
+
     # -------------------------------------------------------------------------
     # Embedding
     # -------------------------------------------------------------------------
@@ -225,7 +374,10 @@ class ChunkEmbedProcessor(ContentProcessor):
         if not chunk_entities:
             return
 
-        from airweave.platform.embedders import SparseEmbedder, get_dense_embedder
+        from airweave.platform.embedders import get_dense_embedder
+        from airweave.platform.embedders.cache import get_embedding_cache
+
+        cache = get_embedding_cache()
 
         # Dense embeddings (provider-specific dimensions for neural search)
         dense_texts = [e.textual_representation for e in chunk_entities]
@@ -233,7 +385,15 @@ class ChunkEmbedProcessor(ContentProcessor):
             vector_size=sync_context.collection.vector_size,
             model_name=sync_context.collection.embedding_model_name,
         )
-        dense_embeddings = await dense_embedder.embed_many(dense_texts, sync_context)
+        dense_embeddings = await self._embed_cached(
+            cache,
+            dense_texts,
+            model_name=dense_embedder.MODEL_NAME,
+            dimensions=sync_context.collection.vector_size,
+            embed_fn=lambda texts: dense_embedder.embed_many(texts, sync_context),
+            dense=True,
+            sync_context=sync_context,
+        )
         if (
             dense_embeddings
             and dense_embeddings[0] is not None
@@ -245,8 +405,34 @@ class ChunkEmbedProcessor(ContentProcessor):
                 f"expected {sync_context.collection.vector_size}."
             )
 
-        # Sparse embeddings (FastEmbed Qdrant/bm25 for keyword search scoring)
-        # Uses full entity JSON (minus system metadata) to capture all searchable content
+        # Assign and validate dense embeddings
+        for i, entity in enumerate(chunk_entities):
+            entity.airweave_system_metadata.dense_embedding = dense_embeddings[i]
+            if entity.airweave_system_metadata.dense_embedding is None:
+                raise SyncFailureError(f"Entity {entity.entity_id} has no dense embedding")
+
+        await self._embed_sparse(chunk_entities, sync_context, cache=cache)
+
+    async def _embed_sparse(
+        self,
+        chunk_entities: List[BaseEntity],
+        sync_context: "SyncContext",
+        cache: Optional["EmbeddingCache"] = None,
+    ) -> None:
+        """Compute sparse embeddings (FastEmbed Qdrant/bm25 for keyword search scoring).
+
+        Uses the full entity JSON (minus system metadata) to capture all searchable
+        content, so unchanged chunks of chunk-diff updates need them recomputed too.
+        """
+        if not chunk_entities:
+            return
+
+        from airweave.platform.embedders import SparseEmbedder
+        from airweave.platform.embedders.cache import get_embedding_cache
+
+        if cache is None:
+            cache = get_embedding_cache()
+
         sparse_texts = [
             json.dumps(
                 e.model_dump(mode="json", exclude={"airweave_system_metadata"}),
@@ -255,16 +441,60 @@ class ChunkEmbedProcessor(ContentProcessor):
             for e in chunk_entities
         ]
         sparse_embedder = SparseEmbedder()
-        sparse_embeddings = await sparse_embedder.embed_many(sparse_texts, sync_context)
+        sparse_embeddings = await self._embed_cached(
+            cache,
+            sparse_texts,
+            model_name=SparseEmbedder.MODEL_NAME,
+            dimensions=0,
+            embed_fn=lambda texts: sparse_embedder.embed_many(texts, sync_context),
+            dense=False,
+            sync_context=sync_context,
+        )
 
-        # Assign embeddings to entities
         for i, entity in enumerate(chunk_entities):
-            entity.airweave_system_metadata.dense_embedding = dense_embeddings[i]
             entity.airweave_system_metadata.sparse_embedding = sparse_embeddings[i]
-
-        # Validate
-        for entity in chunk_entities:
-            if entity.airweave_system_metadata.dense_embedding is None:
-                raise SyncFailureError(f"Entity {entity.entity_id} has no dense embedding")
             if entity.airweave_system_metadata.sparse_embedding is None:
                 raise SyncFailureError(f"Entity {entity.entity_id} has no sparse embedding")
+
+    async def _embed_cached(
+        self,
+        cache: Optional["EmbeddingCache"],
+        texts: List[str],
+        model_name: str,
+        dimensions: int,
+        embed_fn: Callable[[List[str]], Awaitable[List[Any]]],
+        dense: bool,
+        sync_context: "SyncContext",
+    ) -> List[Any]:
+        """Embed texts through the embedding cache when enabled.
+
+        Only texts whose (model, dimensions, text hash) key misses the cache are sent
+        to the provider. Hit/miss counts are recorded on the entity tracker.
+        """
+        if cache is None:
+            return await embed_fn(texts)
+
+        from airweave.platform.embedders.cache import (
+            decode_dense,
+            decode_sparse,
+            encode_dense,
+            encode_sparse,
+            is_cacheable_dense,
+            is_cacheable_sparse,
+        )
+
+        result = await cache.embed(
+            texts,
+            model_name=model_name,
+            dimensions=dimensions,
+            embed_fn=embed_fn,
+            encode=encode_dense if dense else encode_sparse,
+            decode=decode_dense if dense else decode_sparse,
+            is_cacheable=is_cacheable_dense if dense else is_cacheable_sparse,
+        )
+        await sync_context.entity_tracker.record_embedding_cache(result.hits, result.misses)
+        sync_context.logger.debug(
+            f"[ChunkEmbedProcessor] {'Dense' if dense else 'Sparse'} embedding cache: "
+            f"{result.hits} hits, {result.misses} misses"
+        )
+        return result.embeddings
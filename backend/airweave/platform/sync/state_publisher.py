@@ -217,3 +217,8 @@ class SyncStatePublisher:
             f"{emoji} Sync {text} | Total entities: {total_entities} | "
             f"Ops: {stats.total_operations} ({ops_summary})"
         )
+        if stats.file_downloads_skipped:
+            self.logger.info(
+                f"Skipped {stats.file_downloads_skipped} unchanged file downloads "
+                f"({stats.file_download_bytes_saved / (1024 * 1024):.1f}MB saved)"
+            )
@@ -6,6 +6,7 @@ from enum import Enum
 from typing import AsyncGenerator, Generic, Optional, TypeVar
 
 from airweave.platform.entities._base import BaseEntity
+from airweave.platform.sync.checkpoint import SyncCheckpointer
 from airweave.platform.utils.error_utils import get_error_message
 
 T = TypeVar("T", bound=BaseEntity)
@@ -38,6 +39,7 @@ class AsyncSourceStream(Generic[T]):
         source_generator: AsyncGenerator[T, None],
         queue_size: int = 10000,
         logger: Optional[logging.Logger] = None,
+        checkpointer: Optional[SyncCheckpointer] = None,
     ):
         """Initialize the async source stream.
 
@@ -45,8 +47,10 @@ class AsyncSourceStream(Generic[T]):
             source_generator: The source async generator
             queue_size: Size of the queue connecting producer and consumer
             logger: Optional contextualized logger, falls back to global logger if not provided
+            checkpointer: Optional checkpointer that snapshots the cursor per produced entity
         """
         self.source_generator = source_generator
+        self.checkpointer = checkpointer
         # Queue is used to buffer entities and implement backpressure
         self.queue: asyncio.Queue[Optional[T]] = asyncio.Queue(maxsize=queue_size)
         self.producer_task = None
@@ -88,6 +92,9 @@ class AsyncSourceStream(Generic[T]):
                     self.logger.debug(f"Producer stopping early due to state: {self._state}")
                     break
 
+                if self.checkpointer:
+                    self.checkpointer.record_produced()
+
                 # Put item in queue, waiting if queue is full.
                 # This is a blocking call, so producer will wait until the queue has space
                 # Effectively, this is a backpressure mechanism.
@@ -14,10 +14,16 @@ from airweave.platform.temporal.activities.api_key_notifications import (
     CheckAndNotifyExpiringKeysActivity,
 )
 from airweave.platform.temporal.activities.cleanup import SelfDestructOrphanedSyncActivity
+from airweave.platform.temporal.activities.partitions import (
+    FinalizePartitionedSyncActivity,
+    PlanSyncPartitionsActivity,
+    RunSyncPartitionActivity,
+)
 from airweave.platform.temporal.activities.sync import (
     CleanupStuckSyncJobsActivity,
     CreateSyncJobActivity,
     MarkSyncJobCancelledActivity,
+    ResolveSyncOptionsActivity,
     RunSyncActivity,
 )
 
@@ -33,25 +39,37 @@ from airweave.platform.temporal.activities.sync import (
 # The actual activity instances with dependencies are registered separately in worker.py.
 
 run_sync_activity = RunSyncActivity.run
+resolve_sync_options_activity = ResolveSyncOptionsActivity.run
 mark_sync_job_cancelled_activity = MarkSyncJobCancelledActivity.run
 create_sync_job_activity = CreateSyncJobActivity.run
 cleanup_stuck_sync_jobs_activity = CleanupStuckSyncJobsActivity.run
 self_destruct_orphaned_sync_activity = SelfDestructOrphanedSyncActivity.run
 check_and_notify_expiring_keys_activity = CheckAndNotifyExpiringKeysActivity.run
+plan_sync_partitions_activity = PlanSyncPartitionsActivity.run
+run_sync_partition_activity = RunSyncPartitionActivity.run
+finalize_partitioned_sync_activity = FinalizePartitionedSyncActivity.run
 
 __all__ = [
     # Activity classes (for worker.py instantiation)
     "RunSyncActivity",
+    "ResolveSyncOptionsActivity",
     "MarkSyncJobCancelledActivity",
     "CreateSyncJobActivity",
     "CleanupStuckSyncJobsActivity",
     "SelfDestructOrphanedSyncActivity",
     "CheckAndNotifyExpiringKeysActivity",
+    "PlanSyncPartitionsActivity",
+    "RunSyncPartitionActivity",
+    "FinalizePartitionedSyncActivity",
     # Activity method references (for workflow imports)
     "run_sync_activity",
+    "resolve_sync_options_activity",
     "mark_sync_job_cancelled_activity",
     "create_sync_job_activity",
     "cleanup_stuck_sync_jobs_activity",
     "self_destruct_orphaned_sync_activity",
     "check_and_notify_expiring_keys_activity",
+    "plan_sync_partitions_activity",
+    "run_sync_partition_activity",
+    "finalize_partitioned_sync_activity",
 ]
@@ -0,0 +1,377 @@
+"""Temporal activities for partitioned syncs (see platform/sync/partitions.py).
+
+RunSourceConnectionWorkflow runs these instead of run_sync_activity when
+SYNC_PARTITIONING_ENABLED and the source lists at least two partitions:
+
+- PlanSyncPartitionsActivity: list the partitions and mark the job RUNNING
+- RunSyncPartitionActivity: sync one partition (one activity per partition)
+- FinalizePartitionedSyncActivity: orphan cleanup, cursor merge, job completion
+"""
+
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from airweave.core.protocols import EventBus
+
+from temporalio import activity
+from temporalio.exceptions import ApplicationError
+
+
+async def _load_inputs(
+    sync_dict: Dict[str, Any],
+    sync_job_dict: Dict[str, Any],
+    collection_dict: Dict[str, Any],
+    connection_dict: Dict[str, Any],
+    ctx_dict: Dict[str, Any],
+    logger_name: str,
+) -> Tuple[Any, Any, Any, Any, Any, Any]:
+    """Rebuild the sync inputs from workflow dicts, with fresh job and collection rows.
+
+    Returns:
+        (sync, sync_job, collection, connection, ctx, execution_config)
+    """
+    from airweave import crud, schemas
+    from airweave.api.context import ApiContext
+    from airweave.core.logging import LoggerConfigurator
+    from airweave.db.session import get_db_context
+    from airweave.platform.sync.config import SyncConfig
+
+    sync = schemas.Sync(**sync_dict)
+    sync_job = schemas.SyncJob(**sync_job_dict)
+    connection = schemas.Connection(**connection_dict)
+
+    user = schemas.User(**ctx_dict["user"]) if ctx_dict.get("user") else None
+    organization = schemas.Organization(**ctx_dict["organization"])
+
+    ctx = ApiContext(
+        request_id=ctx_dict["request_id"],
+        organization=organization,
+        user=user,
+        auth_method=ctx_dict["auth_method"],
+        auth_metadata=ctx_dict.get("auth_metadata"),
+        logger=LoggerConfigurator.configure_logger(
+            logger_name,
+            dimensions={
+                "sync_job_id": str(sync_job.id),
+                "organization_id": str(organization.id),
+                "organization_name": organization.name,
+            },
+        ),
+    )
+
+    collection_id = UUID(collection_dict["id"])
+    async with get_db_context() as db:
+        collection_model = await crud.collection.get(db=db, id=collection_id, ctx=ctx)
+        if not collection_model:
+            raise ValueError(f"Collection {collection_id} not found in database")
+        collection = schemas.Collection.model_validate(collection_model, from_attributes=True)
+
+        # The job row carries started_at (set by planning) and the execution config
+        execution_config = None
+        sync_job_model = await crud.sync_job.get(db, id=sync_job.id, ctx=ctx)
+        if sync_job_model:
+            sync_job = schemas.SyncJob.model_validate(sync_job_model, from_attributes=True)
+            if sync_job_model.sync_config:
+                execution_config = SyncConfig(**sync_job_model.sync_config)
+
+    return sync, sync_job, collection, connection, ctx, execution_config
+
+
+def _event_fields(sync, sync_job, collection, connection) -> Dict[str, Any]:
+    """Common fields of the job's SyncLifecycleEvents."""
+    return {
+        "organization_id": collection.organization_id,
+        "source_connection_id": sync.source_connection_id,
+        "sync_job_id": sync_job.id,
+        "sync_id": sync.id,
+        "collection_id": collection.id,
+        "source_type": connection.short_name,
+        "collection_name": collection.name,
+        "collection_readable_id": collection.readable_id,
+    }
+
+
+async def _run_with_heartbeat(work: Awaitable, sync, ctx) -> Any:
+    """Run the work as a task, heartbeating until it finishes or is cancelled.
+
+    Source connections deleted mid-run surface as ORPHANED_SYNC, like in
+    RunSyncActivity, so the workflow self-destructs.
+    """
+    from airweave.core.exceptions import NotFoundException
+
+    task = asyncio.create_task(work)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=1)
+            if task in done:
+                return await task
+            activity.heartbeat("Sync in progress")
+    except asyncio.CancelledError:
+        task.cancel()
+        while not task.done():
+            await asyncio.wait({task}, timeout=1)
+            activity.heartbeat("Cancelling sync...")
+        with suppress(asyncio.CancelledError, Exception):
+            task.result()
+        raise
+    except NotFoundException as e:
+        if "Source connection record not found" in str(e) or "Connection not found" in str(e):
+            ctx.logger.info(f"🧹 Source connection for sync {sync.id} not found.")
+            raise Exception("ORPHANED_SYNC: Source connection record not found") from e
+        raise
+
+
+# =============================================================================
+# Plan Sync Partitions Activity
+# =============================================================================
+
+
+@dataclass
+class PlanSyncPartitionsActivity:
+    """List the partitions of a sync's source.
+
+    Dependencies:
+        event_bus: Publish the RUNNING event when the sync is partitioned
+
+    Returns the partition keys; with fewer than two the workflow runs the sync as a
+    single run_sync_activity, which marks the job RUNNING itself.
+    """
+
+    event_bus: "EventBus"
+
+    @activity.defn(name="plan_sync_partitions_activity")
+    async def run(
+        self,
+        sync_dict: Dict[str, Any],
+        sync_job_dict: Dict[str, Any],
+        collection_dict: Dict[str, Any],
+        connection_dict: Dict[str, Any],
+        ctx_dict: Dict[str, Any],
+        access_token: Optional[str] = None,
+        force_full_sync: bool = False,
+    ) -> List[str]:
+        """List the partitions of the sync's source.
+
+        Args:
+            sync_dict: The sync configuration as dict
+            sync_job_dict: The sync job as dict
+            collection_dict: The collection as dict
+            connection_dict: The connection as dict (Connection schema, NOT SourceConnection)
+            ctx_dict: The API context as dict
+            access_token: Optional access token
+            force_full_sync: If True, forces a full sync with orphaned entity deletion
+
+        Returns:
+            Partition keys
+        """
+        from airweave.core.datetime_utils import utc_now_naive
+        from airweave.core.events.sync import SyncLifecycleEvent
+        from airweave.core.shared_models import SyncJobStatus
+        from airweave.core.sync_job_service import sync_job_service
+        from airweave.core.sync_service import sync_service
+
+        sync, sync_job, collection, connection, ctx, execution_config = await _load_inputs(
+            sync_dict,
+            sync_job_dict,
+            collection_dict,
+            connection_dict,
+            ctx_dict,
+            "airweave.temporal.activity.plan_partitions",
+        )
+
+        partitions = await _run_with_heartbeat(
+            sync_service.plan_partitions(
+                sync=sync,
+                sync_job=sync_job,
+                collection=collection,
+                source_connection=connection,
+                ctx=ctx,
+                access_token=access_token,
+                force_full_sync=force_full_sync,
+                execution_config=execution_config,
+            ),
+            sync,
+            ctx,
+        )
+        if len(partitions) < 2:
+            return []
+
+        ctx.logger.info(f"Partitioned sync job {sync_job.id} into {len(partitions)} partitions")
+        await sync_job_service.update_status(
+            sync_job_id=sync_job.id,
+            status=SyncJobStatus.RUNNING,
+            ctx=ctx,
+            started_at=utc_now_naive(),
+        )
+        await self.event_bus.publish(
+            SyncLifecycleEvent.running(**_event_fields(sync, sync_job, collection, connection))
+        )
+        return partitions
+
+
+# =============================================================================
+# Run Sync Partition Activity
+# =============================================================================
+
+
+@dataclass
+class RunSyncPartitionActivity:
+    """Sync one partition of a partitioned sync.
+
+    Dependencies:
+        event_bus: Publish the FAILED event when the partition fails the sync
+
+    Cancellation does not touch the job status: the workflow cancels partitions when
+    a sibling failed, and marks the job CANCELLED when it is cancelled itself.
+    """
+
+    event_bus: "EventBus"
+
+    @activity.defn(name="run_sync_partition_activity")
+    async def run(
+        self,
+        sync_dict: Dict[str, Any],
+        sync_job_dict: Dict[str, Any],
+        collection_dict: Dict[str, Any],
+        connection_dict: Dict[str, Any],
+        ctx_dict: Dict[str, Any],
+        access_token: Optional[str],
+        force_full_sync: bool,
+        partition: str,
+    ) -> None:
+        """Sync one partition and save its result for the final activity.
+
+        Args:
+            sync_dict: The sync configuration as dict
+            sync_job_dict: The sync job as dict
+            collection_dict: The collection as dict
+            connection_dict: The connection as dict (Connection schema, NOT SourceConnection)
+            ctx_dict: The API context as dict
+            access_token: Optional access token
+            force_full_sync: If True, forces a full sync with orphaned entity deletion
+            partition: The partition key
+        """
+        from airweave.core.events.sync import SyncLifecycleEvent
+        from airweave.core.sync_service import sync_service
+
+        sync, sync_job, collection, connection, ctx, execution_config = await _load_inputs(
+            sync_dict,
+            sync_job_dict,
+            collection_dict,
+            connection_dict,
+            ctx_dict,
+            "airweave.temporal.activity.sync_partition",
+        )
+        ctx.logger.info(f"Starting partition '{partition}' of sync job {sync_job.id}")
+
+        try:
+            await _run_with_heartbeat(
+                sync_service.run(
+                    sync=sync,
+                    sync_job=sync_job,
+                    collection=collection,
+                    source_connection=connection,
+                    ctx=ctx,
+                    access_token=access_token,
+                    force_full_sync=force_full_sync,
+                    execution_config=execution_config,
+                    partition=partition,
+                ),
+                sync,
+                ctx,
+            )
+        except asyncio.CancelledError:
+            ctx.logger.info(f"Partition '{partition}' of sync job {sync_job.id} cancelled")
+            raise
+        except Exception as e:
+            ctx.logger.error(f"Failed partition '{partition}' of sync job {sync_job.id}: {e}")
+            await self.event_bus.publish(
+                SyncLifecycleEvent.failed(
+                    **_event_fields(sync, sync_job, collection, connection), error=str(e)
+                )
+            )
+            raise ApplicationError(str(e), type=type(e).__name__, non_retryable=True) from e
+
+
+# =============================================================================
+# Finalize Partitioned Sync Activity
+# =============================================================================
+
+
+@dataclass
+class FinalizePartitionedSyncActivity:
+    """Complete a partitioned sync once every partition ran.
+
+    Dependencies:
+        event_bus: Publish the COMPLETED or FAILED event
+    """
+
+    event_bus: "EventBus"
+
+    @activity.defn(name="finalize_partitioned_sync_activity")
+    async def run(
+        self,
+        sync_dict: Dict[str, Any],
+        sync_job_dict: Dict[str, Any],
+        collection_dict: Dict[str, Any],
+        connection_dict: Dict[str, Any],
+        ctx_dict: Dict[str, Any],
+        access_token: Optional[str],
+        force_full_sync: bool,
+        partitions: List[str],
+    ) -> None:
+        """Merge partition results, clean up orphans, save the cursor, complete the job.
+
+        Args:
+            sync_dict: The sync configuration as dict
+            sync_job_dict: The sync job as dict
+            collection_dict: The collection as dict
+            connection_dict: The connection as dict (Connection schema, NOT SourceConnection)
+            ctx_dict: The API context as dict
+            access_token: Optional access token
+            force_full_sync: If True, forces a full sync with orphaned entity deletion
+            partitions: All partition keys of the sync job
+        """
+        from airweave.core.events.sync import SyncLifecycleEvent
+        from airweave.core.sync_service import sync_service
+
+        sync, sync_job, collection, connection, ctx, execution_config = await _load_inputs(
+            sync_dict,
+            sync_job_dict,
+            collection_dict,
+            connection_dict,
+            ctx_dict,
+            "airweave.temporal.activity.finalize_partitions",
+        )
+        event_fields = _event_fields(sync, sync_job, collection, connection)
+
+        try:
+            await _run_with_heartbeat(
+                sync_service.finalize_partitions(
+                    sync=sync,
+                    sync_job=sync_job,
+                    collection=collection,
+                    source_connection=connection,
+                    ctx=ctx,
+                    partitions=partitions,
+                    access_token=access_token,
+                    force_full_sync=force_full_sync,
+                    execution_config=execution_config,
+                ),
+                sync,
+                ctx,
+            )
+        except asyncio.CancelledError:
+            await self.event_bus.publish(SyncLifecycleEvent.cancelled(**event_fields))
+            raise
+        except Exception as e:
+            ctx.logger.error(f"Failed to finalize partitioned sync job {sync_job.id}: {e}")
+            await self.event_bus.publish(SyncLifecycleEvent.failed(**event_fields, error=str(e)))
+            raise ApplicationError(str(e), type=type(e).__name__, non_retryable=True) from e
+
+        await self.event_bus.publish(SyncLifecycleEvent.completed(**event_fields))
+        ctx.logger.info(f"Completed partitioned sync job {sync_job.id}")
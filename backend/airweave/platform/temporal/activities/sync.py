@@ -21,6 +21,46 @@ if TYPE_CHECKING:
     from airweave.core.protocols import EventBus
 
 from temporalio import activity
+from temporalio.exceptions import ApplicationError
+
+# =============================================================================
+# Resolve Sync Options Activity
+# =============================================================================
+
+
+@dataclass
+class ResolveSyncOptionsActivity:
+    """Resolve how the workflow runs a sync from this worker's settings.
+
+    Dependencies: None
+
+    Schedules keep their serialized ctx_dict for their whole lifetime, so settings
+    copied into it at creation go stale. Workflows ask a worker instead; the result is
+    recorded in the workflow history, which keeps replays deterministic.
+    """
+
+    @activity.defn(name="resolve_sync_options_activity")
+    async def run(self, force_full_sync: bool = False) -> Dict[str, Any]:
+        """Resolve the sync's execution options.
+
+        Args:
+            force_full_sync: Whether this is a forced full sync
+
+        Returns:
+            Dict with max_attempts: attempts of the sync activity (retries resume from a
+            checkpoint, so they only apply when resuming is enabled), partitioning_enabled
+            and partition_max_parallel
+        """
+        from airweave.core.config import settings
+        from airweave.platform.sync.checkpoint import checkpoint_resume_enabled
+
+        resumable = checkpoint_resume_enabled(force_full_sync)
+        return {
+            "max_attempts": settings.SYNC_CHECKPOINT_MAX_ATTEMPTS if resumable else 1,
+            "partitioning_enabled": settings.SYNC_PARTITIONING_ENABLED,
+            "partition_max_parallel": settings.SYNC_PARTITION_MAX_PARALLEL,
+        }
+
 
 # =============================================================================
 # Run Sync Activity
@@ -257,6 +297,12 @@ class RunSyncActivity:
                         error=str(e),
                     )
                 )
+                from airweave.platform.sync.checkpoint import checkpoint_resume_enabled
+
+                if checkpoint_resume_enabled(force_full_sync):
+                    # The sync already failed cleanly: only crashed attempts (heartbeat
+                    # timeouts) are retried and resumed from a checkpoint
+                    raise ApplicationError(str(e), type=type(e).__name__, non_retryable=True) from e
                 raise
 
         finally:
@@ -2,7 +2,15 @@
 
 from typing import Dict, Set
 
-from prometheus_client import CollectorRegistry, Gauge, Info, ProcessCollector, generate_latest
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    Info,
+    ProcessCollector,
+    generate_latest,
+)
 
 # Create a custom registry for worker metrics
 # (separate from any other Prometheus metrics in the system)
@@ -101,6 +109,52 @@ worker_thread_pool_active = Gauge(
     registry=worker_registry,
 )
 
+# Pod-wide embedding batcher (see airweave/platform/embedders/batcher.py)
+# Throughput: rate() of the texts/tokens counters
+embedding_batcher_requests_total = Counter(
+    "airweave_worker_embedding_batcher_requests_total",
+    "Embedding provider requests sent by the batcher",
+    ["model"],
+    registry=worker_registry,
+)
+
+embedding_batcher_texts_total = Counter(
+    "airweave_worker_embedding_batcher_texts_total",
+    "Texts embedded through the batcher",
+    ["model"],
+    registry=worker_registry,
+)
+
+embedding_batcher_tokens_total = Counter(
+    "airweave_worker_embedding_batcher_tokens_total",
+    "Tokens embedded through the batcher",
+    ["model"],
+    registry=worker_registry,
+)
+
+embedding_batcher_fill_ratio = Histogram(
+    "airweave_worker_embedding_batcher_fill_ratio",
+    "Request fill: max of inputs/input limit and tokens/token limit",
+    ["model"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0),
+    registry=worker_registry,
+)
+
+embedding_batcher_queue_delay_seconds = Histogram(
+    "airweave_worker_embedding_batcher_queue_delay_seconds",
+    "Time a text waited in the batcher before its request was sent",
+    ["model"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    registry=worker_registry,
+)
+
+embedding_batcher_queued_texts = Gauge(
+    "airweave_worker_embedding_batcher_queued_texts",
+    "Texts waiting in the batcher",
+    ["model"],
+    registry=worker_registry,
+)
+
 
 def update_worker_metrics(
     worker_id: str,
@@ -103,6 +103,16 @@ class TemporalWorker:
 
         await self._control_server.stop()
 
+        # Close the pod's shared Vespa feed connections
+        from airweave.platform.destinations.vespa.feeder import vespa_feeder
+
+        await vespa_feeder.aclose()
+
+        # Stop the pod's chunking/hashing worker processes
+        from airweave.platform.sync.async_helpers import shutdown_process_pool
+
+        shutdown_process_pool()
+
         # Close Temporal client
         from airweave.platform.temporal.client import temporal_client
 
@@ -23,8 +23,12 @@ def create_activities() -> list:
         CheckAndNotifyExpiringKeysActivity,
         CleanupStuckSyncJobsActivity,
         CreateSyncJobActivity,
+        FinalizePartitionedSyncActivity,
         MarkSyncJobCancelledActivity,
+        PlanSyncPartitionsActivity,
+        ResolveSyncOptionsActivity,
         RunSyncActivity,
+        RunSyncPartitionActivity,
         SelfDestructOrphanedSyncActivity,
     )
 
@@ -38,9 +42,14 @@ def create_activities() -> list:
     return [
         # Sync activities
         RunSyncActivity(event_bus=event_bus).run,
+        ResolveSyncOptionsActivity().run,
         CreateSyncJobActivity(event_bus=event_bus).run,
         MarkSyncJobCancelledActivity().run,
         CleanupStuckSyncJobsActivity().run,
+        # Partitioned sync activities
+        PlanSyncPartitionsActivity(event_bus=event_bus).run,
+        RunSyncPartitionActivity(event_bus=event_bus).run,
+        FinalizePartitionedSyncActivity(event_bus=event_bus).run,
         # Cleanup
         SelfDestructOrphanedSyncActivity().run,
         # Notifications
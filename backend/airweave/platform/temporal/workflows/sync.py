@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
@@ -48,6 +48,156 @@ class RunSourceConnectionWorkflow:
                 return None  # Signal to exit gracefully
         return sync_job_dict
 
+    async def _resolve_sync_options(
+        self, ctx_dict: Dict[str, Any], force_full_sync: bool
+    ) -> Dict[str, Any]:
+        """Resolve the sync's execution options from a worker's current settings."""
+        from airweave.platform.temporal.activities import resolve_sync_options_activity
+
+        if not workflow.patched("resolve-sync-options"):
+            # Histories recorded before the options were resolved by a worker
+            return {
+                "max_attempts": ctx_dict.get("sync_activity_max_attempts", 1),
+                "partitioning_enabled": ctx_dict.get("sync_partitioning_enabled", False),
+                "partition_max_parallel": ctx_dict.get("sync_partition_max_parallel"),
+            }
+        return await workflow.execute_activity(
+            resolve_sync_options_activity,
+            args=[force_full_sync],
+            start_to_close_timeout=timedelta(seconds=30),
+            retry_policy=RetryPolicy(maximum_attempts=3),
+        )
+
+    async def _run_partitioned_sync(
+        self,
+        sync_args: List[Any],
+        partitions: List[str],
+        heartbeat_timeout: timedelta,
+        options: Dict[str, Any],
+    ) -> None:
+        """Run one activity per partition, then the final merge and cleanup activity.
+
+        At most partition_max_parallel partitions run at once. The first failed
+        partition cancels the others and fails the sync.
+        """
+        from airweave.platform.temporal.activities import (
+            finalize_partitioned_sync_activity,
+            run_sync_partition_activity,
+        )
+
+        max_parallel = options.get("partition_max_parallel") or len(partitions)
+        slots = asyncio.Semaphore(max(1, max_parallel))
+
+        async def run_partition(partition: str) -> None:
+            async with slots:
+                await workflow.execute_activity(
+                    run_sync_partition_activity,
+                    args=[*sync_args, partition],
+                    start_to_close_timeout=timedelta(days=7),
+                    heartbeat_timeout=heartbeat_timeout,
+                    cancellation_type=workflow.ActivityCancellationType.WAIT_CANCELLATION_COMPLETED,
+                    retry_policy=RetryPolicy(maximum_attempts=options["max_attempts"]),
+                )
+
+        workflow.logger.info(f"Fanning out sync over {len(partitions)} partitions")
+        tasks = [asyncio.create_task(run_partition(partition)) for partition in partitions]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        await workflow.execute_activity(
+            finalize_partitioned_sync_activity,
+            args=[*sync_args, partitions],
+            start_to_close_timeout=timedelta(days=1),
+            heartbeat_timeout=heartbeat_timeout,
+            cancellation_type=workflow.ActivityCancellationType.WAIT_CANCELLATION_COMPLETED,
+            retry_policy=RetryPolicy(maximum_attempts=1),
+        )
+
+    async def _self_destruct(self, sync_id: Any, ctx_dict: Dict[str, Any], reason: str) -> None:
+        """Clean up the schedules of an orphaned sync; errors are logged, not raised."""
+        from airweave.platform.temporal.activities import self_destruct_orphaned_sync_activity
+
+        try:
+            await workflow.execute_activity(
+                self_destruct_orphaned_sync_activity,
+                args=[sync_id, ctx_dict, reason],
+                start_to_close_timeout=timedelta(minutes=5),
+                retry_policy=RetryPolicy(maximum_attempts=3),
+            )
+            workflow.logger.info(f"✅ Self-destruct cleanup complete for sync {sync_id}")
+        except Exception as cleanup_error:
+            workflow.logger.warning(
+                f"⚠️ Self-destruct cleanup encountered an error: {cleanup_error}. "
+                f"Continuing graceful exit."
+            )
+
+    async def _run_sync(
+        self, sync_args: List[Any], ctx_dict: Dict[str, Any], force_full_sync: bool
+    ) -> None:
+        """Run the sync as one activity, or fanned out over partitions when planned."""
+        from airweave.platform.temporal.activities import (
+            plan_sync_partitions_activity,
+            run_sync_activity,
+        )
+
+        # Use longer heartbeat timeout in local development for debugging
+        local_development = ctx_dict.get("local_development", False)
+        heartbeat_timeout = timedelta(hours=1) if local_development else timedelta(minutes=15)
+        options = await self._resolve_sync_options(ctx_dict, force_full_sync)
+
+        # Partitionable sources fan out across the worker fleet
+        partitions: List[str] = []
+        if options.get("partitioning_enabled", False):
+            partitions = await workflow.execute_activity(
+                plan_sync_partitions_activity,
+                args=sync_args,
+                start_to_close_timeout=timedelta(hours=1),
+                heartbeat_timeout=heartbeat_timeout,
+                retry_policy=RetryPolicy(maximum_attempts=1),
+            )
+        if partitions:
+            await self._run_partitioned_sync(sync_args, partitions, heartbeat_timeout, options)
+            return
+
+        await workflow.execute_activity(
+            run_sync_activity,
+            args=sync_args,
+            start_to_close_timeout=timedelta(days=7),
+            heartbeat_timeout=heartbeat_timeout,
+            cancellation_type=workflow.ActivityCancellationType.WAIT_CANCELLATION_COMPLETED,
+            # Retries (only when checkpoint resume applies) cover worker crashes: the
+            # activity marks sync failures non-retryable, and a retried attempt
+            # resumes from the job's last cursor checkpoint
+            retry_policy=RetryPolicy(maximum_attempts=options["max_attempts"]),
+        )
+
+    async def _mark_cancelled(
+        self, sync_job_dict: Dict[str, Any], ctx_dict: Dict[str, Any], error: BaseException
+    ) -> None:
+        """Mark the sync job cancelled, even though the workflow itself is being cancelled."""
+        from airweave.platform.temporal.activities import mark_sync_job_cancelled_activity
+
+        reason = f"{type(error).__name__}: {error}"
+        await asyncio.shield(
+            workflow.execute_activity(
+                mark_sync_job_cancelled_activity,
+                args=[
+                    str(sync_job_dict["id"]),
+                    ctx_dict,
+                    reason,
+                    workflow.now().replace(tzinfo=None).isoformat(),
+                ],
+                start_to_close_timeout=timedelta(seconds=30),
+                # fire-and-forget semantics on the server side
+                cancellation_type=workflow.ActivityCancellationType.ABANDON,
+            )
+        )
+
     @workflow.run
     async def run(
         self,
@@ -70,11 +220,6 @@ class RunSourceConnectionWorkflow:
             access_token: Optional access token
             force_full_sync: If True, forces a full sync with orphaned entity deletion
         """
-        from airweave.platform.temporal.activities import (
-            run_sync_activity,
-            self_destruct_orphaned_sync_activity,
-        )
-
         # Create sync job if needed (for scheduled runs)
         sync_job_dict = await self._create_sync_job_if_needed(
             sync_dict, sync_job_dict, ctx_dict, force_full_sync
@@ -89,53 +234,23 @@ class RunSourceConnectionWorkflow:
                 f"Reason: {sync_job_dict.get('reason', 'Unknown')}. "
                 f"Initiating self-destruct cleanup..."
             )
-
             # Self-destruct: clean up any remaining schedules
-            try:
-                await workflow.execute_activity(
-                    self_destruct_orphaned_sync_activity,
-                    args=[
-                        sync_dict["id"],
-                        ctx_dict,
-                        sync_job_dict.get("reason", "Sync not found"),
-                    ],
-                    start_to_close_timeout=timedelta(minutes=5),
-                    retry_policy=RetryPolicy(maximum_attempts=3),
-                )
-                workflow.logger.info(
-                    f"✅ Self-destruct cleanup complete for sync {sync_dict['id']}"
-                )
-            except Exception as cleanup_error:
-                workflow.logger.warning(
-                    f"⚠️ Self-destruct cleanup encountered an error: {cleanup_error}. "
-                    f"Continuing graceful exit."
-                )
-
+            await self._self_destruct(
+                sync_dict["id"], ctx_dict, sync_job_dict.get("reason", "Sync not found")
+            )
             return  # Exit gracefully without error
 
+        sync_args = [
+            sync_dict,
+            sync_job_dict,
+            collection_dict,
+            connection_dict,
+            ctx_dict,
+            access_token,
+            force_full_sync,
+        ]
         try:
-            # Use longer heartbeat timeout in local development for debugging
-            local_development = ctx_dict.get("local_development", False)
-            heartbeat_timeout = timedelta(hours=1) if local_development else timedelta(minutes=15)
-
-            await workflow.execute_activity(
-                run_sync_activity,
-                args=[
-                    sync_dict,
-                    sync_job_dict,
-                    collection_dict,
-                    connection_dict,
-                    ctx_dict,
-                    access_token,
-                    force_full_sync,
-                ],
-                start_to_close_timeout=timedelta(days=7),
-                heartbeat_timeout=heartbeat_timeout,
-                cancellation_type=workflow.ActivityCancellationType.WAIT_CANCELLATION_COMPLETED,
-                retry_policy=RetryPolicy(
-                    maximum_attempts=1,  # NO RETRIES - fail fast
-                ),
-            )
+            await self._run_sync(sync_args, ctx_dict, force_full_sync)
 
         except Exception as e:
             # Check if this is an orphaned sync error (source connection deleted mid-execution)
@@ -153,51 +268,17 @@ class RunSourceConnectionWorkflow:
                     f"🧹 Sync {sync_dict['id']} became orphaned during execution. "
                     f"Source connection was deleted. Initiating self-destruct cleanup..."
                 )
-
                 # Self-destruct: clean up any remaining schedules
-                try:
-                    await workflow.execute_activity(
-                        self_destruct_orphaned_sync_activity,
-                        args=[
-                            sync_dict["id"],
-                            ctx_dict,
-                            "Source connection deleted during sync execution",
-                        ],
-                        start_to_close_timeout=timedelta(minutes=5),
-                        retry_policy=RetryPolicy(maximum_attempts=3),
-                    )
-                    workflow.logger.info(
-                        f"✅ Self-destruct cleanup complete for sync {sync_dict['id']}"
-                    )
-                except Exception as cleanup_error:
-                    workflow.logger.warning(
-                        f"⚠️ Self-destruct cleanup encountered an error: {cleanup_error}. "
-                        f"Continuing graceful exit."
-                    )
-
+                await self._self_destruct(
+                    sync_dict["id"], ctx_dict, "Source connection deleted during sync execution"
+                )
                 return  # Exit gracefully without error
 
             # For CancelledError, need to mark job as cancelled before re-raising
             if isinstance(e, asyncio.CancelledError):
                 # ensure DB gets updated even though the workflow was cancelled
-                from airweave.platform.temporal.activities import mark_sync_job_cancelled_activity
-
-                reason = f"{type(e).__name__}: {e}"
                 try:
-                    await asyncio.shield(
-                        workflow.execute_activity(
-                            mark_sync_job_cancelled_activity,
-                            args=[
-                                str(sync_job_dict["id"]),
-                                ctx_dict,
-                                reason,
-                                workflow.now().replace(tzinfo=None).isoformat(),
-                            ],
-                            start_to_close_timeout=timedelta(seconds=30),
-                            # fire-and-forget semantics on the server side
-                            cancellation_type=workflow.ActivityCancellationType.ABANDON,
-                        )
-                    )
+                    await self._mark_cancelled(sync_job_dict, ctx_dict, e)
                 finally:
                     # keep Workflow result as CANCELED
                     raise
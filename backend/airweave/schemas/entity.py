@@ -1,7 +1,7 @@
 """Entity schema."""
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -15,6 +15,7 @@ class EntityBase(BaseModel):
     entity_id: str
     entity_definition_id: Optional[UUID] = None
     hash: str
+    chunk_hashes: Optional[List[str]] = None
 
     class Config:
         """Pydantic config for EntityBase."""
@@ -36,6 +37,7 @@ class EntityUpdate(BaseModel):
     entity_id: Optional[str] = None
     entity_definition_id: Optional[UUID] = None
     hash: Optional[str] = None
+    chunk_hashes: Optional[List[str]] = None
 
 
 class EntityInDBBase(EntityBase):
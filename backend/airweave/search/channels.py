@@ -0,0 +1,132 @@
+"""In-process channels for streaming search events.
+
+The /search/stream endpoint runs the search in the same process that serves the SSE
+response, yet every EventEmitter.emit used to go out to Redis pub/sub and come back
+through a dedicated subscription. When producer and consumer share a process, the
+endpoint now opens a LocalSearchChannel for the request instead, and EventEmitter
+hands events to it directly:
+
+- events are JSON-encoded at emit time (the same snapshot Redis would have received)
+  and buffered in memory, bounded by SEARCH_STREAM_LOCAL_BUFFER_SIZE
+- a still-unread event of a high-frequency type (COALESCED_EVENT_TYPES) is replaced
+  by its newer version rather than queued twice
+- when the buffer is full (slow client), publish() waits up to
+  SEARCH_STREAM_LOCAL_PUBLISH_TIMEOUT_SECONDS and then drops the event; terminal
+  events are never dropped
+
+Emitters whose request has no local channel (another process) still use Redis pub/sub.
+
+Events are counted as airweave_search_stream_events_total{transport, result}.
+"""
+
+import asyncio
+import json
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from prometheus_client import Counter
+
+from airweave.core.config import settings
+
+search_stream_events = Counter(
+    "airweave_search_stream_events_total",
+    "Streaming search events by transport and outcome",
+    ["transport", "result"],
+)
+
+# Event types whose latest unread version supersedes earlier ones
+COALESCED_EVENT_TYPES = frozenset({"rankings"})
+
+# Event types a client needs to finish the stream; never dropped
+TERMINAL_EVENT_TYPES = frozenset({"results", "done", "error"})
+
+
+class LocalSearchChannel:
+    """Bounded, coalescing event buffer between a search and its SSE response."""
+
+    def __init__(self, max_buffered: int, publish_timeout_seconds: float) -> None:
+        """Initialize an empty channel.
+
+        Args:
+            max_buffered: Events held before publish() applies backpressure
+            publish_timeout_seconds: How long publish() waits for space before dropping
+        """
+        self._max_buffered = max_buffered
+        self._publish_timeout = publish_timeout_seconds
+        # Each slot is [coalescing key, encoded event] so coalescing can replace in place
+        self._buffer: Deque[List[Any]] = deque()
+        self._unread: Dict[Tuple[Any, Any], List[Any]] = {}
+        self._condition = asyncio.Condition()
+
+    def __len__(self) -> int:
+        """Number of buffered events."""
+        return len(self._buffer)
+
+    async def publish(self, payload: Dict[str, Any]) -> None:
+        """Buffer an event for the SSE consumer."""
+        event_type = payload.get("type")
+        key = (event_type, payload.get("op"))
+        message = json.dumps(payload)
+
+        async with self._condition:
+            if event_type in COALESCED_EVENT_TYPES and key in self._unread:
+                self._unread[key][1] = message
+                search_stream_events.labels(transport="local", result="coalesced").inc()
+                return
+
+            if len(self._buffer) >= self._max_buffered and event_type not in TERMINAL_EVENT_TYPES:
+                try:
+                    await asyncio.wait_for(
+                        self._condition.wait_for(lambda: len(self._buffer) < self._max_buffered),
+                        self._publish_timeout,
+                    )
+                except asyncio.TimeoutError:
+                    search_stream_events.labels(transport="local", result="dropped").inc()
+                    return
+
+            slot = [key, message]
+            self._buffer.append(slot)
+            if event_type in COALESCED_EVENT_TYPES:
+                self._unread[key] = slot
+            self._condition.notify_all()
+        search_stream_events.labels(transport="local", result="delivered").inc()
+
+    async def get(self, timeout: float) -> Optional[str]:
+        """Return the next encoded event, or None if none arrived within timeout."""
+        async with self._condition:
+            try:
+                await asyncio.wait_for(self._condition.wait_for(lambda: self._buffer), timeout)
+            except asyncio.TimeoutError:
+                return None
+            key, message = self._buffer.popleft()
+            self._unread.pop(key, None)
+            self._condition.notify_all()
+            return message
+
+
+class LocalSearchChannels:
+    """Registry of the local channels open in this process, by request ID."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._channels: Dict[str, LocalSearchChannel] = {}
+
+    def open(self, request_id: str) -> LocalSearchChannel:
+        """Open the channel a streaming request will read from."""
+        channel = LocalSearchChannel(
+            max_buffered=settings.SEARCH_STREAM_LOCAL_BUFFER_SIZE,
+            publish_timeout_seconds=settings.SEARCH_STREAM_LOCAL_PUBLISH_TIMEOUT_SECONDS,
+        )
+        self._channels[request_id] = channel
+        return channel
+
+    def get(self, request_id: str) -> Optional[LocalSearchChannel]:
+        """Return the request's channel if its consumer lives in this process."""
+        return self._channels.get(request_id)
+
+    def close(self, request_id: str) -> None:
+        """Close the request's channel; later events fall back to Redis."""
+        self._channels.pop(request_id, None)
+
+
+local_search_channels = LocalSearchChannels()
@@ -0,0 +1,250 @@
+"""Process-wide client registry for the search path.
+
+Every search used to build a fresh Qdrant/Vespa client and a fresh LLM/embedding
+SDK client per provider, paying DNS, TCP and TLS setup on each request.
+SearchClientRegistry keeps those clients alive across requests in the API process:
+
+- clients are keyed by (kind, client type, credentials fingerprint), so different
+  API keys or endpoints never share a client
+- HTTP clients built with pooled_http_client() keep a bounded keep-alive pool and
+  negotiate HTTP/2 when the h2 package is available and the endpoint is https
+- a background task health-checks clients that registered a check and retires
+  clients that fail it or have been idle longer than SEARCH_CLIENT_IDLE_SECONDS
+- searches run inside lease_scope(), which counts every client they got as in use
+  until the search ends; a retired client is closed once no search holds it
+- aclose() closes everything on API shutdown
+
+If SEARCH_CLIENT_POOL_ENABLED is off, get() builds a new client on every call.
+
+Reuse is exported as Prometheus metrics:
+- airweave_search_client_requests_total{kind, result="hit|miss"}
+- airweave_search_client_evictions_total{kind, reason="idle|unhealthy"}
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import inspect
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+import httpx
+from prometheus_client import Counter
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+search_client_requests = Counter(
+    "airweave_search_client_requests_total",
+    "Search client lookups by client kind and outcome",
+    ["kind", "result"],
+)
+
+search_client_evictions = Counter(
+    "airweave_search_client_evictions_total",
+    "Pooled search clients closed by the registry, by reason",
+    ["kind", "reason"],
+)
+
+
+def credentials_fingerprint(*parts: Any) -> str:
+    """Hash credentials so registry keys never hold raw secrets."""
+    return hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+
+
+def pooled_http_client(timeout: float, base_url: str = "", **kwargs: Any) -> httpx.AsyncClient:
+    """Build an httpx client sized for long-lived, shared use."""
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=timeout,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=settings.SEARCH_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SEARCH_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.SEARCH_CLIENT_IDLE_SECONDS,
+        ),
+        **kwargs,
+    )
+
+
+async def close_client(client: Any) -> None:
+    """Close a client using whichever close method its SDK exposes."""
+    for name in ("aclose", "close"):
+        method = getattr(client, name, None)
+        if method is None:
+            continue
+        result = method()
+        if inspect.isawaitable(result):
+            await result
+        return
+
+
+@dataclass(eq=False)
+class _Entry:
+    """A pooled client and its bookkeeping."""
+
+    kind: str
+    client: Any
+    health_check: Optional[Callable[[Any], Awaitable[Any]]]
+    last_used: float = field(default_factory=time.monotonic)
+    # Open lease scopes holding the client
+    in_flight: int = 0
+    retired: bool = False
+
+
+# Entries leased by the current lease_scope() (shared with the tasks it spawns)
+_leases: ContextVar[Optional[List[_Entry]]] = ContextVar("search_client_leases", default=None)
+
+
+class SearchClientRegistry:
+    """Long-lived clients shared by all searches in this process."""
+
+    def __init__(
+        self,
+        enabled: bool,
+        idle_seconds: float,
+        health_check_interval_seconds: float,
+    ) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            enabled: If False, get() returns a new client every time
+            idle_seconds: Close clients unused for this long
+            health_check_interval_seconds: Interval of the maintenance loop
+        """
+        self.enabled = enabled
+        self.idle_seconds = idle_seconds
+        self.health_check_interval_seconds = health_check_interval_seconds
+        self._entries: Dict[Tuple[str, Hashable], _Entry] = {}
+        self._retired: List[_Entry] = []
+        self._maintenance_task: Optional[asyncio.Task] = None
+
+    def get(
+        self,
+        kind: str,
+        key: Hashable,
+        factory: Callable[[], Any],
+        health_check: Optional[Callable[[Any], Awaitable[Any]]] = None,
+    ) -> Any:
+        """Return the pooled client for (kind, key), building it with factory() if needed.
+
+        Args:
+            kind: Client family for metrics and logs (e.g. "qdrant", "openai")
+            key: Everything that makes two clients non-interchangeable - include the
+                client class and a credentials_fingerprint()
+            factory: Synchronous constructor of a new client
+            health_check: Optional async probe; raising marks the client unhealthy
+        """
+        if not self.enabled:
+            search_client_requests.labels(kind=kind, result="miss").inc()
+            return factory()
+
+        entry = self._entries.get((kind, key))
+        if entry is not None:
+            entry.last_used = time.monotonic()
+            search_client_requests.labels(kind=kind, result="hit").inc()
+        else:
+            search_client_requests.labels(kind=kind, result="miss").inc()
+            entry = _Entry(kind=kind, client=factory(), health_check=health_check)
+            self._entries[(kind, key)] = entry
+            logger.debug(f"[SearchClientRegistry] Created pooled {kind} client")
+
+        leases = _leases.get()
+        if leases is not None:
+            entry.in_flight += 1
+            leases.append(entry)
+        return entry.client
+
+    @asynccontextmanager
+    async def lease_scope(self) -> AsyncIterator[None]:
+        """Hold every client get() returns in this block until the block exits.
+
+        Wrap a whole search in it: a client retired meanwhile stays open until the
+        last scope holding it exits, and is closed then.
+        """
+        leases: List[_Entry] = []
+        token = _leases.set(leases)
+        try:
+            yield
+        finally:
+            _leases.reset(token)
+            for entry in leases:
+                entry.in_flight -= 1
+            released = [entry for entry in set(leases) if entry.retired and not entry.in_flight]
+            self._retired = [entry for entry in self._retired if entry not in released]
+            await self._close_entries(released)
+
+    def start(self) -> None:
+        """Start the background health-check and idle-eviction loop."""
+        if self.enabled and self._maintenance_task is None:
+            self._maintenance_task = asyncio.create_task(self._maintain())
+
+    async def aclose(self) -> None:
+        """Stop maintenance and close every client (API shutdown)."""
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            await asyncio.gather(self._maintenance_task, return_exceptions=True)
+            self._maintenance_task = None
+
+        entries = self._retired + list(self._entries.values())
+        self._retired = []
+        self._entries.clear()
+        await self._close_entries(entries)
+        logger.info(f"[SearchClientRegistry] Closed {len(entries)} pooled search clients")
+
+    async def run_maintenance(self) -> None:
+        """Close retired clients no search holds, then retire idle and unhealthy ones."""
+        released = [entry for entry in self._retired if not entry.in_flight]
+        self._retired = [entry for entry in self._retired if entry.in_flight]
+        await self._close_entries(released)
+
+        now = time.monotonic()
+        for registry_key, entry in list(self._entries.items()):
+            if now - entry.last_used > self.idle_seconds:
+                self._retire(registry_key, "idle")
+                continue
+            if entry.health_check is None:
+                continue
+            try:
+                await entry.health_check(entry.client)
+            except Exception as e:
+                logger.warning(f"[SearchClientRegistry] {entry.kind} client unhealthy: {e}")
+                self._retire(registry_key, "unhealthy")
+
+    def _retire(self, registry_key: Tuple[str, Hashable], reason: str) -> None:
+        entry = self._entries.pop(registry_key, None)
+        if entry is None:
+            return
+        # Closed once no search holds it, at the earliest on the next tick, so
+        # requests that got it outside a lease scope can finish too
+        entry.retired = True
+        self._retired.append(entry)
+        search_client_evictions.labels(kind=entry.kind, reason=reason).inc()
+
+    async def _maintain(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval_seconds)
+            try:
+                await self.run_maintenance()
+            except Exception as e:
+                logger.warning(f"[SearchClientRegistry] Maintenance failed: {e}")
+
+    @staticmethod
+    async def _close_entries(entries: List[_Entry]) -> None:
+        for entry in entries:
+            try:
+                await close_client(entry.client)
+            except Exception as e:
+                logger.debug(f"[SearchClientRegistry] Error closing {entry.kind} client: {e}")
+
+
+search_clients = SearchClientRegistry(
+    enabled=settings.SEARCH_CLIENT_POOL_ENABLED,
+    idle_seconds=settings.SEARCH_CLIENT_IDLE_SECONDS,
+    health_check_interval_seconds=settings.SEARCH_CLIENT_HEALTH_CHECK_INTERVAL_SECONDS,
+)
@@ -1,15 +1,18 @@
 """Event emitter for streaming search events."""
 
+import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from airweave.core.pubsub import core_pubsub
+from airweave.search.channels import local_search_channels, search_stream_events
 
 
 class EventEmitter:
     """Event emitter for search operations.
 
-    Handles publishing events to Redis pubsub when streaming is enabled.
+    Handles publishing events when streaming is enabled: to the request's local
+    channel if its SSE consumer runs in this process, otherwise to Redis pubsub.
     All operations use this to emit lifecycle and data events.
     """
 
@@ -65,9 +68,14 @@ class EventEmitter:
         if data:
             payload.update(data)
 
-        # Publish to Redis channel
+        # Hand to the in-process SSE consumer if there is one, else publish to Redis
         try:
-            await core_pubsub.publish("search", self.request_id, payload)
+            channel = local_search_channels.get(self.request_id)
+            if channel is not None:
+                await channel.publish(payload)
+            else:
+                await core_pubsub.publish("search", self.request_id, payload)
+                search_stream_events.labels(transport="redis", result="delivered").inc()
         except Exception:
             # Never fail pipeline due to streaming issues
             pass
@@ -102,3 +110,69 @@ class EventEmitter:
                 result.append("_")
             result.append(char.lower())
         return "".join(result)
+
+
+class OrderedEventEmitter:
+    """Emitter wrapper that keeps event order stable when operations run concurrently.
+
+    Operations are ranked by the orchestrator's topological order. Events from the
+    earliest unfinished operation (the "head") are forwarded immediately; events
+    from operations further down the order are buffered and flushed once every
+    operation ranked before them has completed. The resulting stream is identical
+    to the one a strictly sequential run would produce.
+
+    Events without an op_name (or from operations outside the order) are forwarded
+    as-is.
+    """
+
+    def __init__(self, emitter: Any, order: List[str]) -> None:
+        """Initialize the ordered emitter.
+
+        Args:
+            emitter: Underlying emitter (usually an EventEmitter)
+            order: Operation names in deterministic execution order
+        """
+        self._emitter = emitter
+        self._order = order
+        self._head = 0
+        self._completed: Set[str] = set()
+        self._buffers: Dict[str, List[Tuple[str, Optional[Dict[str, Any]]]]] = {
+            name: [] for name in order[1:]
+        }
+        self._lock = asyncio.Lock()
+
+    async def emit(
+        self, event_type: str, data: Optional[Dict[str, Any]] = None, op_name: Optional[str] = None
+    ) -> None:
+        """Forward the event now, or buffer it until its operation reaches the head."""
+        async with self._lock:
+            if op_name is not None and op_name in self._buffers:
+                self._buffers[op_name].append((event_type, data))
+                return
+            await self._emitter.emit(event_type, data, op_name=op_name)
+
+    async def complete(self, op_name: str) -> None:
+        """Mark an operation as finished and flush every operation that is now unblocked."""
+        async with self._lock:
+            self._completed.add(op_name)
+            while self._head < len(self._order) and self._order[self._head] in self._completed:
+                self._head += 1
+                if self._head < len(self._order):
+                    await self._flush(self._order[self._head])
+
+    async def fail(self, op_name: str, data: Dict[str, Any]) -> None:
+        """Flush the failing operation's buffered events followed by its error event.
+
+        Buffered events from other (cancelled) operations are discarded.
+        """
+        async with self._lock:
+            if op_name in self._buffers:
+                await self._flush(op_name)
+            for name in self._buffers:
+                self._buffers[name].clear()
+            await self._emitter.emit("error", data, op_name=op_name)
+
+    async def _flush(self, op_name: str) -> None:
+        """Emit and drop the buffer of an operation; later events go out directly."""
+        for event_type, data in self._buffers.pop(op_name, []):
+            await self._emitter.emit(event_type, data, op_name=op_name)
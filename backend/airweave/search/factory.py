@@ -3,6 +3,7 @@
 from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 
+import httpx
 from fastapi import HTTPException
 from sqlalchemy import select as sa_select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,6 +21,7 @@ from airweave.platform.utils.source_factory_utils import (
     process_credentials_for_source,
 )
 from airweave.schemas.search import RetrievalStrategy, SearchDefaults, SearchRequest
+from airweave.search.clients import pooled_http_client, search_clients
 from airweave.search.context import SearchContext
 from airweave.search.emitter import EventEmitter
 from airweave.search.helpers import search_helpers
@@ -35,6 +37,12 @@ from airweave.search.operations import (
     TemporalRelevance,
     UserFilter,
 )
+from airweave.search.plan import (
+    CollectionSnapshot,
+    SearchPlan,
+    SourceDescriptor,
+    get_search_plan_cache,
+)
 from airweave.search.providers._base import BaseProvider
 from airweave.search.providers.cerebras import CerebrasProvider
 from airweave.search.providers.cohere import CohereProvider
@@ -106,24 +114,26 @@ class SearchFactory:
         # Apply defaults and validate parameters
         params = self._apply_defaults_and_validate(search_request, ctx)
 
-        # Get collection - with or without organization filtering
-        if skip_organization_check:
-            from airweave.models.collection import Collection
-
-            result = await db.execute(sa_select(Collection).where(Collection.id == collection_id))
-            collection = result.scalar_one_or_none()
-        else:
-            collection = await crud.collection.get(db, id=collection_id, ctx=ctx)
-
-        if not collection:
-            raise ValueError(f"Collection {collection_id} not found")
+        # Resolve the cached, configuration-derived search plan (collection, sources,
+        # destination); request parameters are applied on top of it below
+        plan = await self._get_search_plan(
+            db, collection_id, readable_collection_id, ctx, skip_organization_check
+        )
+        collection = plan.collection
 
-        federated_sources = await self.get_federated_sources(db, collection, ctx)
+        # Federated sources are instantiated per request - their credentials must be fresh
+        federated_sources = (
+            await self.get_federated_sources(db, collection, ctx)
+            if plan.has_federated_sources
+            else []
+        )
         has_federated_sources = bool(federated_sources)
-        has_vector_sources = await self._has_vector_sources(db, collection, ctx)
+        has_vector_sources = plan.has_vector_sources
 
         # Resolve destination (may be overridden for admin search)
-        destination = await self._resolve_destination(db, collection, ctx, destination_override)
+        destination = await self._resolve_destination(
+            db, collection, ctx, destination_override, default_destination=plan.destination
+        )
         requires_embedding = getattr(destination, "_requires_client_embedding", True)
         supports_temporal = getattr(destination, "_supports_temporal_relevance", True)
 
@@ -167,13 +177,12 @@ class SearchFactory:
         # Only check if destination supports temporal relevance
         temporal_supporting_sources = None
         if params["temporal_weight"] > 0 and has_vector_sources and supports_temporal:
-            try:
-                temporal_supporting_sources = await self._get_temporal_supporting_sources(
-                    db, collection, ctx, emitter
-                )
-            except Exception as e:
-                # If we can't determine source support, raise the error
-                raise ValueError(f"Failed to check temporal relevance support: {e}") from e
+            temporal_supporting_sources = await self._report_temporal_support(
+                plan.temporal_supporting_sources,
+                plan.temporal_non_supporting_sources,
+                ctx,
+                emitter,
+            )
         elif params["temporal_weight"] > 0 and not supports_temporal:
             # Destination doesn't support temporal relevance, skip the operation
             ctx.logger.info(
@@ -220,6 +229,75 @@ class SearchFactory:
 
         return search_context
 
+    async def _get_search_plan(
+        self,
+        db: AsyncSession,
+        collection_id: UUID,
+        readable_collection_id: str,
+        ctx: ApiContext,
+        skip_organization_check: bool = False,
+    ) -> SearchPlan:
+        """Get the collection's search plan from the cache, building it on a miss.
+
+        Admin cross-organization lookups (skip_organization_check) bypass the cache.
+        """
+        cache = None if skip_organization_check else get_search_plan_cache()
+        if cache is not None:
+            plan = cache.get(ctx.organization.id, readable_collection_id)
+            if plan is not None and plan.collection.id == collection_id:
+                ctx.logger.debug("[SearchFactory] Using cached search plan")
+                return plan
+
+        # Get collection - with or without organization filtering
+        if skip_organization_check:
+            from airweave.models.collection import Collection
+
+            result = await db.execute(sa_select(Collection).where(Collection.id == collection_id))
+            collection = result.scalar_one_or_none()
+        else:
+            collection = await crud.collection.get(db, id=collection_id, ctx=ctx)
+
+        if not collection:
+            raise ValueError(f"Collection {collection_id} not found")
+
+        plan = await self._build_search_plan(db, collection, ctx)
+        if cache is not None:
+            cache.set(plan)
+        return plan
+
+    async def _build_search_plan(self, db: AsyncSession, collection, ctx: ApiContext) -> SearchPlan:
+        """Describe a collection's sources and default destination for search.
+
+        Raises:
+            ValueError: If a source model cannot be found
+        """
+        source_connections = await crud.source_connection.get_for_collection(
+            db, readable_collection_id=collection.readable_id, ctx=ctx
+        )
+
+        sources = []
+        for source_connection in source_connections:
+            source_model = await crud.source.get_by_short_name(db, source_connection.short_name)
+            if not source_model:
+                raise ValueError(f"Source model not found for {source_connection.short_name}")
+            source_class = resource_locator.get_source(source_model)
+            sources.append(
+                SourceDescriptor(
+                    source_connection_id=source_connection.id,
+                    short_name=source_connection.short_name,
+                    federated=getattr(source_class, "_federated_search", False),
+                    supports_temporal_relevance=getattr(
+                        source_model, "supports_temporal_relevance", True
+                    ),
+                )
+            )
+
+        return SearchPlan(
+            collection=CollectionSnapshot.from_model(collection),
+            sources=tuple(sources),
+            destination=self._get_default_destination(),
+        )
+
     def _apply_defaults_and_validate(
         self, search_request: SearchRequest, ctx: Optional["ApiContext"] = None
     ) -> Dict[str, Any]:
@@ -710,57 +788,52 @@ class SearchFactory:
         collection,
         ctx: ApiContext,
         destination_override: Optional[DestinationOverride] = None,
+        default_destination: Optional[DestinationOverride] = None,
     ) -> BaseDestination:
         """Resolve the destination for search.
 
         If destination_override is provided, creates that specific destination.
-        Otherwise, uses collection's default destination (currently always Qdrant).
+        Otherwise, uses the collection's default destination.
 
         Args:
             db: Database session
-            collection: Collection object
+            collection: Collection object (or CollectionSnapshot)
             ctx: API context
             destination_override: Override destination ("qdrant" or "vespa")
+            default_destination: Default destination from the search plan; resolved
+                from sync config if not given
 
         Returns:
             Destination instance (Qdrant or Vespa)
         """
         if destination_override == "vespa":
-            from airweave.platform.destinations.vespa import VespaDestination
-
             ctx.logger.info(
                 f"[SearchFactory] Using Vespa destination (override) for "
                 f"collection {collection.readable_id}"
             )
-            return await VespaDestination.create(
-                collection_id=collection.id,
-                organization_id=collection.organization_id,
-                vector_size=collection.vector_size,
-                logger=ctx.logger,
-            )
+            return await self._create_vespa_destination(collection, ctx)
         elif destination_override == "qdrant":
-            from airweave.platform.destinations.qdrant import QdrantDestination
-
             ctx.logger.info(
                 f"[SearchFactory] Using Qdrant destination (override) for "
                 f"collection {collection.readable_id}"
             )
-            return await QdrantDestination.create(
-                collection_id=collection.id,
-                organization_id=collection.organization_id,
-                vector_size=collection.vector_size,
-                logger=ctx.logger,
+            return await self._create_qdrant_destination(collection, ctx)
+
+        # No override - use default destination resolution
+        if (default_destination or self._get_default_destination()) == "vespa":
+            ctx.logger.info(
+                f"[SearchFactory] Collection {collection.readable_id} uses Vespa (skip_qdrant=True)"
             )
-        else:
-            # No override - use default destination resolution
-            return await self._get_destination_for_collection(db, collection, ctx)
+            return await self._create_vespa_destination(collection, ctx)
+        ctx.logger.info(
+            f"[SearchFactory] Collection {collection.readable_id} uses Qdrant (default)"
+        )
+        return await self._create_qdrant_destination(collection, ctx)
 
-    async def _get_destination_for_collection(
-        self, db: AsyncSession, collection, ctx: ApiContext
-    ) -> BaseDestination:
-        """Get the default destination instance for a collection.
+    @staticmethod
+    def _get_default_destination() -> DestinationOverride:
+        """Get the default destination for collections from sync config.
 
-        Uses sync config to determine which vector DB to use:
         - If skip_qdrant=True, uses Vespa
         - Otherwise, uses Qdrant (default)
         """
@@ -769,28 +842,50 @@ class SearchFactory:
         sync_config = SyncConfig()
 
         if sync_config.destinations.skip_qdrant and not sync_config.destinations.skip_vespa:
-            from airweave.platform.destinations.vespa import VespaDestination
+            return "vespa"
+        return "qdrant"
+
+    async def _create_vespa_destination(self, collection, ctx: ApiContext) -> BaseDestination:
+        """Create a Vespa destination whose queries go over the pooled HTTP client."""
+        from airweave.platform.destinations.vespa import VespaDestination
+
+        http_client = search_clients.get(
+            "vespa",
+            (httpx.AsyncClient, settings.vespa_url),
+            lambda: pooled_http_client(timeout=settings.VESPA_TIMEOUT),
+            health_check=self._check_vespa_health,
+        )
+        return await VespaDestination.create(
+            collection_id=collection.id,
+            organization_id=collection.organization_id,
+            vector_size=collection.vector_size,
+            logger=ctx.logger,
+            http_client=http_client,
+        )
 
-            ctx.logger.info(
-                f"[SearchFactory] Collection {collection.readable_id} uses Vespa (skip_qdrant=True)"
-            )
-            return await VespaDestination.create(
-                collection_id=collection.id,
-                organization_id=collection.organization_id,
-                logger=ctx.logger,
-            )
-        else:
-            from airweave.platform.destinations.qdrant import QdrantDestination
+    async def _create_qdrant_destination(self, collection, ctx: ApiContext) -> BaseDestination:
+        """Create a Qdrant destination backed by the pooled Qdrant client."""
+        from airweave.platform.destinations.qdrant import QdrantDestination
 
-            ctx.logger.info(
-                f"[SearchFactory] Collection {collection.readable_id} uses Qdrant (default)"
-            )
-            return await QdrantDestination.create(
-                collection_id=collection.id,
-                organization_id=collection.organization_id,
-                vector_size=collection.vector_size,
-                logger=ctx.logger,
-            )
+        client = search_clients.get(
+            "qdrant",
+            (QdrantDestination, settings.qdrant_url),
+            QdrantDestination.build_client,
+            health_check=lambda client: client.get_collections(),
+        )
+        return await QdrantDestination.create(
+            collection_id=collection.id,
+            organization_id=collection.organization_id,
+            vector_size=collection.vector_size,
+            logger=ctx.logger,
+            client=client,
+        )
+
+    @staticmethod
+    async def _check_vespa_health(client: httpx.AsyncClient) -> None:
+        """Raise if the Vespa container does not report itself up."""
+        response = await client.get(f"{settings.vespa_url}/state/v1/health")
+        response.raise_for_status()
 
     async def _get_temporal_supporting_sources(
         self, db: AsyncSession, collection, ctx: ApiContext, emitter: EventEmitter
@@ -834,6 +929,22 @@ class SearchFactory:
             else:
                 non_supporting_sources.append(source_connection.short_name)
 
+        return await self._report_temporal_support(
+            supporting_sources, non_supporting_sources, ctx, emitter
+        )
+
+    async def _report_temporal_support(
+        self,
+        supporting_sources: List[str],
+        non_supporting_sources: List[str],
+        ctx: ApiContext,
+        emitter: EventEmitter,
+    ) -> List[str]:
+        """Log temporal relevance support and emit a skip notice if no source supports it.
+
+        Returns:
+            supporting_sources, or an empty list if the operation should be skipped
+        """
         # Log the results
         if supporting_sources:
             ctx.logger.info(
@@ -1,17 +1,18 @@
 """Helpers for search."""
 
 from pathlib import Path
-from uuid import UUID
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID, uuid4
 
 import yaml
 from fastapi import HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from airweave import crud
 from airweave.api.context import ApiContext
+from airweave.core.datetime_utils import utc_now_naive
 from airweave.schemas.search import SearchResponse
 from airweave.schemas.search_query import SearchQueryCreate
 from airweave.search.context import SearchContext
+from airweave.search.write_behind import search_query_writer
 
 
 class SearchHelpers:
@@ -19,65 +20,33 @@ class SearchHelpers:
 
     async def persist_search_data(
         self,
-        db: AsyncSession,
         search_context: SearchContext,
         search_response: SearchResponse,
         ctx: ApiContext,
         duration_ms: float,
+        after_write: Optional[Callable[[], None]] = None,
     ) -> None:
         """Persist search data for analytics and user experience.
 
+        The row is handed to the write-behind SearchQueryWriter, so this returns
+        without waiting for Postgres.
+
         Args:
-            db: Database session
             search_context: The search context with actual executed configuration
             search_response: The search response
             ctx: API context
             duration_ms: Search execution time in milliseconds
+            after_write: Called by the writer once the row has been written (called here
+                if the row could not be queued)
         """
+        queued = False
         try:
-            # Extract API key ID from auth metadata if available
-            api_key_id = None
-            if ctx.is_api_key_auth and ctx.auth_metadata:
-                api_key_id = ctx.auth_metadata.get("api_key_id")
-
-            # Extract filter from user_filter operation if it was configured
-            filter_dict = None
-            if search_context.user_filter and search_context.user_filter.filter:
-                filter_dict = search_context.user_filter.filter.model_dump(exclude_none=True)
-
-            # Create search query schema using actual values from SearchContext
-            # (which has defaults applied via factory)
-            search_query_create = SearchQueryCreate(
-                collection_id=search_context.collection_id,
-                organization_id=ctx.organization.id,
-                user_id=ctx.user.id if ctx.user else None,
-                api_key_id=UUID(api_key_id) if api_key_id else None,
-                query_text=search_context.query,
-                query_length=len(search_context.query),
-                is_streaming=search_context.stream,
-                retrieval_strategy=search_context.retrieval.strategy.value,
-                limit=search_context.retrieval.limit,
-                offset=search_context.retrieval.offset,
-                temporal_relevance=(
-                    search_context.temporal_relevance.weight
-                    if search_context.temporal_relevance
-                    else 0.0
-                ),
-                filter=filter_dict,
-                duration_ms=int(duration_ms),
-                results_count=len(search_response.results),
-                expand_query=search_context.query_expansion is not None,
-                interpret_filters=search_context.query_interpretation is not None,
-                rerank=search_context.reranking is not None,
-                generate_answer=search_context.generate_answer is not None,
-            )
-
-            # Create search query record using standard CRUD pattern
-            await crud.search_query.create(db=db, obj_in=search_query_create, ctx=ctx)
+            row = self.build_search_query_row(search_context, search_response, ctx, duration_ms)
+            await search_query_writer.submit(row, after_write=after_write)
+            queued = True
 
             ctx.logger.debug(
-                f"[SearchHelpers] Search data persisted successfully for query: "
-                f"'{search_context.query[:50]}...'"
+                f"[SearchHelpers] Search data queued for query: '{search_context.query[:50]}...'"
             )
 
         except Exception as e:
@@ -87,6 +56,82 @@ class SearchHelpers:
                 f"Search completed successfully but analytics data was not saved."
             )
 
+        # The writer owns the callback once the row is queued; otherwise run it here so
+        # search analytics are still tracked
+        if not queued and after_write is not None:
+            try:
+                after_write()
+            except Exception as e:
+                ctx.logger.error(f"[SearchHelpers] Search analytics callback failed: {e}")
+
+    @staticmethod
+    def build_search_query_row(
+        search_context: SearchContext,
+        search_response: SearchResponse,
+        ctx: ApiContext,
+        duration_ms: float,
+    ) -> Dict[str, Any]:
+        """Build the full search_query row, as crud.search_query.create would store it.
+
+        Args:
+            search_context: The search context with actual executed configuration
+            search_response: The search response
+            ctx: API context
+            duration_ms: Search execution time in milliseconds
+
+        Returns:
+            Column values for a multi-row INSERT
+        """
+        # Extract API key ID from auth metadata if available
+        api_key_id = None
+        if ctx.is_api_key_auth and ctx.auth_metadata:
+            api_key_id = ctx.auth_metadata.get("api_key_id")
+
+        # Extract filter from user_filter operation if it was configured
+        filter_dict = None
+        if search_context.user_filter and search_context.user_filter.filter:
+            filter_dict = search_context.user_filter.filter.model_dump(exclude_none=True)
+
+        # Create search query schema using actual values from SearchContext
+        # (which has defaults applied via factory)
+        search_query_create = SearchQueryCreate(
+            collection_id=search_context.collection_id,
+            organization_id=ctx.organization.id,
+            user_id=ctx.user.id if ctx.user else None,
+            api_key_id=UUID(api_key_id) if api_key_id else None,
+            query_text=search_context.query,
+            query_length=len(search_context.query),
+            is_streaming=search_context.stream,
+            retrieval_strategy=search_context.retrieval.strategy.value,
+            limit=search_context.retrieval.limit,
+            offset=search_context.retrieval.offset,
+            temporal_relevance=(
+                search_context.temporal_relevance.weight
+                if search_context.temporal_relevance
+                else 0.0
+            ),
+            filter=filter_dict,
+            duration_ms=int(duration_ms),
+            results_count=len(search_response.results),
+            expand_query=search_context.query_expansion is not None,
+            interpret_filters=search_context.query_interpretation is not None,
+            rerank=search_context.reranking is not None,
+            generate_answer=search_context.generate_answer is not None,
+        )
+
+        # Bulk inserts skip the ORM, so fill in what create() and the model defaults would
+        now = utc_now_naive()
+        tracking_email = ctx.tracking_email if ctx.has_user_context else None
+        return {
+            **search_query_create.model_dump(),
+            "id": uuid4(),
+            "organization_id": ctx.organization.id,
+            "created_by_email": tracking_email,
+            "modified_by_email": tracking_email,
+            "created_at": now,
+            "modified_at": now,
+        }
+
     @staticmethod
     def load_defaults() -> dict:
         """Load search defaults from yaml."""
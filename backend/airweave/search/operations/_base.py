@@ -29,6 +29,16 @@ class SearchOperation(ABC):
         """Execute the operation."""
         pass
 
+    async def prefetch(self, context: SearchContext, ctx: ApiContext) -> None:  # noqa: B027
+        """Start work that does not need any dependency's output.
+
+        The orchestrator runs this concurrently with an operation's dependencies
+        and awaits it right before execute(). It must not touch SearchState or
+        emit events, and it is best effort: on failure, execute() does the work
+        itself. The default does nothing.
+        """
+        pass
+
     def _report_metrics(self, state: "SearchState", **metrics: Any) -> None:
         """Report operation-specific metrics for analytics tracking.
 
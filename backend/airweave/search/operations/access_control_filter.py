@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.api.context import ApiContext
 from airweave.platform.access_control.broker import access_broker
+from airweave.platform.access_control.cache import get_principal_cache
 from airweave.search.context import SearchContext
 
 from ._base import SearchOperation
@@ -73,9 +74,15 @@ class AccessControlFilter(SearchOperation):
         """
         ctx.logger.info("[AccessControlFilter] Resolving access context...")
 
-        # Resolve access context for this collection
+        # Resolve access context for this collection (through the principal cache if enabled)
         # Returns None if collection has no AC sources (skip filtering)
-        access_context = await access_broker.resolve_access_context_for_collection(
+        principal_cache = get_principal_cache()
+        resolve = (
+            principal_cache.resolve
+            if principal_cache is not None
+            else access_broker.resolve_access_context_for_collection
+        )
+        access_context = await resolve(
             db=self.db,
             user_principal=self.user_email,
             readable_collection_id=context.readable_collection_id,
@@ -5,7 +5,7 @@ Generates dense neural embeddings and/or sparse BM25 embeddings based on
 the retrieval strategy (hybrid, neural, or keyword).
 """
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from airweave.api.context import ApiContext
 from airweave.platform.embedders import SparseEmbedder
@@ -29,11 +29,17 @@ class EmbedQuery(SearchOperation):
         self.strategy = strategy
         self.provider = provider
         self.vector_size = vector_size
+        # Embeddings of the original query computed by prefetch(), if any
+        self._prefetched: Optional[Tuple[Optional[List[List[float]]], Optional[List]]] = None
 
     def depends_on(self) -> List[str]:
         """Depends on query expansion to get all queries to embed."""
         return ["QueryExpansion"]
 
+    async def prefetch(self, context: SearchContext, ctx: ApiContext) -> None:
+        """Embed the original query while QueryExpansion is still running."""
+        self._prefetched = await self._embed([context.query], ctx)
+
     async def execute(
         self,
         context: SearchContext,
@@ -53,19 +59,21 @@ class EmbedQuery(SearchOperation):
         # Determine queries to embed (expanded + original, or just original)
         queries = self._get_queries_to_embed(context, state)
 
-        # Generate dense embeddings if needed
-        # Note: Token validation is handled by the provider in its embed() method
-        if self.strategy in (RetrievalStrategy.HYBRID, RetrievalStrategy.NEURAL):
-            dense_embeddings = await self._generate_dense_embeddings(queries, ctx)
-        else:
-            # Keyword-only doesn't need dense embeddings
-            dense_embeddings = None
-
-        # Generate sparse BM25 embeddings if needed
-        if self.strategy in (RetrievalStrategy.HYBRID, RetrievalStrategy.KEYWORD):
-            sparse_embeddings = await self._generate_sparse_embeddings(queries, ctx)
+        # Reuse the prefetched embedding of the original query, embed only the rest
+        if self._prefetched is not None and queries[0] == context.query:
+            prefetched_dense, prefetched_sparse = self._prefetched
+            if len(queries) > 1:
+                rest_dense, rest_sparse = await self._embed(queries[1:], ctx)
+            else:
+                rest_dense, rest_sparse = [], []
+            dense_embeddings = (
+                prefetched_dense + rest_dense if prefetched_dense is not None else None
+            )
+            sparse_embeddings = (
+                prefetched_sparse + rest_sparse if prefetched_sparse is not None else None
+            )
         else:
-            sparse_embeddings = None
+            dense_embeddings, sparse_embeddings = await self._embed(queries, ctx)
 
         # Write to state - embeddings are REQUIRED, never write None
         if dense_embeddings is None and sparse_embeddings is None:
@@ -88,6 +96,26 @@ class EmbedQuery(SearchOperation):
         # Emit embedding done with stats
         await self._emit_embedding_done(dense_embeddings, sparse_embeddings, context.emitter)
 
+    async def _embed(
+        self, queries: List[str], ctx: ApiContext
+    ) -> Tuple[Optional[List[List[float]]], Optional[List]]:
+        """Generate the dense and/or sparse embeddings the strategy needs."""
+        # Generate dense embeddings if needed
+        # Note: Token validation is handled by the provider in its embed() method
+        if self.strategy in (RetrievalStrategy.HYBRID, RetrievalStrategy.NEURAL):
+            dense_embeddings = await self._generate_dense_embeddings(queries, ctx)
+        else:
+            # Keyword-only doesn't need dense embeddings
+            dense_embeddings = None
+
+        # Generate sparse BM25 embeddings if needed
+        if self.strategy in (RetrievalStrategy.HYBRID, RetrievalStrategy.KEYWORD):
+            sparse_embeddings = await self._generate_sparse_embeddings(queries, ctx)
+        else:
+            sparse_embeddings = None
+
+        return dense_embeddings, sparse_embeddings
+
     def _get_queries_to_embed(self, context: SearchContext, state: "SearchState") -> List[str]:
         """Get all queries to embed (original + expanded)."""
         queries = [context.query]
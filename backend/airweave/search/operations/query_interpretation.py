@@ -200,8 +200,10 @@ class QueryInterpretation(SearchOperation):
         filter_dict = self._build_qdrant_filter(validated_filters)
         ctx.logger.debug(f"[QueryInterpretation] Filter dict: {filter_dict}")
 
-        # Write to state (UserFilter will merge with this if it runs)
-        state.filter = filter_dict
+        # Write to state, AND-ing with any filter already there (AccessControlFilter may
+        # run concurrently). UserFilter will merge with this if it runs.
+        state.interpreted_filter = filter_dict
+        state.filter = {"must": [state.filter, filter_dict]} if state.filter else filter_dict
 
         # Report metrics for analytics
         self._report_metrics(
@@ -54,8 +54,12 @@ class TemporalRelevance(SearchOperation):
         self.supporting_sources = supporting_sources
 
     def depends_on(self) -> List[str]:
-        """Depends on filter operations."""
-        return ["QueryInterpretation", "UserFilter"]
+        """Depends on every operation that writes state.filter.
+
+        The filter is read before and written after awaiting the destination, so
+        AccessControlFilter must have finished to avoid dropping the ACL filter.
+        """
+        return ["QueryInterpretation", "AccessControlFilter", "UserFilter"]
 
     async def execute(
         self,
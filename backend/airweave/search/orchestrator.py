@@ -3,17 +3,19 @@
 The orchestrator is responsible for:
 1. Extracting enabled operations from the search context
 2. Determining execution order based on dependencies
-3. Executing operations sequentially, passing state between them
-4. Using the emitter from context for streaming updates
+3. Executing operations concurrently as a DAG, passing state between them
+4. Using the emitter from context for streaming updates, in a deterministic order
 5. Automatically capturing timing metrics for each operation
 """
 
+import asyncio
 import time
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 from airweave.api.context import ApiContext
 from airweave.schemas.search import SearchResponse
 from airweave.search.context import SearchContext
+from airweave.search.emitter import OrderedEventEmitter
 from airweave.search.operations._base import SearchOperation
 from airweave.search.state import SearchState
 
@@ -21,8 +23,11 @@ from airweave.search.state import SearchState
 class SearchOrchestrator:
     """Orchestrates search operation execution.
 
-    The orchestrator uses topological sort to determine execution order
-    based on declared dependencies, then executes operations sequentially.
+    The orchestrator uses topological sort to determine a canonical execution
+    order based on declared dependencies, then starts every operation as soon as
+    all of its dependencies have finished. Independent operations (e.g. access
+    control resolution and query expansion) therefore overlap, while streamed
+    events keep the canonical order.
     """
 
     async def run(
@@ -56,37 +61,16 @@ class SearchOrchestrator:
         # Resolve execution order
         execution_order = self._resolve_execution_order(context, ctx)
 
-        # Execute operations in order with automatic timing
-        for operation in execution_order:
-            op_name = operation.__class__.__name__
-
-            # Emit operator_start
-            await emitter.emit("operator_start", {"name": op_name}, op_name=op_name)
-
-            try:
-                # Capture start time
-                start_time = time.monotonic()
-
-                # Execute operation (emitter is now in context)
-                await operation.execute(context, state, ctx)
-
-                # Capture end time and calculate duration
-                duration_ms = (time.monotonic() - start_time) * 1000
-
-                # Store timing metric automatically
-                if op_name not in state.operation_metrics:
-                    state.operation_metrics[op_name] = {}
-                state.operation_metrics[op_name]["duration_ms"] = duration_ms
-
-                # Emit operator_end
-                await emitter.emit("operator_end", {"name": op_name}, op_name=op_name)
-
-            except Exception as e:
-                # Emit error event
-                await emitter.emit(
-                    "error", {"operation": op_name, "message": str(e)}, op_name=op_name
-                )
-                raise
+        # Operations run concurrently; the ordered emitter keeps the event stream
+        # identical to a sequential run
+        ordered_emitter = OrderedEventEmitter(
+            emitter, [op.__class__.__name__ for op in execution_order]
+        )
+        context.emitter = ordered_emitter
+        try:
+            await self._execute_graph(execution_order, context, state, ctx, ordered_emitter)
+        finally:
+            context.emitter = emitter
 
         # Emit results event
         await emitter.emit("results", {"results": state.results})
@@ -99,6 +83,122 @@ class SearchOrchestrator:
         state_dict = state.model_dump()
         return response, state_dict
 
+    async def _execute_graph(
+        self,
+        execution_order: List[SearchOperation],
+        context: SearchContext,
+        state: SearchState,
+        ctx: ApiContext,
+        ordered_emitter: OrderedEventEmitter,
+    ) -> None:
+        """Run operations as a DAG, starting each one as soon as its dependencies finish.
+
+        Dependencies on operations that are not enabled are ignored. Ready operations
+        are started in execution order, so scheduling is deterministic. If any operation
+        fails, every other running operation is cancelled and the error is re-raised.
+        """
+        op_names = [op.__class__.__name__ for op in execution_order]
+        enabled_names = set(op_names)
+        dependencies = {
+            op.__class__.__name__: {dep for dep in op.depends_on() if dep in enabled_names}
+            for op in execution_order
+        }
+
+        pending: Dict[str, SearchOperation] = {op.__class__.__name__: op for op in execution_order}
+        completed: Set[str] = set()
+        running: Dict[asyncio.Task, str] = {}
+        prefetches: Dict[str, asyncio.Task] = {}
+        run_start = time.monotonic()
+
+        # Let blocked operations start their dependency-free work right away
+        for op_name, operation in pending.items():
+            if dependencies[op_name]:
+                prefetches[op_name] = asyncio.create_task(operation.prefetch(context, ctx))
+
+        try:
+            while pending or running:
+                ready = [
+                    name for name in op_names if name in pending and dependencies[name] <= completed
+                ]
+                for op_name in ready:
+                    task = asyncio.create_task(
+                        self._run_operation(
+                            pending.pop(op_name),
+                            context,
+                            state,
+                            ctx,
+                            run_start,
+                            prefetches.get(op_name),
+                        )
+                    )
+                    running[task] = op_name
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                # Handle finished operations in execution order for deterministic emission
+                for task in sorted(done, key=lambda t: op_names.index(running[t])):
+                    op_name = running.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        await self._cancel_tasks(list(running))
+                        running.clear()
+                        await ordered_emitter.fail(
+                            op_name, {"operation": op_name, "message": str(error)}
+                        )
+                        raise error
+                    completed.add(op_name)
+                    await ordered_emitter.complete(op_name)
+        finally:
+            await self._cancel_tasks(list(running) + list(prefetches.values()))
+
+    async def _run_operation(
+        self,
+        operation: SearchOperation,
+        context: SearchContext,
+        state: SearchState,
+        ctx: ApiContext,
+        run_start: float,
+        prefetch: Optional[asyncio.Task],
+    ) -> None:
+        """Execute a single operation, capturing its timing metrics."""
+        op_name = operation.__class__.__name__
+
+        # Prefetch is best effort: the operation falls back to doing the work itself
+        if prefetch is not None:
+            try:
+                await prefetch
+            except Exception as e:
+                ctx.logger.warning(f"[Orchestrator] Prefetch for {op_name} failed: {e}")
+
+        # Emit operator_start
+        await context.emitter.emit("operator_start", {"name": op_name}, op_name=op_name)
+
+        # Capture start time
+        start_time = time.monotonic()
+
+        # Execute operation (emitter is now in context)
+        await operation.execute(context, state, ctx)
+
+        # Capture end time and calculate duration
+        duration_ms = (time.monotonic() - start_time) * 1000
+
+        # Store timing metrics automatically; the offset shows how operations overlapped
+        if op_name not in state.operation_metrics:
+            state.operation_metrics[op_name] = {}
+        state.operation_metrics[op_name]["duration_ms"] = duration_ms
+        state.operation_metrics[op_name]["start_offset_ms"] = (start_time - run_start) * 1000
+
+        # Emit operator_end
+        await context.emitter.emit("operator_end", {"name": op_name}, op_name=op_name)
+
+    @staticmethod
+    async def _cancel_tasks(tasks: List[asyncio.Task]) -> None:
+        """Cancel tasks and wait for them to unwind."""
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def _resolve_execution_order(
         self, context: SearchContext, ctx: ApiContext
     ) -> List[SearchOperation]:
@@ -138,9 +238,9 @@ class SearchOrchestrator:
             visited.add(op_name)
             ordered.append(operation)
 
-        # Visit each operation
-        for op_name in enabled_names:
-            visit(op_name)
+        # Visit each operation in declaration order so the resulting order is deterministic
+        for operation in operations:
+            visit(operation.__class__.__name__)
 
         # Log execution order
         op_names = [op.__class__.__name__ for op in ordered]
@@ -0,0 +1,183 @@
+"""Cached search plans.
+
+SearchFactory.build used to rediscover a collection's configuration on every request:
+the collection row, its source connections, each source's model and class (vector vs
+federated, temporal relevance support) and the default destination. That
+configuration changes rarely, so SearchPlan captures it once per (organization,
+collection readable_id) and SearchPlanCache keeps it in an in-process LRU with a TTL
+(a LocalCache).
+Per-request work is then limited to applying request parameters (and instantiating
+federated sources, whose credentials must be fresh).
+
+Invalidation:
+- SearchPlanEventSubscriber listens to collection.* and source_connection.* domain
+  events on the event bus and invalidates the affected collection
+- invalidation is broadcast on the "search_plan" pubsub namespace so every API pod
+  drops its copy, not only the pod that handled the change
+- the TTL bounds staleness for changes that publish no event
+
+Hit ratio is exported as airweave_search_plan_cache_requests_total{result="hit|miss"}.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from uuid import UUID
+
+from prometheus_client import Counter
+
+from airweave.core.config import settings
+from airweave.core.local_cache import LocalCache
+
+if TYPE_CHECKING:
+    from airweave.core.events.base import DomainEvent
+
+search_plan_cache_requests = Counter(
+    "airweave_search_plan_cache_requests_total",
+    "Search plan lookups by outcome",
+    ["result"],
+)
+
+
+@dataclass(frozen=True)
+class CollectionSnapshot:
+    """The collection fields search needs, detached from the DB session."""
+
+    id: UUID
+    readable_id: str
+    organization_id: UUID
+    vector_size: Optional[int]
+    embedding_model_name: Optional[str]
+
+    @classmethod
+    def from_model(cls, collection) -> "CollectionSnapshot":
+        """Snapshot a Collection ORM object."""
+        return cls(
+            id=collection.id,
+            readable_id=collection.readable_id,
+            organization_id=collection.organization_id,
+            vector_size=collection.vector_size,
+            embedding_model_name=collection.embedding_model_name,
+        )
+
+
+@dataclass(frozen=True)
+class SourceDescriptor:
+    """Search-relevant capabilities of one source connection in a collection."""
+
+    source_connection_id: UUID
+    short_name: str
+    federated: bool
+    supports_temporal_relevance: bool
+
+
+@dataclass(frozen=True)
+class SearchPlan:
+    """Configuration-derived part of a search, shared by all requests to a collection."""
+
+    collection: CollectionSnapshot
+    sources: Tuple[SourceDescriptor, ...]
+    destination: str  # Default destination: "qdrant" or "vespa"
+
+    @property
+    def has_vector_sources(self) -> bool:
+        """Whether any source is synced into the vector destination."""
+        return any(not source.federated for source in self.sources)
+
+    @property
+    def has_federated_sources(self) -> bool:
+        """Whether any source is searched live (federated)."""
+        return any(source.federated for source in self.sources)
+
+    @property
+    def temporal_supporting_sources(self) -> List[str]:
+        """Short names of sources whose entities support temporal relevance."""
+        return [s.short_name for s in self.sources if s.supports_temporal_relevance]
+
+    @property
+    def temporal_non_supporting_sources(self) -> List[str]:
+        """Short names of sources whose entities do not support temporal relevance."""
+        return [s.short_name for s in self.sources if not s.supports_temporal_relevance]
+
+
+class SearchPlanCache:
+    """In-process LRU of search plans with TTL and cross-pod invalidation."""
+
+    INVALIDATION_NAMESPACE = "search_plan"
+
+    def __init__(self, max_entries: int, ttl_seconds: float, broadcast: bool = True):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum plans held in memory
+            ttl_seconds: Time-to-live of a plan
+            broadcast: Whether to broadcast and listen for invalidations over pubsub
+        """
+        self._plans: LocalCache[Tuple[str, str], SearchPlan] = LocalCache(
+            "SearchPlanCache",
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            invalidation_namespace=self.INVALIDATION_NAMESPACE if broadcast else None,
+            on_invalidation=lambda data: self._drop_local(
+                data["organization_id"], data["readable_collection_id"]
+            ),
+        )
+
+    def __len__(self) -> int:
+        """Number of cached plans."""
+        return len(self._plans)
+
+    def get(self, organization_id: UUID, readable_collection_id: str) -> Optional[SearchPlan]:
+        """Return the cached plan for a collection, or None on a miss."""
+        plan = self._plans.get((str(organization_id), readable_collection_id))
+        search_plan_cache_requests.labels(result="miss" if plan is None else "hit").inc()
+        return plan
+
+    def set(self, plan: SearchPlan) -> None:
+        """Cache a freshly built plan."""
+        key = (str(plan.collection.organization_id), plan.collection.readable_id)
+        self._plans.set(key, plan)
+
+    async def invalidate_collection(
+        self, organization_id: UUID, readable_collection_id: str
+    ) -> None:
+        """Drop a collection's plan on this pod and broadcast the invalidation."""
+        self._drop_local(str(organization_id), readable_collection_id)
+        await self._plans.broadcast(
+            {
+                "organization_id": str(organization_id),
+                "readable_collection_id": readable_collection_id,
+            }
+        )
+
+    def _drop_local(self, organization_id: str, readable_collection_id: str) -> None:
+        self._plans.pop((organization_id, readable_collection_id))
+
+
+class SearchPlanEventSubscriber:
+    """Invalidates cached search plans when a collection or its sources change."""
+
+    EVENT_PATTERNS = ["collection.*", "source_connection.*"]
+
+    async def handle(self, event: "DomainEvent") -> None:
+        """Invalidate the plan of the collection the event refers to."""
+        cache = get_search_plan_cache()
+        readable_collection_id = getattr(event, "collection_readable_id", None)
+        if cache is None or not readable_collection_id:
+            return
+        await cache.invalidate_collection(event.organization_id, readable_collection_id)
+
+
+_search_plan_cache: Optional[SearchPlanCache] = None
+
+
+def get_search_plan_cache() -> Optional[SearchPlanCache]:
+    """Get the pod-wide search plan cache, or None when disabled in settings."""
+    global _search_plan_cache
+    if not settings.SEARCH_PLAN_CACHE_ENABLED:
+        return None
+    if _search_plan_cache is None:
+        _search_plan_cache = SearchPlanCache(
+            max_entries=settings.SEARCH_PLAN_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.SEARCH_PLAN_CACHE_TTL_SECONDS,
+        )
+    return _search_plan_cache
@@ -12,6 +12,7 @@ from pydantic import BaseModel
 
 from airweave.api.context import ApiContext
 from airweave.platform.tokenizers import BaseTokenizer
+from airweave.search.clients import credentials_fingerprint, pooled_http_client, search_clients
 
 from ._base import BaseProvider, ProviderError
 from .schemas import ProviderModelSpec
@@ -23,13 +24,24 @@ class CerebrasProvider(BaseProvider):
     MAX_COMPLETION_TOKENS = 10000
     MAX_STRUCTURED_OUTPUT_TOKENS = 2000
 
+    TIMEOUT = 30.0
+
     def __init__(self, api_key: str, model_spec: ProviderModelSpec, ctx: ApiContext) -> None:
         """Initialize Cerebras provider with model specs from defaults.yml."""
         super().__init__(api_key, model_spec, ctx)
 
         try:
-            # Set 30s timeout to prevent indefinite hangs
-            self.client = AsyncCerebras(api_key=api_key, timeout=30.0)
+            # Set 30s timeout to prevent indefinite hangs. Shared across requests; the
+            # pooled HTTP client keeps connections warm
+            self.client = search_clients.get(
+                "cerebras",
+                (AsyncCerebras, credentials_fingerprint(api_key)),
+                lambda: AsyncCerebras(
+                    api_key=api_key,
+                    timeout=self.TIMEOUT,
+                    http_client=pooled_http_client(timeout=self.TIMEOUT),
+                ),
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Cerebras client: {e}") from e
 
@@ -15,6 +15,7 @@ from pydantic import BaseModel
 
 from airweave.api.context import ApiContext
 from airweave.platform.tokenizers import BaseTokenizer
+from airweave.search.clients import credentials_fingerprint, pooled_http_client, search_clients
 
 from ._base import BaseProvider, ProviderError
 from .schemas import ProviderModelSpec
@@ -23,6 +24,8 @@ from .schemas import ProviderModelSpec
 class CohereProvider(BaseProvider):
     """Cohere LLM provider."""
 
+    TIMEOUT = 300.0
+
     def __init__(self, api_key: str, model_spec: ProviderModelSpec, ctx: ApiContext) -> None:
         """Initialize Cohere provider with model specs from defaults.yml."""
         super().__init__(api_key, model_spec, ctx)
@@ -31,7 +34,14 @@ class CohereProvider(BaseProvider):
             raise ImportError("Cohere package not installed. Install with: pip install cohere")
 
         try:
-            self.client = cohere.AsyncClientV2(api_key=api_key)
+            # Shared across requests; the pooled HTTP client keeps connections warm
+            self.client = search_clients.get(
+                "cohere",
+                (cohere.AsyncClientV2, credentials_fingerprint(api_key)),
+                lambda: cohere.AsyncClientV2(
+                    api_key=api_key, httpx_client=pooled_http_client(timeout=self.TIMEOUT)
+                ),
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Cohere client: {e}") from e
 
@@ -12,6 +12,7 @@ from pydantic import BaseModel
 
 from airweave.api.context import ApiContext
 from airweave.platform.tokenizers import BaseTokenizer
+from airweave.search.clients import credentials_fingerprint, pooled_http_client, search_clients
 
 from ._base import BaseProvider, ProviderError
 from .schemas import ProviderModelSpec
@@ -24,12 +25,21 @@ class GroqProvider(BaseProvider):
     MAX_STRUCTURED_OUTPUT_TOKENS = 2000
     RERANK_SAFETY_TOKENS = 1500
 
+    TIMEOUT = 60.0
+
     def __init__(self, api_key: str, model_spec: ProviderModelSpec, ctx: ApiContext) -> None:
         """Initialize Groq provider with model specs from defaults.yml."""
         super().__init__(api_key, model_spec, ctx)
 
         try:
-            self.client = AsyncGroq(api_key=api_key)
+            # Shared across requests; the pooled HTTP client keeps connections warm
+            self.client = search_clients.get(
+                "groq",
+                (AsyncGroq, credentials_fingerprint(api_key)),
+                lambda: AsyncGroq(
+                    api_key=api_key, http_client=pooled_http_client(timeout=self.TIMEOUT)
+                ),
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Groq client: {e}") from e
 
@@ -19,6 +19,7 @@ from pydantic import BaseModel
 from airweave.api.context import ApiContext
 from airweave.platform.embedders.config import is_mock_model
 from airweave.platform.tokenizers import BaseTokenizer
+from airweave.search.clients import credentials_fingerprint, search_clients
 
 from ._base import BaseProvider, ProviderError
 from .schemas import ProviderModelSpec
@@ -49,7 +50,12 @@ class MistralProvider(BaseProvider):
         self.client = None
         if not self._mock_embeddings:
             try:
-                self.client = Mistral(api_key=api_key)
+                # Shared across requests instead of reconnecting per search
+                self.client = search_clients.get(
+                    "mistral",
+                    (Mistral, credentials_fingerprint(api_key)),
+                    lambda: Mistral(api_key=api_key),
+                )
             except Exception as e:
                 raise RuntimeError(f"Failed to initialize Mistral client: {e}") from e
 
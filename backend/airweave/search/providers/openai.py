@@ -11,6 +11,7 @@ from pydantic import BaseModel
 
 from airweave.api.context import ApiContext
 from airweave.platform.tokenizers import BaseTokenizer
+from airweave.search.clients import credentials_fingerprint, pooled_http_client, search_clients
 
 from ._base import BaseProvider, ProviderError
 from .schemas import ProviderModelSpec
@@ -32,8 +33,16 @@ class OpenAIProvider(BaseProvider):
         super().__init__(api_key, model_spec, ctx)
 
         try:
-            self.client = AsyncOpenAI(
-                api_key=api_key, timeout=self.TIMEOUT, max_retries=self.MAX_RETRIES
+            # Shared across requests; the pooled HTTP client keeps connections warm
+            self.client = search_clients.get(
+                "openai",
+                (AsyncOpenAI, credentials_fingerprint(api_key)),
+                lambda: AsyncOpenAI(
+                    api_key=api_key,
+                    timeout=self.TIMEOUT,
+                    max_retries=self.MAX_RETRIES,
+                    http_client=pooled_http_client(timeout=self.TIMEOUT),
+                ),
             )
         except Exception as e:
             raise RuntimeError(f"Failed to initialize OpenAI client: {e}") from e
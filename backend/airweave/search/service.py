@@ -5,6 +5,7 @@ is broken down into composable operations that can be configured
 and executed in a flexible pipeline.
 """
 
+import functools
 import time
 from typing import Any, Dict, List, Literal
 from uuid import UUID
@@ -16,6 +17,7 @@ from airweave import crud
 from airweave.api.context import ApiContext
 from airweave.core.exceptions import NotFoundException
 from airweave.schemas.search import SearchRequest, SearchResponse
+from airweave.search.clients import search_clients
 from airweave.search.factory import factory
 from airweave.search.helpers import search_helpers
 from airweave.search.orchestrator import orchestrator
@@ -60,20 +62,21 @@ class SearchService:
         if not collection:
             raise NotFoundException(message=f"Collection '{readable_collection_id}' not found")
 
-        ctx.logger.debug("Building search context")
-        search_context = await factory.build(
-            request_id,
-            collection.id,
-            readable_collection_id,
-            search_request,
-            stream,
-            ctx,
-            db,
-            destination_override=destination_override,
-        )
+        async with search_clients.lease_scope():
+            ctx.logger.debug("Building search context")
+            search_context = await factory.build(
+                request_id,
+                collection.id,
+                readable_collection_id,
+                search_request,
+                stream,
+                ctx,
+                db,
+                destination_override=destination_override,
+            )
 
-        ctx.logger.debug("Executing search")
-        response, state = await orchestrator.run(ctx, search_context)
+            ctx.logger.debug("Executing search")
+            response, state = await orchestrator.run(ctx, search_context)
 
         # Handle any federated source auth failures (mark connections as unauthenticated)
         await self._handle_failed_federated_auth(db, state, ctx)
@@ -102,9 +105,10 @@ class SearchService:
             "offset": search_context.retrieval.offset if search_context.retrieval else 0,
         }
 
-        # Track the search event with state for automatic metrics extraction
-        # TODO: use background task to track search completion, not blocking the response
-        track_search_completion(
+        # Track the search event with state for automatic metrics extraction once the
+        # search_query row has been written; both happen off the request path
+        track_completion = functools.partial(
+            track_search_completion,
             ctx=ctx,
             query=search_context.query,
             collection_slug=readable_collection_id,
@@ -117,14 +121,13 @@ class SearchService:
             **search_config,
         )
 
-        # Persist search data to database
-        # TODO: use background task to persist search data, not blocking the response
+        # Persist search data to database (write-behind, see SearchQueryWriter)
         await search_helpers.persist_search_data(
-            db=db,
             search_context=search_context,
             search_response=response,
             ctx=ctx,
             duration_ms=duration_ms,
+            after_write=track_completion,
         )
 
         return response
@@ -173,21 +176,22 @@ class SearchService:
             f"(org: {collection.organization_id}) using destination: {destination}"
         )
 
-        ctx.logger.debug("Building admin search context")
-        search_context = await factory.build(
-            request_id=request_id,
-            collection_id=collection.id,
-            readable_collection_id=readable_collection_id,
-            search_request=search_request,
-            stream=False,
-            ctx=ctx,
-            db=db,
-            destination_override=destination,
-            skip_organization_check=True,
-        )
+        async with search_clients.lease_scope():
+            ctx.logger.debug("Building admin search context")
+            search_context = await factory.build(
+                request_id=request_id,
+                collection_id=collection.id,
+                readable_collection_id=readable_collection_id,
+                search_request=search_request,
+                stream=False,
+                ctx=ctx,
+                db=db,
+                destination_override=destination,
+                skip_organization_check=True,
+            )
 
-        ctx.logger.debug("Executing admin search")
-        response, state = await orchestrator.run(ctx, search_context)
+            ctx.logger.debug("Executing admin search")
+            response, state = await orchestrator.run(ctx, search_context)
 
         duration_ms = (time.monotonic() - start_time) * 1000
         ctx.logger.info(
@@ -231,6 +235,7 @@ class SearchService:
         # Get collection without organization filtering
         from airweave.models.collection import Collection
         from airweave.platform.access_control.broker import access_broker
+        from airweave.platform.access_control.cache import get_principal_cache
 
         result = await db.execute(
             sa_select(Collection).where(Collection.readable_id == readable_collection_id)
@@ -245,8 +250,14 @@ class SearchService:
             f"(org: {collection.organization_id}) using destination: {destination}"
         )
 
-        # Resolve access context for the specified user
-        access_context = await access_broker.resolve_access_context_for_collection(
+        # Resolve access context for the specified user (through the principal cache if enabled)
+        principal_cache = get_principal_cache()
+        resolve = (
+            principal_cache.resolve
+            if principal_cache is not None
+            else access_broker.resolve_access_context_for_collection
+        )
+        access_context = await resolve(
             db=db,
             user_principal=user_principal,
             readable_collection_id=readable_collection_id,
@@ -267,22 +278,23 @@ class SearchService:
             )
             user_principal_for_factory = user_principal
 
-        ctx.logger.debug("Building search context with user ACL override")
-        search_context = await factory.build(
-            request_id=request_id,
-            collection_id=collection.id,
-            readable_collection_id=readable_collection_id,
-            search_request=search_request,
-            stream=False,
-            ctx=ctx,
-            db=db,
-            destination_override=destination,
-            user_principal_override=user_principal_for_factory,
-            skip_organization_check=True,
-        )
+        async with search_clients.lease_scope():
+            ctx.logger.debug("Building search context with user ACL override")
+            search_context = await factory.build(
+                request_id=request_id,
+                collection_id=collection.id,
+                readable_collection_id=readable_collection_id,
+                search_request=search_request,
+                stream=False,
+                ctx=ctx,
+                db=db,
+                destination_override=destination,
+                user_principal_override=user_principal_for_factory,
+                skip_organization_check=True,
+            )
 
-        ctx.logger.debug("Executing search with user ACL")
-        response, state = await orchestrator.run(ctx, search_context)
+            ctx.logger.debug("Executing search with user ACL")
+            response, state = await orchestrator.run(ctx, search_context)
 
         duration_ms = (time.monotonic() - start_time) * 1000
         ctx.logger.info(
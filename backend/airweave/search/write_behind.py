@@ -0,0 +1,278 @@
+"""Write-behind persistence for search_query rows and search analytics.
+
+SearchService.search used to insert its search_query row (one INSERT + COMMIT + refresh)
+and build its PostHog event before returning, so search latency included Postgres write
+latency. SearchQueryWriter moves both off the request path:
+
+- submit() puts the row on a bounded in-process queue and returns immediately
+- a background task flushes queued rows as one multi-row INSERT once
+  SEARCH_QUERY_WRITER_BATCH_SIZE rows are waiting or SEARCH_QUERY_WRITER_FLUSH_INTERVAL_SECONDS
+  has passed since the first one, then runs each row's analytics callback
+- when a batch INSERT fails, its rows are retried one by one so one bad row doesn't lose
+  the whole batch
+- when the queue is full, submit() waits up to SEARCH_QUERY_WRITER_ENQUEUE_TIMEOUT_SECONDS
+  for space (backpressure) and then drops the record and counts it
+- aclose() drains the queue on API shutdown, for at most
+  SEARCH_QUERY_WRITER_DRAIN_TIMEOUT_SECONDS; records left after that are dropped
+
+Analytics callbacks run for every record, including dropped ones, so search completion
+is tracked even when its row is not persisted.
+
+While the writer is not running (disabled, not started, or shutting down) submit() writes
+inline, which is the previous behaviour.
+
+Metrics:
+- airweave_search_query_writer_queue_depth
+- airweave_search_query_writer_flush_seconds
+- airweave_search_query_writer_rows_total{result="written|dropped|failed"}
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+
+search_query_writer_queue_depth = Gauge(
+    "airweave_search_query_writer_queue_depth",
+    "Search query records waiting to be written",
+)
+
+search_query_writer_flush_seconds = Histogram(
+    "airweave_search_query_writer_flush_seconds",
+    "Time spent writing one batch of search query rows",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+search_query_writer_rows = Counter(
+    "airweave_search_query_writer_rows_total",
+    "Search query records handled by the writer, by outcome",
+    ["result"],
+)
+
+
+@dataclass
+class _PendingSearch:
+    """A search_query row and the analytics to emit once it has been handled."""
+
+    row: Dict[str, Any]
+    after_write: Optional[Callable[[], None]] = None
+
+
+_STOP = object()
+
+
+async def _insert_search_queries(rows: List[Dict[str, Any]]) -> None:
+    """Insert rows in their own session, independent of any request."""
+    from airweave import crud
+    from airweave.db.session import get_db_context
+
+    async with get_db_context() as db:
+        await crud.search_query.create_many(db, rows=rows)
+
+
+class SearchQueryWriter:
+    """Bounded write-behind queue for search query rows."""
+
+    def __init__(
+        self,
+        enabled: bool,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval_seconds: float,
+        enqueue_timeout_seconds: float,
+        drain_timeout_seconds: float,
+        insert: Callable[[List[Dict[str, Any]]], Awaitable[None]] = _insert_search_queries,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            enabled: If False, submit() always writes inline
+            max_queue_size: Records held in memory before submit() applies backpressure
+            batch_size: Rows per multi-row INSERT
+            flush_interval_seconds: Max time a record waits for its batch to fill
+            enqueue_timeout_seconds: How long submit() waits for space before dropping
+            drain_timeout_seconds: How long aclose() may spend flushing the queue
+            insert: Writes one batch of rows
+        """
+        self.enabled = enabled
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.enqueue_timeout_seconds = enqueue_timeout_seconds
+        self.drain_timeout_seconds = drain_timeout_seconds
+        self._insert = insert
+        self._max_queue_size = max_queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether records are currently queued rather than written inline."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flush loop."""
+        if not self.enabled or self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._batch_ready = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def submit(
+        self, row: Dict[str, Any], after_write: Optional[Callable[[], None]] = None
+    ) -> bool:
+        """Queue a search_query row for writing.
+
+        Args:
+            row: Full column values of the search_query row
+            after_write: Called once the row has been written (or failed or dropped)
+
+        Returns:
+            False if the record was dropped because the queue stayed full
+        """
+        pending = _PendingSearch(row=row, after_write=after_write)
+        if not self.running:
+            await self._flush([pending])
+            return True
+
+        try:
+            self._queue.put_nowait(pending)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self._queue.put(pending), self.enqueue_timeout_seconds)
+            except asyncio.TimeoutError:
+                search_query_writer_rows.labels(result="dropped").inc()
+                logger.warning("[SearchQueryWriter] Queue full, dropped search query record")
+                self._run_callbacks([pending])
+                return False
+
+        search_query_writer_queue_depth.set(self._queue.qsize())
+        if self._queue.qsize() >= self.batch_size:
+            self._batch_ready.set()
+        return True
+
+    async def aclose(self) -> None:
+        """Flush everything still queued and stop the loop (API shutdown).
+
+        Gives up after drain_timeout_seconds: the loop is cancelled and the records still
+        queued are dropped (their analytics callbacks still run).
+        """
+        if not self.running:
+            return
+        task = self._task
+        deadline = time.monotonic() + self.drain_timeout_seconds
+        try:
+            # The stop marker waits for queue space like any record, within the same budget
+            await asyncio.wait_for(self._queue.put(_STOP), self.drain_timeout_seconds)
+            self._batch_ready.set()
+            await asyncio.wait_for(task, max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            dropped = self._drop_queued()
+            logger.warning(f"[SearchQueryWriter] Drain timed out, {dropped} records not written")
+        self._task = None
+        search_query_writer_queue_depth.set(0)
+
+    def _drop_queued(self) -> int:
+        """Drop every queued record, running its callback; returns how many were dropped."""
+        dropped = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                dropped.append(item)
+        search_query_writer_rows.labels(result="dropped").inc(len(dropped))
+        self._run_callbacks(dropped)
+        return len(dropped)
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is _STOP:
+                break
+            if self._queue.qsize() < self.batch_size - 1:
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), self.flush_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+            self._batch_ready.clear()
+
+            batch = [first]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            search_query_writer_queue_depth.set(self._queue.qsize())
+            await self._flush(batch)
+
+        # Anything queued behind the stop marker while draining
+        remaining = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                remaining.append(item)
+        for start in range(0, len(remaining), self.batch_size):
+            await self._flush(remaining[start : start + self.batch_size])
+
+    async def _flush(self, batch: List[_PendingSearch]) -> None:
+        start = time.perf_counter()
+        try:
+            await self._write([pending.row for pending in batch])
+        finally:
+            # Also when the drain is cancelled mid-write
+            search_query_writer_flush_seconds.observe(time.perf_counter() - start)
+            self._run_callbacks(batch)
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert rows as one batch, falling back to one row at a time if the batch fails."""
+        try:
+            await self._insert(rows)
+            search_query_writer_rows.labels(result="written").inc(len(rows))
+            return
+        except Exception as e:
+            if len(rows) == 1:
+                # Don't fail searches (or the loop) if analytics persistence fails
+                search_query_writer_rows.labels(result="failed").inc()
+                logger.error(f"[SearchQueryWriter] Failed to write search query: {e}")
+                return
+            logger.warning(
+                f"[SearchQueryWriter] Failed to write {len(rows)} search queries, "
+                f"retrying one by one: {e}"
+            )
+
+        failed = 0
+        for row in rows:
+            try:
+                await self._insert([row])
+            except Exception as e:
+                failed += 1
+                logger.error(f"[SearchQueryWriter] Failed to write search query: {e}")
+        search_query_writer_rows.labels(result="written").inc(len(rows) - failed)
+        search_query_writer_rows.labels(result="failed").inc(failed)
+
+    def _run_callbacks(self, batch: List[_PendingSearch]) -> None:
+        for pending in batch:
+            if pending.after_write is None:
+                continue
+            try:
+                pending.after_write()
+            except Exception as e:
+                logger.error(f"[SearchQueryWriter] Search analytics callback failed: {e}")
+
+
+search_query_writer = SearchQueryWriter(
+    enabled=settings.SEARCH_QUERY_WRITER_ENABLED,
+    max_queue_size=settings.SEARCH_QUERY_WRITER_MAX_QUEUE_SIZE,
+    batch_size=settings.SEARCH_QUERY_WRITER_BATCH_SIZE,
+    flush_interval_seconds=settings.SEARCH_QUERY_WRITER_FLUSH_INTERVAL_SECONDS,
+    enqueue_timeout_seconds=settings.SEARCH_QUERY_WRITER_ENQUEUE_TIMEOUT_SECONDS,
+    drain_timeout_seconds=settings.SEARCH_QUERY_WRITER_DRAIN_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,35 @@
+"""Add chunk_hashes column to entity table.
+
+Revision ID: q3r4s5t6u7v8
+Revises: j3k4l5m6n7o8
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "q3r4s5t6u7v8"
+down_revision = "j3k4l5m6n7o8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add chunk_hashes column to entity table.
+
+    Stores the per-chunk text hashes (ordered by chunk index) of each parent
+    entity so that UPDATEs can re-embed and rewrite only the chunks whose text
+    changed. Nullable: rows without hashes fall back to full re-chunking.
+    """
+    op.add_column(
+        "entity",
+        sa.Column("chunk_hashes", sa.JSON(), nullable=True),
+    )
+
+
+def downgrade():
+    """Remove chunk_hashes column from entity table."""
+    op.drop_column("entity", "chunk_hashes")
@@ -0,0 +1,79 @@
+"""Add access_control_group_closure table.
+
+Revision ID: r4s5t6u7v8w9
+Revises: q3r4s5t6u7v8
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "r4s5t6u7v8w9"
+down_revision = "q3r4s5t6u7v8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create access_control_group_closure and backfill it from existing memberships.
+
+    Rows are (group_id, ancestor_group_id) pairs reachable through the group-to-group
+    tuples of an organization, across its source connections. AccessControlPipeline
+    rebuilds the organization's rows after every membership sync; the backfill makes
+    nested groups resolve correctly before the next sync runs.
+    """
+    op.create_table(
+        "access_control_group_closure",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("organization_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("group_id", sa.String(255), nullable=False),
+        sa.Column("ancestor_group_id", sa.String(255), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("modified_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organization.id"], ondelete="CASCADE"),
+    )
+    op.create_index(
+        "ix_access_control_group_closure_organization_id",
+        "access_control_group_closure",
+        ["organization_id"],
+    )
+    op.create_index(
+        "idx_acl_closure_group",
+        "access_control_group_closure",
+        ["organization_id", "group_id", "ancestor_group_id"],
+    )
+
+    # Backfill (UNION terminates on cyclic group graphs)
+    op.execute(
+        """
+        WITH RECURSIVE edges AS (
+            SELECT DISTINCT organization_id, member_id AS child, group_id AS parent
+            FROM access_control_membership
+            WHERE member_type = 'group'
+        ),
+        closure (organization_id, group_id, ancestor_group_id) AS (
+            SELECT organization_id, child, parent FROM edges
+            UNION
+            SELECT c.organization_id, c.group_id, e.parent
+            FROM closure c
+            JOIN edges e
+              ON e.organization_id = c.organization_id
+             AND e.child = c.ancestor_group_id
+        )
+        INSERT INTO access_control_group_closure (
+            id, organization_id, group_id, ancestor_group_id, created_at, modified_at
+        )
+        SELECT gen_random_uuid(), organization_id, group_id, ancestor_group_id, now(), now()
+        FROM closure
+        WHERE group_id <> ancestor_group_id
+        """
+    )
+
+
+def downgrade():
+    """Drop access_control_group_closure table."""
+    op.drop_table("access_control_group_closure")
@@ -0,0 +1,206 @@
+"""Benchmark AccessBroker principal resolution: per-group queries vs group closure.
+
+Builds a synthetic ACL graph in session-scoped temp tables that shadow
+access_control_membership, access_control_group_closure and source_connection (so no
+real rows or fixtures are touched), on one pinned connection of the Postgres
+configured in settings (POSTGRES_*):
+
+- G groups in L nesting levels; every group below the top level is a member of one
+  random group on the level above (plus an extra parent for 10% of them)
+- U users, each a direct member of a few random bottom-level groups
+
+Then it times resolve_access_context_for_collection for random users with:
+- legacy: the previous expansion, one get_by_member query per group
+- closure: one query against the materialized closure (after rebuild_group_closure)
+
+Usage (from backend/):
+    python scripts/benchmark_access_broker.py --groups 50000 --levels 8 --requests 500
+
+Requires the access_control_group_closure migration to be applied.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Dict, List, Set
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave import crud
+from airweave.db.session import async_engine
+from airweave.models.access_control_membership import AccessControlMembership
+from airweave.platform.access_control.broker import AccessBroker
+from airweave.platform.access_control.schemas import AccessContext
+
+COLLECTION = "benchmark-collection"
+
+
+class LegacyAccessBroker(AccessBroker):
+    """The previous resolution path: one query per group while expanding."""
+
+    async def resolve_access_context_for_collection(
+        self, db, user_principal, readable_collection_id, organization_id
+    ):
+        """Resolve with per-group expansion (no visit cap, so results are complete)."""
+        if not await self._collection_has_ac_sources(db, readable_collection_id, organization_id):
+            return None
+        memberships = await crud.access_control_membership.get_by_member_and_collection(
+            db=db,
+            member_id=user_principal,
+            member_type="user",
+            readable_collection_id=readable_collection_id,
+            organization_id=organization_id,
+        )
+        all_groups: Set[str] = {m.group_id for m in memberships}
+        to_process = set(all_groups)
+        while to_process:
+            nested = await crud.access_control_membership.get_by_member(
+                db=db,
+                member_id=to_process.pop(),
+                member_type="group",
+                organization_id=organization_id,
+            )
+            for m in nested:
+                if m.group_id not in all_groups:
+                    all_groups.add(m.group_id)
+                    to_process.add(m.group_id)
+        return AccessContext(
+            user_principal=user_principal,
+            user_principals=[f"user:{user_principal}"],
+            group_principals=[f"group:{g}" for g in all_groups],
+        )
+
+
+def build_graph(groups: int, levels: int, users: int, seed: int = 7) -> List[Dict[str, str]]:
+    """Build (member_id, member_type, group_id) rows for the synthetic ACL graph."""
+    rng = random.Random(seed)
+    per_level = max(1, groups // levels)
+    level_groups = [[f"g{lvl}-{i}" for i in range(per_level)] for lvl in range(levels)]
+    rows = []
+    for lvl in range(1, levels):
+        for group in level_groups[lvl]:
+            parents = {rng.choice(level_groups[lvl - 1])}
+            if rng.random() < 0.1:
+                parents.add(rng.choice(level_groups[lvl - 1]))
+            rows += [{"member_id": group, "member_type": "group", "group_id": p} for p in parents]
+    for u in range(users):
+        for group in rng.sample(level_groups[-1], 3):
+            rows.append(
+                {"member_id": f"user{u}@acme.com", "member_type": "user", "group_id": group}
+            )
+    return rows
+
+
+async def setup(
+    db: AsyncSession, rows: List[Dict[str, str]], organization_id: UUID, source_connection_id: UUID
+) -> None:
+    """Create the shadow tables and load the graph."""
+    await db.execute(
+        text(
+            "CREATE TEMP TABLE access_control_membership "
+            "(LIKE public.access_control_membership INCLUDING ALL)"
+        )
+    )
+    await db.execute(
+        text(
+            "CREATE TEMP TABLE access_control_group_closure "
+            "(LIKE public.access_control_group_closure INCLUDING ALL)"
+        )
+    )
+    # Resolution only reads id and readable_collection_id
+    await db.execute(
+        text(
+            "CREATE TEMP TABLE source_connection "
+            "(id UUID PRIMARY KEY, readable_collection_id VARCHAR NOT NULL)"
+        )
+    )
+    await db.execute(
+        text("INSERT INTO source_connection VALUES (:id, :collection)"),
+        {"id": source_connection_id, "collection": COLLECTION},
+    )
+    for start in range(0, len(rows), 2000):
+        await db.execute(
+            insert(AccessControlMembership).values(
+                [
+                    {
+                        **row,
+                        "organization_id": organization_id,
+                        "source_connection_id": source_connection_id,
+                        "source_name": "benchmark",
+                    }
+                    for row in rows[start : start + 2000]
+                ]
+            )
+        )
+    await db.execute(text("ANALYZE access_control_membership"))
+    await db.commit()
+
+
+async def measure(
+    name: str, broker: AccessBroker, db: AsyncSession, users: List[str], organization_id: UUID
+) -> None:
+    """Resolve each user once and print latency percentiles."""
+    latencies = []
+    groups = 0
+    for user in users:
+        start = time.perf_counter()
+        context = await broker.resolve_access_context_for_collection(
+            db, user, COLLECTION, organization_id
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        groups += len(context.group_principals)
+    latencies.sort()
+    p99 = latencies[max(0, int(len(latencies) * 0.99) - 1)]
+    print(
+        f"{name:>8}: p50 {statistics.median(latencies):7.2f}ms  p99 {p99:7.2f}ms  "
+        f"({groups / len(users):.1f} groups/user)"
+    )
+
+
+async def run(groups: int, levels: int, users: int, requests: int) -> None:
+    """Load the graph, rebuild the closure and benchmark both brokers."""
+    organization_id, source_connection_id = uuid4(), uuid4()
+    rows = build_graph(groups, levels, users)
+    rng = random.Random(11)
+    sample = [f"user{rng.randrange(users)}@acme.com" for _ in range(requests)]
+
+    async with async_engine.connect() as conn:
+        db = AsyncSession(bind=conn)
+        await setup(db, rows, organization_id, source_connection_id)
+
+        start = time.perf_counter()
+        closure_rows = await crud.access_control_membership.rebuild_group_closure(
+            db, organization_id=organization_id
+        )
+        print(
+            f"{len(rows)} memberships, {closure_rows} closure rows, "
+            f"rebuilt in {time.perf_counter() - start:.2f}s"
+        )
+        await db.execute(text("ANALYZE access_control_group_closure"))
+
+        await measure("legacy", LegacyAccessBroker(), db, sample, organization_id)
+        await measure("closure", AccessBroker(), db, sample, organization_id)
+        await db.close()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=50_000)
+    parser.add_argument("--levels", type=int, default=8)
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.groups, args.levels, args.users, args.requests))
+
+
+if __name__ == "__main__":
+    main()
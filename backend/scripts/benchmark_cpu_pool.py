@@ -0,0 +1,194 @@
+"""Benchmark chunking + hashing throughput: thread pool vs process pool.
+
+Generates a mixed corpus (prose, markdown, code) and pushes it through the same
+calls the sync pipeline makes - SemanticChunker / CodeChunker.chunk_batch and
+HashComputer.compute_for_batch - in batches, with SYNC_MAX_WORKERS-style
+concurrency, once per executor mode. A heartbeat task measures event loop lag,
+which is what the process pool is meant to fix.
+
+Usage (from backend/):
+    python scripts/benchmark_cpu_pool.py --documents 10000 --batch-size 64 --concurrency 8
+
+Requires the chonkie model (minishlab/potion-base-8M) and tiktoken encodings to be
+downloadable or cached.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from typing import List, Tuple
+from unittest.mock import AsyncMock, MagicMock
+
+from airweave.platform.chunkers.code import CodeChunker
+from airweave.platform.chunkers.semantic import SemanticChunker
+from airweave.platform.entities._airweave_field import AirweaveField
+from airweave.platform.entities._base import AirweaveSystemMetadata, BaseEntity
+from airweave.platform.sync.async_helpers import get_process_executor, shutdown_process_pool
+from airweave.platform.sync.pipeline.hash_computer import HashComputer
+
+WORDS = (
+    "sync entity vector chunk embedding search collection source destination token "
+    "pipeline cursor batch worker schema payload document index query filter"
+).split()
+
+CODE_TEMPLATE = '''def handler_{n}(items):
+    """Process batch {n}."""
+    total = 0
+    for item in items:
+        if item.get("value", 0) > {n}:
+            total += item["value"]
+    return total
+
+
+class Worker{n}:
+    def __init__(self, name):
+        self.name = name
+
+    def run(self, payload):
+        return [p * {n} for p in payload]
+'''
+
+
+class _BenchEntity(BaseEntity):
+    """Entity used for hashing."""
+
+    doc_id: str = AirweaveField(..., description="Doc ID", is_entity_id=True)
+    name: str = AirweaveField(..., description="Doc name", is_name=True)
+    body: str = AirweaveField(default="", description="Body")
+
+
+def _prose(rng: random.Random, paragraphs: int) -> str:
+    return "\n\n".join(
+        ". ".join(
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20)))
+            for _ in range(rng.randint(3, 8))
+        )
+        + "."
+        for _ in range(paragraphs)
+    )
+
+
+def build_corpus(count: int, seed: int = 42) -> List[Tuple[str, str]]:
+    """Build (kind, text) documents: 60% prose, 25% markdown, 15% code."""
+    rng = random.Random(seed)
+    corpus = []
+    for n in range(count):
+        roll = rng.random()
+        if roll < 0.6:
+            corpus.append(("text", _prose(rng, rng.randint(1, 12))))
+        elif roll < 0.85:
+            sections = [f"## Section {i}\n\n{_prose(rng, 2)}" for i in range(rng.randint(1, 5))]
+            corpus.append(("text", f"# Document {n}\n\n" + "\n\n".join(sections)))
+        else:
+            corpus.append(("code", "\n\n".join(CODE_TEMPLATE.format(n=n + i) for i in range(3))))
+    return corpus
+
+
+def _make_sync_context(cpu_pool: str) -> MagicMock:
+    ctx = MagicMock()
+    ctx.logger = MagicMock()
+    ctx.entity_tracker = AsyncMock()
+    ctx.execution_config.behavior.cpu_pool = cpu_pool
+    return ctx
+
+
+async def _process_batch(batch: List[Tuple[str, str]], offset: int, cpu_pool: str) -> None:
+    use_process_pool = cpu_pool == "process"
+    texts = [text for kind, text in batch if kind == "text"]
+    code = [text for kind, text in batch if kind == "code"]
+
+    entities = [
+        _BenchEntity(
+            doc_id=f"doc-{offset + i}",
+            entity_id=f"doc-{offset + i}",
+            breadcrumbs=[],
+            name=f"Doc {offset + i}",
+            body=text,
+            airweave_system_metadata=AirweaveSystemMetadata(),
+        )
+        for i, (_, text) in enumerate(batch)
+    ]
+    await HashComputer().compute_for_batch(entities, _make_sync_context(cpu_pool))
+
+    if texts:
+        await SemanticChunker().chunk_batch(texts, use_process_pool=use_process_pool)
+    if code:
+        await CodeChunker().chunk_batch(code, use_process_pool=use_process_pool)
+
+
+async def _heartbeat(stop: asyncio.Event, lags: List[float], interval: float = 0.05) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def run_mode(
+    corpus: List[Tuple[str, str]], cpu_pool: str, batch_size: int, concurrency: int
+) -> None:
+    """Run the corpus through one executor mode and print throughput and loop lag."""
+    if cpu_pool == "process":
+        # Pool start-up and model warm-up are a one-off per pod, not per entity
+        await get_process_executor()
+    else:
+        SemanticChunker()._ensure_chunkers()
+        CodeChunker()._ensure_chunkers()
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(offset: int) -> None:
+        async with semaphore:
+            await _process_batch(corpus[offset : offset + batch_size], offset, cpu_pool)
+
+    stop = asyncio.Event()
+    lags: List[float] = []
+    heartbeat = asyncio.create_task(_heartbeat(stop, lags))
+
+    start = time.perf_counter()
+    await asyncio.gather(*[bounded(o) for o in range(0, len(corpus), batch_size)])
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await heartbeat
+    lags.sort()
+    p99 = lags[int(len(lags) * 0.99) - 1] if lags else 0.0
+
+    max_lag = max(lags, default=0.0)
+    print(
+        f"{cpu_pool:>8}: {len(corpus) / elapsed:8.1f} entities/sec ({elapsed:.1f}s), "
+        f"event loop lag p99 {p99 * 1000:.0f}ms, max {max_lag * 1000:.0f}ms"
+    )
+
+
+def main() -> None:
+    """Parse arguments and run both modes on the same corpus."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--modes", nargs="+", default=["thread", "process"])
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.documents)
+    print(
+        f"{args.documents} documents, batch size {args.batch_size}, "
+        f"concurrency {args.concurrency}, {os.cpu_count()} cores"
+    )
+
+    async def run_all() -> None:
+        try:
+            for mode in args.modes:
+                await run_mode(corpus, mode, args.batch_size, args.concurrency)
+        finally:
+            shutdown_process_pool()
+
+    asyncio.run(run_all())
+
+
+if __name__ == "__main__":
+    main()
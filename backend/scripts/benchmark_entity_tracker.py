@@ -0,0 +1,114 @@
+"""Benchmark EntityTracker encountered-ID memory and throughput.
+
+Tracks N synthetic entity IDs (UUID-like strings, split over a few entity types) in
+batches, the way EntityPipeline does, and compares the compact hash store against the
+previous Dict[str, Set[str]] layout. Reports peak traced memory, bytes per entity,
+throughput, and the cost of re-tracking the same IDs (all duplicates).
+
+Usage (from backend/):
+    python scripts/benchmark_entity_tracker.py --entities 5000000 --batch-size 100
+
+Pass --spill-threshold-mb to exercise the memory-mapped spill mode.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+import uuid
+from collections import defaultdict
+from typing import Dict, Iterator, List, Set, Tuple
+from unittest.mock import MagicMock
+
+from airweave.core.config import settings
+from airweave.platform.sync.pipeline.entity_tracker import EntityTracker
+
+ENTITY_TYPES = ["TaskEntity", "CommentEntity", "FileEntity", "ProjectEntity"]
+
+
+def iter_batches(count: int, batch_size: int) -> Iterator[List[Tuple[str, str]]]:
+    """Yield deterministic (entity_type, entity_id) batches of UUID-shaped IDs."""
+    for start in range(0, count, batch_size):
+        yield [
+            (ENTITY_TYPES[i % len(ENTITY_TYPES)], str(uuid.UUID(int=i * 0x9E3779B97F4A7C15)))
+            for i in range(start, min(start + batch_size, count))
+        ]
+
+
+class SetTracker:
+    """The previous layout: entity ID strings in per-type Python sets."""
+
+    def __init__(self):
+        """Initialize empty per-type sets."""
+        self._encountered_by_type: Dict[str, Set[str]] = defaultdict(set)
+        self._lock = asyncio.Lock()
+
+    async def track_entities_batch(self, entities: List[Tuple[str, str]]) -> List[bool]:
+        """Track a batch, returning one new/duplicate flag per entity."""
+        flags = []
+        async with self._lock:
+            for entity_type, entity_id in entities:
+                seen = self._encountered_by_type[entity_type]
+                flags.append(entity_id not in seen)
+                seen.add(entity_id)
+        return flags
+
+
+async def run(name: str, tracker, count: int, batch_size: int) -> None:
+    """Track all IDs twice and print memory and throughput."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    new = 0
+    for batch in iter_batches(count, batch_size):
+        new += sum(await tracker.track_entities_batch(batch))
+    first_pass = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    duplicates = 0
+    for batch in iter_batches(count, batch_size):
+        duplicates += batch_size - sum(await tracker.track_entities_batch(batch))
+    second_pass = time.perf_counter() - start
+
+    print(
+        f"{name:>8}: peak {peak / 2**20:8.1f} MiB ({peak / count:6.1f} B/entity), "
+        f"{count / first_pass:9.0f} new/sec, {count / second_pass:9.0f} dup/sec, "
+        f"{new} new, {duplicates} duplicates"
+    )
+    if isinstance(tracker, EntityTracker):
+        stats = tracker.get_stats()
+        print(
+            f"{'':>8}  sync stats: {stats.encountered_ids_bytes / 2**20:.1f} MiB resident, "
+            f"{stats.encountered_bytes_per_entity:.1f} B/entity"
+        )
+
+
+def main() -> None:
+    """Parse arguments and benchmark both layouts on the same IDs."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=5_000_000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--spill-threshold-mb", type=int, default=0)
+    parser.add_argument("--layouts", nargs="+", default=["compact", "set"])
+    args = parser.parse_args()
+
+    settings.ENTITY_TRACKER_SPILL_THRESHOLD_BYTES = args.spill_threshold_mb * 2**20
+    print(f"{args.entities} entities, batch size {args.batch_size}")
+
+    async def run_all() -> None:
+        for layout in args.layouts:
+            if layout == "compact":
+                tracker = EntityTracker(uuid.uuid4(), uuid.uuid4(), MagicMock())
+            else:
+                tracker = SetTracker()
+            await run(layout, tracker, args.entities, args.batch_size)
+            del tracker
+
+    asyncio.run(run_all())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Benchmark entity table writes: row-by-row vs set-based.
+
+Runs against the Postgres configured in settings (POSTGRES_*), inside one transaction
+that is rolled back. A temp table named ``entity`` (LIKE public.entity INCLUDING ALL,
+so the same unique constraint and indexes, but no foreign keys) shadows the real table
+for the session, so no real rows are touched and no sync/org fixtures are needed.
+
+For a batch of N rows it times:
+- legacy upsert: one INSERT ... VALUES for the whole batch with RETURNING + db.add
+- bulk_create: chunked upserts with RETURNING + db.add
+- bulk_upsert: chunked upserts, no RETURNING, no ORM hydration
+- legacy hash update: one UPDATE ... WHERE id = ? per row
+- bulk_update_hash: one UPDATE ... FROM unnest(...) per chunk
+
+Usage (from backend/):
+    python scripts/benchmark_entity_writes.py --rows 50000 --rows-per-statement 1000
+
+Note: the legacy single-statement upsert exceeds asyncpg's 32767 bind parameter
+limit beyond ~3000 rows; it is reported as failed in that case.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Awaitable, Callable, List
+from uuid import uuid4
+
+from sqlalchemy import select, text, update
+from sqlalchemy.dialects.postgresql import insert
+
+from airweave.crud.crud_entity import entity as crud_entity
+from airweave.db.session import AsyncSessionLocal
+from airweave.models.entity import Entity
+from airweave.schemas.entity import EntityCreate
+
+
+def _make_objs(count: int, sync_id, job_id, definition_id, suffix: str) -> List[EntityCreate]:
+    return [
+        EntityCreate(
+            sync_job_id=job_id,
+            sync_id=sync_id,
+            entity_id=f"entity-{i}",
+            entity_definition_id=definition_id,
+            hash=f"hash-{i}-{suffix}",
+            chunk_hashes=[f"chunk-{i}-{j}-{suffix}" for j in range(4)],
+        )
+        for i in range(count)
+    ]
+
+
+async def legacy_upsert(db, objs: List[EntityCreate], ctx) -> None:
+    """The previous bulk_create: one statement, RETURNING Entity, db.add per row."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    values = [
+        {
+            **o.model_dump(),
+            "organization_id": ctx.organization_id,
+            "created_at": now,
+            "modified_at": now,
+        }
+        for o in objs
+    ]
+    stmt = insert(Entity).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["sync_id", "entity_id", "entity_definition_id"],
+        set_={"sync_job_id": stmt.excluded.sync_job_id, "hash": stmt.excluded.hash},
+    ).returning(Entity)
+    result = await db.execute(stmt)
+    for row in result.scalars().all():
+        db.add(row)
+    await db.flush()
+
+
+async def legacy_update_hash(db, rows) -> None:
+    """The previous bulk_update_hash: one UPDATE per row."""
+    for entity_db_id, new_hash in rows:
+        await db.execute(update(Entity).where(Entity.id == entity_db_id).values(hash=new_hash))
+
+
+async def timed(db, name: str, rows: int, func: Callable[[], Awaitable[None]]) -> None:
+    """Run one step in a savepoint and print its throughput (failures are reported)."""
+    start = time.perf_counter()
+    try:
+        async with db.begin_nested():
+            await func()
+    except Exception as e:  # noqa: BLE001 - report and continue with the next step
+        print(f"{name:>20}: failed ({type(e).__name__}: {str(e).splitlines()[0][:80]})")
+        return
+    elapsed = time.perf_counter() - start
+    print(f"{name:>20}: {elapsed:7.2f}s  {rows / elapsed:9.0f} rows/sec")
+
+
+async def run(rows: int, rows_per_statement: int) -> None:
+    """Run all steps in one rolled-back transaction against a shadow entity table."""
+    sync_id, job_id, definition_id = uuid4(), uuid4(), uuid4()
+    ctx = SimpleNamespace(organization_id=uuid4())
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            text("CREATE TEMP TABLE entity (LIKE public.entity INCLUDING ALL) ON COMMIT DROP")
+        )
+
+        async def reset() -> None:
+            await db.execute(text("TRUNCATE entity"))
+            db.expunge_all()
+
+        await timed(
+            db,
+            "legacy upsert",
+            rows,
+            lambda: legacy_upsert(db, _make_objs(rows, sync_id, job_id, definition_id, "a"), ctx),
+        )
+        await reset()
+        await timed(
+            db,
+            "bulk_create",
+            rows,
+            lambda: crud_entity.bulk_create(
+                db,
+                objs=_make_objs(rows, sync_id, job_id, definition_id, "a"),
+                ctx=ctx,
+                rows_per_statement=rows_per_statement,
+            ),
+        )
+        await reset()
+        await timed(
+            db,
+            "bulk_upsert",
+            rows,
+            lambda: crud_entity.bulk_upsert(
+                db,
+                objs=_make_objs(rows, sync_id, job_id, definition_id, "a"),
+                ctx=ctx,
+                rows_per_statement=rows_per_statement,
+            ),
+        )
+
+        ids = (await db.execute(select(Entity.id).order_by(Entity.id))).scalars().all()
+        update_rows = [(entity_db_id, f"new-{n}") for n, entity_db_id in enumerate(ids)]
+        chunk_hashes = {entity_db_id: ["c1", "c2"] for entity_db_id in ids}
+
+        await timed(db, "legacy hash update", len(ids), lambda: legacy_update_hash(db, update_rows))
+        await timed(
+            db,
+            "bulk_update_hash",
+            len(ids),
+            lambda: crud_entity.bulk_update_hash(
+                db,
+                rows=update_rows,
+                chunk_hashes=chunk_hashes,
+                rows_per_statement=rows_per_statement,
+            ),
+        )
+        await db.rollback()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--rows-per-statement", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{args.rows} rows, {args.rows_per_statement} rows per statement")
+    asyncio.run(run(args.rows, args.rows_per_statement))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+r"""Benchmark PostgreSQLSource sync throughput against a local Postgres.
+
+Creates --tables tables holding --rows rows in total in a throwaway schema, then
+drains PostgreSQLSource.generate_entities() in each mode:
+
+- sequential: full sync, one table at a time (max_concurrent_tables=1, previous
+  behaviour of the source)
+- concurrent: full sync, --concurrency tables at once over the connection pool; saves
+  the watermarks and key snapshots in a cursor
+- incremental: after updating --changed and deleting --deleted of the rows, sync
+  again with that cursor (rows past the watermarks plus deletions from the key diff)
+
+For each mode it prints wall time, rows per second and the number of deletions.
+Key snapshots go to the configured storage backend and are removed afterwards.
+
+Usage (from backend/, with a database the user may create schemas in):
+    python scripts/benchmark_postgres_source.py --tables 50 --rows 10000000 \
+        --host localhost --port 5432 --user airweave --password airweave --database bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+import asyncpg
+
+from airweave.platform.cursors import PostgreSQLCursor
+from airweave.platform.entities._base import DeletionEntity
+from airweave.platform.sources.postgresql import PostgreSQLSource
+from airweave.platform.storage import storage_backend
+from airweave.platform.storage.paths import paths
+from airweave.platform.sync.cursor import SyncCursor
+
+SCHEMA = "airweave_source_benchmark"
+
+
+async def create_tables(credentials: Dict[str, Any], tables: int, rows: int) -> None:
+    """Create the benchmark tables, indexed on their recency column."""
+    conn = await asyncpg.connect(**credentials)
+    try:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await conn.execute(f"CREATE SCHEMA {SCHEMA}")
+        rows_per_table = rows // tables
+        for i in range(tables):
+            await conn.execute(
+                f"""
+                CREATE TABLE {SCHEMA}.table_{i} (
+                    id bigint PRIMARY KEY,
+                    name text NOT NULL,
+                    body text,
+                    amount numeric(12, 2),
+                    updated_at timestamptz NOT NULL
+                )
+                """
+            )
+            await conn.execute(
+                f"""
+                INSERT INTO {SCHEMA}.table_{i}
+                SELECT g, 'row ' || g, repeat('benchmark ', 20), g * 0.01,
+                       now() - interval '1 day' + g * interval '1 millisecond'
+                FROM generate_series(1, $1::bigint) AS g
+                """,
+                rows_per_table,
+            )
+            await conn.execute(f"CREATE INDEX ON {SCHEMA}.table_{i} (updated_at)")
+        await conn.execute("ANALYZE")
+    finally:
+        await conn.close()
+
+
+async def change_rows(
+    credentials: Dict[str, Any], tables: int, changed: float, deleted: float
+) -> None:
+    """Update and delete a share of every table's rows."""
+    conn = await asyncpg.connect(**credentials)
+    try:
+        for i in range(tables):
+            if changed:
+                await conn.execute(
+                    f"UPDATE {SCHEMA}.table_{i} SET updated_at = now(), amount = amount + 1 "
+                    f"WHERE id % {round(1 / changed)} = 1"
+                )
+            if deleted:
+                await conn.execute(
+                    f"DELETE FROM {SCHEMA}.table_{i} WHERE id % {round(1 / deleted)} = 2"
+                )
+    finally:
+        await conn.close()
+
+
+async def run_mode(
+    mode: str,
+    credentials: Dict[str, Any],
+    concurrency: int,
+    cursor: Optional[SyncCursor],
+    source_connection_id: str,
+) -> None:
+    """Drain one sync of the benchmark schema and print the numbers."""
+    source = await PostgreSQLSource.create(
+        {**credentials, "schema": SCHEMA, "tables": "*"},
+        config={"max_concurrent_tables": concurrency},
+    )
+    source.set_logger(logging.getLogger("benchmark_postgres_source"))
+    source._source_connection_id = source_connection_id  # no organization: no catalog write
+    if cursor:
+        source.set_cursor(cursor)
+
+    rows = deletions = 0
+    start = time.perf_counter()
+    async for entity in source.generate_entities():
+        if isinstance(entity, DeletionEntity):
+            deletions += 1
+        else:
+            rows += 1
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{mode:<12} {elapsed:9.1f}s {rows:>10} rows ({rows / elapsed:8.0f} rows/s) "
+        f"{deletions:>8} deletions"
+    )
+
+
+async def cleanup(credentials: Dict[str, Any], source_connection_id: str) -> None:
+    """Drop the benchmark schema and its key snapshots."""
+    conn = await asyncpg.connect(**credentials)
+    try:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    finally:
+        await conn.close()
+    prefix = f"{paths.PG_KEY_SNAPSHOTS_PREFIX}/{source_connection_id}"
+    for path in await storage_backend.list_files(prefix):
+        await storage_backend.delete(path)
+
+
+def main() -> None:
+    """Parse arguments and run every mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tables", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--changed", type=float, default=0.01)
+    parser.add_argument("--deleted", type=float, default=0.001)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=5432)
+    parser.add_argument("--user", default="airweave")
+    parser.add_argument("--password", default="airweave")
+    parser.add_argument("--database", default="airweave")
+    parser.add_argument("--modes", default="sequential,concurrent,incremental")
+    args = parser.parse_args()
+
+    credentials = {
+        "host": args.host,
+        "port": args.port,
+        "user": args.user,
+        "password": args.password,
+        "database": args.database,
+    }
+    modes = args.modes.split(",")
+
+    async def run_all() -> None:
+        source_connection_id = str(uuid4())
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=PostgreSQLCursor)
+        print(f"Creating {args.tables} tables with {args.rows} rows in total...")
+        await create_tables(credentials, args.tables, args.rows)
+        try:
+            if "sequential" in modes:
+                await run_mode("sequential", credentials, 1, None, source_connection_id)
+            if "concurrent" in modes or "incremental" in modes:
+                await run_mode(
+                    "concurrent", credentials, args.concurrency, cursor, source_connection_id
+                )
+            if "incremental" in modes:
+                await change_rows(credentials, args.tables, args.changed, args.deleted)
+                await run_mode(
+                    "incremental", credentials, args.concurrency, cursor, source_connection_id
+                )
+        finally:
+            await cleanup(credentials, source_connection_id)
+
+    asyncio.run(run_all())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark Qdrant bulk upsert throughput against a local Qdrant.
+
+Upserts --points chunk points with --dim dense embeddings and BM25-shaped sparse
+vectors (under a throwaway sync ID), in each mode:
+
+- sequential: one PointStruct per entity with list vectors, request-sized batches
+  upserted one after another (previous behaviour of QdrantDestination.bulk_insert)
+- pipelined: QdrantDestination.bulk_insert (columnar Batch requests, up to the write
+  concurrency in flight)
+
+For each mode it prints wall time and points per second. Pass --grpc to run both
+modes with QDRANT_PREFER_GRPC.
+
+Usage (from backend/, with Qdrant on QDRANT_HOST:QDRANT_PORT or QDRANT_FULL_URL):
+    python scripts/benchmark_qdrant_upsert.py --points 4000 --dim 3072
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from uuid import UUID, uuid4
+
+import numpy as np
+from qdrant_client.http import models as rest
+from qdrant_client.local.local_collection import DEFAULT_VECTOR_NAME
+
+from airweave.core.config import settings
+from airweave.platform.destinations.qdrant import KEYWORD_VECTOR_NAME, QdrantDestination
+
+
+class BenchmarkEntity(SimpleNamespace):
+    """Chunk entity stand-in with the fields bulk_insert reads."""
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        """Payload as dumped by BaseEntity (embeddings excluded)."""
+        return {"entity_id": self.entity_id, "name": self.name, "md_content": self.content}
+
+
+def build_entities(points: int, dim: int, sync_id: UUID) -> List[BenchmarkEntity]:
+    """Chunk entities carrying the embeddings ChunkEmbedProcessor attaches."""
+    rng = np.random.default_rng(0)
+    dense = rng.standard_normal((points, dim))
+    dense /= np.linalg.norm(dense, axis=1, keepdims=True)
+    entities = []
+    for i in range(points):
+        indices = np.sort(rng.choice(2**31 - 1, size=100, replace=False))
+        metadata = SimpleNamespace(
+            sync_id=sync_id,
+            dense_embedding=dense[i].tolist(),
+            sparse_embedding={"indices": indices.tolist(), "values": rng.random(100).tolist()},
+        )
+        entities.append(
+            BenchmarkEntity(
+                entity_id=f"bench-{i}__chunk_0",
+                name=f"Benchmark chunk {i}",
+                content="benchmark content " * 50,
+                airweave_system_metadata=metadata,
+            )
+        )
+    return entities
+
+
+async def sequential_insert(dest: QdrantDestination, entities: List[BenchmarkEntity]) -> None:
+    """The previous bulk_insert: PointStructs, one request at a time."""
+    points = [
+        rest.PointStruct(
+            id=dest._make_point_uuid(e.airweave_system_metadata.sync_id, e.entity_id),
+            vector={
+                DEFAULT_VECTOR_NAME: e.airweave_system_metadata.dense_embedding,
+                KEYWORD_VECTOR_NAME: e.airweave_system_metadata.sparse_embedding,
+            },
+            payload=dest._build_payload(e),
+        )
+        for e in entities
+    ]
+    max_batch = dest._max_points_per_batch()
+    async with dest._write_sem:
+        for i in range(0, len(points), max_batch):
+            await dest.client.upsert(
+                collection_name=dest.collection_name, points=points[i : i + max_batch], wait=True
+            )
+
+
+async def run_mode(mode: str, dest: QdrantDestination, points: int, dim: int) -> None:
+    """Upsert a fresh set of points with `mode`, print the numbers and clean up."""
+    sync_id = uuid4()
+    entities = build_entities(points, dim, sync_id)
+
+    start = time.perf_counter()
+    if mode == "sequential":
+        await sequential_insert(dest, entities)
+    else:
+        await dest.bulk_insert(entities)
+    elapsed = time.perf_counter() - start
+
+    print(f"{mode:<10} {elapsed * 1000:9.1f}ms ({points / elapsed:8.0f} points/s)")
+    await dest.delete_by_sync_id(sync_id)
+
+
+def main() -> None:
+    """Parse arguments and run every mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=4000)
+    parser.add_argument("--dim", type=int, default=3072)
+    parser.add_argument("--grpc", action="store_true")
+    parser.add_argument("--modes", default="sequential,pipelined")
+    args = parser.parse_args()
+
+    settings.QDRANT_PREFER_GRPC = args.grpc
+
+    async def run_all() -> None:
+        dest = await QdrantDestination.create(collection_id=uuid4(), vector_size=args.dim)
+        await dest.ensure_collection_ready()
+        for mode in args.modes.split(","):
+            await run_mode(mode, dest, args.points, args.dim)
+
+    asyncio.run(run_all())
+
+
+if __name__ == "__main__":
+    main()
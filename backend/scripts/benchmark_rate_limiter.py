@@ -0,0 +1,159 @@
+"""Benchmark the API rate limiter against a local Redis.
+
+Drives RateLimiter.check_rate_limit open-loop at --rps for --seconds in three modes:
+
+- legacy: the previous pipeline(ZREMRANGEBYSCORE, ZCOUNT) + ZADD + EXPIRE check
+- atomic: one EVALSHA per request (default mode)
+- lease: RATE_LIMIT_LOCAL_LEASE_ENABLED, one EVALSHA per leased batch
+
+For each mode it prints Redis round trips per request, Redis commands executed per
+request (INFO commandstats, including commands run inside scripts) and p50/p99 added
+latency measured from each request's scheduled start.
+
+The plan limit is raised to --limit so requests are admitted; pass a small --limit to
+benchmark the denial path instead.
+
+Usage (from backend/, with Redis on REDIS_HOST:REDIS_PORT):
+    python scripts/benchmark_rate_limiter.py --rps 5000 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from types import SimpleNamespace
+from typing import List
+from uuid import uuid4
+
+from redis.asyncio.client import Pipeline, Redis
+
+from airweave.core.config import settings
+from airweave.core.exceptions import RateLimitExceededException
+from airweave.core.rate_limiter_service import RateLimiter
+from airweave.core.redis_client import redis_client
+from airweave.schemas.organization_billing import BillingPlan
+
+round_trips = 0
+
+
+def count_round_trips() -> None:
+    """Count client round trips: each command or pipeline execution is one."""
+    execute_command = Redis.execute_command
+    execute_pipeline = Pipeline.execute
+
+    async def counted_command(self, *args, **kwargs):
+        global round_trips
+        round_trips += 1
+        return await execute_command(self, *args, **kwargs)
+
+    async def counted_pipeline(self, *args, **kwargs):
+        global round_trips
+        round_trips += 1
+        return await execute_pipeline(self, *args, **kwargs)
+
+    Redis.execute_command = counted_command
+    Pipeline.execute = counted_pipeline
+
+
+async def legacy_check(organization_id, rate_limit: int) -> None:
+    """The previous check-then-add sliding window."""
+    current_time = time.time()
+    window_start = current_time - RateLimiter.WINDOW_SIZE
+    redis_key = RateLimiter._get_redis_key(organization_id)
+    pipe = redis_client.client.pipeline()
+    pipe.zremrangebyscore(redis_key, 0, window_start)
+    pipe.zcount(redis_key, window_start, current_time)
+    results = await pipe.execute()
+    if results[1] >= rate_limit:
+        await redis_client.client.zrange(redis_key, 0, 0, withscores=True)
+        raise RateLimitExceededException(retry_after=1.0, limit=rate_limit, remaining=0)
+    await redis_client.client.zadd(redis_key, {str(current_time): current_time})
+    await redis_client.client.expire(redis_key, RateLimiter.WINDOW_SIZE * 2)
+
+
+async def server_commands() -> int:
+    """Total commands executed by Redis so far."""
+    stats = await redis_client.client.info("commandstats")
+    return sum(value["calls"] for value in stats.values())
+
+
+async def run_mode(mode: str, rps: int, seconds: float, orgs: int) -> None:
+    """Run one mode open-loop and print its numbers."""
+    global round_trips
+    settings.RATE_LIMIT_LOCAL_LEASE_ENABLED = mode == "lease"
+    RateLimiter._leases.clear()
+    contexts = [
+        SimpleNamespace(
+            organization=SimpleNamespace(
+                id=uuid4(),
+                billing=SimpleNamespace(current_period=SimpleNamespace(plan=BillingPlan.TEAM)),
+            ),
+            logger=logging.getLogger("benchmark"),
+        )
+        for _ in range(orgs)
+    ]
+    rate_limit = RateLimiter.PLAN_LIMITS[BillingPlan.TEAM]
+    latencies: List[float] = []
+    denied = 0
+
+    async def one(ctx, scheduled: float) -> None:
+        nonlocal denied
+        try:
+            if mode == "legacy":
+                await legacy_check(ctx.organization.id, rate_limit)
+            else:
+                await RateLimiter.check_rate_limit(ctx)
+        except RateLimitExceededException:
+            denied += 1
+        latencies.append(time.perf_counter() - scheduled)
+
+    total = int(rps * seconds)
+    commands_before = await server_commands()
+    round_trips = 0
+    tasks = []
+    start = time.perf_counter()
+    for i in range(total):
+        scheduled = start + i / rps
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(contexts[i % orgs], scheduled)))
+    await asyncio.gather(*tasks)
+    trips = round_trips
+    commands = await server_commands() - commands_before - 1  # Minus the INFO call
+
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{mode:<7} round_trips/req={trips / total:5.2f} redis_cmds/req={commands / total:5.2f} "
+        f"p50={statistics.median(ordered) * 1000:6.2f}ms p99={p99 * 1000:6.2f}ms "
+        f"denied={denied}"
+    )
+
+
+def main() -> None:
+    """Parse arguments and run every mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rps", type=int, default=5000)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--orgs", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=10_000_000)
+    parser.add_argument("--modes", default="legacy,atomic,lease")
+    args = parser.parse_args()
+
+    settings.DISABLE_RATE_LIMIT = False
+    RateLimiter.PLAN_LIMITS[BillingPlan.TEAM] = args.limit
+    count_round_trips()
+
+    async def run_all() -> None:
+        for mode in args.modes.split(","):
+            await run_mode(mode, args.rps, args.seconds, args.orgs)
+
+    asyncio.run(run_all())
+
+
+if __name__ == "__main__":
+    main()
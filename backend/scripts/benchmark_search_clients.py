@@ -0,0 +1,122 @@
+"""Load test search-path HTTP clients: per-request clients vs the pooled registry.
+
+Starts a local HTTP/1.1 keep-alive server that stands in for Vespa's /search/
+endpoint (or an LLM API). It sleeps --server-latency per request and --connect-delay
+per new connection, which stands in for the TCP+TLS handshake to a remote endpoint.
+Then it runs --requests searches at --concurrency twice:
+
+- per-request: a new httpx.AsyncClient per search (previous behaviour)
+- pooled: one client from SearchClientRegistry shared by all searches
+
+For each mode it prints p50/p99 request latency and how many TCP connections the
+server accepted.
+
+Usage (from backend/):
+    python scripts/benchmark_search_clients.py --requests 2000 --concurrency 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from airweave.search.clients import SearchClientRegistry, pooled_http_client
+
+RESPONSE_BODY = b'{"root": {"fields": {"totalCount": 0}, "children": []}}'
+
+
+class StubServer:
+    """Minimal keep-alive HTTP server that counts accepted connections."""
+
+    def __init__(self, connect_delay: float, latency: float) -> None:
+        """Delay each new connection by connect_delay and each response by latency."""
+        self.connect_delay = connect_delay
+        self.latency = latency
+        self.connections = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until the client closes it."""
+        self.connections += 1
+        await asyncio.sleep(self.connect_delay)
+        try:
+            while True:
+                headers = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in headers.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                await reader.readexactly(length)
+                await asyncio.sleep(self.latency)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(RESPONSE_BODY)}\r\n\r\n".encode()
+                    + RESPONSE_BODY
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run_mode(mode: str, url: str, requests: int, concurrency: int) -> List[float]:
+    """Run all requests in one mode and return per-request latencies in seconds."""
+    registry = SearchClientRegistry(
+        enabled=mode == "pooled", idle_seconds=600.0, health_check_interval_seconds=30.0
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            client = registry.get("vespa", url, lambda: pooled_http_client(timeout=30.0))
+            response = await client.post(f"{url}/search/", json={"yql": "select * from x"})
+            response.raise_for_status()
+            if mode == "per-request":
+                await client.aclose()
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one() for _ in range(requests)))
+    await registry.aclose()
+    return latencies
+
+
+def report(mode: str, latencies: List[float], connections: int) -> None:
+    """Print p50/p99 latency and accepted connections for one mode."""
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{mode:<12} p50={statistics.median(ordered) * 1000:7.1f}ms "
+        f"p99={p99 * 1000:7.1f}ms connections={connections}"
+    )
+
+
+def main() -> None:
+    """Parse arguments, start the stub server and run both modes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--connect-delay", type=float, default=0.02)
+    parser.add_argument("--server-latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    async def run_all() -> None:
+        for mode in ("per-request", "pooled"):
+            stub = StubServer(args.connect_delay, args.server_latency)
+            server = await asyncio.start_server(stub.handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                latencies = await run_mode(
+                    mode, f"http://127.0.0.1:{port}", args.requests, args.concurrency
+                )
+            report(mode, latencies, stub.connections)
+
+    asyncio.run(run_all())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark end-to-end search latency: sequential operations vs the DAG executor.
+
+Builds stand-in operations that carry the real operations' names and depends_on()
+graphs, but whose execute() just sleeps for a latency typical of the LLM, DB or
+vector-store round trip behind it. The same pipeline is run once strictly in
+topological order (the previous orchestrator behaviour) and once through
+SearchOrchestrator, and p50/p99 end-to-end latencies are reported.
+
+Usage (from backend/):
+    python scripts/benchmark_search_orchestrator.py --iterations 50 --jitter 0.2
+
+No external services are required.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+from airweave.search.operations import (
+    AccessControlFilter,
+    EmbedQuery,
+    FederatedSearch,
+    GenerateAnswer,
+    QueryExpansion,
+    QueryInterpretation,
+    Reranking,
+    Retrieval,
+    TemporalRelevance,
+    UserFilter,
+)
+from airweave.search.operations._base import SearchOperation
+from airweave.search.orchestrator import SearchOrchestrator
+from airweave.search.state import SearchState
+
+# Median latency (seconds) of the round trip each operation waits on
+LATENCIES: Dict[type, float] = {
+    AccessControlFilter: 0.030,  # principal resolution (DB)
+    QueryExpansion: 0.600,  # LLM structured output
+    QueryInterpretation: 0.700,  # field discovery + LLM structured output
+    EmbedQuery: 0.150,  # embedding API
+    UserFilter: 0.0,
+    TemporalRelevance: 0.080,  # destination aggregation
+    Retrieval: 0.120,  # vector store query
+    FederatedSearch: 0.400,  # federated source APIs
+    Reranking: 0.500,  # LLM rerank
+    GenerateAnswer: 1.200,  # LLM completion
+}
+
+CONTEXT_FIELDS = {
+    AccessControlFilter: "access_control_filter",
+    QueryExpansion: "query_expansion",
+    QueryInterpretation: "query_interpretation",
+    EmbedQuery: "embed_query",
+    UserFilter: "user_filter",
+    TemporalRelevance: "temporal_relevance",
+    Retrieval: "retrieval",
+    FederatedSearch: "federated_search",
+    Reranking: "reranking",
+    GenerateAnswer: "generate_answer",
+}
+
+
+def _stub_class(real: type) -> type:
+    """Create a sleeping stand-in that shares the real operation's name and dependencies."""
+
+    class Stub(SearchOperation):
+        def __init__(self, latency: float, jitter: float) -> None:
+            self.latency = latency
+            self.jitter = jitter
+
+        def depends_on(self) -> List[str]:
+            return real.depends_on(None)
+
+        async def execute(self, context, state, ctx) -> None:
+            await context.emitter.emit("stub_start", {}, op_name=real.__name__)
+            await asyncio.sleep(self.latency * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    Stub.__name__ = real.__name__
+    Stub.__qualname__ = real.__name__
+    return Stub
+
+
+STUBS = {real: _stub_class(real) for real in LATENCIES}
+
+
+def build_context(jitter: float) -> MagicMock:
+    """Build a search context with every operation enabled."""
+    context = MagicMock()
+    context.request_id = "bench"
+    context.query = "quarterly revenue reports"
+    context.collection_id = "bench-collection"
+    context.emitter = AsyncMock()
+    for real, field in CONTEXT_FIELDS.items():
+        setattr(context, field, STUBS[real](LATENCIES[real], jitter))
+    return context
+
+
+async def run_sequential(orchestrator: SearchOrchestrator, ctx: MagicMock, jitter: float) -> float:
+    """Run the operations one after another in topological order."""
+    context = build_context(jitter)
+    state = SearchState()
+    start = time.perf_counter()
+    for operation in orchestrator._resolve_execution_order(context, ctx):
+        await operation.execute(context, state, ctx)
+    return time.perf_counter() - start
+
+
+async def run_dag(orchestrator: SearchOrchestrator, ctx: MagicMock, jitter: float) -> float:
+    """Run the operations through the orchestrator's DAG executor."""
+    context = build_context(jitter)
+    start = time.perf_counter()
+    await orchestrator.run(ctx, context)
+    return time.perf_counter() - start
+
+
+def report(label: str, samples: List[float]) -> None:
+    """Print p50/p99 latency for a list of samples in seconds."""
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<12} p50={statistics.median(ordered) * 1000:8.1f}ms "
+        f"p99={p99 * 1000:8.1f}ms (n={len(ordered)})"
+    )
+
+
+def main() -> None:
+    """Parse arguments and run both modes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--jitter", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    orchestrator = SearchOrchestrator()
+    ctx = MagicMock()
+
+    async def run_all() -> None:
+        sequential = [
+            await run_sequential(orchestrator, ctx, args.jitter) for _ in range(args.iterations)
+        ]
+        dag = [await run_dag(orchestrator, ctx, args.jitter) for _ in range(args.iterations)]
+        report("sequential", sequential)
+        report("dag", dag)
+        speedup = statistics.median(sequential) / statistics.median(dag)
+        print(f"p50 speedup: {speedup:.2f}x")
+
+    asyncio.run(run_all())
+
+
+if __name__ == "__main__":
+    main()
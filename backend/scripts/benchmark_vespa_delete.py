@@ -0,0 +1,118 @@
+"""Benchmark Vespa parent/chunk deletes against a local Vespa container.
+
+Feeds --parents parent entities with --chunks chunk documents each into base_entity
+(under a throwaway collection ID), deletes them, and repeats for each mode:
+
+- sequential: one selection delete per 50-ID batch and schema, awaited one by one,
+  each on its own HTTP client (previous behaviour of delete_by_parent_ids)
+- concurrent: VespaClient.delete_by_parent_ids (concurrent selections, shared client)
+- by-id: VespaClient.delete_by_document_ids with IDs derived from the parent entity
+  IDs and chunk indices (document/v1 removes, no visitor scan)
+
+For each mode it prints wall time, documents deleted and the deletes per second.
+
+Usage (from backend/, with Vespa on VESPA_URL:VESPA_PORT and the app deployed):
+    python scripts/benchmark_vespa_delete.py --parents 500 --chunks 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+from uuid import UUID, uuid4
+
+from airweave.platform.destinations.vespa.client import VespaClient
+from airweave.platform.destinations.vespa.config import ALL_VESPA_SCHEMAS, DELETE_BATCH_SIZE
+from airweave.platform.destinations.vespa.types import VespaDocument
+
+ENTITY_TYPE = "BenchmarkEntity"
+
+
+def build_documents(parent_ids: List[str], chunks: int, collection_id: UUID) -> List[VespaDocument]:
+    """Chunk documents shaped like EntityTransformer output (without embeddings)."""
+    docs = []
+    for parent_id in parent_ids:
+        for idx in range(chunks):
+            entity_id = f"{parent_id}__chunk_{idx}"
+            docs.append(
+                VespaDocument(
+                    schema="base_entity",
+                    id=f"{ENTITY_TYPE}_{entity_id}",
+                    fields={
+                        "entity_id": entity_id,
+                        "name": entity_id,
+                        "textual_representation": f"benchmark chunk {idx} of {parent_id}",
+                        "airweave_system_metadata_collection_id": str(collection_id),
+                        "airweave_system_metadata_entity_type": ENTITY_TYPE,
+                        "airweave_system_metadata_original_entity_id": parent_id,
+                        "airweave_system_metadata_chunk_index": idx,
+                    },
+                )
+            )
+    return docs
+
+
+async def sequential_delete(client: VespaClient, parent_ids: List[str], collection_id: UUID):
+    """The previous delete_by_parent_ids: every selection awaited in turn."""
+    deleted = 0
+    for i in range(0, len(parent_ids), DELETE_BATCH_SIZE):
+        batch = parent_ids[i : i + DELETE_BATCH_SIZE]
+        for schema in ALL_VESPA_SCHEMAS:
+            conditions = " or ".join(
+                f"{schema}.airweave_system_metadata_original_entity_id=='{pid}'" for pid in batch
+            )
+            selection = (
+                f"({conditions}) and "
+                f"{schema}.airweave_system_metadata_collection_id=='{collection_id}'"
+            )
+            deleted += (await client.delete_by_selection(schema, selection)).deleted_count
+    return deleted
+
+
+async def run_mode(mode: str, client: VespaClient, parents: int, chunks: int) -> None:
+    """Feed a fresh set of documents, delete them with `mode` and print the numbers."""
+    collection_id = uuid4()
+    parent_ids = [f"bench-{uuid4().hex[:12]}" for _ in range(parents)]
+    docs = build_documents(parent_ids, chunks, collection_id)
+    feed = await client.feed_documents({"base_entity": docs})
+    if feed.failed_docs:
+        raise RuntimeError(f"Feeding failed for {len(feed.failed_docs)} documents")
+
+    start = time.perf_counter()
+    if mode == "sequential":
+        deleted = await sequential_delete(client, parent_ids, collection_id)
+    elif mode == "concurrent":
+        results = await client.delete_by_parent_ids(parent_ids, collection_id)
+        deleted = sum(r.deleted_count for r in results)
+    else:
+        doc_ids: Dict[str, List[str]] = {"base_entity": [doc.id for doc in docs]}
+        results = await client.delete_by_document_ids(doc_ids, collection_id)
+        deleted = sum(r.deleted_count for r in results)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{mode:<10} {elapsed * 1000:9.1f}ms deleted={deleted}/{len(docs)} "
+        f"({len(docs) / elapsed:8.0f} docs/s)"
+    )
+
+
+def main() -> None:
+    """Parse arguments and run every mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--parents", type=int, default=500)
+    parser.add_argument("--chunks", type=int, default=4)
+    parser.add_argument("--modes", default="sequential,concurrent,by-id")
+    args = parser.parse_args()
+
+    async def run_all() -> None:
+        client = await VespaClient.connect()
+        for mode in args.modes.split(","):
+            await run_mode(mode, client, args.parents, args.chunks)
+
+    asyncio.run(run_all())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark Vespa feed throughput against a local Vespa container.
+
+Runs --batches concurrent VespaClient.feed_documents calls of --docs documents each
+(like concurrent sync workers on one pod), in each mode:
+
+- pyvespa: feed_iterable in a thread per call, each with its own connection pool
+  (VESPA_ASYNC_FEED_ENABLED off)
+- asyncio: the pod's shared VespaFeeder (VESPA_ASYNC_FEED_ENABLED on)
+
+Documents are written under a throwaway collection ID and deleted afterwards. For each
+mode it prints wall time, documents fed per second, retried and failed documents.
+
+Usage (from backend/, with Vespa on VESPA_URL:VESPA_PORT and the app deployed):
+    python scripts/benchmark_vespa_feed.py --batches 8 --docs 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import List
+from uuid import UUID, uuid4
+
+from airweave.core.config import settings
+from airweave.platform.destinations.vespa.client import VespaClient
+from airweave.platform.destinations.vespa.feeder import vespa_feeder
+from airweave.platform.destinations.vespa.types import VespaDocument
+
+ENTITY_TYPE = "BenchmarkEntity"
+
+
+def build_documents(docs: int, collection_id: UUID) -> List[VespaDocument]:
+    """Chunk documents shaped like EntityTransformer output (without embeddings)."""
+    documents = []
+    for _ in range(docs):
+        entity_id = f"bench-{uuid4().hex[:12]}__chunk_0"
+        documents.append(
+            VespaDocument(
+                schema="base_entity",
+                id=f"{ENTITY_TYPE}_{entity_id}",
+                fields={
+                    "entity_id": entity_id,
+                    "name": entity_id,
+                    "textual_representation": f"benchmark document {entity_id} " * 20,
+                    "airweave_system_metadata_collection_id": str(collection_id),
+                    "airweave_system_metadata_entity_type": ENTITY_TYPE,
+                    "airweave_system_metadata_chunk_index": 0,
+                },
+            )
+        )
+    return documents
+
+
+async def run_mode(mode: str, client: VespaClient, batches: int, docs: int) -> None:
+    """Feed `batches` concurrent batches with `mode` and print the numbers."""
+    settings.VESPA_ASYNC_FEED_ENABLED = mode == "asyncio"
+    collection_id = uuid4()
+    payloads = [{"base_entity": build_documents(docs, collection_id)} for _ in range(batches)]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client.feed_documents(p) for p in payloads))
+    elapsed = time.perf_counter() - start
+
+    total = batches * docs
+    fed = sum(r.success_count for r in results)
+    failed = sum(len(r.failed_docs) for r in results)
+    retried = sum(1 for r in results for d in r.documents if d.attempts > 1)
+    print(
+        f"{mode:<8} {elapsed * 1000:9.1f}ms fed={fed}/{total} ({total / elapsed:8.0f} docs/s) "
+        f"retried={retried} failed={failed}"
+    )
+
+    await client.delete_by_collection_id(collection_id)
+
+
+def main() -> None:
+    """Parse arguments and run every mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batches", type=int, default=8)
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--modes", default="pyvespa,asyncio")
+    args = parser.parse_args()
+
+    async def run_all() -> None:
+        client = await VespaClient.connect()
+        for mode in args.modes.split(","):
+            await run_mode(mode, client, args.batches, args.docs)
+        await vespa_feeder.aclose()
+
+    asyncio.run(run_all())
+
+
+if __name__ == "__main__":
+    main()
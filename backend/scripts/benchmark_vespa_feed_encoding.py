@@ -0,0 +1,98 @@
+"""Benchmark the size and encoding cost of embedding fields in the Vespa feed.
+
+Builds --docs chunk documents with a --dim dense embedding and --tokens sparse
+tokens, then encodes their embedding fields the way the feed does (fields built by
+EntityTransformer, serialized with json.dumps) in two formats:
+
+- list: dense embedding as a JSON list of floats, sparse embedding as one
+  {"address": {"token": ...}, "value": ...} object per cell (previous format)
+- hex: dense embedding as a hex string in the field's cell type, sparse embedding as
+  label -> value cells (current format, see DENSE_EMBEDDING_CELL_TYPE)
+
+For each format it prints JSON bytes per document and documents encoded per second.
+No Vespa instance is needed.
+
+Usage (from backend/):
+    python scripts/benchmark_vespa_feed_encoding.py --docs 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from airweave.platform.destinations.vespa.config import VESPA_EMBEDDING_DIM
+from airweave.platform.destinations.vespa.transformer import EntityTransformer
+
+
+def build_entities(docs: int, dim: int, tokens: int) -> List[Any]:
+    """Chunk-like objects carrying the embeddings ChunkEmbedProcessor attaches."""
+    rng = np.random.default_rng(0)
+    entities = []
+    for i in range(docs):
+        dense = rng.standard_normal(dim).astype(np.float32)
+        dense /= np.linalg.norm(dense)
+        sparse = SimpleNamespace(
+            indices=np.sort(rng.choice(2**31 - 1, size=tokens, replace=False)),
+            values=rng.random(tokens).astype(np.float32),
+        )
+        meta = SimpleNamespace(dense_embedding=dense.tolist(), sparse_embedding=sparse)
+        entities.append(
+            SimpleNamespace(entity_id=f"doc-{i}__chunk_0", airweave_system_metadata=meta)
+        )
+    return entities
+
+
+def list_fields(entity: Any) -> Dict[str, Any]:
+    """The previous embedding fields: float list and one object per sparse cell."""
+    meta = entity.airweave_system_metadata
+    sparse = meta.sparse_embedding
+    return {
+        "dense_embedding": {"values": meta.dense_embedding},
+        "sparse_embedding": {
+            "cells": [
+                {"address": {"token": str(idx)}, "value": float(val)}
+                for idx, val in zip(sparse.indices.tolist(), sparse.values.tolist(), strict=True)
+            ]
+        },
+    }
+
+
+def run_format(name: str, build: Callable[[Any], Dict[str, Any]], entities: List[Any]) -> None:
+    """Encode every entity's embedding fields and print size and throughput."""
+    start = time.perf_counter()
+    total_bytes = sum(len(json.dumps(build(entity)).encode()) for entity in entities)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<5} {total_bytes / len(entities):10.0f} bytes/doc "
+        f"{len(entities) / elapsed:10.0f} docs/s"
+    )
+
+
+def main() -> None:
+    """Parse arguments and compare both formats."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--dim", type=int, default=VESPA_EMBEDDING_DIM)
+    parser.add_argument("--tokens", type=int, default=150)
+    args = parser.parse_args()
+
+    entities = build_entities(args.docs, args.dim, args.tokens)
+    transformer = EntityTransformer()
+
+    def hex_fields(entity: Any) -> Dict[str, Any]:
+        fields: Dict[str, Any] = {}
+        transformer._add_embedding_fields(fields, entity)
+        return fields
+
+    run_format("list", list_fields, entities)
+    run_format("hex", hex_fields, entities)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Unit tests for the in-process LRU cache with TTL and pubsub invalidation."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.core.local_cache import LocalCache, close_local_caches
+
+MONOTONIC = "airweave.core.local_cache.time.monotonic"
+PUBSUB = "airweave.core.pubsub.core_pubsub"
+
+
+class _Subscription:
+    """PubSub stand-in yielding the given messages, then raising error or waiting forever."""
+
+    def __init__(self, messages, error=None):
+        self.messages = messages
+        self.error = error
+        self.unsubscribe = AsyncMock()
+        self.close = AsyncMock()
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+        if self.error is not None:
+            raise self.error
+        await asyncio.Event().wait()
+
+
+class TestLocalCache:
+    """Tests for LRU eviction, size bounds and expiry."""
+
+    def test_evicts_least_recently_used(self):
+        """The oldest untouched entry goes first once max_entries is exceeded."""
+        cache = LocalCache("test", max_entries=2, ttl_seconds=None)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert [cache.get(k) for k in ("a", "b", "c")] == ["1", None, "3"]
+
+    def test_evicts_by_size(self):
+        """Values are evicted past max_bytes, and a value larger than it is not cached."""
+        cache = LocalCache("test", max_entries=100, ttl_seconds=None, max_bytes=10)
+        cache.set("a", "x" * 6)
+        cache.set("b", "y" * 6)
+        cache.set("c", "z" * 11)
+
+        assert len(cache) == 1
+        assert cache.size_bytes == 6
+        assert cache.get("b") == "y" * 6
+
+    def test_entries_expire(self):
+        """Entries past their TTL are misses and dropped."""
+        cache = LocalCache("test", max_entries=10, ttl_seconds=60)
+        with patch(MONOTONIC, return_value=0.0):
+            cache.set("a", "1")
+        with patch(MONOTONIC, return_value=59.0):
+            assert cache.get("a") == "1"
+        with patch(MONOTONIC, return_value=61.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_drop_where(self):
+        """Only entries whose key matches are dropped."""
+        cache = LocalCache("test", max_entries=10, ttl_seconds=None)
+        cache.set(("org-a", "x"), 1)
+        cache.set(("org-b", "x"), 2)
+
+        cache.drop_where(lambda key: key[0] == "org-a")
+
+        assert cache.get(("org-a", "x")) is None
+        assert cache.get(("org-b", "x")) == 2
+
+
+class TestInvalidation:
+    """Tests for broadcasting, listening and shutting the listener down."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_publishes_on_the_namespace(self):
+        """Invalidations are published for every pod; caches without a namespace don't."""
+        cache = LocalCache("test", 10, None, invalidation_namespace="things")
+        local = LocalCache("test", 10, None)
+
+        with patch(PUBSUB) as pubsub:
+            pubsub.publish = AsyncMock()
+            await cache.broadcast({"id": "a"})
+            await local.broadcast({"id": "b"})
+
+        pubsub.publish.assert_awaited_once_with("things", "invalidations", {"id": "a"})
+
+    @pytest.mark.asyncio
+    async def test_listener_applies_invalidations_until_closed(self):
+        """The first lookup starts the listener; close_local_caches() cancels it."""
+        on_invalidation = MagicMock()
+        cache = LocalCache(
+            "test", 10, None, invalidation_namespace="things", on_invalidation=on_invalidation
+        )
+        messages = [
+            {"type": "subscribe", "data": 1},
+            {"type": "message", "data": json.dumps({"id": "a"})},
+        ]
+
+        subscription = _Subscription(messages)
+
+        with patch(PUBSUB) as pubsub:
+            pubsub.subscribe = AsyncMock(return_value=subscription)
+            cache.get("a")
+            listener = cache._listener
+            await asyncio.sleep(0.01)
+
+            await close_local_caches()
+
+        on_invalidation.assert_called_once_with({"id": "a"})
+        assert listener.cancelled()
+        assert cache._listener is None
+        subscription.unsubscribe.assert_awaited_once()
+        subscription.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_listener_releases_its_subscription(self):
+        """A listener that dies closes its subscription; the next lookup resubscribes."""
+        cache = LocalCache("test", 10, None, invalidation_namespace="things")
+        failed = _Subscription([], error=ConnectionError("redis went away"))
+
+        with patch(PUBSUB) as pubsub:
+            pubsub.subscribe = AsyncMock(side_effect=[failed, _Subscription([])])
+            cache.get("a")
+            await asyncio.sleep(0.01)
+
+            failed.unsubscribe.assert_awaited_once()
+            failed.close.assert_awaited_once()
+            assert cache._listener.done()
+
+            cache.get("a")
+            await asyncio.sleep(0.01)
+            assert pubsub.subscribe.await_count == 2
+            await cache.aclose()
@@ -1,6 +1,7 @@
 """Tests for rate limiter service.
 
-Tests the minute-based rate limiting system with Redis-backed sliding window.
+Tests the minute-based rate limiting system with Redis-backed sliding window,
+checked and recorded in one atomic Lua call.
 
 Rate limits:
 - Developer: 10 requests/minute
@@ -14,9 +15,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from redis.exceptions import NoScriptError
 
 from airweave.core.exceptions import RateLimitExceededException
-from airweave.core.rate_limiter_service import RateLimiter
+from airweave.core.rate_limiter_service import RateLimiter, _Lease
 from airweave.schemas.organization_billing import BillingPlan
 from airweave.schemas.rate_limit import RateLimitResult
 
@@ -42,6 +44,9 @@ def mock_settings():
     """Mock settings to enable rate limiting."""
     with patch("airweave.core.rate_limiter_service.settings") as mock:
         mock.DISABLE_RATE_LIMIT = False
+        mock.RATE_LIMIT_LOCAL_LEASE_ENABLED = False
+        mock.RATE_LIMIT_LEASE_SIZE = 10
+        mock.RATE_LIMIT_LEASE_TTL_SECONDS = 1.0
         yield mock
 
 
@@ -49,16 +54,32 @@ def mock_settings():
 def mock_redis():
     """Mock Redis client."""
     with patch("airweave.core.rate_limiter_service.redis_client") as mock:
-        # Setup mock pipeline
-        mock_pipeline = AsyncMock()
-        mock_pipeline.execute = AsyncMock(return_value=[None, 0])  # zremrangebyscore, zcount
-        mock.client.pipeline.return_value = mock_pipeline
-        mock.client.zrange = AsyncMock(return_value=[])
-        mock.client.zadd = AsyncMock(return_value=1)
-        mock.client.expire = AsyncMock(return_value=True)
+        # Lua script result: [granted, count_in_window, retry_after]
+        mock.client.evalsha = AsyncMock(return_value=[1, 1, "0"])
+        mock.client.eval = AsyncMock(return_value=[1, 1, "0"])
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def clear_leases():
+    """Reset per-process leases between tests."""
+    RateLimiter._leases.clear()
+    RateLimiter._lease_locks.clear()
+    RateLimiter._next_lease_sweep = 0.0
+    yield
+    RateLimiter._leases.clear()
+    RateLimiter._lease_locks.clear()
+    RateLimiter._next_lease_sweep = 0.0
+
+
+def _set_plan(mock_ctx, plan):
+    mock_billing = MagicMock()
+    mock_period = MagicMock()
+    mock_period.plan = plan
+    mock_billing.current_period = mock_period
+    mock_ctx.organization.billing = mock_billing
+
+
 @pytest.mark.asyncio
 async def test_rate_limiter_allows_request_under_limit(
     mock_ctx, mock_settings, mock_redis
@@ -71,8 +92,8 @@ async def test_rate_limiter_allows_request_under_limit(
     mock_billing.current_period = mock_period
     mock_ctx.organization.billing = mock_billing
 
-    # Current count is 50, limit is 100
-    mock_redis.client.pipeline().execute = AsyncMock(return_value=[None, 50])
+    # Current count is 50, limit is 100; this request makes it 51
+    mock_redis.client.evalsha = AsyncMock(return_value=[1, 51, "0"])
 
     result = await RateLimiter.check_rate_limit(ctx=mock_ctx)
 
@@ -95,15 +116,14 @@ async def test_rate_limiter_blocks_request_over_limit(
     mock_ctx.organization.billing = mock_billing
 
     # Current count is 10, limit is 10 (at limit)
-    mock_redis.client.pipeline().execute = AsyncMock(return_value=[None, 10])
-    mock_redis.client.zrange = AsyncMock(return_value=[(b"1234567890.0", 1234567890.0)])
+    mock_redis.client.evalsha = AsyncMock(return_value=[0, 10, "42.5"])
 
     with pytest.raises(RateLimitExceededException) as exc_info:
         await RateLimiter.check_rate_limit(ctx=mock_ctx)
 
     assert exc_info.value.limit == 10
     assert exc_info.value.remaining == 0
-    assert exc_info.value.retry_after > 0
+    assert exc_info.value.retry_after == 42.5
 
 
 @pytest.mark.asyncio
@@ -133,7 +153,7 @@ async def test_rate_limiter_legacy_org_without_billing(
     """Test that legacy organizations without billing get Pro tier limits."""
     # No billing record - ctx.organization.billing is None (set in fixture)
     # Current count is 5
-    mock_redis.client.pipeline().execute = AsyncMock(return_value=[None, 5])
+    mock_redis.client.evalsha = AsyncMock(return_value=[1, 6, "0"])
 
     result = await RateLimiter.check_rate_limit(ctx=mock_ctx)
 
@@ -156,12 +176,12 @@ async def test_rate_limiter_concurrent_requests(
     # Simulate increasing count for each call
     call_count = 0
 
-    def mock_execute():
+    async def mock_evalsha(*args):
         nonlocal call_count
         call_count += 1
-        return AsyncMock(return_value=[None, call_count])()
+        return [1, call_count, "0"]
 
-    mock_redis.client.pipeline().execute = mock_execute
+    mock_redis.client.evalsha = mock_evalsha
 
     # Make 5 concurrent requests
     tasks = [RateLimiter.check_rate_limit(ctx=mock_ctx) for _ in range(5)]
@@ -190,3 +210,123 @@ async def test_rate_limiter_redis_key_format(organization_id):
 
     expected_key = f"rate_limit:org:{organization_id}"
     assert key == expected_key
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_single_atomic_call(mock_ctx, mock_settings, mock_redis):
+    """Test that each check is one script call recording exactly one request."""
+    _set_plan(mock_ctx, BillingPlan.PRO)
+
+    await RateLimiter.check_rate_limit(ctx=mock_ctx)
+
+    mock_redis.client.evalsha.assert_awaited_once()
+    args = mock_redis.client.evalsha.await_args.args
+    assert args[0] == RateLimiter.LUA_ACQUIRE_SHA
+    assert args[2] == f"rate_limit:org:{mock_ctx.organization.id}"
+    assert args[3:6] == (100, RateLimiter.WINDOW_SIZE, 1)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_loads_script_when_missing(mock_ctx, mock_settings, mock_redis):
+    """Test that the script is sent with EVAL when Redis does not have it cached."""
+    _set_plan(mock_ctx, BillingPlan.PRO)
+    mock_redis.client.evalsha = AsyncMock(side_effect=NoScriptError("NOSCRIPT"))
+    mock_redis.client.eval = AsyncMock(return_value=[1, 3, "0"])
+
+    result = await RateLimiter.check_rate_limit(ctx=mock_ctx)
+
+    mock_redis.client.eval.assert_awaited_once()
+    assert result.remaining == 97
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_lease_serves_from_memory(mock_ctx, mock_settings, mock_redis):
+    """Test that a leased batch admits requests without further Redis calls."""
+    mock_settings.RATE_LIMIT_LOCAL_LEASE_ENABLED = True
+    _set_plan(mock_ctx, BillingPlan.TEAM)  # 250 req/min, lease of 10
+    mock_redis.client.evalsha = AsyncMock(return_value=[10, 10, "0"])
+
+    results = [await RateLimiter.check_rate_limit(ctx=mock_ctx) for _ in range(10)]
+
+    mock_redis.client.evalsha.assert_awaited_once()
+    assert mock_redis.client.evalsha.await_args.args[5] == 10
+    assert all(result.allowed for result in results)
+
+    await RateLimiter.check_rate_limit(ctx=mock_ctx)
+    assert mock_redis.client.evalsha.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_concurrent_lease_refill_is_single_flight(
+    mock_ctx, mock_settings, mock_redis
+):
+    """Test that concurrent requests share one lease refill."""
+    mock_settings.RATE_LIMIT_LOCAL_LEASE_ENABLED = True
+    _set_plan(mock_ctx, BillingPlan.TEAM)
+    mock_redis.client.evalsha = AsyncMock(return_value=[10, 10, "0"])
+
+    await asyncio.gather(*(RateLimiter.check_rate_limit(ctx=mock_ctx) for _ in range(5)))
+
+    mock_redis.client.evalsha.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_lease_remembers_denial(mock_ctx, mock_settings, mock_redis):
+    """Test that a denied lease refill short-circuits until retry_after."""
+    mock_settings.RATE_LIMIT_LOCAL_LEASE_ENABLED = True
+    _set_plan(mock_ctx, BillingPlan.TEAM)
+    mock_redis.client.evalsha = AsyncMock(return_value=[0, 250, "30.0"])
+
+    for _ in range(3):
+        with pytest.raises(RateLimitExceededException):
+            await RateLimiter.check_rate_limit(ctx=mock_ctx)
+
+    mock_redis.client.evalsha.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_small_limits_are_not_leased(mock_ctx, mock_settings, mock_redis):
+    """Test that leasing is skipped when a batch would be a large share of the limit."""
+    mock_settings.RATE_LIMIT_LOCAL_LEASE_ENABLED = True
+    _set_plan(mock_ctx, BillingPlan.DEVELOPER)  # 10 req/min
+
+    await RateLimiter.check_rate_limit(ctx=mock_ctx)
+
+    assert mock_redis.client.evalsha.await_args.args[5] == 1
+    assert not RateLimiter._leases
+
+
+def test_lease_expires():
+    """Test that leased requests cannot be used after the lease TTL."""
+    lease = _Lease(tokens=5, expires_at=10.0, remaining=100)
+
+    assert lease.take(now=9.0) is True
+    assert lease.take(now=10.0) is False
+    assert lease.tokens == 4
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_evicts_expired_leases(mock_ctx, mock_settings, mock_redis):
+    """Test that a refill drops other organizations' expired leases and idle locks."""
+    mock_settings.RATE_LIMIT_LOCAL_LEASE_ENABLED = True
+    _set_plan(mock_ctx, BillingPlan.TEAM)
+    mock_redis.client.evalsha = AsyncMock(return_value=[10, 10, "0"])
+    stale_org, denied_org = uuid4(), uuid4()
+    RateLimiter._leases[stale_org] = _Lease(tokens=3, expires_at=0.0, remaining=10)
+    RateLimiter._lease_locks[stale_org] = asyncio.Lock()
+    RateLimiter._leases[denied_org] = _Lease(
+        tokens=0, expires_at=0.0, remaining=0, denied_until=float("inf")
+    )
+
+    await RateLimiter.check_rate_limit(ctx=mock_ctx)
+
+    assert set(RateLimiter._leases) == {mock_ctx.organization.id, denied_org}
+    assert set(RateLimiter._lease_locks) == {mock_ctx.organization.id}
+
+
+def test_lease_expired_only_after_denial_ends():
+    """Test that a remembered denial keeps the lease alive until retry_after."""
+    lease = _Lease(tokens=0, expires_at=10.0, remaining=0, denied_until=20.0)
+
+    assert lease.expired(now=15.0) is False
+    assert lease.expired(now=20.0) is True
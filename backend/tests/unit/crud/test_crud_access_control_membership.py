@@ -0,0 +1,124 @@
+"""Tests for access control group closure CRUD.
+
+Validates that:
+1. Group expansion is one statement: direct groups UNION their closure ancestors
+2. Collection scoping only applies to direct memberships
+3. Rebuilding the closure replaces the organization's rows in one transaction, from
+   the group tuples of all its source connections
+4. Deleting a source connection's memberships rebuilds the closure with them
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from airweave.crud.crud_access_control_membership import (
+    _LOCK_GROUP_CLOSURE_SQL,
+    _REBUILD_GROUP_CLOSURE_SQL,
+    access_control_membership,
+)
+
+
+def _make_db(rows=None, rowcount=0):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows or []
+    result.rowcount = rowcount
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+    return db
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestGetExpandedGroupIds:
+    """Test single-query group expansion."""
+
+    @pytest.mark.asyncio
+    async def test_single_statement_unions_direct_and_ancestor_groups(self):
+        """One execute: direct memberships CTE joined to the closure table."""
+        db = _make_db(rows=["frontend", "engineering"])
+
+        groups = await access_control_membership.get_expanded_group_ids(
+            db, member_id="john@acme.com", member_type="user", organization_id=uuid4()
+        )
+
+        assert groups == ["frontend", "engineering"]
+        db.execute.assert_awaited_once()
+        sql = _sql(db.execute.await_args.args[0])
+        assert "WITH direct_groups AS" in sql
+        assert "UNION" in sql
+        assert "access_control_group_closure" in sql
+        assert "source_connection" not in sql
+
+    @pytest.mark.asyncio
+    async def test_collection_scope_applies_to_direct_memberships(self):
+        """Scoped expansion joins source_connection inside the direct-groups CTE."""
+        db = _make_db()
+
+        await access_control_membership.get_expanded_group_ids(
+            db,
+            member_id="john@acme.com",
+            member_type="user",
+            organization_id=uuid4(),
+            readable_collection_id="my-collection",
+        )
+
+        sql = _sql(db.execute.await_args.args[0])
+        cte, ancestors = sql.split("UNION")
+        assert "readable_collection_id" in cte
+        assert "readable_collection_id" not in ancestors
+
+
+class TestRebuildGroupClosure:
+    """Test closure maintenance."""
+
+    @pytest.mark.asyncio
+    async def test_replaces_organization_rows(self):
+        """Under the rebuild lock, old rows are deleted and the CTE reinserts, one commit."""
+        db = _make_db(rowcount=7)
+        organization_id = uuid4()
+
+        count = await access_control_membership.rebuild_group_closure(
+            db, organization_id=organization_id
+        )
+
+        lock_call, delete_call, insert_call = db.execute.await_args_list
+        assert lock_call.args[0] is _LOCK_GROUP_CLOSURE_SQL
+        assert lock_call.args[1] == {"organization_id": str(organization_id)}
+        delete_sql = _sql(delete_call.args[0])
+        assert delete_sql.startswith("DELETE FROM access_control_group_closure")
+        assert "source_connection_id" not in delete_sql
+        assert insert_call.args[0] is _REBUILD_GROUP_CLOSURE_SQL
+        assert insert_call.args[1] == {"organization_id": organization_id}
+        db.commit.assert_awaited_once()
+        assert count == 7
+
+    def test_closure_follows_group_tuples_of_all_source_connections(self):
+        """Nestings synced by different source connections chain into one closure."""
+        edges_cte = _REBUILD_GROUP_CLOSURE_SQL.text.split("closure (")[0]
+
+        assert "organization_id = :organization_id" in edges_cte
+        assert "source_connection_id" not in _REBUILD_GROUP_CLOSURE_SQL.text
+
+    @pytest.mark.asyncio
+    async def test_deleting_source_connection_memberships_rebuilds_closure(self):
+        """Memberships and the rebuilt closure commit together."""
+        db = _make_db(rowcount=3)
+        organization_id = uuid4()
+
+        count = await access_control_membership.delete_by_source_connection(
+            db, source_connection_id=uuid4(), organization_id=organization_id
+        )
+
+        delete_memberships, lock_call, delete_closure, insert_call = db.execute.await_args_list
+        assert _sql(delete_memberships.args[0]).startswith("DELETE FROM access_control_membership")
+        assert lock_call.args[0] is _LOCK_GROUP_CLOSURE_SQL
+        assert _sql(delete_closure.args[0]).startswith("DELETE FROM access_control_group_closure")
+        assert insert_call.args[0] is _REBUILD_GROUP_CLOSURE_SQL
+        db.commit.assert_awaited_once()
+        assert count == 3
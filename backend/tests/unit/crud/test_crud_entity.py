@@ -0,0 +1,129 @@
+"""Tests for set-based entity writes.
+
+Validates that:
+1. bulk_upsert sends chunked multi-row upserts without RETURNING
+2. bulk_create still hydrates and returns the upserted rows
+3. bulk_update_hash sends one UPDATE ... FROM unnest(...) per chunk
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from airweave.crud.crud_entity import entity as crud_entity
+from airweave.schemas.entity import EntityCreate
+
+
+def _make_objs(count):
+    sync_id, job_id, definition_id = uuid4(), uuid4(), uuid4()
+    return [
+        EntityCreate(
+            sync_job_id=job_id,
+            sync_id=sync_id,
+            entity_id=f"e-{i}",
+            entity_definition_id=definition_id,
+            hash=f"h-{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def _make_db(rowcount=0, rows=None):
+    result = MagicMock()
+    result.rowcount = rowcount
+    result.scalars.return_value.all.return_value = rows or []
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    db.flush = AsyncMock()
+    return db
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestBulkUpsert:
+    """Test chunked upserts."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_rows_and_skips_returning(self):
+        """Rows are split per statement and the count is summed from rowcount."""
+        db = _make_db(rowcount=2)
+        ctx = SimpleNamespace(organization_id=uuid4())
+
+        count = await crud_entity.bulk_upsert(db, objs=_make_objs(5), ctx=ctx, rows_per_statement=2)
+
+        statements = [call.args[0] for call in db.execute.await_args_list]
+        assert [len(s._multi_values[0]) for s in statements] == [2, 2, 1]
+        assert all("RETURNING" not in _sql(s) for s in statements)
+        assert "ON CONFLICT" in _sql(statements[0])
+        assert count == 6
+        db.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_returns_hydrated_rows(self):
+        """bulk_create keeps RETURNING and adds the rows to the session."""
+        rows = [MagicMock(), MagicMock()]
+        db = _make_db(rows=rows)
+        ctx = SimpleNamespace(organization_id=uuid4())
+
+        entities = await crud_entity.bulk_create(
+            db, objs=_make_objs(3), ctx=ctx, rows_per_statement=2
+        )
+
+        assert db.execute.await_count == 2
+        assert "RETURNING" in _sql(db.execute.await_args.args[0])
+        assert entities == rows * 2
+        db.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_definition_raises(self):
+        """Rows without an entity definition are rejected before any statement."""
+        db = _make_db()
+        objs = _make_objs(1)
+        objs[0].entity_definition_id = None
+
+        with pytest.raises(ValueError, match="missing entity_definition_id"):
+            await crud_entity.bulk_upsert(
+                db, objs=objs, ctx=SimpleNamespace(organization_id=uuid4())
+            )
+        db.execute.assert_not_called()
+
+
+class TestBulkUpdateHash:
+    """Test set-based hash updates."""
+
+    @pytest.mark.asyncio
+    async def test_one_statement_per_chunk_with_parallel_arrays(self):
+        """Hashes and chunk hashes travel as arrays; only mapped rows replace chunk_hashes."""
+        ids = [uuid4() for _ in range(3)]
+        db = _make_db()
+
+        await crud_entity.bulk_update_hash(
+            db,
+            rows=[(ids[0], "h0"), (ids[1], "h1"), (ids[2], "h2")],
+            chunk_hashes={ids[0]: ["a", "b"], ids[1]: None},
+            rows_per_statement=2,
+        )
+
+        assert db.execute.await_count == 2
+        first, second = (call.args[1] for call in db.execute.await_args_list)
+        assert "unnest" in str(db.execute.await_args.args[0])
+        assert first["ids"] == ids[:2]
+        assert first["hashes"] == ["h0", "h1"]
+        assert first["chunk_hashes"] == [json.dumps(["a", "b"]), None]
+        assert first["set_chunk_hashes"] == [True, True]
+        assert second["set_chunk_hashes"] == [False]
+
+    @pytest.mark.asyncio
+    async def test_empty_rows_is_noop(self):
+        """No rows, no statement."""
+        db = _make_db()
+
+        await crud_entity.bulk_update_hash(db, rows=[])
+
+        db.execute.assert_not_called()
@@ -36,7 +36,7 @@ class TestAccessBrokerBasicResolution:
     ):
         """Test resolution for user with no group memberships."""
         with patch("airweave.platform.access_control.broker.crud") as mock_crud:
-            mock_crud.access_control_membership.get_by_member = AsyncMock(return_value=[])
+            mock_crud.access_control_membership.get_expanded_group_ids = AsyncMock(return_value=[])
 
             result = await broker.resolve_access_context(
                 db=mock_db, user_principal="john@acme.com", organization_id=organization_id
@@ -54,16 +54,9 @@ class TestAccessBrokerBasicResolution:
     ):
         """Test resolution for user with direct group memberships."""
         with patch("airweave.platform.access_control.broker.crud") as mock_crud:
-            # Mock membership data
-            membership1 = MagicMock()
-            membership1.group_id = "sp:engineering"
-            membership1.group_name = "Engineering"
-
-            membership2 = MagicMock()
-            membership2.group_id = "ad:frontend"
-            membership2.group_name = "Frontend Team"
-
-            mock_crud.access_control_membership.get_by_member = AsyncMock(return_value=[membership1, membership2])
+            mock_crud.access_control_membership.get_expanded_group_ids = AsyncMock(
+                return_value=["sp:engineering", "ad:frontend"]
+            )
 
             result = await broker.resolve_access_context(
                 db=mock_db, user_principal="john@acme.com", organization_id=organization_id
@@ -82,9 +75,9 @@ class TestAccessBrokerBasicResolution:
     ):
         """Test that all_principals property combines user and group principals."""
         with patch("airweave.platform.access_control.broker.crud") as mock_crud:
-            membership = MagicMock()
-            membership.group_id = "sp:site_owners"
-            mock_crud.access_control_membership.get_by_member = AsyncMock(return_value=[membership])
+            mock_crud.access_control_membership.get_expanded_group_ids = AsyncMock(
+                return_value=["sp:site_owners"]
+            )
 
             result = await broker.resolve_access_context(
                 db=mock_db, user_principal="admin@acme.com", organization_id=organization_id
@@ -105,12 +98,9 @@ class TestAccessBrokerCollectionScoping:
     ):
         """Test that collection resolution filters by readable_collection_id."""
         with patch("airweave.platform.access_control.broker.crud") as mock_crud:
-            membership = MagicMock()
-            membership.group_id = "sp:engineering"
-            mock_crud.access_control_membership.get_by_member_and_collection = AsyncMock(return_value=[membership])
-            
-            # Mock get_by_member for group expansion (returns empty for simplicity)
-            mock_crud.access_control_membership.get_by_member = AsyncMock(return_value=[])
+            mock_crud.access_control_membership.get_expanded_group_ids = AsyncMock(
+                return_value=["sp:engineering"]
+            )
 
             # Mock _collection_has_ac_sources to return True
             with patch.object(broker, "_collection_has_ac_sources", new=AsyncMock(return_value=True)):
@@ -122,12 +112,12 @@ class TestAccessBrokerCollectionScoping:
                 )
 
                 # Verify CRUD was called with collection filter
-                mock_crud.access_control_membership.get_by_member_and_collection.assert_called_once_with(
+                mock_crud.access_control_membership.get_expanded_group_ids.assert_called_once_with(
                     db=mock_db,
                     member_id="john@acme.com",
                     member_type="user",
-                    readable_collection_id="my-collection",
                     organization_id=organization_id,
+                    readable_collection_id="my-collection",
                 )
 
                 assert isinstance(result, AccessContext)
@@ -187,93 +177,30 @@ class TestAccessBrokerCollectionScoping:
 
 
 class TestAccessBrokerGroupExpansion:
-    """Test recursive group membership expansion."""
-
-    @pytest.mark.asyncio
-    async def test_expand_group_memberships_handles_nested_groups(
-        self, broker, mock_db, organization_id
-    ):
-        """Test expansion of nested group-to-group relationships."""
-        with patch("airweave.platform.access_control.broker.crud") as mock_crud:
-            # Mock nested groups: frontend -> engineering -> all-staff
-            async def mock_get_by_member(db, member_id, member_type, organization_id):
-                if member_id == "frontend" and member_type == "group":
-                    parent = MagicMock()
-                    parent.group_id = "engineering"
-                    return [parent]
-                elif member_id == "engineering" and member_type == "group":
-                    parent = MagicMock()
-                    parent.group_id = "all-staff"
-                    return [parent]
-                return []
-
-            mock_crud.access_control_membership.get_by_member = AsyncMock(side_effect=mock_get_by_member)
-
-            result = await broker._expand_group_memberships(
-                db=mock_db, group_ids=["frontend"], organization_id=organization_id
-            )
-
-            # Should include all levels: frontend, engineering, all-staff
-            assert "frontend" in result
-            assert "engineering" in result
-            assert "all-staff" in result
-            assert len(result) == 3
+    """Test nested group expansion via the materialized group closure."""
 
     @pytest.mark.asyncio
-    async def test_expand_group_memberships_handles_circular_references(
+    async def test_nested_groups_resolved_in_single_query(
         self, broker, mock_db, organization_id
     ):
-        """Test that circular group references don't cause infinite loops."""
+        """Direct and ancestor groups come back from one CRUD call, not one per group."""
         with patch("airweave.platform.access_control.broker.crud") as mock_crud:
-
-            async def mock_get_by_member(db, member_id, member_type, organization_id):
-                # Create circular reference: group-a -> group-b -> group-a
-                if member_id == "group-a" and member_type == "group":
-                    parent = MagicMock()
-                    parent.group_id = "group-b"
-                    return [parent]
-                elif member_id == "group-b" and member_type == "group":
-                    parent = MagicMock()
-                    parent.group_id = "group-a"
-                    return [parent]
-                return []
-
-            mock_crud.access_control_membership.get_by_member = AsyncMock(side_effect=mock_get_by_member)
-
-            result = await broker._expand_group_memberships(
-                db=mock_db, group_ids=["group-a"], organization_id=organization_id
+            # frontend -> engineering -> all-staff, already closed over by the closure table
+            mock_crud.access_control_membership.get_expanded_group_ids = AsyncMock(
+                return_value=["frontend", "engineering", "all-staff"]
             )
 
-            # Should handle circular reference gracefully
-            assert "group-a" in result
-            assert "group-b" in result
-            assert len(result) == 2
-
-    @pytest.mark.asyncio
-    async def test_expand_group_memberships_respects_max_depth(
-        self, broker, mock_db, organization_id
-    ):
-        """Test that expansion stops at max depth to prevent abuse."""
-        with patch("airweave.platform.access_control.broker.crud") as mock_crud:
-
-            call_count = 0
-
-            async def mock_get_by_member(db, member_id, member_type, organization_id):
-                nonlocal call_count
-                call_count += 1
-                # Always return a new parent group (infinite nesting)
-                parent = MagicMock()
-                parent.group_id = f"level-{call_count}"
-                return [parent]
-
-            mock_crud.access_control_membership.get_by_member = AsyncMock(side_effect=mock_get_by_member)
-
-            result = await broker._expand_group_memberships(
-                db=mock_db, group_ids=["level-0"], organization_id=organization_id
+            result = await broker.resolve_access_context(
+                db=mock_db, user_principal="john@acme.com", organization_id=organization_id
             )
 
-            # Should stop at max depth (10 in implementation)
-            assert len(result) <= 12  # initial + 10 levels + some tolerance
+            mock_crud.access_control_membership.get_expanded_group_ids.assert_awaited_once()
+            mock_crud.access_control_membership.get_by_member.assert_not_called()
+            assert set(result.group_principals) == {
+                "group:frontend",
+                "group:engineering",
+                "group:all-staff",
+            }
 
 
 class TestAccessBrokerEntityAccess:
@@ -0,0 +1,230 @@
+"""Unit tests for the access principal cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.core.local_cache import close_local_caches
+from airweave.platform.access_control.cache import (
+    CachedPrincipals,
+    PrincipalCache,
+    principal_cache_requests,
+)
+from airweave.platform.access_control.schemas import AccessContext
+
+BROKER = "airweave.platform.access_control.cache.access_broker"
+REDIS = "airweave.core.redis_client.redis_client"
+
+
+def _context(*groups):
+    return AccessContext(
+        user_principal="john@acme.com",
+        user_principals=["user:john@acme.com"],
+        group_principals=[f"group:{g}" for g in groups],
+    )
+
+
+def _requests(result):
+    return principal_cache_requests.labels(result=result)._value.get()
+
+
+@pytest.fixture
+def mock_broker():
+    """Patch the AccessBroker the cache resolves through."""
+    with patch(BROKER) as broker:
+        broker.resolve_access_context_for_collection = AsyncMock(
+            return_value=_context("sp:engineering")
+        )
+        yield broker
+
+
+@pytest.fixture
+def mock_redis():
+    """Patch the Redis client with an in-memory dict (yields the patched pubsub)."""
+    store = {}
+    client = MagicMock()
+    client.mget = AsyncMock(side_effect=lambda keys: [store.get(k) for k in keys])
+    client.setex = AsyncMock(side_effect=lambda k, ttl, v: store.__setitem__(k, v))
+    client.incr = AsyncMock(
+        side_effect=lambda k: store.__setitem__(k, str(int(store.get(k) or 0) + 1))
+    )
+    with patch(REDIS) as redis_client, patch("airweave.core.pubsub.core_pubsub") as pubsub:
+        redis_client.client = client
+        pubsub.publish = AsyncMock()
+        yield pubsub
+
+
+async def _resolve(cache, organization_id, user="john@acme.com", collection="col"):
+    return await cache.resolve(
+        db=AsyncMock(),
+        user_principal=user,
+        readable_collection_id=collection,
+        organization_id=organization_id,
+    )
+
+
+class TestCachedPrincipals:
+    """Tests for serialization of resolutions."""
+
+    def test_roundtrip_preserves_access_context(self):
+        """Decoded principals rebuild the same AccessContext."""
+        cached = CachedPrincipals.from_context(_context("sp:engineering", "ad:frontend"))
+        generation, decoded = CachedPrincipals.decode(cached.encode(3))
+
+        assert generation == 3
+        assert decoded.to_context("john@acme.com") == _context("sp:engineering", "ad:frontend")
+
+    def test_no_ac_sources_is_cached_as_none(self):
+        """A collection without AC sources round-trips to None, not an empty context."""
+        cached = CachedPrincipals.from_context(None)
+        _, decoded = CachedPrincipals.decode(cached.encode(0))
+
+        assert decoded.to_context("john@acme.com") is None
+
+
+class TestMemoryLayer:
+    """Tests for the in-process LRU layer."""
+
+    @pytest.mark.asyncio
+    async def test_second_resolve_is_a_memory_hit(self, mock_broker):
+        """The broker is queried once per (organization, collection, user)."""
+        cache = PrincipalCache(
+            max_entries=10, memory_ttl_seconds=60, redis_ttl_seconds=60, use_redis=False
+        )
+        organization_id = uuid4()
+        hits = _requests("memory_hit")
+
+        first = await _resolve(cache, organization_id)
+        second = await _resolve(cache, organization_id)
+        await _resolve(cache, organization_id, collection="other")
+
+        assert first == second == _context("sp:engineering")
+        assert mock_broker.resolve_access_context_for_collection.await_count == 2
+        assert _requests("memory_hit") == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_and_evict(self, mock_broker):
+        """Expired entries are re-resolved and the LRU is bounded."""
+        cache = PrincipalCache(
+            max_entries=2, memory_ttl_seconds=0, redis_ttl_seconds=60, use_redis=False
+        )
+        organization_id = uuid4()
+
+        await _resolve(cache, organization_id)
+        await _resolve(cache, organization_id)
+        for user in ("a", "b", "c"):
+            await _resolve(cache, organization_id, user=user)
+
+        assert mock_broker.resolve_access_context_for_collection.await_count == 5
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_organization_drops_only_that_organization(self, mock_broker):
+        """Invalidation is organization-wide and leaves other organizations cached."""
+        cache = PrincipalCache(
+            max_entries=10, memory_ttl_seconds=60, redis_ttl_seconds=60, use_redis=False
+        )
+        org_a, org_b = uuid4(), uuid4()
+        await _resolve(cache, org_a)
+        await _resolve(cache, org_b)
+
+        await cache.invalidate_organization(org_a)
+
+        assert len(cache) == 1
+        await _resolve(cache, org_b)
+        assert mock_broker.resolve_access_context_for_collection.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_resolution_is_not_cached(self, mock_broker):
+        """A resolution that raced an invalidation is returned but not stored."""
+        cache = PrincipalCache(
+            max_entries=10, memory_ttl_seconds=60, redis_ttl_seconds=60, use_redis=False
+        )
+        organization_id = uuid4()
+
+        async def resolve_while_invalidated(**kwargs):
+            await cache.invalidate_organization(organization_id)
+            return _context("sp:engineering")
+
+        mock_broker.resolve_access_context_for_collection.side_effect = resolve_while_invalidated
+        await _resolve(cache, organization_id)
+
+        assert len(cache) == 0
+
+
+class TestListener:
+    """Tests for the invalidation listener's lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_the_listener(self, mock_broker):
+        """Shutdown cancels the pubsub listener started by the first lookup."""
+        cache = PrincipalCache(max_entries=10, memory_ttl_seconds=60, redis_ttl_seconds=60)
+        listening = asyncio.Event()
+
+        async def listen():
+            listening.set()
+            await asyncio.Event().wait()
+
+        cache._memory._listen = listen
+        with patch(REDIS) as redis_client:
+            redis_client.client.mget = AsyncMock(return_value=[None, None])
+            redis_client.client.setex = AsyncMock()
+            await _resolve(cache, uuid4())
+        await listening.wait()
+        listener = cache._memory._listener
+
+        await close_local_caches()
+
+        assert listener.cancelled()
+
+
+class TestRedisLayer:
+    """Tests for the shared Redis layer and generation-based invalidation."""
+
+    def _cache(self):
+        cache = PrincipalCache(max_entries=10, memory_ttl_seconds=60, redis_ttl_seconds=60)
+        cache._memory.ensure_listener = lambda: None
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_other_pod_hits_redis(self, mock_broker, mock_redis):
+        """A resolution stored by one pod is served from Redis on another."""
+        organization_id = uuid4()
+        await _resolve(self._cache(), organization_id)
+        hits = _requests("redis_hit")
+
+        result = await _resolve(self._cache(), organization_id)
+
+        assert result == _context("sp:engineering")
+        assert mock_broker.resolve_access_context_for_collection.await_count == 1
+        assert _requests("redis_hit") == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_bumps_generation_and_publishes(self, mock_broker, mock_redis):
+        """After invalidation, Redis entries of the old generation are ignored."""
+        organization_id = uuid4()
+        pod_a, pod_b = self._cache(), self._cache()
+        await _resolve(pod_a, organization_id)
+
+        await pod_a.invalidate_organization(organization_id)
+        mock_broker.resolve_access_context_for_collection.return_value = _context("sp:sales")
+        result = await _resolve(pod_b, organization_id)
+
+        assert result == _context("sp:sales")
+        assert mock_broker.resolve_access_context_for_collection.await_count == 2
+        mock_redis.publish.assert_awaited_once_with(
+            "access_control", "invalidations", {"organization_id": str(organization_id)}
+        )
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_broker(self, mock_broker):
+        """A broken Redis layer is a miss, never a failed search."""
+        with patch(REDIS) as redis_client:
+            redis_client.client.mget = AsyncMock(side_effect=ConnectionError("down"))
+            redis_client.client.setex = AsyncMock(side_effect=ConnectionError("down"))
+
+            result = await _resolve(self._cache(), uuid4())
+
+        assert result == _context("sp:engineering")
@@ -0,0 +1,143 @@
+"""Unit tests for QdrantDestination columnar, pipelined upserts."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import httpx
+import pytest
+from qdrant_client.http.exceptions import UnexpectedResponse
+
+from airweave.platform.destinations.qdrant import KEYWORD_VECTOR_NAME, QdrantDestination
+
+SYNC_ID = UUID("11111111-1111-1111-1111-111111111111")
+
+
+def _entity(i, dim, sparse=True):
+    entity = MagicMock()
+    entity.entity_id = f"entity-{i}__chunk_0"
+    entity.model_dump.return_value = {"entity_id": entity.entity_id, "name": f"Entity {i}"}
+    metadata = entity.airweave_system_metadata
+    metadata.sync_id = SYNC_ID
+    metadata.dense_embedding = [float(i)] * dim
+    metadata.sparse_embedding = {"indices": [i], "values": [1.0]} if sparse else None
+    return entity
+
+
+def _destination(vector_size):
+    dest = QdrantDestination()
+    dest.collection_id = UUID("12345678-1234-1234-1234-123456789abc")
+    dest.collection_name = f"airweave_vectors_{vector_size}"
+    dest.vector_size = vector_size
+    dest._write_limit = dest._compute_write_concurrency()
+    dest._write_sem = asyncio.Semaphore(dest._write_limit)
+    dest._collection_ready = True
+    dest.client = AsyncMock()
+    return dest
+
+
+class TestPointColumns:
+    """Test building and splitting columnar batches."""
+
+    def test_builds_columns_from_entities(self):
+        """Test ids, payloads and the embedders' dense vectors are taken as they are."""
+        dest = _destination(8)
+        entities = [_entity(i, 8) for i in range(3)]
+        points = dest._build_point_columns(entities)
+
+        assert len(points) == 3
+        assert points.dense[1] is entities[1].airweave_system_metadata.dense_embedding
+        assert points.ids[0] == dest._make_point_uuid(SYNC_ID, "entity-0__chunk_0")
+        assert points.payloads[0]["airweave_collection_id"] == str(dest.collection_id)
+
+    def test_rejects_wrong_dimensions(self):
+        """Test embeddings that do not match the collection's vector size fail early."""
+        dest = _destination(8)
+        with pytest.raises(ValueError, match="8 dimensions"):
+            dest._build_point_columns([_entity(0, 8), _entity(1, 4)])
+
+    def test_slicing_keeps_columns_aligned(self):
+        """Test slices (used by the halving fallback) keep rows together."""
+        dest = _destination(4)
+        points = dest._build_point_columns([_entity(i, 4) for i in range(4)])
+        right = points[2:]
+
+        assert right.ids == points.ids[2:]
+        assert [vector[0] for vector in right.dense] == [2.0, 3.0]
+        assert right.sparse == points.sparse[2:]
+
+    def test_points_without_sparse_vectors_go_in_a_separate_batch(self):
+        """Test named vectors stay complete per Batch when sparse vectors are missing."""
+        dest = _destination(4)
+        entities = [_entity(0, 4), _entity(1, 4, sparse=False), _entity(2, 4)]
+        batches = dest._build_point_columns(entities).to_batches()
+
+        assert [len(b.ids) for b in batches] == [2, 1]
+        assert len(batches[0].vectors[KEYWORD_VECTOR_NAME]) == 2
+        assert KEYWORD_VECTOR_NAME not in batches[1].vectors
+
+
+class TestBulkInsert:
+    """Test pipelined bulk inserts."""
+
+    @pytest.mark.asyncio
+    async def test_pipelines_batches_within_its_share_of_write_slots(self):
+        """Test batches are upserted concurrently, leaving write slots for other writers."""
+        dest = _destination(1024)
+        in_flight = 0
+        peak = 0
+
+        async def upsert(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(errors=None)
+
+        dest.client.upsert.side_effect = upsert
+        await dest.bulk_insert([_entity(i, 1024) for i in range(600)])
+
+        # 600 points at 60 per request; 8 write slots at 1024 dims, half of them per call
+        assert dest.client.upsert.await_count == 10
+        assert dest._write_limit == 8
+        assert peak == 4
+        sent = sum(len(c.kwargs["points"].ids) for c in dest.client.upsert.await_args_list)
+        assert sent == 600
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_falls_back_to_halving(self):
+        """Test a rejected request is split in half and retried."""
+        dest = _destination(3072)
+        rejection = UnexpectedResponse(503, "Service Unavailable", b"{}", httpx.Headers())
+        dest.client.upsert.side_effect = [rejection, MagicMock(errors=None), MagicMock(errors=None)]
+
+        await dest.bulk_insert([_entity(i, 3072) for i in range(40)])
+
+        sizes = [len(c.kwargs["points"].ids) for c in dest.client.upsert.await_args_list]
+        assert sizes == [40, 20, 20]
+
+
+class TestBulkUpdatePayloads:
+    """Test payload refreshes of unchanged chunk points (chunk-diff updates)."""
+
+    @pytest.mark.asyncio
+    async def test_rewrites_payload_and_sparse_vector_but_not_dense(self):
+        """Test the BM25 vector is refreshed with the payload; dense vectors are kept."""
+        dest = _destination(4)
+        entities = [_entity(0, 4), _entity(1, 4, sparse=False)]
+        for entity in entities:
+            entity.airweave_system_metadata.dense_embedding = None
+
+        await dest.bulk_update_payloads(entities)
+
+        operations = dest.client.batch_update_points.await_args.kwargs["update_operations"]
+        assert [type(op).__name__ for op in operations] == [
+            "OverwritePayloadOperation",
+            "UpdateVectorsOperation",
+            "OverwritePayloadOperation",
+        ]
+        point = operations[1].update_vectors.points[0]
+        assert point.id == dest._make_point_uuid(SYNC_ID, "entity-0__chunk_0")
+        assert set(point.vector) == {KEYWORD_VECTOR_NAME}
+        assert point.vector[KEYWORD_VECTOR_NAME].indices == [0]
@@ -1,11 +1,15 @@
 """Unit tests for VespaClient (with mocked I/O)."""
 
+import asyncio
+
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID
 
 from airweave.platform.destinations.vespa.client import VespaClient
-from airweave.platform.destinations.vespa.types import VespaDocument
+from airweave.platform.destinations.vespa.config import ALL_VESPA_SCHEMAS, DELETE_MAX_CONCURRENCY
+from airweave.platform.destinations.vespa.types import DeleteResult, VespaDocument
 
 
 @pytest.fixture
@@ -164,6 +168,85 @@ class TestVespaClient:
             
             assert mock_delete.call_count > 0
 
+    @pytest.mark.asyncio
+    async def test_delete_by_parent_ids_runs_selections_concurrently(self, client):
+        """Test batches x schemas are deleted concurrently on one shared HTTP client."""
+        parent_ids = [f"parent-{i}" for i in range(120)]  # 3 batches of 50
+        collection_id = UUID("22222222-2222-2222-2222-222222222222")
+        in_flight = 0
+        max_in_flight = 0
+        sessions = set()
+
+        async def fake_delete(schema, selection, http_client=None):
+            nonlocal in_flight, max_in_flight
+            sessions.add(id(http_client))
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return DeleteResult(deleted_count=1, schema=schema)
+
+        with patch.object(client, "delete_by_selection", side_effect=fake_delete):
+            results = await client.delete_by_parent_ids(parent_ids, collection_id)
+
+        assert len(results) == 3 * len(ALL_VESPA_SCHEMAS)
+        assert len(sessions) == 1
+        assert 1 < max_in_flight <= DELETE_MAX_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_delete_by_document_ids_removes_by_id(self, client):
+        """Test known document IDs are removed via document/v1, scoped by collection."""
+        collection_id = UUID("22222222-2222-2222-2222-222222222222")
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            status = 412 if request.url.path.endswith("missing") else 200
+            return httpx.Response(status, json={})
+
+        with patch.object(
+            client,
+            "_delete_session",
+            return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ):
+            results = await client.delete_by_document_ids(
+                {"base_entity": ["Doc_a__chunk_1", "missing"], "file_entity": ["File_b__chunk_0"]},
+                collection_id,
+            )
+
+        assert {(r.schema, r.deleted_count) for r in results} == {
+            ("base_entity", 1),
+            ("file_entity", 1),
+        }
+        assert all(r.method == "DELETE" for r in requests)
+        by_path = {r.url.path: r for r in requests}
+        chunk = by_path["/document/v1/airweave/file_entity/docid/File_b__chunk_0"]
+        assert chunk.url.params["condition"] == (
+            f"file_entity.airweave_system_metadata_collection_id=='{collection_id}'"
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_by_document_ids_raises_after_all_removes_finish(self, client):
+        """Test network errors surface (for the caller's retry) once every remove settled."""
+        collection_id = UUID("22222222-2222-2222-2222-222222222222")
+        handled = []
+
+        def handler(request):
+            handled.append(request.url.path)
+            if request.url.path.endswith("b"):
+                raise httpx.ConnectError("connection refused")
+            return httpx.Response(200, json={})
+
+        with patch.object(
+            client,
+            "_delete_session",
+            return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ):
+            with pytest.raises(httpx.ConnectError):
+                await client.delete_by_document_ids({"base_entity": ["a", "b", "c"]}, collection_id)
+
+        assert len(handled) == 3
+
     @pytest.mark.asyncio
     async def test_execute_query_success(self, client, mock_vespa_app):
         """Test query execution with successful response."""
@@ -209,6 +292,51 @@ class TestVespaClient:
             
             assert "Vespa search error" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_execute_query_uses_shared_http_client(self, mock_vespa_app):
+        """Test queries go over the shared HTTP client instead of pyvespa when given one."""
+        mock_vespa_app.end_point = "http://vespa:8081"
+        http_response = MagicMock()
+        http_response.status_code = 200
+        http_response.json = MagicMock(
+            return_value={
+                "root": {
+                    "fields": {"totalCount": 1},
+                    "coverage": {"coverage": 100.0},
+                    "children": [{"id": "1", "relevance": 0.9, "fields": {"entity_id": "1"}}],
+                }
+            }
+        )
+        http_client = MagicMock()
+        http_client.post = AsyncMock(return_value=http_response)
+        client = VespaClient(app=mock_vespa_app, http_client=http_client)
+        query_params = {"yql": "select * from base_entity", "hits": 10}
+
+        result = await client.execute_query(query_params)
+
+        http_client.post.assert_awaited_once_with(
+            "http://vespa:8081/search/", json=query_params
+        )
+        mock_vespa_app.query.assert_not_called()
+        assert len(result.hits) == 1
+        assert result.total_count == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_query_shared_http_client_error(self, mock_vespa_app):
+        """Test a non-200 response over the shared HTTP client raises."""
+        mock_vespa_app.end_point = "http://vespa:8081"
+        http_response = MagicMock()
+        http_response.status_code = 400
+        http_response.json = MagicMock(return_value={"root": {"errors": ["Invalid YQL"]}})
+        http_client = MagicMock()
+        http_client.post = AsyncMock(return_value=http_response)
+        client = VespaClient(app=mock_vespa_app, http_client=http_client)
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await client.execute_query({"yql": "invalid query"})
+
+        assert "Vespa search error" in str(exc_info.value)
+
     def test_convert_hits_to_results(self, client):
         """Test converting Vespa hits to AirweaveSearchResult."""
         hits = [
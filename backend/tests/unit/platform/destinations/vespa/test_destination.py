@@ -277,6 +277,51 @@ class TestVespaDestination:
             
             mock_client.delete_by_parent_ids.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_bulk_delete_by_entity_ids_uses_document_ids_with_parents(
+        self, collection_id, sync_id
+    ):
+        """Test chunk deletes go by document ID when parent entities are known."""
+        with patch('airweave.platform.destinations.vespa.destination.VespaClient.connect', new_callable=AsyncMock) as mock_connect, \
+             patch('airweave.platform.destinations.vespa.destination.EntityTransformer') as MockTransformer, \
+             patch('airweave.platform.destinations.vespa.destination.QueryBuilder'):
+
+            mock_client = AsyncMock()
+            mock_connect.return_value = mock_client
+            doc_ids = {"base_entity": ["Doc_parent-1__chunk_2"]}
+            MockTransformer.return_value.chunk_document_ids.return_value = doc_ids
+            parent = MagicMock()
+
+            dest = await VespaDestination.create(collection_id=collection_id)
+            await dest.bulk_delete_by_entity_ids(
+                ["parent-1__chunk_2"], sync_id, parent_entities=[parent]
+            )
+
+            mock_client.delete_by_document_ids.assert_called_once_with(doc_ids, collection_id)
+            mock_client.delete_by_entity_ids.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_by_entity_ids_falls_back_to_selection(
+        self, collection_id, sync_id
+    ):
+        """Test chunk deletes use a selection when document IDs cannot be derived."""
+        with patch('airweave.platform.destinations.vespa.destination.VespaClient.connect', new_callable=AsyncMock) as mock_connect, \
+             patch('airweave.platform.destinations.vespa.destination.EntityTransformer') as MockTransformer, \
+             patch('airweave.platform.destinations.vespa.destination.QueryBuilder'):
+
+            mock_client = AsyncMock()
+            mock_connect.return_value = mock_client
+            MockTransformer.return_value.chunk_document_ids.return_value = None
+
+            dest = await VespaDestination.create(collection_id=collection_id)
+            await dest.bulk_delete_by_entity_ids(
+                ["parent-1__chunk_2"], sync_id, parent_entities=[MagicMock()]
+            )
+            await dest.bulk_delete_by_entity_ids(["parent-1__chunk_3"], sync_id)
+
+            mock_client.delete_by_document_ids.assert_not_called()
+            assert mock_client.delete_by_entity_ids.call_count == 2
+
     @pytest.mark.asyncio
     async def test_search_executes_query(self, collection_id):
         """Test search() builds query and executes search."""
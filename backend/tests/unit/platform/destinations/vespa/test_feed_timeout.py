@@ -47,6 +47,7 @@ class TestFeedTimeout:
         # Patch VESPA_TIMEOUT to 0.1s so the test completes quickly
         with patch("airweave.platform.destinations.vespa.client.settings") as mock_settings:
             mock_settings.VESPA_TIMEOUT = 0.1
+            mock_settings.VESPA_ASYNC_FEED_ENABLED = False
 
             with pytest.raises(asyncio.TimeoutError):
                 await client.feed_documents(sample_docs)
@@ -65,6 +66,7 @@ class TestFeedTimeout:
 
         with patch("airweave.platform.destinations.vespa.client.settings") as mock_settings:
             mock_settings.VESPA_TIMEOUT = 5.0
+            mock_settings.VESPA_ASYNC_FEED_ENABLED = False
 
             result = await client.feed_documents(sample_docs)
             assert result.success_count == 0  # No callback was invoked
@@ -85,6 +87,7 @@ class TestFeedTimeout:
 
         with patch("airweave.platform.destinations.vespa.client.settings") as mock_settings:
             mock_settings.VESPA_TIMEOUT = 0.1
+            mock_settings.VESPA_ASYNC_FEED_ENABLED = False
 
             with pytest.raises(asyncio.TimeoutError):
                 await client.feed_documents(sample_docs)
@@ -0,0 +1,208 @@
+"""Unit tests for the asyncio Vespa feeder (with a mocked HTTP transport)."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from airweave.platform.destinations.vespa.feeder import (
+    InFlightWindow,
+    VespaFeeder,
+    feed_deadline,
+)
+from airweave.platform.destinations.vespa.types import VespaDocument
+
+
+def _docs(count, schema="base_entity"):
+    return {
+        schema: [
+            VespaDocument(schema=schema, id=f"doc-{i}", fields={"entity_id": str(i)})
+            for i in range(count)
+        ]
+    }
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    """Retry immediately."""
+    with patch("airweave.platform.destinations.vespa.feeder.FEED_RETRY_BACKOFF_SECONDS", 0):
+        yield
+
+
+class TestVespaFeeder:
+    """Test per-document feeding, retries and results."""
+
+    @pytest.mark.asyncio
+    async def test_feeds_every_document_with_document_v1_put(self):
+        """Test each document is POSTed to its document/v1 URL with its fields."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"id": "ok"})
+
+        feeder = VespaFeeder(transport=httpx.MockTransport(handler))
+        result = await feeder.feed(_docs(3))
+        await feeder.aclose()
+
+        assert result.success_count == 3
+        assert result.failed_docs == []
+        assert [d.attempts for d in result.documents] == [1, 1, 1]
+        assert requests[0].method == "POST"
+        assert requests[0].url.path == "/document/v1/airweave/base_entity/docid/doc-0"
+        assert json.loads(requests[0].content) == {"fields": {"entity_id": "0"}}
+
+    @pytest.mark.asyncio
+    async def test_update_assigns_fields_of_existing_documents(self):
+        """Test updates PUT the fields as assignments, leaving other fields as stored."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"id": "ok"})
+
+        feeder = VespaFeeder(transport=httpx.MockTransport(handler))
+        result = await feeder.feed(_docs(1), update=True)
+        await feeder.aclose()
+
+        assert result.success_count == 1
+        assert requests[0].method == "PUT"
+        assert requests[0].url.path == "/document/v1/airweave/base_entity/docid/doc-0"
+        assert json.loads(requests[0].content) == {"fields": {"entity_id": {"assign": "0"}}}
+
+    @pytest.mark.asyncio
+    async def test_retries_throttled_document(self):
+        """Test a 429 is retried for that document only."""
+        calls = {}
+
+        def handler(request):
+            path = request.url.path
+            calls[path] = calls.get(path, 0) + 1
+            if path.endswith("doc-1") and calls[path] == 1:
+                return httpx.Response(429, json={"message": "Rejecting execution"})
+            return httpx.Response(200, json={})
+
+        feeder = VespaFeeder(transport=httpx.MockTransport(handler))
+        result = await feeder.feed(_docs(3))
+
+        assert result.success_count == 3
+        assert {d.doc_id: d.attempts for d in result.documents} == {
+            "doc-0": 1,
+            "doc-1": 2,
+            "doc-2": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self):
+        """Test a 400 fails the document immediately and reports Vespa's error body."""
+        attempts = 0
+
+        def handler(request):
+            nonlocal attempts
+            attempts += 1
+            return httpx.Response(400, json={"message": "No field 'bogus'"})
+
+        feeder = VespaFeeder(transport=httpx.MockTransport(handler))
+        result = await feeder.feed(_docs(1))
+
+        assert attempts == 1
+        assert result.success_count == 0
+        assert result.failed_docs == [("doc-0", 400, {"message": "No field 'bogus'"})]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts_on_transport_errors(self):
+        """Test transport errors are retried up to FEED_MAX_ATTEMPTS, then reported."""
+
+        def handler(request):
+            raise httpx.ConnectError("connection refused")
+
+        with patch("airweave.platform.destinations.vespa.feeder.FEED_MAX_ATTEMPTS", 3):
+            feeder = VespaFeeder(transport=httpx.MockTransport(handler))
+            result = await feeder.feed(_docs(1))
+
+        document = result.documents[0]
+        assert document.success is False
+        assert document.attempts == 3
+        assert document.status_code is None
+        assert "ConnectError" in document.body["message"]
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_stay_within_window(self):
+        """Test concurrent requests never exceed the initial window."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        module = "airweave.platform.destinations.vespa.feeder"
+        with (
+            patch(f"{module}.FEED_INITIAL_IN_FLIGHT", 4),
+            patch(f"{module}.FEED_MAX_IN_FLIGHT", 4),
+        ):
+            feeder = VespaFeeder(transport=httpx.MockTransport(handler))
+            result = await feeder.feed(_docs(40))
+
+        assert result.success_count == 40
+        assert 1 < peak <= 4
+
+
+class TestFeedDeadline:
+    """Test the deadline of one feed call."""
+
+    def test_leaves_room_for_every_attempt_of_a_document(self):
+        """Test a single document may use all its attempts at the request timeout."""
+        with patch("airweave.platform.destinations.vespa.feeder.settings") as mock_settings:
+            mock_settings.VESPA_TIMEOUT = 60.0
+            assert feed_deadline(1) > 5 * 60.0
+
+    def test_grows_with_batch_size(self):
+        """Test larger batches get proportionally more time."""
+        with patch("airweave.platform.destinations.vespa.feeder.settings") as mock_settings:
+            mock_settings.VESPA_TIMEOUT = 60.0
+            assert feed_deadline(1000) - feed_deadline(0) == pytest.approx(500.0)
+
+
+class TestInFlightWindow:
+    """Test the AIMD in-flight limit."""
+
+    @pytest.mark.asyncio
+    async def test_successes_grow_limit_by_one_per_window(self):
+        """Test a full window of successes raises the limit by about one."""
+        window = InFlightWindow(initial=4, minimum=1, maximum=10)
+        for _ in range(4):
+            await window.acquire()
+            await window.release(throttled=False)
+
+        assert 4.9 < window.limit < 5.0
+
+    @pytest.mark.asyncio
+    async def test_throttling_halves_limit_once_per_window(self):
+        """Test a burst of throttled responses halves the limit once."""
+        window = InFlightWindow(initial=8, minimum=2, maximum=10)
+        for _ in range(8):
+            await window.acquire()
+        for _ in range(8):
+            await window.release(throttled=True)
+
+        assert window.limit == 4.0
+
+    @pytest.mark.asyncio
+    async def test_limit_respects_bounds(self):
+        """Test the limit never leaves [minimum, maximum]."""
+        window = InFlightWindow(initial=2, minimum=2, maximum=3)
+        for _ in range(20):
+            await window.acquire()
+            await window.release(throttled=True)
+        assert window.limit == 2.0
+        for _ in range(50):
+            await window.acquire()
+            await window.release(throttled=False)
+        assert window.limit == 3.0
@@ -1,5 +1,6 @@
 """Unit tests for EntityTransformer (with simplified mocking)."""
 
+import numpy as np
 import pytest
 from unittest.mock import MagicMock
 from uuid import UUID
@@ -9,6 +10,7 @@ from airweave.platform.destinations.vespa.transformer import (
     EntityTransformer,
     _sanitize_for_vespa,
     _validate_text_quality,
+    encode_dense_tensor,
 )
 from airweave.platform.destinations.vespa.types import VespaDocument
 
@@ -217,7 +219,7 @@ class TestEntityTransformer:
         entity2.airweave_system_metadata.entity_type = "folder"
         
         # Mock transform to return simple VespaDocument
-        def mock_transform(entity):
+        def mock_transform(entity, include_dense_embedding=True):
             return VespaDocument(
                 schema="base_entity",
                 id=entity.id,
@@ -243,7 +245,7 @@ class TestEntityTransformer:
         entity_chunk.airweave_system_metadata = MagicMock()
         entity_chunk.airweave_system_metadata.chunk_index = 2
         
-        def mock_transform(entity):
+        def mock_transform(entity, include_dense_embedding=True):
             schema = "chunk_entity" if entity.airweave_system_metadata.chunk_index else "base_entity"
             return VespaDocument(
                 schema=schema,
@@ -446,6 +448,21 @@ class TestEntityTransformer:
         assert result.fields["access_is_public"] is False
         assert "user@example.com" in result.fields["access_viewers"]
 
+    def test_chunk_document_ids_match_transformed_ids(self, transformer, mock_entity):
+        """Test chunk document IDs are derived the same way transform() builds them."""
+        doc_ids = transformer.chunk_document_ids(
+            ["entity-123__chunk_2", "entity-123__chunk_3"], [mock_entity]
+        )
+
+        assert doc_ids == {
+            "base_entity": ["document_entity-123__chunk_2", "document_entity-123__chunk_3"]
+        }
+
+    def test_chunk_document_ids_unknown_parent(self, transformer, mock_entity):
+        """Test None is returned when a chunk's parent was not provided."""
+        assert transformer.chunk_document_ids(["other__chunk_0"], [mock_entity]) is None
+        assert transformer.chunk_document_ids(["entity-123"], [mock_entity]) is None
+
 
 class TestSanitizeForVespa:
     """Test _sanitize_for_vespa function."""
@@ -663,3 +680,56 @@ class TestEntityTransformerWithValidation:
         assert isinstance(result, VespaDocument)
         assert result.fields["textual_representation"] == "This is clean text without any corruption."
 
+
+
+class TestEmbeddingEncoding:
+    """Test compact tensor encodings of embeddings in the feed."""
+
+    def test_encode_dense_float(self):
+        """Test float cells are 8 big-endian hex digits."""
+        assert encode_dense_tensor([1.0, -2.0], cell_type="float") == "3F800000C0000000"
+
+    def test_encode_dense_bfloat16_rounds_to_nearest(self):
+        """Test bfloat16 cells are the rounded upper half of the float32 bits."""
+        # 1.0 is exact; 0x3F808000 is a tie rounded to even (3F80);
+        # 0x3F808001 rounds up (3F81)
+        values = np.array([0x3F800000, 0x3F808000, 0x3F808001], dtype=np.uint32).view(np.float32)
+        assert encode_dense_tensor(values, cell_type="bfloat16") == "3F803F803F81"
+
+    def test_encode_dense_int8_scales_to_peak(self):
+        """Test int8 cells are scaled so the largest magnitude is 127."""
+        # 0.5 * 127 = 63.5 rounds to even (64 = 0x40); -1.0 -> -127 (0x81)
+        assert encode_dense_tensor([0.5, -1.0, 0.0], cell_type="int8") == "408100"
+
+    def test_encode_dense_unknown_cell_type(self):
+        """Test an unsupported cell type is rejected."""
+        with pytest.raises(ValueError):
+            encode_dense_tensor([1.0], cell_type="double")
+
+    def test_embeddings_use_short_forms(self, transformer):
+        """Test dense embeddings are sent as hex and sparse ones as label -> value cells."""
+        entity = MagicMock()
+        entity.entity_id = "chunk-1"
+        entity.airweave_system_metadata.dense_embedding = np.full(3072, 0.25, dtype=np.float32)
+        entity.airweave_system_metadata.sparse_embedding = {
+            "indices": np.array([7, 42]),
+            "values": np.array([0.5, 1.5], dtype=np.float32),
+        }
+        fields = {}
+
+        transformer._add_embedding_fields(fields, entity)
+
+        assert fields["dense_embedding"] == {"values": "3E80" * 3072}
+        assert fields["sparse_embedding"] == {"cells": {"7": 0.5, "42": 1.5}}
+
+    def test_partial_updates_keep_dense_but_assign_sparse(self, transformer):
+        """Test updates of unchanged chunks leave out the dense embedding only."""
+        entity = MagicMock()
+        entity.entity_id = "chunk-1"
+        entity.airweave_system_metadata.dense_embedding = None
+        entity.airweave_system_metadata.sparse_embedding = {"indices": [3], "values": [0.5]}
+        fields = {}
+
+        transformer._add_embedding_fields(fields, entity, include_dense=False)
+
+        assert fields == {"sparse_embedding": {"cells": {"3": 0.5}}}
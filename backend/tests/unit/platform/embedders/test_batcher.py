@@ -0,0 +1,195 @@
+"""Unit tests for the pod-wide embedding batcher."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from airweave.platform.embedders.batcher import EmbeddingBatcher
+
+
+def _recording_embed_fn(requests, delay=0.0):
+    """Embed function that records each request's texts."""
+
+    async def embed(texts, tokens, logger):
+        requests.append(list(texts))
+        if delay:
+            await asyncio.sleep(delay)
+        return [[float(len(t))] for t in texts]
+
+    return embed
+
+
+class _Batcher(EmbeddingBatcher):
+    """Batcher whose callers all submit with the same embed function."""
+
+    def __init__(self, embed_fn, **kwargs):
+        super().__init__("test-model:4", **kwargs)
+        self.embed_fn = embed_fn
+
+    async def submit(self, texts, token_counts, key, embed_fn=None, logger=None):
+        return await super().submit(
+            texts, token_counts, key, embed_fn or self.embed_fn, logger or MagicMock()
+        )
+
+
+def _batcher(embed_fn, max_inputs=100, max_tokens=1000, max_concurrent=4, linger=0.01):
+    return _Batcher(
+        embed_fn,
+        max_inputs=max_inputs,
+        max_tokens=max_tokens,
+        max_concurrent=max_concurrent,
+        max_linger_seconds=linger,
+    )
+
+
+class TestEmbeddingBatcher:
+    """Tests for coalescing, packing and fair sharing."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_submissions_from_many_syncs(self):
+        """Concurrent small submissions share one request and get their own results."""
+        requests = []
+        batcher = _batcher(_recording_embed_fn(requests))
+
+        results = await asyncio.gather(
+            batcher.submit(["a", "bb"], [1, 1], key="sync-1"),
+            batcher.submit(["ccc"], [1], key="sync-2"),
+            batcher.submit(["dddd", "e"], [1, 1], key="sync-3"),
+        )
+
+        assert len(requests) == 1
+        assert results == [[[1.0], [2.0]], [[3.0]], [[4.0], [1.0]]]
+
+    @pytest.mark.asyncio
+    async def test_full_request_is_sent_without_waiting_for_linger(self):
+        """A request that reaches max_inputs goes out before the linger deadline."""
+        requests = []
+        batcher = _batcher(_recording_embed_fn(requests), max_inputs=3, linger=60)
+
+        result = await asyncio.wait_for(
+            batcher.submit(["a", "b", "c"], [1, 1, 1], key="sync-1"), timeout=1
+        )
+
+        assert requests == [["a", "b", "c"]]
+        assert len(result) == 3
+
+    @pytest.mark.asyncio
+    async def test_respects_input_and_token_limits(self):
+        """Requests stay under both limits; a text over the token budget goes alone."""
+        requests = []
+        batcher = _batcher(_recording_embed_fn(requests), max_inputs=3, max_tokens=10)
+
+        await batcher.submit(["a", "b", "c", "d", "big", "e"], [4, 4, 1, 1, 50, 1], key="s")
+
+        assert requests == [["a", "b", "c"], ["d"], ["big"], ["e"]]
+
+    @pytest.mark.asyncio
+    async def test_packs_round_robin_across_syncs(self):
+        """A large sync cannot crowd a small one out of the next request."""
+        requests = []
+        batcher = _batcher(_recording_embed_fn(requests), max_inputs=4)
+
+        await asyncio.gather(
+            batcher.submit([f"big-{i}" for i in range(8)], [1] * 8, key="big"),
+            batcher.submit(["small-0", "small-1"], [1, 1], key="small"),
+        )
+
+        assert requests[0] == ["big-0", "small-0", "big-1", "small-1"]
+
+    @pytest.mark.asyncio
+    async def test_limits_requests_in_flight(self):
+        """No more than max_concurrent requests run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def embed(texts, tokens, logger):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[0.0] for _ in texts]
+
+        batcher = _batcher(embed, max_inputs=1, max_concurrent=2)
+        await batcher.submit([str(i) for i in range(6)], [1] * 6, key="s")
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_provider_error_fails_every_caller_in_the_request(self):
+        """An embed_fn error is raised to each submitter whose texts were in the request."""
+
+        async def embed(texts, tokens, logger):
+            raise RuntimeError("provider down")
+
+        batcher = _batcher(embed)
+        results = await asyncio.gather(
+            batcher.submit(["a"], [1], key="sync-1"),
+            batcher.submit(["b"], [1], key="sync-2"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_texts_are_not_sent(self):
+        """Texts of a caller that gave up are dropped from later requests."""
+        requests = []
+        batcher = _batcher(_recording_embed_fn(requests), linger=0.05)
+
+        abandoned = asyncio.create_task(batcher.submit(["gone"], [1], key="sync-1"))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        result = await batcher.submit(["kept"], [1], key="sync-2")
+
+        assert requests == [["kept"]]
+        assert result == [[4.0]]
+
+    @pytest.mark.asyncio
+    async def test_failed_request_only_fails_its_own_callers(self):
+        """One caller's failing texts don't fail the callers packed with it."""
+        requests = []
+        logger = MagicMock()
+
+        async def embed(texts, tokens, logger):
+            requests.append(list(texts))
+            if "bad" in texts:
+                raise RuntimeError("invalid input")
+            return [[float(len(t))] for t in texts]
+
+        batcher = _batcher(embed)
+        results = await asyncio.gather(
+            batcher.submit(["a"], [1], key="sync-1"),
+            batcher.submit(["bad"], [1], key="sync-2", logger=logger),
+            batcher.submit(["ccc"], [1], key="sync-3"),
+            return_exceptions=True,
+        )
+
+        assert requests[0] == ["a", "bad", "ccc"]
+        assert results[0] == [[1.0]] and results[2] == [[3.0]]
+        assert isinstance(results[1], RuntimeError)
+        logger.error.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_request_uses_its_first_callers_embedder_and_logger(self):
+        """The batcher keeps no embedder: each request uses one of its callers'."""
+        calls = []
+
+        def embed_fn(name):
+            async def embed(texts, tokens, logger):
+                calls.append((name, logger))
+                return [[0.0] for _ in texts]
+
+            return embed
+
+        first, second = embed_fn("first"), embed_fn("second")
+        first_logger, second_logger = MagicMock(), MagicMock()
+        batcher = _batcher(embed_fn("unused"))
+        await asyncio.gather(
+            batcher.submit(["a"], [1], "sync-1", first, first_logger),
+            batcher.submit(["b"], [1], "sync-2", second, second_logger),
+        )
+        await batcher.submit(["c"], [1], "sync-2", second, second_logger)
+
+        assert calls == [("first", first_logger), ("second", second_logger)]
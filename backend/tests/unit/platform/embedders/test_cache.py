@@ -0,0 +1,204 @@
+"""Unit tests for the content-addressed embedding cache."""
+
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+from fastembed import SparseEmbedding
+
+from airweave.platform.embedders.cache import (
+    EmbeddingCache,
+    LRUEmbeddingCache,
+    decode_dense,
+    decode_sparse,
+    embedding_cache_key,
+    encode_dense,
+    encode_sparse,
+    is_cacheable_dense,
+    is_cacheable_sparse,
+)
+
+
+def _fake_embed_fn(calls):
+    """Embed function that records the texts it is asked to embed."""
+
+    async def embed(texts):
+        calls.append(list(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+    return embed
+
+
+class TestKeysAndCodecs:
+    """Tests for cache keys and serialization."""
+
+    def test_key_depends_on_model_dimensions_and_text(self):
+        """Different model, dimensions or text must give different keys."""
+        base = embedding_cache_key("m", 3072, "hello")
+        assert base == embedding_cache_key("m", 3072, "hello")
+        assert base != embedding_cache_key("m2", 3072, "hello")
+        assert base != embedding_cache_key("m", 1536, "hello")
+        assert base != embedding_cache_key("m", 3072, "hello!")
+
+    def test_dense_roundtrip(self):
+        """Dense vectors survive encode/decode at float32 precision."""
+        vector = [0.25, -1.5, 3.0]
+        assert decode_dense(encode_dense(vector)) == vector
+
+    def test_zero_and_invalid_embeddings_are_not_cacheable(self):
+        """Zero vectors (provider failures) and non-finite values are rejected."""
+        assert is_cacheable_dense([0.1, 0.0])
+        assert not is_cacheable_dense([0.0, 0.0])
+        assert not is_cacheable_dense([float("nan"), 1.0])
+        assert not is_cacheable_dense([])
+        assert is_cacheable_sparse(SparseEmbedding(indices=np.array([3]), values=np.array([0.5])))
+        assert not is_cacheable_sparse(SparseEmbedding(indices=np.array([]), values=np.array([])))
+
+    def test_sparse_roundtrip(self):
+        """Sparse embeddings survive encode/decode."""
+        emb = SparseEmbedding(indices=np.array([3, 7]), values=np.array([0.5, 1.25]))
+        decoded = decode_sparse(encode_sparse(emb))
+        assert decoded.indices.tolist() == [3, 7]
+        assert decoded.values.tolist() == [0.5, 1.25]
+
+
+class TestLRUEmbeddingCache:
+    """Tests for the in-process LRU layer."""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_by_entries(self):
+        """Oldest untouched entry is evicted when max_entries is exceeded."""
+        lru = LRUEmbeddingCache(max_entries=2, max_bytes=1000, ttl_seconds=0)
+        await lru.set_many({"a": "1", "b": "2"})
+        await lru.get_many(["a"])  # touch a
+        await lru.set_many({"c": "3"})
+
+        assert await lru.get_many(["a", "b", "c"]) == ["1", None, "3"]
+
+    @pytest.mark.asyncio
+    async def test_evicts_by_bytes(self):
+        """Entries are evicted once total payload bytes exceed max_bytes."""
+        lru = LRUEmbeddingCache(max_entries=100, max_bytes=10, ttl_seconds=0)
+        await lru.set_many({"a": "x" * 6, "b": "y" * 6})
+
+        assert len(lru) == 1
+        assert lru.size_bytes == 6
+        assert await lru.get_many(["a", "b"]) == [None, "y" * 6]
+
+    @pytest.mark.asyncio
+    async def test_expires_by_ttl(self):
+        """Entries past their TTL are treated as misses."""
+        lru = LRUEmbeddingCache(max_entries=10, max_bytes=1000, ttl_seconds=60)
+        with patch("airweave.core.local_cache.time.monotonic", return_value=0.0):
+            await lru.set_many({"a": "1"})
+        with patch("airweave.core.local_cache.time.monotonic", return_value=61.0):
+            assert await lru.get_many(["a"]) == [None]
+        assert len(lru) == 0
+
+
+class TestEmbeddingCache:
+    """Tests for the tiered cache."""
+
+    @pytest.mark.asyncio
+    async def test_only_misses_are_embedded(self):
+        """Second call with one changed text only embeds that text."""
+        cache = EmbeddingCache([LRUEmbeddingCache(100, 10_000, 0)])
+        calls = []
+        embed = _fake_embed_fn(calls)
+
+        first = await cache.embed(["aa", "bbb"], "m", 2, embed, encode_dense, decode_dense)
+        second = await cache.embed(["aa", "cccc"], "m", 2, embed, encode_dense, decode_dense)
+
+        assert calls == [["aa", "bbb"], ["cccc"]]
+        assert (first.hits, first.misses) == (0, 2)
+        assert (second.hits, second.misses) == (1, 1)
+        assert second.embeddings == [[2.0, 1.0], [4.0, 1.0]]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_embedded_once(self):
+        """Identical texts in one batch are sent to the provider once."""
+        cache = EmbeddingCache([LRUEmbeddingCache(100, 10_000, 0)])
+        calls = []
+
+        result = await cache.embed(
+            ["same", "same"], "m", 2, _fake_embed_fn(calls), encode_dense, decode_dense
+        )
+
+        assert calls == [["same"]]
+        assert result.embeddings == [[4.0, 1.0], [4.0, 1.0]]
+
+    @pytest.mark.asyncio
+    async def test_hits_in_slower_layer_are_promoted(self):
+        """Hits from the shared layer are copied into the in-process layer."""
+        memory = LRUEmbeddingCache(100, 10_000, 0)
+        shared = LRUEmbeddingCache(100, 10_000, 0)
+        shared.name = "shared"
+        key = embedding_cache_key("m", 2, "aa")
+        await shared.set_many({key: encode_dense([9.0, 9.0])})
+
+        cache = EmbeddingCache([memory, shared])
+        calls = []
+        result = await cache.embed(
+            ["aa"], "m", 2, _fake_embed_fn(calls), encode_dense, decode_dense
+        )
+
+        assert calls == []
+        assert result.embeddings == [[9.0, 9.0]]
+        assert await memory.get_many([key]) == [encode_dense([9.0, 9.0])]
+
+    @pytest.mark.asyncio
+    async def test_broken_layer_is_treated_as_miss(self):
+        """A failing layer never fails the embedding call."""
+        broken = AsyncMock()
+        broken.name = "broken"
+        broken.get_many.side_effect = ConnectionError("redis down")
+        broken.set_many.side_effect = ConnectionError("redis down")
+
+        cache = EmbeddingCache([broken])
+        calls = []
+        result = await cache.embed(
+            ["aa"], "m", 2, _fake_embed_fn(calls), encode_dense, decode_dense
+        )
+
+        assert calls == [["aa"]]
+        assert result.embeddings == [[2.0, 1.0]]
+
+    @pytest.mark.asyncio
+    async def test_zero_vectors_are_never_cached(self):
+        """A zero vector from a failed provider call is re-embedded next time."""
+        memory = LRUEmbeddingCache(100, 10_000, 0)
+        cache = EmbeddingCache([memory])
+        calls = []
+
+        async def failing_embed(texts):
+            calls.append(list(texts))
+            return [[0.0, 0.0] for _ in texts]
+
+        first = await cache.embed(
+            ["aa"], "m", 2, failing_embed, encode_dense, decode_dense, is_cacheable_dense
+        )
+        second = await cache.embed(
+            ["aa"], "m", 2, _fake_embed_fn(calls), encode_dense, decode_dense, is_cacheable_dense
+        )
+
+        assert first.embeddings == [[0.0, 0.0]]
+        assert calls == [["aa"], ["aa"]]
+        assert second.embeddings == [[2.0, 1.0]]
+        assert len(memory) == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_zero_vectors_are_treated_as_misses(self):
+        """Zero vectors cached before validation existed are ignored and replaced."""
+        memory = LRUEmbeddingCache(100, 10_000, 0)
+        key = embedding_cache_key("m", 2, "aa")
+        await memory.set_many({key: encode_dense([0.0, 0.0])})
+        cache = EmbeddingCache([memory])
+        calls = []
+
+        result = await cache.embed(
+            ["aa"], "m", 2, _fake_embed_fn(calls), encode_dense, decode_dense, is_cacheable_dense
+        )
+
+        assert calls == [["aa"]]
+        assert (result.hits, result.misses) == (0, 1)
+        assert await memory.get_many([key]) == [encode_dense([2.0, 1.0])]
@@ -0,0 +1,97 @@
+"""Unit tests for the OpenAI dense embedder."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.platform.embedders.openai import OpenAIDenseEmbedder
+from airweave.platform.sync.exceptions import SyncFailureError
+
+
+def _embedder() -> OpenAIDenseEmbedder:
+    """Embedder with a mocked client and rate limiter (no API key needed)."""
+    embedder = object.__new__(OpenAIDenseEmbedder)
+    embedder.MODEL_NAME = "text-embedding-3-small"
+    embedder.VECTOR_DIMENSIONS = 4
+    embedder._client = MagicMock()
+    embedder._client.embeddings.create = AsyncMock()
+    embedder._rate_limiter = MagicMock()
+    embedder._rate_limiter.acquire = AsyncMock()
+    return embedder
+
+
+class TestEmbedBatch:
+    """Tests for rate limiting and error handling of single requests."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_timeout_fails_instead_of_zero_vectors(self):
+        """A limiter timeout raises; the request is never sent or zero-filled."""
+        embedder = _embedder()
+        embedder._rate_limiter.acquire.side_effect = TimeoutError("next slot in 4000s")
+
+        with pytest.raises(SyncFailureError, match="rate limit"):
+            await embedder._embed_batch(["hello"], MagicMock(), 4, tokens=1)
+
+        embedder._client.embeddings.create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_charges_tokens_against_the_limiter(self):
+        """The request's token count is passed to the rate limiter."""
+        embedder = _embedder()
+        embedder._client.embeddings.create.return_value = MagicMock(
+            data=[MagicMock(embedding=[0.1, 0.2, 0.3, 0.4])]
+        )
+
+        result = await embedder._embed_batch(["hello"], MagicMock(), 4, tokens=7)
+
+        assert result == [[0.1, 0.2, 0.3, 0.4]]
+        embedder._rate_limiter.acquire.assert_awaited_once_with(tokens=7)
+
+    @pytest.mark.asyncio
+    async def test_api_error_returns_zero_vectors(self):
+        """A failed API call doesn't kill the sync: the batch gets zero vectors."""
+        embedder = _embedder()
+        embedder._client.embeddings.create.side_effect = RuntimeError("server error")
+
+        result = await embedder._embed_batch(["hello"], MagicMock(), 4, tokens=1)
+        assert result == [[0.0] * 4]
+
+    @pytest.mark.asyncio
+    async def test_batcher_keeps_zero_vector_policy_on_api_error(self):
+        """With the pod-wide batcher, a failed API call still returns zero vectors."""
+        embedder = _embedder()
+        embedder._tokenizer = MagicMock()
+        embedder._tokenizer.encode.return_value = [1]
+        embedder._client.embeddings.create.side_effect = RuntimeError("server error")
+        context = MagicMock()
+        context.sync_id = "sync-1"
+
+        with (
+            patch("airweave.platform.embedders.openai.settings") as mock_settings,
+            patch("airweave.platform.embedders.batcher._batchers", {}),
+            patch("airweave.platform.embedders.batcher.settings") as batcher_settings,
+        ):
+            mock_settings.EMBEDDING_BATCHER_ENABLED = True
+            batcher_settings.EMBEDDING_BATCHER_MAX_LINGER_MS = 0
+            result = await embedder.embed_many(["hello", "world"], context)
+
+        assert result == [[0.0] * 4, [0.0] * 4]
+
+
+class TestEmbedSubBatches:
+    """Tests for concurrent sub-batch embedding."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        """Sub-batches run concurrently; their embeddings come back in input order."""
+        embedder = _embedder()
+
+        async def embed_sub_batch(texts, logger, output_dims):
+            return [[float(text)] for text in texts]
+
+        embedder._embed_sub_batch = embed_sub_batch
+        sub_batches = [["0", "1"], ["2"], ["3", "4"]]
+
+        result = await embedder._embed_sub_batches(sub_batches, MagicMock(), 4)
+
+        assert result == [[0.0], [1.0], [2.0], [3.0], [4.0]]
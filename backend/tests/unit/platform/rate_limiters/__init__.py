@@ -0,0 +1 @@
+"""Tests for platform rate limiters."""
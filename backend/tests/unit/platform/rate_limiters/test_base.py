@@ -0,0 +1,205 @@
+"""Unit tests for the token bucket BaseRateLimiter."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from airweave.platform.rate_limiters._base import BaseRateLimiter, _Bucket
+
+
+class _TestRateLimiter(BaseRateLimiter):
+    RATE_LIMIT_PER_POD_RPS = 10.0  # Burst of 10, then one every 100ms
+    RATE_LIMIT_PER_POD_TPM = 600.0  # 10 tokens per second, burst of 600
+    MAX_WAIT_FOR_SLOT_SECONDS = 5.0
+    RATE_LIMIT_CLUSTER_RPS = 20.0
+    RATE_LIMIT_CLUSTER_TPM = 1200.0
+
+
+@pytest.fixture
+def limiter():
+    """Fresh limiter per test (the class is a per-pod singleton)."""
+    _TestRateLimiter._instance = None
+    yield _TestRateLimiter()
+    _TestRateLimiter._instance = None
+
+
+@pytest.fixture
+def clock():
+    """Frozen monotonic clock; asyncio.sleep records waits instead of sleeping."""
+    with (
+        patch("airweave.platform.rate_limiters._base.time.monotonic", return_value=100.0),
+        patch(
+            "airweave.platform.rate_limiters._base.asyncio.sleep", new_callable=AsyncMock
+        ) as sleep,
+        patch("airweave.platform.rate_limiters._base.settings") as settings,
+    ):
+        settings.PLATFORM_RATE_LIMITER_REDIS_ENABLED = False
+        yield sleep
+
+
+def _waits(sleep):
+    return [round(call.args[0], 6) for call in sleep.await_args_list]
+
+
+class TestBucket:
+    def test_full_bucket_admits_burst(self):
+        bucket = _Bucket(rate=10.0, capacity=10.0)
+        for _ in range(10):
+            assert bucket.wait_for(1.0, now=0.0) <= 0
+            bucket.commit(1.0, now=0.0)
+        assert bucket.wait_for(1.0, now=0.0) == pytest.approx(0.1)
+
+    def test_refills_over_time(self):
+        bucket = _Bucket(rate=10.0, capacity=10.0)
+        for _ in range(10):
+            bucket.commit(1.0, now=0.0)
+        assert bucket.wait_for(1.0, now=0.1) == pytest.approx(0.0)
+        assert bucket.wait_for(5.0, now=0.1) == pytest.approx(0.4)
+
+    def test_refund_returns_capacity(self):
+        bucket = _Bucket(rate=10.0, capacity=1.0)
+        bucket.commit(1.0, now=0.0)
+        bucket.commit(1.0, now=0.0)
+        assert bucket.wait_for(1.0, now=0.0) == pytest.approx(0.2)
+        bucket.refund(1.0)
+        assert bucket.wait_for(1.0, now=0.0) == pytest.approx(0.1)
+
+
+@pytest.mark.asyncio
+async def test_burst_is_admitted_without_sleeping(limiter, clock):
+    """Requests within the burst do not sleep at all."""
+    for _ in range(10):
+        await limiter.acquire()
+
+    clock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_waiters_sleep_exact_fifo_waits(limiter, clock):
+    """Past the burst each caller sleeps once, for exactly its slot, in arrival order."""
+    for _ in range(10):
+        await limiter.acquire()
+
+    await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+
+    assert _waits(clock) == [0.1, 0.2, 0.3]
+
+
+@pytest.mark.asyncio
+async def test_tokens_are_weighted(limiter, clock):
+    """acquire(tokens=...) waits on the token bucket when it is the tighter limit."""
+    await limiter.acquire(tokens=600)
+    await limiter.acquire(tokens=20)
+
+    assert _waits(clock) == [2.0]
+
+
+@pytest.mark.asyncio
+async def test_tokens_ignored_without_token_limit(clock):
+    """Limiters without a TPM limit only count requests."""
+
+    class _RequestsOnly(BaseRateLimiter):
+        RATE_LIMIT_PER_POD_RPS = 10.0
+
+    _RequestsOnly._instance = None
+    await _RequestsOnly().acquire(tokens=10_000)
+
+    clock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_raises_immediately_when_wait_exceeds_max(limiter, clock):
+    """A slot further away than MAX_WAIT_FOR_SLOT_SECONDS fails without sleeping."""
+    await limiter.acquire(tokens=600)
+
+    with pytest.raises(TimeoutError):
+        await limiter.acquire(tokens=60)  # 6s away
+
+    clock.assert_not_awaited()
+    await limiter.acquire(tokens=10)  # The failed call reserved nothing
+    assert _waits(clock) == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_openai_limiter_paces_large_token_requests(clock):
+    """Requests beyond the per-pod TPM budget wait for it instead of failing."""
+    from airweave.platform.rate_limiters.openai import OpenAIRateLimiter
+
+    OpenAIRateLimiter._instance = None
+    try:
+        limiter = OpenAIRateLimiter()
+        for _ in range(5):
+            await limiter.acquire(tokens=300_000)
+    finally:
+        OpenAIRateLimiter._instance = None
+
+    # 750k tokens burst, then 12.5k tokens per second
+    assert _waits(clock) == [12.0, 36.0, 60.0]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_refunds_reservation(limiter, clock):
+    """A caller cancelled while waiting hands its slot back."""
+    for _ in range(10):
+        await limiter.acquire()
+    clock.side_effect = [asyncio.CancelledError(), None]
+
+    with pytest.raises(asyncio.CancelledError):
+        await limiter.acquire()
+    await limiter.acquire()
+
+    assert _waits(clock) == [0.1, 0.1]
+
+
+@pytest.mark.asyncio
+async def test_cluster_reservation_uses_redis(limiter, clock):
+    """With Redis coordination the wait comes from the cluster-wide buckets."""
+    with (
+        patch("airweave.platform.rate_limiters._base.settings") as settings,
+        patch("airweave.core.redis_client.redis_client") as redis_client,
+    ):
+        settings.PLATFORM_RATE_LIMITER_REDIS_ENABLED = True
+        redis_client.client.evalsha = AsyncMock(return_value=[1, "0.25"])
+
+        await limiter.acquire(tokens=30)
+
+    args = redis_client.client.evalsha.await_args.args
+    assert args[0] == BaseRateLimiter.LUA_RESERVE_SHA
+    assert args[1] == 2
+    assert args[2:4] == (
+        "platform_rate_limit:_TestRateLimiter:requests",
+        "platform_rate_limit:_TestRateLimiter:tokens",
+    )
+    assert args[4:] == (5.0, 20.0, 20.0, 1.0, 20.0, 1200.0, 30.0)
+    assert _waits(clock) == [0.25]
+
+
+@pytest.mark.asyncio
+async def test_cluster_denial_raises_timeout(limiter, clock):
+    """Redis refusing the reservation fails fast like the local limit."""
+    with (
+        patch("airweave.platform.rate_limiters._base.settings") as settings,
+        patch("airweave.core.redis_client.redis_client") as redis_client,
+    ):
+        settings.PLATFORM_RATE_LIMITER_REDIS_ENABLED = True
+        redis_client.client.evalsha = AsyncMock(return_value=[0, "12.5"])
+
+        with pytest.raises(TimeoutError):
+            await limiter.acquire()
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_local_buckets_when_redis_fails(limiter, clock):
+    """Redis errors degrade to the per-pod limit instead of failing the caller."""
+    with (
+        patch("airweave.platform.rate_limiters._base.settings") as settings,
+        patch("airweave.core.redis_client.redis_client") as redis_client,
+    ):
+        settings.PLATFORM_RATE_LIMITER_REDIS_ENABLED = True
+        redis_client.client.evalsha = AsyncMock(side_effect=ConnectionError("down"))
+
+        for _ in range(11):
+            await limiter.acquire()
+
+    assert _waits(clock) == [0.1]
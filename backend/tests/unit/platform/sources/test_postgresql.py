@@ -0,0 +1,661 @@
+"""Unit tests for PostgreSQLSource table streaming.
+
+Validates that:
+- Tables are streamed concurrently over the pool, and a failing table fails the sync
+- A table's cursor values are saved only after its last entity was yielded, so
+  checkpoints never cover rows still waiting in the stream queue
+- Syncs save per-table watermarks and key snapshots in the cursor
+- The next sync re-reads rows from an overlap window before the watermark and yields
+  deletions for the rows the key diff reports as gone, diffing in Python when the SQL
+  diff can't run
+- A table without diffable keys or with a missing key snapshot makes every table sync
+  in full without cursor state
+- Merged partition cursors keep every table's watermark and key snapshot
+- Only NOT NULL modification timestamps make a table incremental
+"""
+
+import asyncio
+import copy
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import asyncpg
+import pytest
+
+from airweave.platform.cursors import PostgreSQLCursor
+from airweave.platform.entities._base import DeletionEntity, PolymorphicEntity
+from airweave.platform.sources import postgresql as postgresql_module
+from airweave.platform.sources.postgresql import PostgreSQLSource, _TableSynced
+from airweave.platform.storage.backends.filesystem import FilesystemBackend
+from airweave.platform.sync.checkpoint import SyncCheckpointer
+from airweave.platform.sync.cursor import SyncCursor
+
+TABLE_KEY = "public.users"
+
+
+def _source() -> PostgreSQLSource:
+    source = PostgreSQLSource()
+    source.set_logger(MagicMock())
+    return source
+
+
+# ---------------------------------------------------------------------------
+# Concurrent table streaming
+# ---------------------------------------------------------------------------
+
+
+class _FakePool:
+    """Pool handing out the given connection (or a plain object if tables are faked)."""
+
+    def __init__(self, conn=None):
+        self.conn = conn
+
+    def acquire(self):
+        conn = self.conn or self
+
+        class _Acquire:
+            async def __aenter__(self):
+                return conn
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+        return _Acquire()
+
+    async def close(self):
+        pass
+
+
+class TestStreamTables:
+    """Test streaming tables concurrently into one entity stream."""
+
+    @pytest.mark.asyncio
+    async def test_streams_tables_concurrently(self):
+        """Four connections stream eight slow tables in about a quarter of the time."""
+        source = _source()
+        tables = [f"table_{i}" for i in range(8)]
+        in_flight = peak = 0
+
+        async def process_table(conn, schema, table):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            for row in range(3):
+                await asyncio.sleep(0.02)
+                yield f"{table}:{row}"
+            in_flight -= 1
+
+        source._process_table = process_table
+
+        start = time.perf_counter()
+        entities = [e async for e in source._stream_tables(_FakePool(), "public", tables, 4)]
+        elapsed = time.perf_counter() - start
+
+        assert sorted(entities) == sorted(f"{t}:{r}" for t in tables for r in range(3))
+        assert peak == 4
+        assert elapsed < 8 * 3 * 0.02 / 2
+
+    @pytest.mark.asyncio
+    async def test_failing_table_fails_the_stream(self):
+        """An error in one table surfaces and stops the other tables."""
+        source = _source()
+        streamed: List[str] = []
+
+        async def process_table(conn, schema, table):
+            if table == "broken":
+                raise RuntimeError("relation is gone")
+            for row in range(100):
+                await asyncio.sleep(0.01)
+                streamed.append(table)
+                yield row
+
+        source._process_table = process_table
+
+        with pytest.raises(RuntimeError, match="relation is gone"):
+            async for _ in source._stream_tables(_FakePool(), "public", ["ok", "broken"], 2):
+                pass
+        assert len(streamed) < 100
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_only_cover_fully_yielded_tables(self):
+        """Queued rows of a table are not covered by a checkpoint including its watermark."""
+        source = _source()
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=PostgreSQLCursor)
+        source.set_cursor(cursor)
+        source.TABLE_STREAM_QUEUE_SIZE = 4
+        tables = ["a", "b", "c"]
+
+        async def process_table(conn, schema, table):
+            for row in range(6):
+                yield f"{table}:{row}"
+            yield _TableSynced(f"public.{table}", f"snapshots/{table}", "2024-05-01")
+
+        source._process_table = process_table
+        now = 0.0
+        checkpointer = SyncCheckpointer(cursor, interval_seconds=1.0, clock=lambda: now)
+        yielded: List[str] = []
+        checkpoints = []
+
+        async for entity in source._stream_tables(_FakePool(), "public", tables, 2):
+            # Let the table workers run ahead and fill the queue
+            await asyncio.sleep(0)
+            checkpointer.record_produced()
+            checkpointer.complete(checkpointer.dispatch(1))
+            yielded.append(entity)
+            now += 1.0
+            checkpoint = checkpointer.next_checkpoint()
+            if checkpoint:
+                checkpoints.append(checkpoint)
+
+        assert checkpoints
+        for checkpoint in checkpoints:
+            covered = yielded[: checkpoint.position]
+            for table_key in checkpoint.cursor_data["table_cursors"]:
+                table = table_key.split(".")[1]
+                assert all(f"{table}:{row}" in covered for row in range(6))
+        assert cursor.data["table_cursors"] == {f"public.{t}": "2024-05-01" for t in tables}
+        assert cursor.data["key_snapshots"] == {f"public.{t}": f"snapshots/{t}" for t in tables}
+
+
+# ---------------------------------------------------------------------------
+# Incremental syncs
+# ---------------------------------------------------------------------------
+
+
+class _Rows:
+    """Server-side cursor stand-in."""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for row in self.rows:
+            yield row
+
+
+class _Transaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _FakeConnection:
+    """Connection serving a table's rows, its keys and the rows the key diff reports."""
+
+    def __init__(
+        self,
+        rows,
+        keys,
+        deleted_ids=(),
+        max_updated_at="2024-05-01 00:00:00+00",
+        read_only=False,
+    ):
+        self.rows = rows
+        self.keys = keys
+        self.deleted_ids = deleted_ids
+        self.max_updated_at = max_updated_at
+        self.read_only = read_only
+        self.row_queries: List[tuple] = []
+        self.copied_keys: List[tuple] = []
+
+    def transaction(self, **kwargs):
+        return _Transaction()
+
+    async def fetchval(self, query, *args):
+        return self.max_updated_at
+
+    def cursor(self, query, *args, prefetch=None):
+        if query.startswith('SELECT "id" FROM'):
+            return _Rows(self.keys)
+        self.row_queries.append((" ".join(query.split()), args))
+        return _Rows(self.rows)
+
+    async def execute(self, query, *args):
+        if self.read_only and query.startswith("CREATE"):
+            raise asyncpg.exceptions.ReadOnlySQLTransactionError(
+                "cannot execute CREATE TABLE in a read-only transaction"
+            )
+        return "OK"
+
+    async def copy_records_to_table(self, table_name, records):
+        self.copied_keys = list(records)
+
+    async def fetch(self, query, *args):
+        return [{"entity_id": entity_id} for entity_id in self.deleted_ids]
+
+
+def _row(row_id: int, name: str) -> Dict[str, Any]:
+    return {"id": row_id, "name": name, "updated_at": datetime(2024, 5, 1)}
+
+
+def _users_source(cursor: SyncCursor, source_connection_id: str) -> PostgreSQLSource:
+    """Source with the users table prepared as _prepare_table() would."""
+    source = _source()
+    source.set_cursor(cursor)
+    source._source_connection_id = source_connection_id
+    source.entity_classes[TABLE_KEY] = PolymorphicEntity.create_table_entity_class(
+        table_name="users",
+        schema_name="public",
+        columns={
+            "id_": {"python_type": int},
+            "name_field": {"python_type": str},
+            "updated_at_field": {"python_type": datetime},
+        },
+        primary_keys=["id"],
+    )
+    source.column_field_mappings[TABLE_KEY] = {
+        "id": "id_",
+        "name": "name_field",
+        "updated_at": "updated_at_field",
+    }
+    source.recency_columns[TABLE_KEY] = ("updated_at", "timestamp with time zone")
+    source.key_column_types[TABLE_KEY] = {"id": "bigint"}
+    return source
+
+
+async def _sync_users(source: PostgreSQLSource, conn: _FakeConnection) -> list:
+    stream = source._stream_tables(_FakePool(conn), "public", ["users"], 1)
+    return [entity async for entity in stream]
+
+
+class TestIncrementalSync:
+    """Test watermarks and key-diff deletes across two syncs of one table."""
+
+    @pytest.mark.asyncio
+    async def test_second_sync_reads_changed_rows_and_deletions(self, monkeypatch, tmp_path):
+        """Sync one saves the cursor; sync two streams past it and yields deletions."""
+        storage = FilesystemBackend(tmp_path)
+        monkeypatch.setattr(postgresql_module, "_storage", lambda: storage)
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=PostgreSQLCursor)
+        source_connection_id = str(uuid4())
+
+        first = _FakeConnection(rows=[_row(1, "ada"), _row(2, "grace")], keys=[])
+        entities = await _sync_users(_users_source(cursor, source_connection_id), first)
+
+        assert [e.entity_id for e in entities] == ["public.users:1", "public.users:2"]
+        assert first.row_queries == [('SELECT * FROM "public"."users"', ())]
+        assert cursor.data["table_cursors"] == {TABLE_KEY: "2024-05-01 00:00:00+00"}
+        first_snapshot = cursor.data["key_snapshots"][TABLE_KEY]
+
+        second = _FakeConnection(
+            rows=[_row(1, "ada lovelace")],
+            keys=[{"id": 1}, {"id": 3}],
+            deleted_ids=["public.users:2"],
+            max_updated_at="2024-05-02 00:00:00+00",
+        )
+        entities = await _sync_users(_users_source(cursor, source_connection_id), second)
+
+        deletion, changed = entities
+        assert isinstance(deletion, DeletionEntity)
+        assert deletion.entity_id == "public.users:2"
+        assert deletion.deletion_status == "removed"
+        assert deletion.deletes_entity_class.__name__ == "UsersTableEntity"
+        assert changed.entity_id == "public.users:1" and changed.name == "ada lovelace"
+
+        assert second.copied_keys == [("public.users:1", ["1"]), ("public.users:2", ["2"])]
+        assert second.row_queries == [
+            (
+                'SELECT * FROM "public"."users" '
+                'WHERE "updated_at" >= $1::text::timestamp with time zone '
+                "- make_interval(secs => $2)",
+                ("2024-05-01 00:00:00+00", 300.0),
+            )
+        ]
+        assert cursor.data["table_cursors"] == {TABLE_KEY: "2024-05-02 00:00:00+00"}
+        second_snapshot = cursor.data["key_snapshots"][TABLE_KEY]
+        assert second_snapshot != first_snapshot
+        snapshot = await storage.read_file(second_snapshot)
+        snapshot_keys = list(PostgreSQLSource._read_snapshot_keys(snapshot))
+        assert snapshot_keys == [("public.users:1", ["1"]), ("public.users:3", ["3"])]
+
+        # The next sync deletes snapshots the (persisted) cursor no longer references
+        third = _FakeConnection(rows=[], keys=[{"id": 1}, {"id": 3}], deleted_ids=[])
+        await _sync_users(_users_source(cursor, source_connection_id), third)
+        assert not await storage.exists(first_snapshot)
+        assert await storage.exists(second_snapshot)
+        assert await storage.exists(cursor.data["key_snapshots"][TABLE_KEY])
+
+    @pytest.mark.asyncio
+    async def test_failed_sql_diff_falls_back_to_python_diff(self, monkeypatch, tmp_path):
+        """On a read-only replica the deletions are found by diffing keys in Python."""
+        storage = FilesystemBackend(tmp_path)
+        monkeypatch.setattr(postgresql_module, "_storage", lambda: storage)
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=PostgreSQLCursor)
+        source_connection_id = str(uuid4())
+        first = _FakeConnection(rows=[_row(1, "ada"), _row(2, "grace")], keys=[])
+        await _sync_users(_users_source(cursor, source_connection_id), first)
+
+        second = _FakeConnection(
+            rows=[],
+            keys=[{"id": 1}, {"id": 3}],
+            max_updated_at="2024-05-02 00:00:00+00",
+            read_only=True,
+        )
+        entities = await _sync_users(_users_source(cursor, source_connection_id), second)
+
+        (deletion,) = entities
+        assert isinstance(deletion, DeletionEntity)
+        assert deletion.entity_id == "public.users:2"
+        assert cursor.data["table_cursors"] == {TABLE_KEY: "2024-05-02 00:00:00+00"}
+
+    @pytest.mark.asyncio
+    async def test_missing_snapshot_keeps_cursor_values(self, monkeypatch, tmp_path):
+        """A table whose snapshot is gone is fully scanned without replacing its cursor."""
+        storage = FilesystemBackend(tmp_path)
+        monkeypatch.setattr(postgresql_module, "_storage", lambda: storage)
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=PostgreSQLCursor)
+        source_connection_id = str(uuid4())
+        await _sync_users(
+            _users_source(cursor, source_connection_id),
+            _FakeConnection(rows=[_row(1, "ada")], keys=[]),
+        )
+        previous = dict(cursor.data)
+        await storage.delete(previous["key_snapshots"][TABLE_KEY])
+
+        conn = _FakeConnection(rows=[_row(1, "ada")], keys=[{"id": 1}])
+        entities = await _sync_users(_users_source(cursor, source_connection_id), conn)
+
+        assert [e.entity_id for e in entities] == ["public.users:1"]
+        assert conn.row_queries == [('SELECT * FROM "public"."users"', ())]
+        assert cursor.data == previous
+
+    @pytest.mark.asyncio
+    async def test_without_cursor_every_sync_is_full(self):
+        """Sources without a cursor stream whole tables and save nothing."""
+        source = _users_source(cursor=None, source_connection_id=str(uuid4()))
+        conn = _FakeConnection(rows=[_row(1, "ada")], keys=[])
+
+        entities = await _sync_users(source, conn)
+
+        assert [e.entity_id for e in entities] == ["public.users:1"]
+        assert conn.row_queries == [('SELECT * FROM "public"."users"', ())]
+
+    @pytest.mark.asyncio
+    async def test_overlap_window_is_configurable(self):
+        """The configured overlap is passed to the incremental scan."""
+        configured = await PostgreSQLSource.create({}, config={"incremental_overlap_seconds": 60})
+        source = _users_source(cursor=None, source_connection_id=str(uuid4()))
+        source.incremental_overlap_seconds = configured.incremental_overlap_seconds
+        conn = _FakeConnection(rows=[], keys=[])
+
+        entity_class = source.entity_classes[TABLE_KEY]
+        async for _ in source._process_table_with_streaming(
+            conn, "public", "users", entity_class, watermark="2024-05-01"
+        ):
+            pass
+
+        assert conn.row_queries[0][1] == ("2024-05-01", 60.0)
+
+    def test_recency_column_prefers_updated_timestamps(self):
+        """Timestamps without time zone count, and 'updated' names win."""
+        columns = [
+            {"column_name": "created_at", "data_type": "timestamp without time zone"},
+            {"column_name": "last_modified", "data_type": "timestamp without time zone"},
+            {"column_name": "name", "data_type": "text"},
+        ]
+        assert _source()._select_recency_column(columns) == "last_modified"
+
+
+def _with_undiffable_orders(source: PostgreSQLSource) -> PostgreSQLSource:
+    """Add an orders table whose key columns couldn't be resolved (like a view)."""
+    source.config = {}
+    source.entity_classes["public.orders"] = source.entity_classes[TABLE_KEY]
+    source.recency_columns["public.orders"] = None
+    source.key_column_types["public.orders"] = {}
+
+    async def noop(*args, **kwargs):
+        return None
+
+    async def get_table_list(schema):
+        return ["users", "orders"]
+
+    source._connect = noop
+    source._persist_field_catalog = noop
+    source._get_table_list = get_table_list
+    return source
+
+
+class TestUndiffableTables:
+    """Test that a table without diffable keys leaves deletes to orphan cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_all_tables_sync_in_full_without_cursor_state(self, monkeypatch, tmp_path):
+        """The users watermark and snapshot are dropped and every table is fully scanned."""
+        storage = FilesystemBackend(tmp_path)
+        monkeypatch.setattr(postgresql_module, "_storage", lambda: storage)
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=PostgreSQLCursor)
+        source_connection_id = str(uuid4())
+        await _sync_users(
+            _users_source(cursor, source_connection_id),
+            _FakeConnection(rows=[_row(1, "ada")], keys=[]),
+        )
+        users_snapshot = cursor.data["key_snapshots"][TABLE_KEY]
+
+        source = _with_undiffable_orders(_users_source(cursor, source_connection_id))
+        conn = _FakeConnection(rows=[_row(1, "ada")], keys=[{"id": 1}])
+
+        async def create_pool(size):
+            return _FakePool(conn)
+
+        source._create_pool = create_pool
+        entities = [e async for e in source.generate_entities()]
+
+        assert len(entities) == 2
+        assert not any(isinstance(e, DeletionEntity) for e in entities)
+        assert conn.row_queries == [
+            ('SELECT * FROM "public"."users"', ()),
+            ('SELECT * FROM "public"."orders"', ()),
+        ]
+        assert cursor.data == {"table_cursors": {}, "key_snapshots": {}}
+        assert not await storage.exists(users_snapshot)
+
+    @pytest.mark.asyncio
+    async def test_missing_snapshot_leaves_deletes_to_orphan_cleanup(self, monkeypatch, tmp_path):
+        """A missing key snapshot drops all cursor state, like an undiffable table."""
+        storage = FilesystemBackend(tmp_path)
+        monkeypatch.setattr(postgresql_module, "_storage", lambda: storage)
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=PostgreSQLCursor)
+        source_connection_id = str(uuid4())
+        await _sync_users(
+            _users_source(cursor, source_connection_id),
+            _FakeConnection(rows=[_row(1, "ada")], keys=[]),
+        )
+        await storage.delete(cursor.data["key_snapshots"][TABLE_KEY])
+
+        source = _with_undiffable_orders(_users_source(cursor, source_connection_id))
+        source.key_column_types["public.orders"] = {"id": "bigint"}
+        conn = _FakeConnection(rows=[_row(1, "ada")], keys=[{"id": 1}])
+
+        async def create_pool(size):
+            return _FakePool(conn)
+
+        source._create_pool = create_pool
+        entities = [e async for e in source.generate_entities()]
+
+        assert len(entities) == 2
+        assert conn.row_queries == [
+            ('SELECT * FROM "public"."users"', ()),
+            ('SELECT * FROM "public"."orders"', ()),
+        ]
+        assert cursor.data == {"table_cursors": {}, "key_snapshots": {}}
+        assert await source.get_partitions() == ["users", "orders"]
+
+    @pytest.mark.asyncio
+    async def test_missing_snapshot_is_not_partitioned(self, monkeypatch, tmp_path):
+        """Partitions can't drop the other tables' cursor state, so there are none."""
+        storage = FilesystemBackend(tmp_path)
+        monkeypatch.setattr(postgresql_module, "_storage", lambda: storage)
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=PostgreSQLCursor)
+        cursor.update(key_snapshots={TABLE_KEY: "pg_key_snapshots/gone.jsonl.gz"})
+        source = _with_undiffable_orders(_users_source(cursor, str(uuid4())))
+        source.key_column_types["public.orders"] = {"id": "bigint"}
+
+        assert await source.get_partitions() == []
+
+    @pytest.mark.asyncio
+    async def test_sync_is_not_partitioned(self):
+        """A partition can't make the other tables sync in full, so there are none."""
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=PostgreSQLCursor)
+        source = _with_undiffable_orders(_users_source(cursor, str(uuid4())))
+
+        assert await source.get_partitions() == []
+
+        source.key_column_types["public.orders"] = {"id": "bigint"}
+        assert await source.get_partitions() == ["users", "orders"]
+
+
+def _partition_source(cursor: SyncCursor, source_connection_id: str, table: str):
+    """Source syncing one table partition, prepared like the users table."""
+    source = _users_source(cursor, source_connection_id)
+    source.config = {}
+    source.set_partition(table)
+    table_key = f"public.{table}"
+    for prepared in (
+        source.entity_classes,
+        source.column_field_mappings,
+        source.recency_columns,
+        source.key_column_types,
+    ):
+        prepared[table_key] = prepared[TABLE_KEY]
+    return source
+
+
+async def _sync_partitions(cursor_data: dict, source_connection_id: str, conns: dict) -> dict:
+    """Sync each table as its own partition from cursor_data and merge their cursors."""
+    partition_cursors = {}
+    for table, conn in conns.items():
+        cursor = SyncCursor(
+            sync_id=uuid4(), cursor_schema=PostgreSQLCursor, cursor_data=copy.deepcopy(cursor_data)
+        )
+        source = _partition_source(cursor, source_connection_id, table)
+        [_ async for _ in source._stream_tables(_FakePool(conn), "public", [table], 1)]
+        partition_cursors[table] = copy.deepcopy(cursor.data)
+    final = _partition_source(None, source_connection_id, "users")
+    return final.merge_partition_cursors(partition_cursors)
+
+
+class TestPartitionedSync:
+    """Test merging the cursors of table partitions."""
+
+    @pytest.mark.asyncio
+    async def test_every_tables_cursor_values_survive_the_merge(self, monkeypatch, tmp_path):
+        """Each table keeps the watermark and snapshot its own partition saved."""
+        storage = FilesystemBackend(tmp_path)
+        monkeypatch.setattr(postgresql_module, "_storage", lambda: storage)
+        source_connection_id = str(uuid4())
+        tables = ("users", "orders")
+
+        first = await _sync_partitions(
+            {},
+            source_connection_id,
+            {
+                table: _FakeConnection(rows=[_row(1, "a"), _row(2, "b")], keys=[])
+                for table in tables
+            },
+        )
+        assert first["table_cursors"] == {
+            f"public.{table}": "2024-05-01 00:00:00+00" for table in tables
+        }
+
+        second_conns = {
+            table: _FakeConnection(
+                rows=[],
+                keys=[{"id": 1}],
+                deleted_ids=[f"public.{table}:2"],
+                max_updated_at="2024-05-02 00:00:00+00",
+            )
+            for table in tables
+        }
+        second = await _sync_partitions(first, source_connection_id, second_conns)
+
+        assert second["table_cursors"] == {
+            f"public.{table}": "2024-05-02 00:00:00+00" for table in tables
+        }
+        for table in tables:
+            table_key = f"public.{table}"
+            # Each partition diffed against the snapshot its table saved in the first sync
+            assert second_conns[table].copied_keys == [
+                (f"{table_key}:1", ["1"]),
+                (f"{table_key}:2", ["2"]),
+            ]
+            snapshot_path = second["key_snapshots"][table_key]
+            assert snapshot_path != first["key_snapshots"][table_key]
+            snapshot = await storage.read_file(snapshot_path)
+            assert list(PostgreSQLSource._read_snapshot_keys(snapshot)) == [
+                (f"{table_key}:1", ["1"])
+            ]
+
+    def test_table_values_come_from_their_own_partition(self):
+        """A partition's copies of other tables' previous values are ignored."""
+        source = _partition_source(None, str(uuid4()), "users")
+
+        merged = source.merge_partition_cursors(
+            {
+                "users": {"table_cursors": {"public.users": "2", "public.orders": "1"}},
+                "orders": {"table_cursors": {"public.users": "1", "public.orders": "2"}},
+            }
+        )
+
+        assert merged["table_cursors"] == {"public.users": "2", "public.orders": "2"}
+        assert merged["key_snapshots"] == {}
+
+
+def _column(pg_type: str, nullable: bool = False) -> Dict[str, Any]:
+    return {"pg_type": pg_type, "nullable": nullable}
+
+
+class TestModificationColumn:
+    """Test which column, if any, makes a table incremental."""
+
+    def test_creation_and_date_columns_are_not_modification_columns(self):
+        """Creation timestamps, dates and other names keep the table on full scans."""
+        columns = {
+            "created_at": _column("timestamp with time zone"),
+            "birth_date": _column("date"),
+            "order_date": _column("timestamp without time zone"),
+            "updated_on": _column("date"),
+        }
+        assert _source()._select_modification_column("public", "users", columns) is None
+
+    def test_not_null_updated_timestamp_is_used(self):
+        """A NOT NULL timestamp named like 'modified' is picked over creation times."""
+        columns = {
+            "created_at": _column("timestamp with time zone"),
+            "last_modified": _column("timestamp without time zone"),
+        }
+        assert _source()._select_modification_column("public", "users", columns) == (
+            "last_modified",
+            "timestamp without time zone",
+        )
+
+    def test_nullable_updated_timestamp_falls_back_to_full_scans(self):
+        """NULLs are never past a watermark, so nullable columns aren't used."""
+        columns = {"updated_at": _column("timestamp with time zone", nullable=True)}
+        assert _source()._select_modification_column("public", "users", columns) is None
+
+    @pytest.mark.asyncio
+    async def test_configured_column_wins(self):
+        """A configured 'table:column' is used, if it is a NOT NULL timestamp."""
+        source = await PostgreSQLSource.create(
+            {}, config={"modification_columns": "users:synced_at, public.orders:placed_on"}
+        )
+        source.set_logger(MagicMock())
+        columns = {
+            "updated_at": _column("timestamp with time zone"),
+            "synced_at": _column("timestamp with time zone"),
+            "placed_on": _column("date"),
+        }
+
+        assert source._select_modification_column("public", "users", columns) == (
+            "synced_at",
+            "timestamp with time zone",
+        )
+        assert source._select_modification_column("public", "orders", columns) is None
@@ -5,25 +5,47 @@ Verifies that:
 2. After max retries, SyncFailureError is raised (fail fast, fail loud)
 3. Timing logs fire for slow operations (>10s)
 4. Timing logs fire for slow content processing (>10s)
+5. Destinations sharing a ProcessingRequirement share one processor run
+6. Chunk-diff updates only rewrite changed chunks, refresh the payloads of unchanged
+   ones (matched by text, wherever they moved) and delete stale ones
 """
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 
+from airweave.platform.entities._base import AirweaveSystemMetadata, BaseEntity
+from airweave.platform.entities._airweave_field import AirweaveField
+from airweave.platform.sync.actions.entity.types import EntityActionBatch, EntityUpdateAction
 from airweave.platform.sync.exceptions import SyncFailureError
 from airweave.platform.sync.handlers.destination import DestinationHandler
+from airweave.platform.sync.pipeline import ProcessingRequirement
+from airweave.platform.sync.processors.chunk_embed import compute_chunk_hash
 
 
-def _make_mock_destination(soft_fail=False):
+class _TestDocEntity(BaseEntity):
+    """Test entity for shared processing."""
+
+    doc_id: str = AirweaveField(..., description="Test doc ID", is_entity_id=True)
+    name: str = AirweaveField(..., description="Test doc name", is_name=True)
+
+
+def _make_mock_destination(
+    soft_fail=False, name="MockDestination", requirement=None, supports_chunk_diff=False
+):
     """Create a mock destination with required attributes."""
     dest = MagicMock()
-    dest.__class__.__name__ = "MockDestination"
+    dest.__class__.__name__ = name
     dest.soft_fail = soft_fail
-    dest.processing_requirement = MagicMock()
+    dest.processing_requirement = requirement or MagicMock()
+    dest.supports_chunk_diff = supports_chunk_diff
     dest.bulk_insert = AsyncMock()
     dest.bulk_delete_by_parent_ids = AsyncMock()
+    dest.bulk_delete_by_entity_ids = AsyncMock()
+    dest.bulk_update_payloads = AsyncMock()
     return dest
 
 
@@ -272,3 +294,256 @@ class TestTimingLogs:
         assert len(slow_warnings) == 1
         assert "ChunkEmbedProcessor" in str(slow_warnings[0])
         assert "15.0s" in str(slow_warnings[0])
+
+
+class TestSharedProcessing:
+    """Test that destinations with the same requirement share one processor run."""
+
+    @pytest.mark.asyncio
+    async def test_embedder_called_once_for_two_vector_destinations(self):
+        """Qdrant + Vespa style destinations should chunk and embed once per batch."""
+        qdrant = _make_mock_destination(
+            name="FakeQdrant", requirement=ProcessingRequirement.CHUNKS_AND_EMBEDDINGS
+        )
+        vespa = _make_mock_destination(
+            name="FakeVespa", requirement=ProcessingRequirement.CHUNKS_AND_EMBEDDINGS
+        )
+        handler = DestinationHandler([qdrant, vespa])
+
+        ctx = _make_mock_sync_context()
+        ctx.entity_tracker = AsyncMock()
+        ctx.collection.vector_size = 3
+        ctx.collection.embedding_model_name = "test-model"
+
+        entities = [
+            _TestDocEntity(
+                doc_id=f"doc-{i}",
+                entity_id=f"doc-{i}",
+                breadcrumbs=[],
+                name=f"Doc {i}",
+                textual_representation=f"Body {i}",
+                airweave_system_metadata=AirweaveSystemMetadata(),
+            )
+            for i in range(2)
+        ]
+
+        dense_embedder = MagicMock()
+        dense_embedder.embed_many = AsyncMock(
+            side_effect=lambda texts, _ctx: [[0.1, 0.2, 0.3] for _ in texts]
+        )
+        sparse_embedder = MagicMock()
+        sparse_embedder.embed_many = AsyncMock(side_effect=lambda texts, _ctx: [{} for _ in texts])
+        chunker = MagicMock()
+        chunker.chunk_batch = AsyncMock(
+            side_effect=lambda texts, **_: [[{"text": "a"}, {"text": "b"}] for _ in texts]
+        )
+
+        async def build_for_batch(batch, _ctx):
+            return batch
+
+        with patch(
+            "airweave.platform.sync.processors.chunk_embed.text_builder.build_for_batch",
+            side_effect=build_for_batch,
+        ), patch(
+            "airweave.platform.chunkers.semantic.SemanticChunker", return_value=chunker
+        ), patch(
+            "airweave.platform.embedders.get_dense_embedder", return_value=dense_embedder
+        ), patch(
+            "airweave.platform.embedders.SparseEmbedder", return_value=sparse_embedder
+        ):
+            await handler._do_process_and_insert(entities, ctx)
+
+        dense_embedder.embed_many.assert_awaited_once()
+        sparse_embedder.embed_many.assert_awaited_once()
+        chunker.chunk_batch.assert_awaited_once()
+
+        qdrant_chunks = qdrant.bulk_insert.await_args.args[0]
+        vespa_chunks = vespa.bulk_insert.await_args.args[0]
+        assert len(qdrant_chunks) == 4
+        assert qdrant_chunks is vespa_chunks
+
+        # One processor run and 4 chunk embeddings saved for the second destination
+        ctx.entity_tracker.record_shared_processing.assert_awaited_once_with(
+            runs_saved=1, embeddings_saved=4
+        )
+
+    @pytest.mark.asyncio
+    async def test_different_requirements_processed_separately(self):
+        """Destinations with different requirements each get their own processor run."""
+        vector = _make_mock_destination(
+            name="FakeVector", requirement=ProcessingRequirement.CHUNKS_AND_EMBEDDINGS
+        )
+        storage = _make_mock_destination(
+            name="FakeStorage", requirement=ProcessingRequirement.RAW
+        )
+        handler = DestinationHandler([vector, storage])
+        ctx = _make_mock_sync_context()
+
+        processors = {}
+
+        def get_processor(dest):
+            processor = MagicMock()
+            processor.process = AsyncMock(side_effect=lambda batch, _ctx: batch)
+            processors[dest.__class__.__name__] = processor
+            return processor
+
+        mock_entity = MagicMock()
+        mock_entity.model_copy = MagicMock(side_effect=lambda deep=False: MagicMock())
+
+        with patch.object(handler, "_get_processor", side_effect=get_processor):
+            await handler._do_process_and_insert([mock_entity], ctx)
+
+        assert set(processors) == {"FakeVector", "FakeStorage"}
+        for processor in processors.values():
+            processor.process.assert_awaited_once()
+        # Each requirement group works on its own deep copy
+        assert mock_entity.model_copy.call_count == 2
+        assert vector.bulk_insert.await_args.args[0] is not storage.bulk_insert.await_args.args[0]
+
+
+class TestChunkDiffUpdates:
+    """Test that updates with stored chunk hashes only rewrite changed chunks."""
+
+    def _make_update_batch(self, previous_hashes):
+        entity = _TestDocEntity(
+            doc_id="doc-0",
+            entity_id="doc-0",
+            breadcrumbs=[],
+            name="Doc 0",
+            textual_representation="Body",
+            airweave_system_metadata=AirweaveSystemMetadata(),
+        )
+        definition_id = uuid4()
+        action = EntityUpdateAction(
+            entity=entity, entity_definition_id=definition_id, db_id=uuid4()
+        )
+        return EntityActionBatch(
+            updates=[action],
+            existing_map={("doc-0", definition_id): SimpleNamespace(chunk_hashes=previous_hashes)},
+        )
+
+    def _make_sync_context(self):
+        ctx = _make_mock_sync_context()
+        ctx.entity_tracker = AsyncMock()
+        ctx.collection.vector_size = 3
+        ctx.collection.embedding_model_name = "test-model"
+        ctx.execution_config.behavior.chunk_diff_updates = True
+        return ctx
+
+    async def _run(self, handler, batch, ctx, dense_embedder, chunk_texts=("a", "c")):
+        sparse_embedder = MagicMock()
+        sparse_embedder.embed_many = AsyncMock(side_effect=lambda texts, _ctx: [{} for _ in texts])
+        chunker = MagicMock()
+        chunker.chunk_batch = AsyncMock(return_value=[[{"text": text} for text in chunk_texts]])
+
+        async def build_for_batch(batch, _ctx):
+            return batch
+
+        with patch(
+            "airweave.platform.sync.processors.chunk_embed.text_builder.build_for_batch",
+            side_effect=build_for_batch,
+        ), patch(
+            "airweave.platform.chunkers.semantic.SemanticChunker", return_value=chunker
+        ), patch(
+            "airweave.platform.embedders.get_dense_embedder", return_value=dense_embedder
+        ), patch(
+            "airweave.platform.embedders.SparseEmbedder", return_value=sparse_embedder
+        ):
+            await handler.handle_batch(batch, ctx)
+        return sparse_embedder
+
+    @pytest.mark.asyncio
+    async def test_only_changed_chunks_rewritten_and_stale_chunks_deleted(self):
+        """Unchanged chunk 0 is kept, edited chunk 1 rewritten, removed chunk 2 deleted."""
+        vector = _make_mock_destination(
+            name="FakeVector",
+            requirement=ProcessingRequirement.CHUNKS_AND_EMBEDDINGS,
+            supports_chunk_diff=True,
+        )
+        handler = DestinationHandler([vector])
+        batch = self._make_update_batch(
+            [compute_chunk_hash("a"), compute_chunk_hash("b"), compute_chunk_hash("x")]
+        )
+        ctx = self._make_sync_context()
+        dense_embedder = MagicMock()
+        dense_embedder.embed_many = AsyncMock(
+            side_effect=lambda texts, _ctx: [[0.1, 0.2, 0.3] for _ in texts]
+        )
+
+        sparse_embedder = await self._run(handler, batch, ctx, dense_embedder)
+
+        vector.bulk_delete_by_parent_ids.assert_not_awaited()
+        vector.bulk_delete_by_entity_ids.assert_awaited_once()
+        delete_call = vector.bulk_delete_by_entity_ids.await_args
+        assert delete_call.args == (["doc-0__chunk_2"], "test-sync-id")
+        assert [e.entity_id for e in delete_call.kwargs["parent_entities"]] == ["doc-0"]
+        dense_embedder.embed_many.assert_awaited_once_with(["c"], ctx)
+        inserted = vector.bulk_insert.await_args.args[0]
+        assert [c.entity_id for c in inserted] == ["doc-0__chunk_1"]
+        updated = vector.bulk_update_payloads.await_args.args[0]
+        assert [c.entity_id for c in updated] == ["doc-0__chunk_0"]
+        # Unchanged chunks get fresh sparse vectors: BM25 covers the whole chunk entity
+        assert updated[0].airweave_system_metadata.dense_embedding is None
+        assert updated[0].airweave_system_metadata.sparse_embedding is not None
+        calls = sparse_embedder.embed_many.await_args_list
+        assert [len(c.args[0]) for c in calls] == [1, 1]
+        # New hashes are carried on the batch entity for EntityPostgresHandler
+        assert batch.updates[0].entity.airweave_system_metadata.chunk_hashes == [
+            compute_chunk_hash("a"),
+            compute_chunk_hash("c"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_shifted_chunks_keep_their_documents(self):
+        """Text inserted before stored chunks only embeds and writes the new chunk."""
+        vector = _make_mock_destination(
+            name="FakeVector",
+            requirement=ProcessingRequirement.CHUNKS_AND_EMBEDDINGS,
+            supports_chunk_diff=True,
+        )
+        handler = DestinationHandler([vector])
+        batch = self._make_update_batch([compute_chunk_hash("a"), compute_chunk_hash("b")])
+        ctx = self._make_sync_context()
+        dense_embedder = MagicMock()
+        dense_embedder.embed_many = AsyncMock(
+            side_effect=lambda texts, _ctx: [[0.1, 0.2, 0.3] for _ in texts]
+        )
+
+        await self._run(handler, batch, ctx, dense_embedder, chunk_texts=("new", "a", "b"))
+
+        dense_embedder.embed_many.assert_awaited_once_with(["new"], ctx)
+        inserted = vector.bulk_insert.await_args.args[0]
+        assert [
+            (c.entity_id, c.airweave_system_metadata.chunk_index) for c in inserted
+        ] == [("doc-0__chunk_2", 2)]
+        updated = vector.bulk_update_payloads.await_args.args[0]
+        assert [
+            (c.entity_id, c.airweave_system_metadata.chunk_index) for c in updated
+        ] == [("doc-0__chunk_0", 0), ("doc-0__chunk_1", 1)]
+        vector.bulk_delete_by_entity_ids.assert_not_awaited()
+        assert batch.updates[0].entity.airweave_system_metadata.chunk_hashes == [
+            compute_chunk_hash("a"),
+            compute_chunk_hash("b"),
+            compute_chunk_hash("new"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_full_rewrite_without_diff_support(self):
+        """Destinations that cannot delete single chunks get delete + full re-insert."""
+        vector = _make_mock_destination(
+            name="FakeVector", requirement=ProcessingRequirement.CHUNKS_AND_EMBEDDINGS
+        )
+        handler = DestinationHandler([vector])
+        batch = self._make_update_batch([compute_chunk_hash("a")])
+        ctx = self._make_sync_context()
+        dense_embedder = MagicMock()
+        dense_embedder.embed_many = AsyncMock(
+            side_effect=lambda texts, _ctx: [[0.1, 0.2, 0.3] for _ in texts]
+        )
+
+        await self._run(handler, batch, ctx, dense_embedder)
+
+        vector.bulk_delete_by_parent_ids.assert_awaited_once_with(["doc-0"], "test-sync-id")
+        vector.bulk_delete_by_entity_ids.assert_not_awaited()
+        vector.bulk_update_payloads.assert_not_awaited()
+        assert len(vector.bulk_insert.await_args.args[0]) == 2
@@ -0,0 +1,162 @@
+"""Tests for compact encountered-ID tracking.
+
+Validates that:
+1. EncounteredIdStore dedupes across the buffer, merges and memory-mapped spills
+2. track_entities_batch flags duplicates within and across batches, per type
+3. The flat view answers membership by entity ID and reports memory stats
+"""
+
+import hashlib
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+
+from airweave.platform.sync.pipeline.encountered_ids import (
+    HASH_DTYPE,
+    EncounteredIdStore,
+    entity_id_hash,
+    entity_id_hashes,
+)
+from airweave.platform.sync.pipeline.entity_tracker import EntityTracker
+
+
+def _make_tracker():
+    return EntityTracker(job_id=uuid4(), sync_id=uuid4(), logger=MagicMock())
+
+
+def _keys(*values: int) -> np.ndarray:
+    """16-byte keys that sort like the given integers."""
+    return np.array([v.to_bytes(16, "big") for v in values], dtype=HASH_DTYPE)
+
+
+def _key(value: int) -> bytes:
+    return value.to_bytes(16, "big")
+
+
+class TestEntityIdHash:
+    """Test the 128-bit ID hash."""
+
+    def test_matches_sql_expression(self):
+        """Python hash is the full digest behind md5(id)::uuid."""
+        entity_id = "issue-42"
+        expected = hashlib.md5(entity_id.encode()).hexdigest()
+
+        assert entity_id_hash(entity_id).hex() == expected
+        assert str(UUID(bytes=entity_id_hash(entity_id))).replace("-", "") == expected
+
+    def test_vectorized_matches_scalar(self):
+        """The batch helper produces the same values as the scalar one."""
+        ids = [f"id-{i}" for i in range(50)] + ["ünïcode"]
+
+        assert entity_id_hashes(ids).tolist() == [entity_id_hash(i) for i in ids]
+
+
+class TestEncounteredIdStore:
+    """Test the sorted-array + buffer store."""
+
+    def test_add_many_flags_first_occurrence_only(self):
+        """Repeats within a batch and across batches are not new."""
+        store = EncounteredIdStore()
+
+        first = store.add_many(_keys(5, 3, 5, 9))
+        second = store.add_many(_keys(9, 1))
+
+        assert first.tolist() == [True, True, False, True]
+        assert second.tolist() == [False, True]
+        assert len(store) == 4
+
+    def test_membership_survives_merge(self, monkeypatch):
+        """Keys stay visible after the buffer is merged into the sorted array."""
+        monkeypatch.setattr(EncounteredIdStore, "BUFFER_MIN", 4)
+        store = EncounteredIdStore()
+        keys = _keys(*range(100, 0, -7))
+
+        assert store.add_many(keys).all()
+        assert not store.add_many(keys).any()
+        assert all(store.contains(k) for k in keys.tolist())
+        assert not store.contains(_key(3))
+        assert sorted(np.concatenate(list(store.iter_chunks(3))).tolist()) == sorted(keys.tolist())
+
+    def test_spills_to_memory_mapped_file(self, monkeypatch, tmp_path):
+        """Past the threshold the sorted array moves to a (deleted) mmap file."""
+        monkeypatch.setattr(EncounteredIdStore, "BUFFER_MIN", 8)
+        store = EncounteredIdStore(spill_threshold_bytes=64, spill_dir=str(tmp_path))
+
+        for start in range(0, 40, 4):
+            store.add_many(_keys(*range(start, start + 4)))
+
+        assert store.spilled
+        assert isinstance(store._sorted, np.memmap)
+        assert list(tmp_path.iterdir()) == []
+        assert store.memory_bytes < len(store) * 16
+        assert not store.add_many(_keys(*range(40))).any()
+        assert store.add(_key(40))
+
+    def test_keys_sharing_a_64_bit_prefix_stay_distinct(self, monkeypatch):
+        """Keys equal in their first 8 bytes are different entities."""
+        monkeypatch.setattr(EncounteredIdStore, "BUFFER_MIN", 2)
+        store = EncounteredIdStore()
+        prefix = 7 << 64
+
+        assert store.add_many(_keys(prefix + 1, prefix + 2)).all()
+        assert store.add(_key(prefix + 3))
+        assert store.contains(_key(prefix + 2))
+        assert not store.contains(_key(prefix + 4))
+
+
+class TestEntityTrackerBatch:
+    """Test EntityTracker batch tracking on top of the store."""
+
+    @pytest.mark.asyncio
+    async def test_batch_flags_duplicates_per_type(self):
+        """Same ID under two types is two entities; repeats are flagged."""
+        tracker = _make_tracker()
+        await tracker.track_entity("TaskEntity", "a")
+
+        flags = await tracker.track_entities_batch(
+            [
+                ("TaskEntity", "a"),
+                ("CommentEntity", "a"),
+                ("TaskEntity", "b"),
+                ("TaskEntity", "b"),
+            ]
+        )
+
+        assert flags == [False, True, True, False]
+        assert tracker.get_encountered_count() == {"TaskEntity": 2, "CommentEntity": 1}
+
+    @pytest.mark.asyncio
+    async def test_flat_view_checks_many_ids_at_once(self, monkeypatch):
+        """contains_many finds IDs in the sorted arrays and the buffers of all types."""
+        monkeypatch.setattr(EncounteredIdStore, "BUFFER_MIN", 4)
+        tracker = _make_tracker()
+        await tracker.track_entities_batch([("TaskEntity", f"t-{i}") for i in range(6)])
+        await tracker.track_entities_batch([("CommentEntity", "c-1")])
+
+        seen = tracker.get_all_encountered_ids_flat()
+
+        assert seen.contains_many(["t-0", "missing", "c-1", "t-5"]).tolist() == [
+            True,
+            False,
+            True,
+            True,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flat_view_and_memory_stats(self):
+        """The flat view matches entity IDs; stats report bytes per tracked entity."""
+        tracker = _make_tracker()
+        await tracker.track_entities_batch([("TaskEntity", f"t-{i}") for i in range(1000)])
+        await tracker.track_entities_batch([("CommentEntity", "c-1")])
+
+        seen = tracker.get_all_encountered_ids_flat()
+
+        assert "t-999" in seen
+        assert "c-1" in seen
+        assert "missing" not in seen
+        assert len(seen) == 1001
+        stats = tracker.get_stats()
+        assert stats.encountered_ids_bytes > 0
+        assert stats.encountered_bytes_per_entity == stats.encountered_ids_bytes / 1001
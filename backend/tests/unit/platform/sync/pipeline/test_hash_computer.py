@@ -0,0 +1,124 @@
+"""Tests for HashComputer process pool offload.
+
+Validates that hashing in the process pool produces exactly the same hashes as the
+thread path, and that per-entity failures keep their position in the batch.
+"""
+
+import pickle
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.platform.entities._airweave_field import AirweaveField
+from airweave.platform.entities._base import AirweaveSystemMetadata, BaseEntity, FileEntity
+from airweave.platform.sync import cpu_jobs
+from airweave.platform.sync.pipeline.hash_computer import HashComputer
+
+
+class _TestDocEntity(BaseEntity):
+    """Test entity for hashing."""
+
+    doc_id: str = AirweaveField(..., description="Test doc ID", is_entity_id=True)
+    name: str = AirweaveField(..., description="Test doc name", is_name=True)
+    body: str = AirweaveField(default="", description="Test body")
+
+
+class _TestFileEntity(FileEntity):
+    """Test file entity without a local_path (hash computation fails)."""
+
+    file_id: str = AirweaveField(..., description="Test file ID", is_entity_id=True)
+    name: str = AirweaveField(..., description="Test file name", is_name=True)
+    url: str = AirweaveField(default="https://example.com/test.txt", description="Test URL")
+    size: int = AirweaveField(default=1024, description="Test file size")
+    file_type: str = AirweaveField(default="text/plain", description="Test file type")
+
+
+def _make_entities():
+    return [
+        _TestDocEntity(
+            doc_id=f"doc-{i}",
+            entity_id=f"doc-{i}",
+            breadcrumbs=[],
+            name=f"Doc {i}",
+            body="x" * i,
+            airweave_system_metadata=AirweaveSystemMetadata(),
+        )
+        for i in range(3)
+    ]
+
+
+def _make_sync_context(cpu_pool):
+    ctx = MagicMock()
+    ctx.logger = MagicMock()
+    ctx.entity_tracker = AsyncMock()
+    ctx.execution_config.behavior.cpu_pool = cpu_pool
+    return ctx
+
+
+async def _run_inline(func, *args):
+    """Stand-in for run_in_process_pool that round-trips arguments through pickle."""
+    return func(*pickle.loads(pickle.dumps(args)))
+
+
+class TestProcessPoolHashing:
+    """Test hash computation offloaded to the process pool."""
+
+    @pytest.mark.asyncio
+    async def test_process_pool_hashes_match_thread_path(self):
+        """Both executors must produce identical hashes (no spurious updates)."""
+        thread_entities = _make_entities()
+        process_entities = _make_entities()
+
+        await HashComputer().compute_for_batch(thread_entities, _make_sync_context("thread"))
+        with patch(
+            "airweave.platform.sync.pipeline.hash_computer.run_in_process_pool",
+            side_effect=_run_inline,
+        ) as mock_pool:
+            await HashComputer().compute_for_batch(process_entities, _make_sync_context("process"))
+
+        # One pool job for the whole batch
+        mock_pool.assert_awaited_once()
+        assert mock_pool.await_args.args[0] is cpu_jobs.compute_dict_hashes
+        assert [e.airweave_system_metadata.hash for e in process_entities] == [
+            e.airweave_system_metadata.hash for e in thread_entities
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_entity_is_skipped_in_process_pool(self):
+        """A file entity that cannot be read is dropped without shifting other hashes."""
+        entities = _make_entities()
+        expected = _make_entities()
+        await HashComputer().compute_for_batch(expected, _make_sync_context("thread"))
+
+        broken = _TestFileEntity(
+            file_id="file-1",
+            entity_id="file-1",
+            breadcrumbs=[],
+            name="file.txt",
+            airweave_system_metadata=AirweaveSystemMetadata(),
+        )
+        entities.insert(1, broken)
+        ctx = _make_sync_context("process")
+
+        with patch(
+            "airweave.platform.sync.pipeline.hash_computer.run_in_process_pool",
+            side_effect=_run_inline,
+        ):
+            await HashComputer().compute_for_batch(entities, ctx)
+
+        assert broken not in entities
+        assert [e.airweave_system_metadata.hash for e in entities] == [
+            e.airweave_system_metadata.hash for e in expected
+        ]
+        ctx.entity_tracker.record_skipped.assert_awaited_once_with(1)
+
+    def test_jobs_are_picklable(self):
+        """Jobs are shipped to spawned workers by reference and must pickle."""
+        for job in (
+            cpu_jobs.compute_dict_hashes,
+            cpu_jobs.chunk_semantic_batch,
+            cpu_jobs.chunk_code_batch,
+            cpu_jobs.warm_worker,
+            cpu_jobs.ping,
+        ):
+            assert pickle.loads(pickle.dumps(job)) is job
@@ -4,7 +4,12 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID
 
-from airweave.platform.sync.processors.chunk_embed import ChunkEmbedProcessor
+from airweave.platform.sync.processors.chunk_embed import (
+    ChunkEmbedProcessor,
+    compute_chunk_hash,
+    match_chunk_slots,
+    split_unchanged_chunks,
+)
 
 
 @pytest.fixture
@@ -425,3 +430,112 @@ class TestChunkEmbedProcessor:
 
             # Should skip entity with no chunks
             assert len(result) == 0
+
+
+def _make_chunk(original_id, idx, text):
+    """Create a mock chunk entity as produced by _multiply_entities."""
+    chunk = MagicMock()
+    chunk.entity_id = f"{original_id}__chunk_{idx}"
+    chunk.textual_representation = text
+    chunk.airweave_system_metadata = MagicMock()
+    chunk.airweave_system_metadata.original_entity_id = original_id
+    chunk.airweave_system_metadata.chunk_index = idx
+    return chunk
+
+
+class TestChunkDiff:
+    """Test chunk hashing and matching of stored chunks on update."""
+
+    def test_multiply_entities_records_positional_chunk_hashes(
+        self, processor, mock_sync_context
+    ):
+        """Parent gets one hash per chunk position, empty string for skipped chunks."""
+        mock_entity = MagicMock()
+        mock_entity.entity_id = "test-123"
+        mock_entity.model_copy = MagicMock(side_effect=lambda deep=False: MagicMock())
+
+        chunks = [[{"text": "First"}, {"text": " "}, {"text": "Third"}]]
+
+        processor._multiply_entities([mock_entity], chunks, mock_sync_context)
+
+        assert mock_entity.airweave_system_metadata.chunk_hashes == [
+            compute_chunk_hash("First"),
+            "",
+            compute_chunk_hash("Third"),
+        ]
+
+    def test_match_chunk_slots_by_content(self):
+        """Stored text keeps its slot wherever it moved; new text reuses freed slots."""
+        previous = ["h-a", "h-b", "", "h-c"]
+
+        slots, unchanged, slot_hashes = match_chunk_slots(["h-x", "h-a", "h-c", "h-y"], previous)
+
+        assert slots == [1, 0, 3, 2]
+        assert unchanged == [False, True, True, False]
+        assert slot_hashes == ["h-a", "h-x", "h-y", "h-c"]
+
+    @pytest.mark.asyncio
+    async def test_match_previous_chunks(self, processor, mock_sync_context):
+        """Unchanged chunks take their stored slot; others are embedded and written."""
+        parent = MagicMock()
+        parent.entity_id = "doc"
+        new_parent = MagicMock()
+        new_parent.entity_id = "new-doc"
+        chunks = [
+            _make_chunk("doc", 0, "inserted"),
+            _make_chunk("doc", 1, "same"),
+            _make_chunk("doc", 2, "edited"),
+            _make_chunk("new-doc", 0, "same"),
+        ]
+        previous = {"doc": [compute_chunk_hash("same"), compute_chunk_hash("original")]}
+
+        changed, unchanged = await processor._match_previous_chunks(
+            [parent, new_parent], chunks, previous, mock_sync_context
+        )
+
+        assert [c.entity_id for c in unchanged] == ["doc__chunk_0"]
+        assert unchanged[0].airweave_system_metadata.chunk_index == 0
+        assert [c.entity_id for c in changed] == [
+            "doc__chunk_1",
+            "doc__chunk_2",
+            "new-doc__chunk_0",
+        ]
+        assert parent.airweave_system_metadata.chunk_hashes == [
+            compute_chunk_hash("same"),
+            compute_chunk_hash("inserted"),
+            compute_chunk_hash("edited"),
+        ]
+        mock_sync_context.entity_tracker.record_unchanged_chunks.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_moved_chunks_take_their_slot_as_chunk_index(
+        self, processor, mock_sync_context
+    ):
+        """A chunk moved to a stored slot stores that slot as chunk_index, like its ID."""
+        parent = MagicMock()
+        parent.entity_id = "doc"
+        chunks = [
+            _make_chunk("doc", 0, "inserted"),
+            _make_chunk("doc", 1, "first"),
+            _make_chunk("doc", 2, "second"),
+        ]
+        previous = {"doc": [compute_chunk_hash("first"), compute_chunk_hash("second")]}
+
+        changed, unchanged = await processor._match_previous_chunks(
+            [parent], chunks, previous, mock_sync_context
+        )
+
+        for chunk in changed + unchanged:
+            slot = int(chunk.entity_id.rsplit("__chunk_", 1)[1])
+            assert chunk.airweave_system_metadata.chunk_index == slot
+        assert [c.airweave_system_metadata.chunk_index for c in unchanged] == [0, 1]
+        assert [c.airweave_system_metadata.chunk_index for c in changed] == [2]
+
+    def test_split_unchanged_chunks(self):
+        """Chunks returned without dense embeddings are the unchanged ones."""
+        written = _make_chunk("doc", 0, "a")
+        written.airweave_system_metadata.dense_embedding = [0.1]
+        kept = _make_chunk("doc", 1, "b")
+        kept.airweave_system_metadata.dense_embedding = None
+
+        assert split_unchanged_chunks([written, kept]) == ([written], [kept])
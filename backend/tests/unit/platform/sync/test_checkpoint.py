@@ -0,0 +1,233 @@
+"""Tests for periodic cursor checkpoints and resumed syncs.
+
+Validates that:
+- SyncCheckpointer only advances the safe cursor past fully processed entities
+- Forced full syncs never resume, so their orphan cleanup sees every entity
+- A stub-source sync killed midway resumes from its last checkpoint and re-processes
+  less than one checkpoint interval of entities, without losing any
+"""
+
+import asyncio
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.platform.sources.stub import StubSource
+from airweave.platform.sync.checkpoint import SyncCheckpointer, checkpoint_resume_enabled
+from airweave.platform.sync.cursor import SyncCursor
+from airweave.platform.sync.exceptions import EntityProcessingError
+from airweave.platform.sync.orchestrator import SyncOrchestrator
+from airweave.platform.sync.stream import AsyncSourceStream
+from airweave.platform.sync.worker_pool import AsyncWorkerPool
+
+INTERVAL_SECONDS = 10.0
+SECONDS_PER_BATCH = 1.0
+BATCH_SIZE = 10
+ENTITY_COUNT = 500
+KILL_AFTER = 300
+
+
+class FakeClock:
+    """Monotonic clock advanced by the test."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _produce(checkpointer: SyncCheckpointer, cursor: SyncCursor, clock, count: int) -> None:
+    """Produce `count` entities one second apart, updating the cursor after each."""
+    for _ in range(count):
+        clock.now += 1
+        checkpointer.record_produced()
+        cursor.update(next_index=cursor.data.get("next_index", 0) + 1)
+
+
+class TestSyncCheckpointer:
+    """Test the safe cursor watermark."""
+
+    def test_waits_for_oldest_batch_in_flight(self):
+        """A finished later batch does not advance the watermark past an unfinished one."""
+        clock = FakeClock()
+        cursor = SyncCursor(sync_id=uuid4())
+        checkpointer = SyncCheckpointer(cursor, interval_seconds=10, clock=clock)
+
+        _produce(checkpointer, cursor, clock, 31)
+        first, second, third = (checkpointer.dispatch(10) for _ in range(3))
+        checkpointer.complete(second)
+        checkpointer.complete(third)
+
+        assert checkpointer.watermark == 0
+        assert checkpointer.next_checkpoint() is None
+
+        checkpointer.complete(first)
+        checkpoint = checkpointer.next_checkpoint()
+
+        assert checkpoint.position == 30
+        assert checkpoint.cursor_data == {"next_index": 30}
+
+    def test_checkpoints_at_most_once_per_interval(self):
+        """Checkpoints are only handed out once the interval has elapsed."""
+        clock = FakeClock()
+        cursor = SyncCursor(sync_id=uuid4())
+        checkpointer = SyncCheckpointer(cursor, interval_seconds=10, clock=clock)
+
+        _produce(checkpointer, cursor, clock, 6)
+        checkpointer.complete(checkpointer.dispatch(5))
+
+        assert checkpointer.next_checkpoint() is None
+        clock.now += 10
+        assert checkpointer.next_checkpoint().position == 5
+        clock.now += 10
+        assert checkpointer.next_checkpoint() is None  # Nothing new is safe
+
+    def test_unchanged_cursor_is_never_checkpointed(self):
+        """Sources that never update their cursor do not write checkpoints."""
+        clock = FakeClock()
+        checkpointer = SyncCheckpointer(SyncCursor(sync_id=uuid4()), 10, clock=clock)
+
+        for _ in range(5):
+            checkpointer.record_produced()
+        checkpointer.complete(checkpointer.dispatch(5))
+        clock.now += 10
+
+        assert checkpointer.next_checkpoint() is None
+
+
+class TestCheckpointResumeEnabled:
+    """Test which syncs checkpoint and resume."""
+
+    def test_forced_full_syncs_start_over(self):
+        """Only enabled, non-forced syncs resume; forced ones keep orphan cleanup."""
+        with patch("airweave.platform.sync.checkpoint.settings") as settings:
+            settings.SYNC_CHECKPOINT_ENABLED = True
+            assert checkpoint_resume_enabled(force_full_sync=False)
+            assert not checkpoint_resume_enabled(force_full_sync=True)
+
+            settings.SYNC_CHECKPOINT_ENABLED = False
+            assert not checkpoint_resume_enabled(force_full_sync=False)
+
+
+def _sync_context(source, cursor):
+    ctx = MagicMock()
+    ctx.source_instance = source
+    ctx.cursor = cursor
+    ctx.batch_size = BATCH_SIZE
+    ctx.max_batch_latency_ms = 0
+    ctx.execution_config.behavior.skip_guardrails = True
+    ctx.entity_tracker = AsyncMock()
+    return ctx
+
+
+async def _run_sync(cursor, clock, kill_after=None):
+    """Run a stub sync through the real stream and orchestrator loop.
+
+    The entity pipeline only records entity identifiers and advances the clock. With
+    kill_after, the sync is cancelled once that many entities were processed;
+    entities and checkpoints completed after that count as lost with the worker.
+
+    Returns:
+        (processed entity identifiers, saved checkpoints)
+    """
+    weights = ["medium_entity_weight", "large_entity_weight", "small_file_weight"]
+    weights += ["large_file_weight", "code_file_weight"]
+    config = {"entity_count": ENTITY_COUNT, "seed": 7, **dict.fromkeys(weights, 0)}
+    source = await StubSource.create(config=config)
+    source.set_logger(MagicMock())
+    source.set_cursor(cursor)
+
+    checkpointer = SyncCheckpointer(cursor, interval_seconds=INTERVAL_SECONDS, clock=clock)
+    stream = AsyncSourceStream(
+        source.generate_entities(), queue_size=50, logger=MagicMock(), checkpointer=checkpointer
+    )
+    processed, saved = [], []
+    killed = asyncio.Event()
+
+    async def process(entities, sync_context):
+        await asyncio.sleep(0)
+        clock.now += SECONDS_PER_BATCH
+        if not killed.is_set():
+            # entity_id is only set by the real pipeline
+            processed.extend(getattr(e, "stub_id", None) or e.container_id for e in entities)
+            if kill_after is not None and len(processed) >= kill_after:
+                killed.set()
+
+    async def save_checkpoint(checkpoint):
+        if not killed.is_set():
+            saved.append(checkpoint)
+
+    pipeline = MagicMock()
+    pipeline.process = process
+    orchestrator = SyncOrchestrator(
+        entity_pipeline=pipeline,
+        worker_pool=AsyncWorkerPool(logger=MagicMock(), max_workers=2),
+        stream=stream,
+        sync_context=_sync_context(source, cursor),
+        access_control_pipeline=MagicMock(),
+        checkpointer=checkpointer,
+    )
+    orchestrator._save_checkpoint = save_checkpoint
+
+    await stream.start()
+    sync_task = asyncio.create_task(orchestrator._process_entities())
+    if kill_after is None:
+        await sync_task
+    else:
+        await killed.wait()
+        sync_task.cancel()
+        # Work done after the kill is discarded above, however far the cancel gets
+        await asyncio.gather(sync_task, return_exceptions=True)
+    return processed, saved
+
+
+class TestResumeAfterCrash:
+    """Chaos test: kill a stub sync midway and resume it from its last checkpoint."""
+
+    @pytest.mark.asyncio
+    async def test_resumed_run_reprocesses_less_than_one_interval(self):
+        """The retry picks up near the crash and every entity is processed."""
+        sync_id = uuid4()
+        first_run, checkpoints = await _run_sync(
+            SyncCursor(sync_id=sync_id), FakeClock(), kill_after=KILL_AFTER
+        )
+        assert checkpoints, "expected at least one checkpoint before the crash"
+
+        resumed_cursor = SyncCursor(
+            sync_id=sync_id,
+            cursor_data=checkpoints[-1].cursor_data,
+            resumed_from_checkpoint=True,
+        )
+        second_run, _ = await _run_sync(resumed_cursor, FakeClock())
+
+        entities_per_interval = INTERVAL_SECONDS / SECONDS_PER_BATCH * BATCH_SIZE
+        reprocessed = set(first_run) & set(second_run)
+        assert len(reprocessed) < entities_per_interval
+        assert len(set(first_run) | set(second_run)) == ENTITY_COUNT + 1  # + container
+        assert resumed_cursor.data == {"next_index": 0}
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_holds_back_the_watermark(self):
+        """Only batches that finished (or skipped their entities) count as processed."""
+        clock = FakeClock()
+        cursor = SyncCursor(sync_id=uuid4())
+        checkpointer = SyncCheckpointer(cursor, interval_seconds=10, clock=clock)
+        orchestrator = SyncOrchestrator.__new__(SyncOrchestrator)
+        orchestrator.checkpointer = checkpointer
+
+        async def fail(error):
+            raise error
+
+        _produce(checkpointer, cursor, clock, 20)
+        skipped = asyncio.create_task(fail(EntityProcessingError("bad entity")))
+        crashed = asyncio.create_task(fail(RuntimeError("boom")))
+        for task in (skipped, crashed):
+            start = checkpointer.dispatch(10)
+            task.add_done_callback(partial(orchestrator._record_batch_done, start))
+        await asyncio.gather(skipped, crashed, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert checkpointer.watermark == 10
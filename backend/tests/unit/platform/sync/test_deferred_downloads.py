@@ -0,0 +1,164 @@
+"""Tests for pre-download change detection with content fingerprints.
+
+Validates that, with FILE_FINGERPRINT_ENABLED:
+- FileService defers downloads of files whose source reports a fingerprint
+- HashComputer hashes the fingerprint instead of the file bytes
+- EntityActionResolver downloads INSERT/UPDATE files only and records bytes saved
+"""
+
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.core.config import settings
+from airweave.platform.entities._airweave_field import AirweaveField
+from airweave.platform.entities._base import AirweaveSystemMetadata, FileEntity
+from airweave.platform.storage.exceptions import FileSkippedException
+from airweave.platform.storage.file_service import FileService
+from airweave.platform.storage.paths import paths
+from airweave.platform.sync.actions.entity.resolver import EntityActionResolver
+from airweave.platform.sync.pipeline.hash_computer import HashComputer
+
+DEFINITION_ID = uuid4()
+
+
+class _TestFileEntity(FileEntity):
+    """Test file entity whose source reports a content checksum."""
+
+    file_id: str = AirweaveField(..., description="Test file ID", is_entity_id=True)
+    name: str = AirweaveField(..., description="Test file name", is_name=True)
+    url: str = AirweaveField(default="https://example.com/file", description="Test URL")
+    size: int = AirweaveField(default=1024, description="Test file size")
+    file_type: str = AirweaveField(default="pdf", description="Test file type")
+    checksum: Optional[str] = AirweaveField(None, description="Test checksum")
+
+    def content_fingerprint(self) -> Optional[str]:
+        return self.checksum
+
+
+def _file(i: int, checksum: Optional[str] = "abc", name: str = "report.pdf"):
+    return _TestFileEntity(
+        file_id=f"file-{i}",
+        entity_id=f"file-{i}",
+        breadcrumbs=[],
+        name=name,
+        size=1000 * (i + 1),
+        checksum=checksum,
+        airweave_system_metadata=AirweaveSystemMetadata(),
+    )
+
+
+def _sync_context():
+    ctx = MagicMock()
+    ctx.logger = MagicMock()
+    ctx.entity_tracker = AsyncMock()
+    ctx.execution_config = None
+    return ctx
+
+
+@pytest.fixture
+def fingerprints_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "FILE_FINGERPRINT_ENABLED", True)
+
+
+@pytest.fixture
+def file_service(monkeypatch, tmp_path):
+    monkeypatch.setattr(paths, "TEMP_PROCESSING", str(tmp_path))
+    return FileService(sync_job_id=uuid4(), storage_backend=MagicMock())
+
+
+class TestDeferDownload:
+    """Test FileService.defer_download."""
+
+    def test_defers_fingerprinted_file(self, fingerprints_enabled, file_service):
+        """Test the download is stored on the entity and local_path gets a placeholder."""
+        entity = _file(0)
+        download = AsyncMock()
+
+        assert file_service.defer_download(entity, download, MagicMock())
+        assert entity._pending_download is download
+        assert entity.local_path.startswith(file_service.base_temp_dir)
+        download.assert_not_awaited()
+
+    def test_downloads_now_without_fingerprint_or_setting(self, monkeypatch, file_service):
+        """Test files without a fingerprint, or with the setting off, are not deferred."""
+        monkeypatch.setattr(settings, "FILE_FINGERPRINT_ENABLED", True)
+        assert not file_service.defer_download(_file(0, checksum=None), AsyncMock(), MagicMock())
+
+        monkeypatch.setattr(settings, "FILE_FINGERPRINT_ENABLED", False)
+        assert not file_service.defer_download(_file(0), AsyncMock(), MagicMock())
+
+    def test_unsupported_extension_is_skipped_up_front(self, fingerprints_enabled, file_service):
+        """Test unsupported files are skipped before they can resolve to INSERT."""
+        with pytest.raises(FileSkippedException):
+            file_service.defer_download(_file(0, name="archive.xyz"), AsyncMock(), MagicMock())
+
+
+class TestFingerprintHash:
+    """Test HashComputer with content fingerprints."""
+
+    @pytest.mark.asyncio
+    async def test_hash_uses_fingerprint_without_local_file(self, fingerprints_enabled):
+        """Test a deferred file (placeholder path, no bytes) still gets a stable hash."""
+        first, second = _file(0), _file(0)
+        first.local_path = "/does/not/exist-1.pdf"
+        second.local_path = "/does/not/exist-2.pdf"
+        changed = _file(0, checksum="def")
+
+        computer = HashComputer()
+        hashes = [await computer.compute_for_entity(e) for e in (first, second, changed)]
+
+        assert hashes[0] == hashes[1]
+        assert hashes[0] != hashes[2]
+
+
+class TestDeferredDownloadsInResolver:
+    """Test EntityActionResolver running deferred downloads."""
+
+    @pytest.mark.asyncio
+    async def test_downloads_only_new_and_changed_files(self, fingerprints_enabled):
+        """Test KEEP files are never downloaded and their bytes are recorded as saved."""
+        new, changed, unchanged = _file(0), _file(1), _file(2)
+        downloads = {}
+        for entity in (new, changed, unchanged):
+            downloads[entity.entity_id] = entity._pending_download = AsyncMock()
+            entity.airweave_system_metadata.hash = await HashComputer().compute_for_entity(entity)
+
+        stored_hash = unchanged.airweave_system_metadata.hash
+        existing = {
+            ("file-1", DEFINITION_ID): MagicMock(id=uuid4(), hash="stale"),
+            ("file-2", DEFINITION_ID): MagicMock(id=uuid4(), hash=stored_hash),
+        }
+        resolver = EntityActionResolver({_TestFileEntity: DEFINITION_ID})
+        ctx = _sync_context()
+
+        with patch.object(resolver, "_fetch_existing_entities", AsyncMock(return_value=existing)):
+            batch = await resolver.resolve([new, changed, unchanged], ctx)
+
+        assert [a.entity for a in batch.inserts] == [new]
+        assert [a.entity for a in batch.updates] == [changed]
+        assert [a.entity for a in batch.keeps] == [unchanged]
+        downloads["file-0"].assert_awaited_once()
+        downloads["file-1"].assert_awaited_once()
+        downloads["file-2"].assert_not_awaited()
+        ctx.entity_tracker.record_skipped_downloads.assert_awaited_once_with(1, unchanged.size)
+
+    @pytest.mark.asyncio
+    async def test_failed_download_drops_action(self, fingerprints_enabled):
+        """Test a file that fails to download is removed from the batch as skipped."""
+        ok, broken = _file(0), _file(1)
+        ok._pending_download = AsyncMock()
+        broken._pending_download = AsyncMock(side_effect=RuntimeError("gone"))
+        for entity in (ok, broken):
+            entity.airweave_system_metadata.hash = "hash"
+
+        resolver = EntityActionResolver({_TestFileEntity: DEFINITION_ID})
+        ctx = _sync_context()
+
+        with patch.object(resolver, "_fetch_existing_entities", AsyncMock(return_value={})):
+            batch = await resolver.resolve([ok, broken], ctx)
+
+        assert [a.entity for a in batch.inserts] == [ok]
+        ctx.entity_tracker.record_skipped.assert_awaited_once_with(1)
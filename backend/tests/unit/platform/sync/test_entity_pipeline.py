@@ -0,0 +1,124 @@
+"""Tests for paged orphan cleanup.
+
+Validates that:
+1. Stored entity keys are read with keyset pagination in short queries
+2. EntityPipeline pages orphans per definition and dispatches them with no session open
+"""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from airweave.crud.crud_entity import entity as crud_entity
+from airweave.platform.sync import entity_pipeline as entity_pipeline_module
+from airweave.platform.sync.entity_pipeline import EntityPipeline
+from airweave.platform.sync.pipeline.entity_tracker import EntityTracker
+
+
+class TestGetKeysPageBySync:
+    """Test the keyset-paginated key query."""
+
+    @pytest.mark.asyncio
+    async def test_pages_after_the_last_key(self):
+        """The next page starts after the given (entity_id, definition) key."""
+        definition_id = uuid4()
+        db = MagicMock()
+        db.execute = AsyncMock(
+            return_value=[SimpleNamespace(entity_id="b", entity_definition_id=definition_id)]
+        )
+
+        keys = await crud_entity.get_keys_page_by_sync(
+            db, sync_id=uuid4(), after=("a", definition_id), limit=2
+        )
+
+        assert keys == [("b", definition_id)]
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "(entity.entity_id, entity.entity_definition_id) >" in sql
+        assert "ORDER BY entity.entity_id, entity.entity_definition_id" in sql
+        assert "LIMIT" in sql
+
+
+class TestOrphanCleanup:
+    """Test that EntityPipeline finds orphans page by page and dispatches them."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_orphans_per_definition_between_queries(self, monkeypatch):
+        """Orphans are grouped per definition and deleted while no session is open."""
+        monkeypatch.setattr(entity_pipeline_module, "ORPHAN_SCAN_PAGE_SIZE", 3)
+        monkeypatch.setattr(entity_pipeline_module, "ORPHAN_CLEANUP_BATCH_SIZE", 2)
+        def_a, def_b = uuid4(), uuid4()
+        stored = sorted(
+            [("a-0", def_a), ("a-1", def_a), ("a-2", def_a), ("b-0", def_b), ("seen", def_b)]
+        )
+        open_sessions = 0
+        queried_after = []
+
+        @asynccontextmanager
+        async def fake_db_context():
+            nonlocal open_sessions
+            open_sessions += 1
+            try:
+                yield MagicMock()
+            finally:
+                open_sessions -= 1
+
+        async def fake_page(db, *, sync_id, after, limit):
+            queried_after.append(after)
+            start = 0 if after is None else stored.index(after) + 1
+            return stored[start : start + limit]
+
+        async def dispatch(entity_ids, sync_context):
+            assert open_sessions == 0
+
+        tracker = EntityTracker(uuid4(), uuid4(), MagicMock())
+        await tracker.track_entity("DocEntity", "seen")
+        dispatcher = MagicMock()
+        dispatcher.dispatch_orphan_cleanup = AsyncMock(side_effect=dispatch)
+        pipeline = EntityPipeline(tracker, MagicMock(), dispatcher)
+
+        ctx = MagicMock()
+        ctx.entity_tracker = MagicMock()
+        ctx.entity_tracker.record_deletes = AsyncMock()
+
+        with (
+            patch.object(crud_entity, "get_keys_page_by_sync", fake_page),
+            patch("airweave.db.session.get_db_context", fake_db_context),
+        ):
+            await pipeline.cleanup_orphaned_entities(ctx)
+
+        assert queried_after == [None, ("a-2", def_a)]
+        assert [c.args[0] for c in dispatcher.dispatch_orphan_cleanup.await_args_list] == [
+            ["a-0", "a-1"],
+            ["a-2"],
+            ["b-0"],
+        ]
+        assert [c.args for c in ctx.entity_tracker.record_deletes.await_args_list] == [
+            (def_a, 2),
+            (def_a, 1),
+            (def_b, 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_no_stored_entities_dispatches_nothing(self):
+        """An empty first page ends the scan."""
+        pipeline_dispatcher = MagicMock()
+        pipeline_dispatcher.dispatch_orphan_cleanup = AsyncMock()
+        pipeline = EntityPipeline(
+            EntityTracker(uuid4(), uuid4(), MagicMock()), MagicMock(), pipeline_dispatcher
+        )
+
+        @asynccontextmanager
+        async def fake_db_context():
+            yield MagicMock()
+
+        with (
+            patch.object(crud_entity, "get_keys_page_by_sync", AsyncMock(return_value=[])),
+            patch("airweave.db.session.get_db_context", fake_db_context),
+        ):
+            await pipeline.cleanup_orphaned_entities(MagicMock())
+
+        pipeline_dispatcher.dispatch_orphan_cleanup.assert_not_awaited()
@@ -0,0 +1,54 @@
+"""Tests for when SyncOrchestrator runs orphan cleanup.
+
+Validates that continuous sources skip orphan cleanup only while their cursor holds
+incremental state; a typed cursor whose fields are all empty does not count.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from airweave.platform.cursors import PostgreSQLCursor
+from airweave.platform.sync.cursor import SyncCursor
+from airweave.platform.sync.orchestrator import SyncOrchestrator
+
+
+class _ContinuousSource:
+    _supports_continuous = True
+
+
+def _orchestrator(cursor: SyncCursor) -> SyncOrchestrator:
+    orchestrator = SyncOrchestrator.__new__(SyncOrchestrator)
+    orchestrator.sync_context = MagicMock()
+    orchestrator.sync_context.cursor = cursor
+    orchestrator.sync_context.force_full_sync = False
+    orchestrator.sync_context.source_instance = _ContinuousSource()
+    orchestrator.entity_pipeline = MagicMock()
+    orchestrator.entity_pipeline.cleanup_orphaned_entities = AsyncMock()
+    return orchestrator
+
+
+class TestOrphanCleanupDecision:
+    """Test orphan cleanup of continuous sources on non-forced syncs."""
+
+    @pytest.mark.asyncio
+    async def test_runs_when_typed_cursor_holds_no_state(self):
+        """An all-empty typed cursor means the sync was a full sync."""
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=PostgreSQLCursor)
+        orchestrator = _orchestrator(cursor)
+
+        await orchestrator._cleanup_orphaned_entities_if_needed()
+
+        orchestrator.entity_pipeline.cleanup_orphaned_entities.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_skipped_when_cursor_holds_incremental_state(self):
+        """Incremental syncs don't re-encounter unchanged entities."""
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=PostgreSQLCursor)
+        cursor.update(key_snapshots={"public.users": "snapshots/users"})
+        orchestrator = _orchestrator(cursor)
+
+        await orchestrator._cleanup_orphaned_entities_if_needed()
+
+        orchestrator.entity_pipeline.cleanup_orphaned_entities.assert_not_awaited()
@@ -0,0 +1,203 @@
+"""Tests for partitioned syncs.
+
+Validates that:
+- The stub source's partitions cover every entity exactly once
+- Partition results saved by each worker merge into the encountered IDs, stats and
+  cursor of the whole sync
+- Partitions synced concurrently, each by its own worker pool, scale near-linearly
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from airweave.platform.sources.stub import StubSource
+from airweave.platform.storage.backends.filesystem import FilesystemBackend
+from airweave.platform.sync import partitions as partitions_module
+from airweave.platform.sync.cursor import SyncCursor
+from airweave.platform.sync.orchestrator import SyncOrchestrator
+from airweave.platform.sync.partitions import (
+    delete_partition_results,
+    merge_partition_results,
+    save_partition_result,
+)
+from airweave.platform.sync.pipeline.entity_tracker import EntityTracker
+from airweave.platform.sync.stream import AsyncSourceStream
+from airweave.platform.sync.worker_pool import AsyncWorkerPool
+
+SMALL_ONLY = {
+    "medium_entity_weight": 0,
+    "large_entity_weight": 0,
+    "small_file_weight": 0,
+    "large_file_weight": 0,
+    "code_file_weight": 0,
+}
+
+
+async def _stub(entity_count: int, partition_count: int = 1, delay_ms: int = 0) -> StubSource:
+    config = {
+        "entity_count": entity_count,
+        "partition_count": partition_count,
+        "generation_delay_ms": delay_ms,
+        **SMALL_ONLY,
+    }
+    source = await StubSource.create(config=config)
+    source.set_logger(MagicMock())
+    return source
+
+
+async def _entity_ids(source: StubSource) -> list:
+    return [getattr(e, "stub_id", None) or e.container_id async for e in source.generate_entities()]
+
+
+class TestStubPartitions:
+    """Test the stub source's partition protocol."""
+
+    @pytest.mark.asyncio
+    async def test_partitions_cover_every_entity_once(self):
+        """Each entity (and the container) belongs to exactly one partition."""
+        source = await _stub(entity_count=103, partition_count=4)
+        partitions = await source.get_partitions()
+        assert len(partitions) == 4
+
+        partitioned = []
+        for partition in partitions:
+            source.set_partition(partition)
+            partitioned.extend(await _entity_ids(source))
+
+        source.set_partition(None)
+        whole = await _entity_ids(source)
+        assert sorted(partitioned) == sorted(whole)
+        assert len(whole) == 104  # + container
+
+    @pytest.mark.asyncio
+    async def test_single_partition_is_not_partitioned(self):
+        """Without partition_count the sync keeps running as a single activity."""
+        assert await (await _stub(entity_count=10)).get_partitions() == []
+
+
+def _partition_context(tracker, cursor, source, sync_job_id):
+    ctx = MagicMock()
+    ctx.entity_tracker = tracker
+    ctx.cursor = cursor
+    ctx.source_instance = source
+    ctx.sync_job.id = sync_job_id
+    return ctx
+
+
+class TestMergePartitionResults:
+    """Test saving partition results and merging them in the final activity."""
+
+    @pytest.mark.asyncio
+    async def test_merges_encountered_ids_stats_and_cursors(self, monkeypatch, tmp_path):
+        """The final tracker and cursor cover every partition; results are deleted."""
+        storage = FilesystemBackend(tmp_path)
+        monkeypatch.setattr(partitions_module, "_storage", lambda: storage)
+        sync_id, sync_job_id = uuid4(), uuid4()
+        source = await _stub(entity_count=10)
+
+        partition_entities = {
+            "users": [("UserEntity", "u-1"), ("UserEntity", "u-2")],
+            "orders": [("OrderEntity", "o-1"), ("UserEntity", "u-3")],
+        }
+        for partition, entities in partition_entities.items():
+            tracker = EntityTracker(job_id=sync_job_id, sync_id=sync_id, logger=MagicMock())
+            await tracker.track_entities_batch(entities)
+            await tracker.record_inserts(uuid4(), count=len(entities))
+            cursor = SyncCursor(sync_id=sync_id, cursor_data={"table_cursors": {"base": "0"}})
+            cursor.update(table_cursors={**cursor.data["table_cursors"], partition: "42"})
+            await save_partition_result(
+                _partition_context(tracker, cursor, source, sync_job_id), partition
+            )
+
+        final_tracker = EntityTracker(job_id=sync_job_id, sync_id=sync_id, logger=MagicMock())
+        final_cursor = SyncCursor(sync_id=sync_id, cursor_data={"table_cursors": {"base": "0"}})
+        final_ctx = _partition_context(final_tracker, final_cursor, source, sync_job_id)
+        await merge_partition_results(final_ctx, list(partition_entities))
+
+        encountered = final_tracker.get_all_encountered_ids_flat()
+        assert len(encountered) == 4
+        assert all(entity_id in encountered for entity_id in ("u-1", "u-2", "u-3", "o-1"))
+        stats = final_tracker.get_stats()
+        assert stats.inserted == 4
+        assert stats.entities_encountered == {"UserEntity": 3, "OrderEntity": 1}
+        assert final_cursor.data == {"table_cursors": {"base": "0", "users": "42", "orders": "42"}}
+
+        await delete_partition_results(sync_job_id, list(partition_entities))
+        assert not list(tmp_path.rglob("*.json")) and not list(tmp_path.rglob("*.npz"))
+
+
+def _sync_context(source):
+    ctx = MagicMock()
+    ctx.source_instance = source
+    ctx.cursor = None
+    ctx.batch_size = 10
+    ctx.max_batch_latency_ms = 0
+    ctx.execution_config.behavior.skip_guardrails = True
+    ctx.entity_tracker = AsyncMock()
+    return ctx
+
+
+async def _run_worker(source: StubSource, seconds_per_batch: float) -> int:
+    """Sync a source through the real stream and orchestrator loop on one worker.
+
+    The entity pipeline only simulates a fixed processing cost per batch.
+
+    Returns:
+        Number of processed entities
+    """
+    processed = 0
+
+    async def process(entities, sync_context):
+        nonlocal processed
+        await asyncio.sleep(seconds_per_batch)
+        processed += len(entities)
+
+    stream = AsyncSourceStream(source.generate_entities(), queue_size=50, logger=MagicMock())
+    pipeline = MagicMock()
+    pipeline.process = process
+    orchestrator = SyncOrchestrator(
+        entity_pipeline=pipeline,
+        worker_pool=AsyncWorkerPool(logger=MagicMock(), max_workers=1),
+        stream=stream,
+        sync_context=_sync_context(source),
+        access_control_pipeline=MagicMock(),
+    )
+    await stream.start()
+    await orchestrator._process_entities()
+    return processed
+
+
+class TestPartitionScaling:
+    """Partitions synced by separate workers run in parallel."""
+
+    @pytest.mark.asyncio
+    async def test_throughput_scales_with_worker_count(self):
+        """Four workers sync four partitions in about a quarter of the time.
+
+        The source's per-entity latency and the pipeline's per-batch cost stand in for
+        the API and destination round trips that bound a single worker.
+        """
+        entity_count, workers, delay_ms, seconds_per_batch = 160, 4, 8, 0.08
+
+        start = time.perf_counter()
+        whole = await _stub(entity_count, delay_ms=delay_ms)
+        assert await _run_worker(whole, seconds_per_batch) == entity_count + 1
+        single_worker = time.perf_counter() - start
+
+        sources = []
+        source = await _stub(entity_count, partition_count=workers)
+        for partition in await source.get_partitions():
+            partition_source = await _stub(entity_count, workers, delay_ms=delay_ms)
+            partition_source.set_partition(partition)
+            sources.append(partition_source)
+
+        start = time.perf_counter()
+        counts = await asyncio.gather(*(_run_worker(s, seconds_per_batch) for s in sources))
+        fleet = time.perf_counter() - start
+
+        assert sum(counts) == entity_count + 1
+        assert single_worker / fleet > 0.6 * workers
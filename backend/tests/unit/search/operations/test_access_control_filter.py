@@ -9,6 +9,16 @@ from airweave.search.operations.access_control_filter import AccessControlFilter
 from airweave.search.state import SearchState
 
 
+@pytest.fixture(autouse=True)
+def no_principal_cache():
+    """Resolve straight from the (patched) AccessBroker."""
+    with patch(
+        "airweave.search.operations.access_control_filter.get_principal_cache",
+        return_value=None,
+    ):
+        yield
+
+
 @pytest.fixture
 def organization_id():
     """Sample organization ID."""
@@ -0,0 +1,111 @@
+"""Unit tests for in-process search event channels."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from airweave.search.channels import LocalSearchChannel, local_search_channels
+from airweave.search.emitter import EventEmitter
+
+
+async def _drain(channel):
+    messages = []
+    while len(channel):
+        messages.append(json.loads(await channel.get(timeout=0.01)))
+    return messages
+
+
+class TestLocalSearchChannel:
+    """Test buffering, coalescing and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_delivered_in_order(self):
+        """Test events come out in publish order."""
+        channel = LocalSearchChannel(max_buffered=10, publish_timeout_seconds=0.01)
+        for seq in range(3):
+            await channel.publish({"type": "embedding_done", "seq": seq})
+
+        assert [m["seq"] for m in await _drain(channel)] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_get_times_out_without_events(self):
+        """Test get returns None so the stream can send heartbeats."""
+        channel = LocalSearchChannel(max_buffered=10, publish_timeout_seconds=0.01)
+
+        assert await channel.get(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_unread_high_frequency_event_is_coalesced(self):
+        """Test a newer unread rankings event replaces the older one in place."""
+        channel = LocalSearchChannel(max_buffered=10, publish_timeout_seconds=0.01)
+        await channel.publish({"type": "rankings", "op": "llm_reranking", "rankings": [1]})
+        await channel.publish({"type": "reranking_start", "op": "llm_reranking"})
+        await channel.publish({"type": "rankings", "op": "llm_reranking", "rankings": [2]})
+
+        messages = await _drain(channel)
+
+        assert [m["type"] for m in messages] == ["rankings", "reranking_start"]
+        assert messages[0]["rankings"] == [2]
+
+    @pytest.mark.asyncio
+    async def test_read_event_is_not_coalesced(self):
+        """Test coalescing only applies to events the client has not read yet."""
+        channel = LocalSearchChannel(max_buffered=10, publish_timeout_seconds=0.01)
+        await channel.publish({"type": "rankings", "rankings": [1]})
+        await channel.get(timeout=0.01)
+        await channel.publish({"type": "rankings", "rankings": [2]})
+
+        assert len(channel) == 1
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_drops_non_terminal_events(self):
+        """Test a slow client causes drops, but never of terminal events."""
+        channel = LocalSearchChannel(max_buffered=1, publish_timeout_seconds=0.01)
+        await channel.publish({"type": "embedding_start"})
+        await channel.publish({"type": "embedding_done"})
+        await channel.publish({"type": "done"})
+
+        assert [m["type"] for m in await _drain(channel)] == ["embedding_start", "done"]
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_waits_for_reader(self):
+        """Test publish waits for the client to make room before dropping."""
+        channel = LocalSearchChannel(max_buffered=1, publish_timeout_seconds=1.0)
+        await channel.publish({"type": "embedding_start"})
+
+        publish = asyncio.create_task(channel.publish({"type": "embedding_done"}))
+        await asyncio.sleep(0)
+        await channel.get(timeout=0.01)
+        await publish
+
+        assert [m["type"] for m in await _drain(channel)] == ["embedding_done"]
+
+
+class TestEventEmitterTransport:
+    """Test the emitter picks the local channel over Redis."""
+
+    @pytest.mark.asyncio
+    async def test_uses_local_channel_when_open(self):
+        """Test events skip Redis when the SSE consumer is in this process."""
+        channel = local_search_channels.open("req-local")
+        try:
+            with patch("airweave.search.emitter.core_pubsub") as pubsub:
+                pubsub.publish = AsyncMock()
+                await EventEmitter("req-local", stream=True).emit("done", {"request_id": "x"})
+
+            pubsub.publish.assert_not_awaited()
+            assert json.loads(await channel.get(timeout=0.01))["type"] == "done"
+        finally:
+            local_search_channels.close("req-local")
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_redis_without_local_channel(self):
+        """Test events go to Redis when the consumer lives in another process."""
+        with patch("airweave.search.emitter.core_pubsub") as pubsub:
+            pubsub.publish = AsyncMock()
+            await EventEmitter("req-remote", stream=True).emit("done")
+
+        pubsub.publish.assert_awaited_once()
+        assert pubsub.publish.await_args.args[:2] == ("search", "req-remote")
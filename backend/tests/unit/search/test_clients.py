@@ -0,0 +1,151 @@
+"""Unit tests for the process-wide search client registry."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.search.clients import SearchClientRegistry, close_client, credentials_fingerprint
+
+
+def _registry(enabled=True, idle_seconds=60.0):
+    return SearchClientRegistry(
+        enabled=enabled, idle_seconds=idle_seconds, health_check_interval_seconds=30.0
+    )
+
+
+def _client():
+    client = MagicMock()
+    client.aclose = AsyncMock()
+    return client
+
+
+class TestSearchClientRegistry:
+    """Test client reuse, eviction and shutdown."""
+
+    def test_reuses_client_for_same_key(self):
+        """Test the factory runs once per key."""
+        registry = _registry()
+        factory = MagicMock(side_effect=_client)
+
+        first = registry.get("openai", ("OpenAI", credentials_fingerprint("key")), factory)
+        second = registry.get("openai", ("OpenAI", credentials_fingerprint("key")), factory)
+
+        assert first is second
+        factory.assert_called_once()
+
+    def test_different_credentials_get_different_clients(self):
+        """Test clients are never shared across API keys."""
+        registry = _registry()
+
+        first = registry.get("openai", ("OpenAI", credentials_fingerprint("a")), _client)
+        second = registry.get("openai", ("OpenAI", credentials_fingerprint("b")), _client)
+
+        assert first is not second
+
+    def test_disabled_registry_builds_every_time(self):
+        """Test the pool can be turned off."""
+        registry = _registry(enabled=False)
+        factory = MagicMock(side_effect=_client)
+
+        registry.get("groq", "key", factory)
+        registry.get("groq", "key", factory)
+
+        assert factory.call_count == 2
+
+    def test_fingerprint_does_not_contain_secret(self):
+        """Test registry keys never hold the raw API key."""
+        assert "sk-secret" not in credentials_fingerprint("sk-secret")
+
+    @pytest.mark.asyncio
+    async def test_idle_client_is_closed_one_tick_after_eviction(self):
+        """Test idle clients are retired first and closed on the next maintenance run."""
+        registry = _registry(idle_seconds=0.0)
+        client = registry.get("cohere", "key", _client)
+
+        await registry.run_maintenance()
+        client.aclose.assert_not_awaited()
+        assert registry.get("cohere", "key", _client) is not client
+
+        await registry.run_maintenance()
+        client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_retired_client_stays_open_while_a_search_holds_it(self):
+        """Test a retired client is closed only when the last lease scope exits."""
+        registry = _registry(idle_seconds=0.0)
+
+        async with registry.lease_scope():
+            client = registry.get("cohere", "key", _client)
+            async with registry.lease_scope():
+                assert registry.get("cohere", "key", _client) is client
+
+            await registry.run_maintenance()
+            await registry.run_maintenance()
+            client.aclose.assert_not_awaited()
+
+        client.aclose.assert_awaited_once()
+        await registry.run_maintenance()
+        client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_lease_scope_covers_spawned_tasks(self):
+        """Test clients fetched by tasks inside a scope are held by that scope."""
+        registry = _registry(idle_seconds=0.0)
+
+        async with registry.lease_scope():
+            client = await asyncio.create_task(self._get_async(registry))
+            await registry.run_maintenance()
+            await registry.run_maintenance()
+            client.aclose.assert_not_awaited()
+
+        client.aclose.assert_awaited_once()
+
+    @staticmethod
+    async def _get_async(registry):
+        return registry.get("groq", "key", _client)
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_client_is_replaced(self):
+        """Test a failing health check evicts the client."""
+        registry = _registry()
+        health_check = AsyncMock(side_effect=ConnectionError("down"))
+        client = registry.get("qdrant", "url", _client, health_check=health_check)
+
+        await registry.run_maintenance()
+
+        health_check.assert_awaited_once_with(client)
+        assert registry.get("qdrant", "url", _client) is not client
+
+    @pytest.mark.asyncio
+    async def test_healthy_client_is_kept(self):
+        """Test a passing health check keeps the client."""
+        registry = _registry()
+        client = registry.get("qdrant", "url", _client, health_check=AsyncMock())
+
+        await registry.run_maintenance()
+
+        assert registry.get("qdrant", "url", _client) is client
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_all_clients(self):
+        """Test shutdown closes pooled and retired clients."""
+        registry = _registry()
+        pooled = registry.get("openai", "a", _client)
+        retired = registry.get("groq", "b", _client, health_check=AsyncMock(side_effect=OSError))
+        await registry.run_maintenance()
+
+        registry.start()
+        await registry.aclose()
+
+        pooled.aclose.assert_awaited_once()
+        retired.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_client_supports_sync_close(self):
+        """Test SDK clients with a synchronous close() are handled."""
+        client = MagicMock(spec=["close"])
+
+        await close_client(client)
+
+        client.close.assert_called_once()
@@ -0,0 +1,51 @@
+"""Unit tests for search helpers."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.search.helpers import SearchHelpers
+
+WRITER = "airweave.search.helpers.search_query_writer"
+
+
+class TestPersistSearchData:
+    """Test handing search_query rows to the write-behind writer."""
+
+    @pytest.mark.asyncio
+    async def test_queued_row_leaves_callback_to_the_writer(self):
+        """Test the callback is passed to the writer and not run here."""
+        helpers = SearchHelpers()
+        after_write = MagicMock()
+
+        with (
+            patch.object(SearchHelpers, "build_search_query_row", return_value={"n": 1}),
+            patch(WRITER) as writer,
+        ):
+            writer.submit = AsyncMock(return_value=True)
+            await helpers.persist_search_data(
+                MagicMock(), MagicMock(), MagicMock(), 12.0, after_write=after_write
+            )
+
+        writer.submit.assert_awaited_once_with({"n": 1}, after_write=after_write)
+        after_write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_row_build_failure_still_runs_callback(self):
+        """Test search analytics are tracked when the row cannot be built."""
+        helpers = SearchHelpers()
+        after_write = MagicMock()
+        ctx = MagicMock()
+
+        with (
+            patch.object(SearchHelpers, "build_search_query_row", side_effect=ValueError("bad")),
+            patch(WRITER) as writer,
+        ):
+            writer.submit = AsyncMock()
+            await helpers.persist_search_data(
+                MagicMock(), MagicMock(), ctx, 12.0, after_write=after_write
+            )
+
+        writer.submit.assert_not_awaited()
+        after_write.assert_called_once()
+        ctx.logger.error.assert_called_once()
@@ -1,5 +1,8 @@
 """Unit tests for SearchOrchestrator."""
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -260,3 +263,131 @@ class TestSearchOrchestrator:
         
         assert "results" in event_names
 
+
+
+def _sleeping_operation(name, depends_on, delay, error=None):
+    """Create an operation named `name` that emits, sleeps and optionally fails."""
+
+    class _Op:
+        def depends_on(self):
+            return depends_on
+
+        async def prefetch(self, context, ctx):
+            pass
+
+        async def execute(self, context, state, ctx):
+            await context.emitter.emit("working", {}, op_name=name)
+            await asyncio.sleep(delay)
+            if error is not None:
+                raise error
+
+    _Op.__name__ = name
+    return _Op()
+
+
+class TestSearchOrchestratorConcurrency:
+    """Test the DAG executor runs independent operations concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_independent_operations_overlap(
+        self, orchestrator, mock_context, mock_api_context
+    ):
+        """Test operations without mutual dependencies run at the same time."""
+        mock_context.access_control_filter = _sleeping_operation("AccessControlFilter", [], 0.2)
+        mock_context.query_expansion = _sleeping_operation("QueryExpansion", [], 0.2)
+
+        start = time.monotonic()
+        _, state_dict = await orchestrator.run(mock_api_context, mock_context)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.35
+        metrics = state_dict["operation_metrics"]
+        assert metrics["AccessControlFilter"]["duration_ms"] >= 150
+        assert metrics["QueryExpansion"]["duration_ms"] >= 150
+
+    @pytest.mark.asyncio
+    async def test_dependent_operation_waits(self, orchestrator, mock_context, mock_api_context):
+        """Test an operation only starts after all of its dependencies finished."""
+        mock_context.access_control_filter = _sleeping_operation("AccessControlFilter", [], 0.1)
+        mock_context.query_expansion = _sleeping_operation("QueryExpansion", [], 0.05)
+        mock_context.retrieval = _sleeping_operation(
+            "Retrieval", ["AccessControlFilter", "QueryExpansion"], 0.01
+        )
+
+        _, state_dict = await orchestrator.run(mock_api_context, mock_context)
+
+        metrics = state_dict["operation_metrics"]
+        acl = metrics["AccessControlFilter"]
+        acl_end_ms = acl["start_offset_ms"] + acl["duration_ms"]
+        assert metrics["Retrieval"]["start_offset_ms"] >= acl_end_ms
+
+    @pytest.mark.asyncio
+    async def test_event_order_matches_sequential_order(
+        self, orchestrator, mock_context, mock_api_context
+    ):
+        """Test events are emitted in execution order even if a later operation finishes first."""
+        mock_context.access_control_filter = _sleeping_operation("AccessControlFilter", [], 0.1)
+        mock_context.query_expansion = _sleeping_operation("QueryExpansion", [], 0.0)
+
+        await orchestrator.run(mock_api_context, mock_context)
+
+        events = [
+            (c.args[0], c.kwargs.get("op_name"))
+            for c in mock_context.emitter.emit.call_args_list
+            if c.kwargs.get("op_name")
+        ]
+        assert events == [
+            ("operator_start", "AccessControlFilter"),
+            ("working", "AccessControlFilter"),
+            ("operator_end", "AccessControlFilter"),
+            ("operator_start", "QueryExpansion"),
+            ("working", "QueryExpansion"),
+            ("operator_end", "QueryExpansion"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_running_operations(
+        self, orchestrator, mock_context, mock_api_context
+    ):
+        """Test a failing operation cancels its siblings and emits an error event."""
+        slow = _sleeping_operation("AccessControlFilter", [], 10)
+        mock_context.access_control_filter = slow
+        mock_context.query_expansion = _sleeping_operation(
+            "QueryExpansion", [], 0.0, error=RuntimeError("expansion failed")
+        )
+
+        start = time.monotonic()
+        with pytest.raises(RuntimeError, match="expansion failed"):
+            await orchestrator.run(mock_api_context, mock_context)
+
+        assert time.monotonic() - start < 1
+        mock_context.emitter.emit.assert_any_call(
+            "error",
+            {"operation": "QueryExpansion", "message": "expansion failed"},
+            op_name="QueryExpansion",
+        )
+
+    @pytest.mark.asyncio
+    async def test_prefetch_runs_before_dependencies_finish(
+        self, orchestrator, mock_context, mock_api_context
+    ):
+        """Test blocked operations get their prefetch started immediately."""
+        prefetch_started = asyncio.Event()
+        embed = _sleeping_operation("EmbedQuery", ["QueryExpansion"], 0.0)
+
+        async def prefetch(context, ctx):
+            prefetch_started.set()
+
+        embed.prefetch = prefetch
+
+        async def expand(context, state, ctx):
+            await asyncio.wait_for(prefetch_started.wait(), timeout=1)
+
+        expansion = _sleeping_operation("QueryExpansion", [], 0.0)
+        expansion.execute = expand
+        mock_context.query_expansion = expansion
+        mock_context.embed_query = embed
+
+        await orchestrator.run(mock_api_context, mock_context)
+
+        assert prefetch_started.is_set()
@@ -0,0 +1,152 @@
+"""Unit tests for cached search plans."""
+
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.core.events import CollectionLifecycleEvent, SourceConnectionLifecycleEvent
+from airweave.search.plan import (
+    CollectionSnapshot,
+    SearchPlan,
+    SearchPlanCache,
+    SearchPlanEventSubscriber,
+    SourceDescriptor,
+)
+
+PUBSUB = "airweave.core.pubsub.core_pubsub"
+
+
+def _plan(organization_id, readable_id="docs-abc123", sources=()):
+    return SearchPlan(
+        collection=CollectionSnapshot(
+            id=uuid4(),
+            readable_id=readable_id,
+            organization_id=organization_id,
+            vector_size=3072,
+            embedding_model_name="text-embedding-3-large",
+        ),
+        sources=tuple(sources),
+        destination="qdrant",
+    )
+
+
+def _source(short_name, federated=False, temporal=True):
+    return SourceDescriptor(
+        source_connection_id=uuid4(),
+        short_name=short_name,
+        federated=federated,
+        supports_temporal_relevance=temporal,
+    )
+
+
+class TestSearchPlan:
+    """Test capabilities derived from source descriptors."""
+
+    def test_source_modes(self):
+        """Test vector and federated flags follow the sources."""
+        plan = _plan(uuid4(), sources=[_source("notion"), _source("slack", federated=True)])
+
+        assert plan.has_vector_sources
+        assert plan.has_federated_sources
+
+    def test_federated_only(self):
+        """Test a collection with only federated sources has no vector sources."""
+        plan = _plan(uuid4(), sources=[_source("slack", federated=True)])
+
+        assert not plan.has_vector_sources
+
+    def test_temporal_support_split(self):
+        """Test sources are split by temporal relevance support."""
+        plan = _plan(uuid4(), sources=[_source("notion"), _source("github", temporal=False)])
+
+        assert plan.temporal_supporting_sources == ["notion"]
+        assert plan.temporal_non_supporting_sources == ["github"]
+
+
+class TestSearchPlanCache:
+    """Test lookup, expiry, eviction and invalidation."""
+
+    def test_hit_after_set(self):
+        """Test a cached plan is returned for the same organization and collection."""
+        cache = SearchPlanCache(max_entries=10, ttl_seconds=60, broadcast=False)
+        organization_id = uuid4()
+        plan = _plan(organization_id)
+        cache.set(plan)
+
+        assert cache.get(organization_id, "docs-abc123") is plan
+
+    def test_miss_for_other_organization(self):
+        """Test plans are scoped to their organization."""
+        cache = SearchPlanCache(max_entries=10, ttl_seconds=60, broadcast=False)
+        cache.set(_plan(uuid4()))
+
+        assert cache.get(uuid4(), "docs-abc123") is None
+
+    def test_expired_plan_is_a_miss(self):
+        """Test plans expire after the TTL."""
+        cache = SearchPlanCache(max_entries=10, ttl_seconds=0, broadcast=False)
+        organization_id = uuid4()
+        cache.set(_plan(organization_id))
+
+        assert cache.get(organization_id, "docs-abc123") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test the least recently used plan is evicted when full."""
+        cache = SearchPlanCache(max_entries=2, ttl_seconds=60, broadcast=False)
+        organization_id = uuid4()
+        cache.set(_plan(organization_id, "a"))
+        cache.set(_plan(organization_id, "b"))
+        cache.get(organization_id, "a")
+        cache.set(_plan(organization_id, "c"))
+
+        assert cache.get(organization_id, "a") is not None
+        assert cache.get(organization_id, "b") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_collection_drops_and_broadcasts(self):
+        """Test invalidation drops the local plan and notifies other pods."""
+        cache = SearchPlanCache(max_entries=10, ttl_seconds=60, broadcast=True)
+        organization_id = uuid4()
+        cache.set(_plan(organization_id))
+
+        with patch(PUBSUB) as pubsub:
+            pubsub.publish = AsyncMock()
+            await cache.invalidate_collection(organization_id, "docs-abc123")
+
+        assert len(cache) == 0
+        pubsub.publish.assert_awaited_once_with(
+            "search_plan",
+            "invalidations",
+            {"organization_id": str(organization_id), "readable_collection_id": "docs-abc123"},
+        )
+
+
+class TestSearchPlanEventSubscriber:
+    """Test domain events invalidate the affected collection."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "event_factory",
+        [
+            lambda org: CollectionLifecycleEvent.updated(org, uuid4(), "Docs", "docs-abc123"),
+            lambda org: CollectionLifecycleEvent.deleted(org, uuid4(), "Docs", "docs-abc123"),
+            lambda org: SourceConnectionLifecycleEvent.created(
+                org, uuid4(), "notion", "docs-abc123"
+            ),
+            lambda org: SourceConnectionLifecycleEvent.deleted(
+                org, uuid4(), "notion", "docs-abc123"
+            ),
+        ],
+    )
+    async def test_events_invalidate_plan(self, event_factory):
+        """Test collection and source connection events invalidate the plan."""
+        organization_id = uuid4()
+        cache = SearchPlanCache(max_entries=10, ttl_seconds=60, broadcast=False)
+        cache.set(_plan(organization_id))
+
+        with patch("airweave.search.plan.get_search_plan_cache", return_value=cache):
+            await SearchPlanEventSubscriber().handle(event_factory(organization_id))
+
+        assert cache.get(organization_id, "docs-abc123") is None
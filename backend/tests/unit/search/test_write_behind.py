@@ -0,0 +1,189 @@
+"""Unit tests for the write-behind search query writer."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.search.write_behind import SearchQueryWriter
+
+
+def _writer(
+    insert,
+    enabled=True,
+    max_queue_size=100,
+    batch_size=3,
+    flush_interval=0.05,
+    drain_timeout=1.0,
+):
+    return SearchQueryWriter(
+        enabled=enabled,
+        max_queue_size=max_queue_size,
+        batch_size=batch_size,
+        flush_interval_seconds=flush_interval,
+        enqueue_timeout_seconds=0.01,
+        drain_timeout_seconds=drain_timeout,
+        insert=insert,
+    )
+
+
+class TestSearchQueryWriter:
+    """Test batching, backpressure, draining and the inline fallback."""
+
+    @pytest.mark.asyncio
+    async def test_not_started_writes_inline(self):
+        """Test rows are written immediately while the writer is not running."""
+        insert = AsyncMock()
+        after_write = MagicMock()
+        writer = _writer(insert)
+
+        await writer.submit({"n": 1}, after_write=after_write)
+
+        insert.assert_awaited_once_with([{"n": 1}])
+        after_write.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_disabled_writer_does_not_start(self):
+        """Test a disabled writer keeps writing inline."""
+        writer = _writer(AsyncMock(), enabled=False)
+
+        writer.start()
+
+        assert not writer.running
+
+    @pytest.mark.asyncio
+    async def test_submit_does_not_wait_for_insert(self):
+        """Test submit returns while the insert is still blocked."""
+        release = asyncio.Event()
+
+        async def slow_insert(rows):
+            await release.wait()
+
+        writer = _writer(slow_insert)
+        writer.start()
+
+        await asyncio.wait_for(writer.submit({"n": 1}), timeout=0.1)
+
+        release.set()
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_as_one_insert(self):
+        """Test rows are written together once a batch is full."""
+        insert = AsyncMock()
+        writer = _writer(insert, batch_size=3, flush_interval=10.0)
+        writer.start()
+
+        for n in range(3):
+            await writer.submit({"n": n})
+        await asyncio.sleep(0.01)
+
+        insert.assert_awaited_once_with([{"n": 0}, {"n": 1}, {"n": 2}])
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushes_after_interval(self):
+        """Test a partial batch is written after the flush interval."""
+        insert = AsyncMock()
+        writer = _writer(insert, batch_size=100, flush_interval=0.02)
+        writer.start()
+
+        await writer.submit({"n": 1})
+        await asyncio.sleep(0.05)
+
+        insert.assert_awaited_once_with([{"n": 1}])
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_record(self):
+        """Test records are dropped once the queue stays full."""
+        release = asyncio.Event()
+
+        async def blocked_insert(rows):
+            await release.wait()
+
+        writer = _writer(blocked_insert, max_queue_size=1, batch_size=1)
+        writer.start()
+        await writer.submit({"n": 0})
+        await asyncio.sleep(0)  # Loop takes n=0 and blocks in insert
+        await writer.submit({"n": 1})
+
+        after_write = MagicMock()
+        assert await writer.submit({"n": 2}, after_write=after_write) is False
+        after_write.assert_called_once()
+
+        release.set()
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_drains_queue(self):
+        """Test shutdown writes everything still queued."""
+        written = []
+
+        async def insert(rows):
+            written.extend(rows)
+
+        writer = _writer(insert, batch_size=2, flush_interval=10.0)
+        writer.start()
+        for n in range(5):
+            await writer.submit({"n": n})
+
+        await writer.aclose()
+
+        assert [row["n"] for row in written] == [0, 1, 2, 3, 4]
+        assert not writer.running
+
+    @pytest.mark.asyncio
+    async def test_failed_insert_still_runs_callbacks(self):
+        """Test a failing insert is swallowed and analytics still fire."""
+        insert = AsyncMock(side_effect=RuntimeError("db down"))
+        after_write = MagicMock()
+        writer = _writer(insert, batch_size=1)
+        writer.start()
+
+        await writer.submit({"n": 1}, after_write=after_write)
+        await writer.aclose()
+
+        after_write.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_row_by_row(self):
+        """Test one bad row doesn't lose the rest of its batch."""
+        written = []
+
+        async def insert(rows):
+            if any(row["n"] == 1 for row in rows):
+                raise RuntimeError("bad row")
+            written.extend(rows)
+
+        after_write = MagicMock()
+        writer = _writer(insert, batch_size=3, flush_interval=10.0)
+        writer.start()
+        for n in range(3):
+            await writer.submit({"n": n}, after_write=after_write)
+
+        await writer.aclose()
+
+        assert [row["n"] for row in written] == [0, 2]
+        assert after_write.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_aclose_gives_up_after_drain_timeout(self):
+        """Test a stuck insert and a full queue can't hang shutdown."""
+        never = asyncio.Event()
+
+        async def stuck_insert(rows):
+            await never.wait()
+
+        after_write = MagicMock()
+        writer = _writer(stuck_insert, max_queue_size=1, batch_size=1, drain_timeout=0.05)
+        writer.start()
+        await writer.submit({"n": 0}, after_write=after_write)
+        await asyncio.sleep(0)  # Loop takes n=0 and blocks in insert
+        await writer.submit({"n": 1}, after_write=after_write)  # Queue is now full
+
+        await asyncio.wait_for(writer.aclose(), timeout=1.0)
+
+        assert not writer.running
+        # The in-flight record and the queued one still get their analytics
+        assert after_write.call_count == 2